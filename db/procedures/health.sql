@@ -29,3 +29,76 @@ BEGIN
     WHERE player_id = p_player_id;
 END;
 $$;
+
+-- set_players_dp: set current_dp for many players in one statement. DP at or below zero also
+-- lays the player down (same rule as Player.apply_dp_change). Returns the stored rows, so the
+-- caller needs no verification read; missing players are simply absent from the result.
+CREATE OR REPLACE FUNCTION :schema_name.set_players_dp(p_player_ids UUID[], p_dps INT[]) -- noqa: PRS
+RETURNS TABLE (player_id UUID, name VARCHAR(50), current_dp INT)
+LANGUAGE plpgsql
+AS $$
+#variable_conflict use_column
+BEGIN
+    RETURN QUERY
+    UPDATE players AS p
+    SET stats = CASE WHEN v.dp <= 0
+            THEN p.stats || jsonb_build_object('current_dp', v.dp, 'position', 'lying')
+            ELSE jsonb_set(p.stats, '{current_dp}', to_jsonb(v.dp))
+        END
+    FROM unnest(p_player_ids, p_dps) AS v(player_id, dp)
+    WHERE p.player_id = v.player_id
+    RETURNING p.player_id, p.name, (p.stats->>'current_dp')::int;
+END;
+$$;
+
+-- player_max_mp: a player's maximum MP (max_magic_points, else ceil(power * 0.2), as in MPRegenerationService)
+CREATE OR REPLACE FUNCTION :schema_name.player_max_mp(p_stats JSONB) -- noqa: PRS
+RETURNS INT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT COALESCE(
+        floor((p_stats->>'max_magic_points')::numeric)::int,
+        ceil(COALESCE((p_stats->>'power')::numeric, 50) * 0.2)::int
+    );
+$$;
+
+-- regenerate_players_mp: add whole regenerated MP for many players in one statement, capped at
+-- each player's maximum. The cap is applied to the row as locked, so MP spent concurrently is kept.
+-- Players with a zero gain are only read. Returns MP, maximum and position of every player found.
+CREATE OR REPLACE FUNCTION :schema_name.regenerate_players_mp(p_player_ids UUID[], p_gains INT[]) -- noqa: PRS
+RETURNS TABLE (player_id UUID, magic_points INT, max_magic_points INT, "position" TEXT)
+LANGUAGE plpgsql
+AS $$
+#variable_conflict use_column
+BEGIN
+    RETURN QUERY
+    WITH gains AS (
+        SELECT g.player_id, g.gain FROM unnest(p_player_ids, p_gains) AS g(player_id, gain)
+    ),
+    updated AS (
+        UPDATE players AS p
+        SET stats = jsonb_set(
+            p.stats - '_mp_fractional',
+            '{magic_points}',
+            to_jsonb(LEAST(
+                player_max_mp(p.stats),
+                floor(COALESCE((p.stats->>'magic_points')::numeric, 0))::int + gains.gain
+            ))
+        )
+        FROM gains
+        WHERE p.player_id = gains.player_id
+            AND gains.gain > 0
+            AND floor(COALESCE((p.stats->>'magic_points')::numeric, 0))::int < player_max_mp(p.stats)
+        RETURNING p.player_id, p.stats
+    )
+    SELECT
+        p.player_id,
+        floor(COALESCE((COALESCE(u.stats, p.stats)->>'magic_points')::numeric, 0))::int,
+        player_max_mp(COALESCE(u.stats, p.stats)),
+        COALESCE(COALESCE(u.stats, p.stats)->>'position', 'standing')
+    FROM players AS p
+    JOIN gains ON gains.player_id = p.player_id
+    LEFT JOIN updated AS u ON u.player_id = p.player_id;
+END;
+$$;
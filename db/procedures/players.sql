@@ -493,3 +493,80 @@ BEGIN
         equipped_json = EXCLUDED.equipped_json;
 END;
 $$;
+
+-- patch_player: update only the columns named in p_columns (dirty-field partial save).
+-- Stats are patched key by key: p_stats_removed keys are dropped and p_stats_patch
+-- is merged over the stored object, so writers of other stats keys are not overwritten.
+-- Returns false when the player row does not exist.
+CREATE OR REPLACE FUNCTION :schema_name.patch_player(
+    p_player_id UUID,
+    p_columns TEXT[],
+    p_stats_patch JSONB,
+    p_stats_removed TEXT[],
+    p_status_effects TEXT,
+    p_current_room_id VARCHAR(255),
+    p_respawn_room_id VARCHAR(100),
+    p_tutorial_instance_id VARCHAR(255),
+    p_experience_points INT,
+    p_level INT,
+    p_is_admin INT,
+    p_profession_id BIGINT,
+    p_last_active TIMESTAMP WITH TIME ZONE
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE players SET
+        stats = CASE WHEN 'stats' = ANY(p_columns)
+            THEN (stats - COALESCE(p_stats_removed, '{}'::text[])) || COALESCE(p_stats_patch, '{}'::jsonb)
+            ELSE stats END,
+        status_effects = CASE WHEN 'status_effects' = ANY(p_columns) THEN p_status_effects ELSE status_effects END,
+        current_room_id = CASE WHEN 'current_room_id' = ANY(p_columns) THEN p_current_room_id ELSE current_room_id END,
+        respawn_room_id = CASE WHEN 'respawn_room_id' = ANY(p_columns) THEN p_respawn_room_id ELSE respawn_room_id END,
+        tutorial_instance_id = CASE WHEN 'tutorial_instance_id' = ANY(p_columns)
+            THEN p_tutorial_instance_id ELSE tutorial_instance_id END,
+        experience_points = CASE WHEN 'experience_points' = ANY(p_columns)
+            THEN p_experience_points ELSE experience_points END,
+        level = CASE WHEN 'level' = ANY(p_columns) THEN p_level ELSE level END,
+        is_admin = CASE WHEN 'is_admin' = ANY(p_columns) THEN p_is_admin ELSE is_admin END,
+        profession_id = CASE WHEN 'profession_id' = ANY(p_columns) THEN p_profession_id ELSE profession_id END,
+        last_active = CASE WHEN 'last_active' = ANY(p_columns) THEN p_last_active ELSE last_active END
+    WHERE player_id = p_player_id;
+    RETURN FOUND;
+END;
+$$;
+
+-- patch_players: apply patch_player to every element of p_patches in one call (batched
+-- partial saves). Each element is an object keyed by patch_player's parameter names
+-- without the p_ prefix; missing keys are NULL, stats_patch is JSON text.
+-- Returns the ids of players whose row does not exist, for the caller to upsert.
+CREATE OR REPLACE FUNCTION :schema_name.patch_players(p_patches JSONB)
+RETURNS SETOF UUID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    patch JSONB;
+BEGIN
+    FOR patch IN SELECT value FROM jsonb_array_elements(p_patches) LOOP
+        IF NOT patch_player(
+            (patch->>'player_id')::uuid,
+            ARRAY(SELECT jsonb_array_elements_text(patch->'columns')),
+            (patch->>'stats_patch')::jsonb,
+            CASE WHEN patch ? 'stats_removed'
+                THEN ARRAY(SELECT jsonb_array_elements_text(patch->'stats_removed')) END,
+            patch->>'status_effects',
+            patch->>'current_room_id',
+            patch->>'respawn_room_id',
+            patch->>'tutorial_instance_id',
+            (patch->>'experience_points')::int,
+            (patch->>'level')::int,
+            (patch->>'is_admin')::int,
+            (patch->>'profession_id')::bigint,
+            (patch->>'last_active')::timestamptz
+        ) THEN
+            RETURN NEXT (patch->>'player_id')::uuid;
+        END IF;
+    END LOOP;
+END;
+$$;
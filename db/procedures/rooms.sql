@@ -222,3 +222,33 @@ BEGIN
     SELECT r.stable_id FROM rooms r WHERE r.id = ANY(p_room_ids);
 END;
 $$ LANGUAGE plpgsql;
+
+
+-- get_player_explored_room_ids: room UUIDs a player has explored (exploration write buffer)
+CREATE OR REPLACE FUNCTION :schema_name.get_player_explored_room_ids(p_player_id uuid) -- noqa: PRS
+RETURNS TABLE (room_id uuid) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT pe.room_id FROM player_exploration pe WHERE pe.player_id = p_player_id;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- record_player_explorations: write-once insert of (player, room, explored_at) rows; returns rows inserted
+CREATE OR REPLACE FUNCTION :schema_name.record_player_explorations( -- noqa: PRS
+    p_player_ids uuid[],
+    p_room_ids uuid[],
+    p_explored_at timestamptz[]
+)
+RETURNS integer AS $$
+DECLARE
+    v_inserted integer;
+BEGIN
+    INSERT INTO player_exploration (player_id, room_id, explored_at)
+    SELECT t.player_id, t.room_id, t.explored_at
+    FROM unnest(p_player_ids, p_room_ids, p_explored_at) AS t(player_id, room_id, explored_at)
+    ON CONFLICT (player_id, room_id) DO NOTHING;
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+    RETURN v_inserted;
+END;
+$$ LANGUAGE plpgsql;
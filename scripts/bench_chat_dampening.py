@@ -0,0 +1,140 @@
+"""
+Chat dampening fan-out benchmark for CI artifacts.
+
+Profiles delivering room says to a mixed-tier room in two modes:
+"per_receiver" applies dampening, formats the message and copies the event
+for every receiver (the behaviour before tier buckets), "bucketed" uses
+NATSMessageBroadcastMixin._send_messages_to_players, which builds each
+tier's variant once (deranged receivers keep a seeded per-receiver scramble).
+Each delivery is JSON-encoded once, as the WebSocket send does. Reports CPU
+time per recipient and the number of distinct events built. Outputs JSON
+metrics to artifacts/perf/chat_dampening_bench.json.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import uuid
+from typing import Any
+
+from anyio import run
+
+RECEIVERS = 50
+MESSAGES = 200
+TIER_MIX = ["lucid"] * 6 + ["uneasy"] * 2 + ["fractured", "deranged"]
+
+
+class _ConnectionManager:
+    """Encodes each delivery the way send_json would and counts distinct events."""
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.events: dict[int, dict[str, Any]] = {}
+
+    async def send_personal_message(self, _player_id: uuid.UUID, event: dict[str, Any]) -> None:
+        self.sent += 1
+        self.events[id(event)] = event  # Keep a reference so ids are not reused
+        _ = json.dumps(event)
+
+
+def _handler_class() -> type:
+    from server.realtime.nats_message_handler_broadcast import NATSMessageBroadcastMixin  # local import
+
+    class _BenchHandler(NATSMessageBroadcastMixin):
+        def __init__(self, tiers: dict[str, str]) -> None:
+            self.tiers = tiers
+            self.connection_manager = _ConnectionManager()
+
+        async def _get_player_lucidity_tier(self, player_id: str) -> str:
+            return self.tiers[player_id]
+
+    return _BenchHandler
+
+
+async def _send_per_receiver(
+    handler: Any, targets: list[str], chat_event: dict[str, Any], sender_id: str, channel: str
+) -> None:
+    """Per-receiver dampening, as _send_messages_to_players did before tier buckets."""
+    from server.services.lucidity_communication_dampening import apply_communication_dampening  # local import
+
+    event_data = chat_event["data"]
+    sender_tier = await handler._get_player_lucidity_tier(sender_id)  # pylint: disable=protected-access  # Reason: Benchmark replays the handler internals
+    for player_id in targets:
+        receiver_tier = await handler._get_player_lucidity_tier(player_id)  # pylint: disable=protected-access  # Reason: Benchmark replays the handler internals
+        result = apply_communication_dampening(event_data["original_content"], sender_tier, receiver_tier, channel)
+        if result["blocked"]:
+            continue
+        receiver_event = chat_event.copy()
+        receiver_event["data"] = event_data.copy()
+        receiver_event["data"]["message"] = handler._format_message_for_receiver(  # pylint: disable=protected-access  # Reason: Benchmark replays the handler internals
+            channel, event_data["player_name"], result["message"]
+        )
+        if result.get("tags"):
+            receiver_event["data"]["tags"] = result["tags"]
+        await handler.connection_manager.send_personal_message(uuid.UUID(player_id), receiver_event)
+
+
+async def _profile(mode: str) -> dict[str, Any]:
+    sender_id = str(uuid.uuid4())
+    targets = [str(uuid.uuid4()) for _ in range(RECEIVERS)]
+    tiers = {sender_id: "uneasy", **{t: TIER_MIX[i % len(TIER_MIX)] for i, t in enumerate(targets)}}
+    handler = _handler_class()(tiers)
+
+    started = time.process_time()
+    for n in range(MESSAGES):
+        chat_event = {
+            "event_type": "chat_message",
+            "timestamp": "2026-01-01T00:00:00Z",
+            "data": {
+                "sender_id": sender_id,
+                "player_name": "Bench",
+                "channel": "say",
+                "message": "Bench says: the stars are right tonight",
+                "message_id": f"bench-{n}",
+                "original_content": "the stars are right tonight",
+            },
+        }
+        if mode == "bucketed":
+            await handler._send_messages_to_players(targets, chat_event, "bench_room", sender_id, "say")  # pylint: disable=protected-access  # Reason: Benchmark drives the handler internals
+        else:
+            await _send_per_receiver(handler, targets, chat_event, sender_id, "say")
+    cpu_seconds = time.process_time() - started
+
+    deliveries = handler.connection_manager.sent
+    return {
+        "cpu_us_per_recipient": round(cpu_seconds / deliveries * 1_000_000, 2) if deliveries else 0.0,
+        "deliveries": deliveries,
+        "events_built": len(handler.connection_manager.events),
+    }
+
+
+async def bench_chat_dampening() -> dict[str, Any]:
+    before = await _profile("per_receiver")
+    after = await _profile("bucketed")
+    return {
+        "suite": "chat_dampening_bench",
+        "receivers": RECEIVERS,
+        "messages": MESSAGES,
+        "per_receiver": before,
+        "bucketed": after,
+        "cpu_speedup": round(before["cpu_us_per_recipient"] / after["cpu_us_per_recipient"], 2)
+        if after["cpu_us_per_recipient"] > 0
+        else 0.0,
+    }
+
+
+def main() -> None:
+    metrics = run(bench_chat_dampening)
+
+    out_dir = os.path.join("artifacts", "perf")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "chat_dampening_bench.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(metrics, f, indent=2)
+    print(json.dumps(metrics))
+
+
+if __name__ == "__main__":
+    main()
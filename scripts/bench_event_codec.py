@@ -0,0 +1,135 @@
+"""
+Domain event codec benchmark for CI artifacts.
+
+Encodes and decodes 20,000 domain events (a mix of room movement, NPC and
+player death events, with UUIDs, timestamps and nested payloads) the way
+NATSEventBusBridge sends them between instances. Two modes: "asdict" runs
+dataclasses.asdict, a recursive JSON walk and per-field Optional unwrapping
+for every event (the behaviour before per-class codecs), "compiled" uses
+encode_event/deserialize_event as is. Reports CPU time per event for encoding
+to bytes and for decoding, and events per second. Outputs JSON metrics to
+artifacts/perf/event_codec_bench.json.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import uuid
+from dataclasses import asdict, fields
+from typing import Any
+
+from anyio import run
+
+EVENTS = 20_000
+
+
+def _events() -> list[Any]:
+    from server.events.combat_events import CombatStartedEvent  # local import
+    from server.events.event_types import NPCEnteredRoom, PlayerDiedEvent, PlayerEnteredRoom  # local import
+
+    events: list[Any] = []
+    for n in range(EVENTS):
+        kind = n % 4
+        if kind == 0:
+            events.append(PlayerEnteredRoom(player_id=f"player-{n}", room_id=f"room-{n % 50}", from_room_id=None))
+        elif kind == 1:
+            events.append(NPCEnteredRoom(npc_id=f"npc-{n}", room_id=f"room-{n % 50}", from_room_id=f"room-{n % 7}"))
+        elif kind == 2:
+            events.append(PlayerDiedEvent(player_id=uuid.uuid4(), player_name=f"Investigator {n}", room_id="room-1"))
+        else:
+            events.append(
+                CombatStartedEvent(
+                    combat_id=uuid.uuid4(),
+                    room_id=f"room-{n % 50}",
+                    participants={str(uuid.uuid4()): {"name": "Ghoul", "hp": 30, "tags": ["npc", "hostile"]}},
+                    turn_order=[f"p{i}" for i in range(4)],
+                )
+            )
+    return events
+
+
+def _asdict_encode(event: Any) -> bytes:
+    from server.events.event_serialization import _convert_value_for_json  # local import
+
+    data = asdict(event)
+    data["_event_type"] = event.event_type or type(event).__name__
+    return json.dumps(_convert_value_for_json(data)).encode("utf-8")
+
+
+def _asdict_decode(data: dict[str, Any]) -> Any:
+    from server.events.event_serialization import (  # local import
+        _EVENT_CLASS_REGISTRY,
+        _unwrap_optional_type,
+    )
+
+    cls = _EVENT_CLASS_REGISTRY[data["_event_type"]]
+    init_fields = {f.name: f for f in fields(cls) if f.init}
+    kwargs: dict[str, Any] = {}
+    for key, value in data.items():
+        if key in init_fields:
+            field_type = _unwrap_optional_type(init_fields[key].type)
+            if field_type is uuid.UUID and isinstance(value, str):
+                value = uuid.UUID(value)
+            kwargs[key] = value
+    return cls(**kwargs)
+
+
+async def _profile(mode: str, events: list[Any]) -> dict[str, Any]:
+    from server.events.event_serialization import deserialize_event, encode_event  # local import
+
+    encode = _asdict_encode if mode == "asdict" else encode_event
+    decode = _asdict_decode if mode == "asdict" else deserialize_event
+
+    started = time.process_time()
+    payloads = [encode(event) for event in events]
+    encode_seconds = time.process_time() - started
+
+    received = [json.loads(payload) for payload in payloads]
+    started = time.process_time()
+    for data in received:
+        _ = decode(data)
+    decode_seconds = time.process_time() - started
+
+    return {
+        "cpu_us_per_encode": round(encode_seconds / len(events) * 1_000_000, 2),
+        "cpu_us_per_decode": round(decode_seconds / len(events) * 1_000_000, 2),
+        "events_per_second": round(len(events) / (encode_seconds + decode_seconds))
+        if encode_seconds + decode_seconds
+        else 0,
+        "avg_payload_bytes": round(sum(len(payload) for payload in payloads) / len(payloads), 1),
+    }
+
+
+async def bench_event_codec() -> dict[str, Any]:
+    from server.events.event_serialization import _register_event_types  # local import
+
+    _register_event_types()
+    events = _events()
+    before = await _profile("asdict", events)
+    after = await _profile("compiled", events)
+    return {
+        "suite": "event_codec_bench",
+        "events": EVENTS,
+        "asdict": before,
+        "compiled": after,
+        "encode_speedup": round(before["cpu_us_per_encode"] / after["cpu_us_per_encode"], 2)
+        if after["cpu_us_per_encode"] > 0
+        else 0.0,
+    }
+
+
+def main() -> None:
+    metrics = run(bench_event_codec)
+
+    out_dir = os.path.join("artifacts", "perf")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "event_codec_bench.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(metrics, f, indent=2)
+    print(json.dumps(metrics))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Follow propagation benchmark for CI artifacts.
+
+Moves the head of a 10-member conga line (each member follows the one ahead)
+and a 10-member group following one leader, on a server that also holds
+5,000 unrelated follow relationships. Two modes: "scan" finds followers by
+scanning every follow relationship and moves them one at a time (the
+behaviour before the reverse index), "indexed" uses FollowService as is.
+Moves take a simulated 2 ms. Reports wall time per propagation and the CPU
+time spent finding followers per move event. Outputs JSON metrics to
+artifacts/perf/follow_conga_bench.json.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Any
+
+from anyio import run, sleep
+
+MEMBERS = 10
+BACKGROUND_FOLLOWS = 5000
+MOVE_LATENCY_MS = 2.0
+ROUNDS = 20
+
+
+class _MovementService:
+    """Moves after a simulated delay and publishes PlayerEnteredRoom the way the room does."""
+
+    def __init__(self) -> None:
+        self.follow_service: Any = None
+        self.moves = 0
+
+    async def move_player(self, player_id: str, from_room_id: str, to_room_id: str) -> bool:
+        from server.events.event_types import PlayerEnteredRoom  # local import
+
+        await sleep(MOVE_LATENCY_MS / 1000.0)
+        self.moves += 1
+        await self.follow_service._on_player_entered_room(  # pylint: disable=protected-access  # Reason: Benchmark stands in for the event bus
+            PlayerEnteredRoom(player_id=player_id, room_id=to_room_id, from_room_id=from_room_id)
+        )
+        return True
+
+
+def _service(mode: str) -> tuple[Any, _MovementService, dict[str, float]]:
+    from server.game.follow_service import FollowService  # local import
+
+    lookup = {"seconds": 0.0, "events": 0}
+
+    class _ScanFollowService(FollowService):
+        """Linear follower scan and one-at-a-time moves."""
+
+        async def _on_player_entered_room(self, event: Any) -> None:
+            started = time.process_time()
+            followers = [f for f, v in self._follow_target.items() if v[0] == event.player_id]
+            lookup["seconds"] += time.process_time() - started
+            lookup["events"] += 1
+            for follower_id in followers:
+                await self._handle_player_follower_move(follower_id, event)
+
+    class _IndexedFollowService(FollowService):
+        """FollowService as shipped, with the follower lookup timed."""
+
+        async def _on_player_entered_room(self, event: Any) -> None:
+            started = time.process_time()
+            _ = self._follow_target.followers_of(event.player_id)
+            lookup["seconds"] += time.process_time() - started
+            lookup["events"] += 1
+            await super()._on_player_entered_room(event)
+
+    movement = _MovementService()
+    service_class = _ScanFollowService if mode == "scan" else _IndexedFollowService
+    service = service_class(movement_service=movement)  # type: ignore[arg-type]  # Reason: Stand-in movement service
+    movement.follow_service = service
+    for i in range(BACKGROUND_FOLLOWS):
+        service._follow_target[f"bystander_{i}"] = (f"elsewhere_{i % 1000}", "player")  # pylint: disable=protected-access  # Reason: Benchmark seeds follow state directly
+    return service, movement, lookup
+
+
+async def _profile(mode: str, shape: str) -> dict[str, Any]:
+    service, movement, lookup = _service(mode)
+    for i in range(MEMBERS):
+        target = f"conga_{i}" if shape == "conga" else "leader"
+        follower = f"conga_{i + 1}" if shape == "conga" else f"member_{i}"
+        service._follow_target[follower] = (target, "player")  # pylint: disable=protected-access  # Reason: Benchmark seeds follow state directly
+    head = "conga_0" if shape == "conga" else "leader"
+
+    started = time.perf_counter()
+    for n in range(ROUNDS):
+        from_room, to_room = (f"room_{n}", f"room_{n + 1}")
+        await movement.move_player(head, from_room, to_room)
+    wall_seconds = time.perf_counter() - started
+
+    return {
+        "wall_ms_per_propagation": round(wall_seconds / ROUNDS * 1000.0, 2),
+        "moves": movement.moves,
+        "lookup_us_per_event": round(lookup["seconds"] / lookup["events"] * 1_000_000, 2) if lookup["events"] else 0.0,
+    }
+
+
+async def bench_follow_conga() -> dict[str, Any]:
+    metrics: dict[str, Any] = {
+        "suite": "follow_conga_bench",
+        "members": MEMBERS,
+        "background_follows": BACKGROUND_FOLLOWS,
+        "move_latency_ms": MOVE_LATENCY_MS,
+        "rounds": ROUNDS,
+    }
+    for shape in ("conga", "group"):
+        metrics[shape] = {mode: await _profile(mode, shape) for mode in ("scan", "indexed")}
+    return metrics
+
+
+def main() -> None:
+    metrics = run(bench_follow_conga)
+
+    out_dir = os.path.join("artifacts", "perf")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "follow_conga_bench.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(metrics, f, indent=2)
+    print(json.dumps(metrics))
+
+
+if __name__ == "__main__":
+    main()
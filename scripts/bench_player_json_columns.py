@@ -0,0 +1,145 @@
+"""
+Player JSON column benchmark for CI artifacts.
+
+Profiles a combat + status-effects tick workload against the Player
+inventory/status_effects columns in two modes: "per_access" parses the JSON
+text on every read and serializes it on every write (the behaviour before
+the parsed-column cache), "cached" uses Player.get_*/set_* with the cache.
+Reports CPU time per tick, JSON parse/serialize counts and the tracemalloc
+allocation peak. Outputs JSON metrics to artifacts/perf/player_json_columns_bench.json.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+PLAYERS = 50
+TICKS = 200
+SAVE_EVERY_TICKS = 10
+
+
+def _player() -> Any:
+    from server.models.player import Player  # local import
+
+    inventory = [{"item_id": f"bench_item_{i}", "item_name": f"Bench Item {i}", "quantity": 1} for i in range(20)]
+    effects = [{"type": "damage_over_time", "duration": 1000, "remaining": 1000, "intensity": i} for i in range(4)]
+    player = Player(
+        player_id=str(uuid.uuid4()),
+        user_id=str(uuid.uuid4()),
+        name="Bench",
+        stats={"current_dp": 50, "max_dp": 50, "constitution": 50, "size": 50, "position": "standing"},
+        inventory=json.dumps(inventory),
+        status_effects=json.dumps(effects),
+    )
+    player.mark_persisted()
+    return player
+
+
+class _PerAccess:
+    """Reads and writes the raw column text, as the accessors did before the cache."""
+
+    def __init__(self) -> None:
+        self.parses = 0
+        self.serializations = 0
+
+    def get(self, player: Any, column: str) -> list[dict[str, Any]]:
+        self.parses += 1
+        return json.loads(getattr(player, column))
+
+    def set(self, player: Any, column: str, value: list[dict[str, Any]]) -> None:
+        self.serializations += 1
+        setattr(player, column, json.dumps(value))
+
+
+class _Cached:
+    """Uses the Player accessors and their parsed-column cache."""
+
+    def get(self, player: Any, column: str) -> list[dict[str, Any]]:
+        return player.get_inventory() if column == "inventory" else player.get_status_effects()
+
+    def set(self, player: Any, column: str, value: list[dict[str, Any]]) -> None:
+        if column == "inventory":
+            player.set_inventory(value)
+        else:
+            player.set_status_effects(value)
+
+
+def _tick(player: Any, accessor: _PerAccess | _Cached, tick: int) -> None:
+    # Combat round: liveness check, participant stats, DP sync
+    if player.is_alive():
+        _ = player.get_combat_stats()
+        _ = player.apply_dp_change(50 - tick % 5)
+    # Status effect tick, then the effect lookups commands and spells make
+    effects = accessor.get(player, "status_effects")
+    updated = [{**effect, "remaining": int(effect["remaining"]) - 1} for effect in effects]
+    accessor.set(player, "status_effects", updated)
+    for _ in range(2):
+        _ = any(effect["type"] == "stunned" for effect in accessor.get(player, "status_effects"))
+    # Material and look checks read the inventory
+    for _ in range(2):
+        _ = len(accessor.get(player, "inventory"))
+    if tick % SAVE_EVERY_TICKS == 0:
+        _ = player.get_dirty_fields()
+        player.mark_persisted()
+
+
+def _profile(make_accessor: Callable[[], _PerAccess | _Cached]) -> dict[str, Any]:
+    players = [_player() for _ in range(PLAYERS)]
+    accessor = make_accessor()
+    tracemalloc.start()
+    started = time.process_time()
+    for tick in range(TICKS):
+        for player in players:
+            _tick(player, accessor, tick)
+    cpu_seconds = time.process_time() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if isinstance(accessor, _PerAccess):
+        parses, serializations = accessor.parses, accessor.serializations
+    else:
+        stats = [player.get_json_column_stats() for player in players]
+        parses = sum(s["parses"] for s in stats)
+        serializations = sum(s["serializations"] for s in stats)
+    return {
+        "cpu_us_per_player_tick": round(cpu_seconds / (TICKS * PLAYERS) * 1_000_000, 2),
+        "json_parses": parses,
+        "json_serializations": serializations,
+        "tracemalloc_peak_kib": round(peak / 1024, 1),
+    }
+
+
+def bench_player_json_columns() -> dict[str, Any]:
+    before = _profile(_PerAccess)
+    after = _profile(_Cached)
+    return {
+        "suite": "player_json_columns_bench",
+        "players": PLAYERS,
+        "ticks": TICKS,
+        "per_access": before,
+        "cached": after,
+        "cpu_speedup": round(before["cpu_us_per_player_tick"] / after["cpu_us_per_player_tick"], 2)
+        if after["cpu_us_per_player_tick"] > 0
+        else 0.0,
+    }
+
+
+def main() -> None:
+    metrics = bench_player_json_columns()
+
+    out_dir = os.path.join("artifacts", "perf")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "player_json_columns_bench.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(metrics, f, indent=2)
+    print(json.dumps(metrics))
+
+
+if __name__ == "__main__":
+    main()
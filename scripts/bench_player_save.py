@@ -0,0 +1,135 @@
+"""
+Player save preparation benchmark for CI artifacts.
+
+Measures the CPU cost of preparing a player save by change type: the full
+upsert_player path (inventory parsing, JSON-schema validation, re-serializing
+stats/inventory/equipped) against the dirty-field patch_player path.
+Database round trips are not included. Outputs JSON metrics to
+artifacts/perf/player_save_bench.json.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+
+ITERATIONS = 2000
+
+
+def _row() -> SimpleNamespace:
+    """A result row shaped like get_player_by_id output, with a realistic inventory."""
+    inventory = [
+        {
+            "item_instance_id": str(uuid.uuid4()),
+            "prototype_id": f"bench_item_{i}",
+            "item_id": f"bench_item_{i}",
+            "item_name": f"Bench Item {i}",
+            "slot_type": "backpack",
+            "quantity": 1,
+        }
+        for i in range(20)
+    ]
+    return SimpleNamespace(
+        player_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        name="Bench",
+        inventory=json.dumps(inventory),
+        status_effects="[]",
+        current_room_id="earth_arkhamcity_sanitarium_room_foyer_001",
+        respawn_room_id="earth_arkhamcity_sanitarium_room_foyer_001",
+        experience_points=0,
+        level=1,
+        is_admin=0,
+        profession_id=0,
+        created_at=datetime.now(UTC),
+        last_active=datetime.now(UTC),
+        stats={"current_dp": 20, "magic_points": 10, "lucidity": 100, "position": "standing", "strength": 50},
+        is_deleted=False,
+        deleted_at=None,
+        tutorial_instance_id=None,
+        inventory_json=json.dumps(inventory),
+        equipped_json="{}",
+    )
+
+
+def _change_dp(player: Any, i: int) -> None:
+    player.apply_dp_change(20 - i % 10)
+
+
+def _change_room(player: Any, i: int) -> None:
+    player.current_room_id = f"bench_room_{i % 2}"
+
+
+def _change_dp_and_room(player: Any, i: int) -> None:
+    _change_dp(player, i)
+    _change_room(player, i)
+
+
+def _change_inventory(player: Any, i: int) -> None:
+    inventory = player.get_inventory()
+    inventory[0]["quantity"] = 1 + i % 3
+    player.set_inventory(inventory)
+
+
+def _time_per_save(prepare: Callable[[Any], Any], change: Callable[[Any, int], None]) -> float:
+    from server.persistence.repositories.player_repository_mappers import row_to_player  # local import
+
+    player = row_to_player(_row())
+    started = time.perf_counter()
+    for i in range(ITERATIONS):
+        change(player, i)
+        _ = prepare(player)
+        player.mark_persisted()
+    return (time.perf_counter() - started) / ITERATIONS * 1_000_000
+
+
+def bench_player_save() -> dict[str, Any]:
+    from server.persistence.repositories.player_repository_save import PlayerSavePreparer  # local import
+    from server.structured_logging.enhanced_logging_config import get_logger  # local import
+
+    preparer = PlayerSavePreparer(get_logger("bench_player_save"))
+
+    def full(player: Any) -> Any:
+        return preparer.prepare(player)
+
+    def partial(player: Any) -> Any:
+        dirty = player.get_dirty_fields()
+        return preparer.prepare_partial(player, dirty) or preparer.prepare(player)
+
+    changes = {
+        "dp_only": _change_dp,
+        "room_only": _change_room,
+        "dp_and_room": _change_dp_and_room,
+        "inventory": _change_inventory,
+    }
+    results: dict[str, Any] = {}
+    for name, change in changes.items():
+        full_us = _time_per_save(full, change)
+        partial_us = _time_per_save(partial, change)
+        results[name] = {
+            "full_upsert_us": round(full_us, 2),
+            "partial_us": round(partial_us, 2),
+            "speedup": round(full_us / partial_us, 2) if partial_us > 0 else 0.0,
+        }
+    return {"suite": "player_save_bench", "iterations": ITERATIONS, "change_types": results}
+
+
+def main() -> None:
+    metrics = bench_player_save()
+
+    out_dir = os.path.join("artifacts", "perf")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "player_save_bench.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(metrics, f, indent=2)
+    print(json.dumps(metrics))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Room floor look benchmark for CI artifacts.
+
+Profiles a look in a room holding 500 drop stacks in two modes: "copy"
+deep-copies every stack in list_room_drops and again in clone_room_drops and
+scans all stacks to resolve a `get` by name (the behaviour before the
+copy-on-write drop store), "shared" uses RoomSubscriptionManager as is, which
+hands out the stored read-only list and resolves names through its index.
+Each look renders the drop summary and JSON-encodes the room_drops payload,
+as the room update does. Reports CPU time per look and per name lookup.
+Outputs JSON metrics to artifacts/perf/room_look_bench.json.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from copy import deepcopy
+from typing import Any
+
+from anyio import run
+
+STACKS = 500
+LOOKS = 200
+LOOKUPS = 2000
+ROOM_ID = "bench_room"
+
+
+def _manager(mode: str) -> Any:
+    from server.commands.inventory_item_matching import match_room_drop_by_name  # local import
+    from server.realtime.room_subscription_manager import RoomSubscriptionManager  # local import
+
+    class _CopyingManager(RoomSubscriptionManager):
+        """Deep-copies every stack per read and scans for names."""
+
+        def list_room_drops(self, room_id: str) -> list[dict[str, Any]]:
+            return [deepcopy(dict(stack)) for stack in super().list_room_drops(room_id)]
+
+        def find_drop(self, search_term: str) -> int | None:
+            return match_room_drop_by_name(self.list_room_drops(ROOM_ID), search_term)
+
+    class _SharedManager(RoomSubscriptionManager):
+        """RoomSubscriptionManager as shipped."""
+
+        def find_drop(self, search_term: str) -> int | None:
+            return match_room_drop_by_name(self.list_room_drops(ROOM_ID), search_term)
+
+    manager = _CopyingManager() if mode == "copy" else _SharedManager()
+    manager._canonical_room_id = lambda room_id: room_id  # type: ignore[method-assign]  # pylint: disable=protected-access  # Reason: No persistence in the benchmark
+    for i in range(STACKS):
+        manager.room_drops.add(
+            ROOM_ID,
+            {
+                "item_instance_id": f"instance-{i:04d}",
+                "item_name": f"Curio {i:03d}",
+                "item_id": f"curio_{i:03d}",
+                "prototype_id": f"curio_{i % 25}",
+                "slot_type": "backpack",
+                "quantity": 1 + i % 3,
+                "metadata": {"condition": "tarnished", "tags": ["antique", "odd"]},
+            },
+        )
+    return manager
+
+
+async def _profile(mode: str) -> dict[str, Any]:
+    from server.utils.room_renderer import build_room_drop_summary, clone_room_drops  # local import
+
+    manager = _manager(mode)
+
+    started = time.process_time()
+    for _ in range(LOOKS):
+        room_drops = clone_room_drops(manager.list_room_drops(ROOM_ID))
+        _ = build_room_drop_summary(room_drops)
+        _ = json.dumps({"room_drops": room_drops})
+    look_seconds = time.process_time() - started
+
+    started = time.process_time()
+    for n in range(LOOKUPS):
+        _ = manager.find_drop(f"curio {n % STACKS:03d}")
+    lookup_seconds = time.process_time() - started
+
+    return {
+        "cpu_ms_per_look": round(look_seconds / LOOKS * 1000.0, 3),
+        "cpu_us_per_name_lookup": round(lookup_seconds / LOOKUPS * 1_000_000, 2),
+    }
+
+
+async def bench_room_look() -> dict[str, Any]:
+    before = await _profile("copy")
+    after = await _profile("shared")
+    return {
+        "suite": "room_look_bench",
+        "stacks": STACKS,
+        "looks": LOOKS,
+        "lookups": LOOKUPS,
+        "copy": before,
+        "shared": after,
+        "look_speedup": round(before["cpu_ms_per_look"] / after["cpu_ms_per_look"], 2)
+        if after["cpu_ms_per_look"] > 0
+        else 0.0,
+    }
+
+
+def main() -> None:
+    metrics = run(bench_room_look)
+
+    out_dir = os.path.join("artifacts", "perf")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, "room_look_bench.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(metrics, f, indent=2)
+    print(json.dumps(metrics))
+
+
+if __name__ == "__main__":
+    main()
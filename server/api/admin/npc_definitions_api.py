@@ -14,13 +14,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...auth.users import get_current_user
 from ...database import get_async_session
+from ...events.event_types import NPCDefinitionsChanged
 from ...exceptions import LoggedHTTPException
 from ...models.user import User
 from ...npc_database import get_npc_session
 from ...services.admin_auth_service import AdminAction, get_admin_auth_service
 from ...services.npc_service import npc_service
 from ...structured_logging.enhanced_logging_config import get_logger
-from .npc_router_core import npc_router, validate_admin_permission
+from .npc_router_core import npc_router, publish_npc_cache_invalidation, validate_admin_permission
 from .npc_schemas import (
     NPCDefinitionCreate,
     NPCDefinitionResponse,
@@ -62,6 +63,7 @@ async def _update_npc_definition_internal(
                 definition_id=definition_id,
             )
         await session.commit()
+        publish_npc_cache_invalidation(request, NPCDefinitionsChanged(definition_id=definition_id))
         return NPCDefinitionResponse.from_orm(definition)
     except HTTPException:
         raise
@@ -131,6 +133,7 @@ async def create_npc_definition(
             )
             break
         await npc_session.commit()  # pylint: disable=undefined-loop-variable
+        publish_npc_cache_invalidation(request, NPCDefinitionsChanged(definition_id=definition.id))
         return NPCDefinitionResponse.from_orm(definition)
     except HTTPException:
         raise
@@ -215,6 +218,7 @@ async def delete_npc_definition(
                 definition_id=definition_id,
             )
         await session.commit()
+        publish_npc_cache_invalidation(request, NPCDefinitionsChanged(definition_id=definition_id))
     except HTTPException:
         raise
     except Exception as e:  # pylint: disable=broad-exception-caught  # Reason: NPC deletion errors unpredictable
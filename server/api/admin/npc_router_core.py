@@ -7,6 +7,8 @@ imports submodules so "from server.api.admin.npc import npc_router" still works.
 
 from fastapi import APIRouter, Request
 
+from ...caching.cache_invalidation import publish_cache_invalidation
+from ...events.event_types import BaseEvent
 from ...models.user import User
 from ...services.admin_auth_service import AdminAction, get_admin_auth_service
 from ...structured_logging.enhanced_logging_config import get_logger
@@ -24,3 +26,9 @@ def validate_admin_permission(
     """Validate that the current user has admin permissions for the specified action."""
     auth_service = get_admin_auth_service()
     auth_service.validate_permission(current_user, action, request)
+
+
+def publish_npc_cache_invalidation(request: Request, event: BaseEvent) -> None:
+    """Publish an NPC cache invalidation event on the application's EventBus (if any)."""
+    container = getattr(request.app.state, "container", None)
+    publish_cache_invalidation(getattr(container, "event_bus", None), event)
@@ -9,12 +9,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...auth.users import get_current_user
 from ...database import get_async_session
+from ...events.event_types import NPCSpawnRulesChanged
 from ...exceptions import LoggedHTTPException
 from ...models.user import User
 from ...services.admin_auth_service import AdminAction, get_admin_auth_service
 from ...services.npc_service import npc_service
 from ...structured_logging.enhanced_logging_config import get_logger
-from .npc_router_core import npc_router, validate_admin_permission
+from .npc_router_core import npc_router, publish_npc_cache_invalidation, validate_admin_permission
 from .npc_schemas import NPCSpawnRuleCreate, NPCSpawnRuleResponse
 
 logger = get_logger(__name__)
@@ -68,6 +69,7 @@ async def create_npc_spawn_rule(
             spawn_conditions=spawn_rule_data.spawn_conditions.model_dump(),
         )
         await session.commit()
+        publish_npc_cache_invalidation(request, NPCSpawnRulesChanged(rule_id=spawn_rule.id))
         return NPCSpawnRuleResponse.from_orm(spawn_rule)
     except HTTPException:
         raise
@@ -106,6 +108,7 @@ async def delete_npc_spawn_rule(
                 spawn_rule_id=spawn_rule_id,
             )
         await session.commit()
+        publish_npc_cache_invalidation(request, NPCSpawnRulesChanged(rule_id=spawn_rule_id))
     except HTTPException:
         raise
     except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904
@@ -29,7 +29,9 @@ from .monitoring_models import (
     AlertsResponse,
     CacheMetricsResponse,
     ConnectionHealthStatsResponse,
+    DatabasePoolMetricsResponse,
     DualConnectionStatsResponse,
+    EventBusDispatchMetricsResponse,
     EventBusMetricsResponse,
     IntegrityResponse,
     MemoryAlertsResponse,
@@ -95,6 +97,8 @@ async def validate_room_integrity(
 ) -> IntegrityResponse:
     """Validate room data integrity and return results."""
     try:
+        from ..persistence.repositories.player_repository_room import get_room_validation_stats
+
         monitor = get_movement_monitor()
 
         # Get all rooms from persistence
@@ -105,6 +109,8 @@ async def validate_room_integrity(
 
         result = monitor.validate_room_integrity(rooms)
         result["timestamp"] = result["timestamp"].isoformat()
+        # How often players had to be moved out of unknown rooms when loaded into memory
+        result["player_room_validation"] = get_room_validation_stats()
 
         return IntegrityResponse(**result)
     except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Integrity validation errors unpredictable, must create error context
@@ -366,6 +372,31 @@ async def get_eventbus_metrics(request: Request) -> EventBusMetricsResponse:
         ) from e
 
 
+@monitoring_router.get("/eventbus/dispatch", response_model=EventBusDispatchMetricsResponse)
+async def get_eventbus_dispatch_metrics(request: Request) -> EventBusDispatchMetricsResponse:
+    """
+    Get EventBus dispatch metrics: queue depth, lanes and per-subscriber latency.
+
+    - queue_depth / queue_high_watermark: events waiting (intake plus lane backlogs) against max_queue_size
+    - backpressure_warnings: times the queue crossed its high watermark
+    - lane_overflow_events / overloaded_events: events dropped because their lane (max_lane_backlog)
+      or the intake queue was full
+    - subscriber_latency: calls, errors, average and max handler time (ms) per subscriber
+    """
+    try:
+        event_bus = _resolve_event_bus_from_request(request)
+        return EventBusDispatchMetricsResponse(
+            **event_bus.get_dispatch_stats(),
+            timestamp=datetime.now(UTC).isoformat(),
+        )
+    except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: EventBus metrics errors unpredictable, must create error context
+        raise LoggedHTTPException(
+            status_code=500,
+            detail=f"Error retrieving EventBus dispatch metrics: {str(e)}",
+            operation="get_eventbus_dispatch_metrics",
+        ) from e
+
+
 def _resolve_cache_manager_from_request(request: Request) -> Any:
     """
     Resolve a CacheManager for routes that require it, preferring the container-managed
@@ -433,6 +464,37 @@ async def get_cache_metrics(request: Request) -> CacheMetricsResponse:
         ) from e
 
 
+@monitoring_router.get("/database-pool", response_model=DatabasePoolMetricsResponse)
+async def get_database_pool_metrics(
+    _request: Request, persistence: AsyncPersistenceLayer = AsyncPersistenceDep
+) -> DatabasePoolMetricsResponse:
+    """
+    Get database connection pool metrics.
+
+    - checkout_wait / checkout_hold: latency histograms (ms) for getting and holding a connection
+    - peak_in_use and recommended: pool_size/max_overflow derived from measured concurrency
+    - invalidations: connections discarded after an error (stale connections are detected on use)
+    - units_of_work: sessions requested per command/tick phase vs. the one connection each unit used
+    - player_loads: get_player_by_id loads served by a unit's identity map, coalesced, or batched
+    """
+    try:
+        from ..database_unit_of_work import get_unit_of_work_stats
+        from ..monitoring.database_pool_metrics import get_database_pool_metrics as get_pool_metrics
+
+        return DatabasePoolMetricsResponse(
+            **get_pool_metrics().get_stats(),
+            units_of_work=get_unit_of_work_stats(),
+            player_loads=persistence.get_player_loader_stats(),
+            timestamp=datetime.now(UTC).isoformat(),
+        )
+    except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Pool metrics errors unpredictable, must create error context
+        raise LoggedHTTPException(
+            status_code=500,
+            detail=f"Error retrieving database pool metrics: {str(e)}",
+            operation="get_database_pool_metrics",
+        ) from e
+
+
 def _resolve_task_registry() -> Any:
     """
     Resolve a TaskRegistry for routes that require it.
@@ -46,6 +46,7 @@ class IntegrityResponse(BaseModel):
     total_players: int
     avg_occupancy: float
     max_occupancy: int
+    player_room_validation: dict[str, int] = {}
     timestamp: str
 
 
@@ -136,6 +137,39 @@ class CacheMetricsResponse(BaseModel):
     timestamp: str
 
 
+class EventBusDispatchMetricsResponse(BaseModel):
+    """Response model for EventBus dispatch queue, lane and subscriber latency metrics."""
+
+    queue_depth: int
+    intake_depth: int
+    lane_backlog: int
+    max_queue_size: int
+    queue_high_watermark: int
+    backpressure_warnings: int
+    max_lane_backlog: int
+    lane_overflow_events: int
+    overloaded_events: int
+    active_lanes: int
+    lanes_started: int
+    subscriber_latency: dict[str, dict[str, float | int]]
+    timestamp: str
+
+
+class DatabasePoolMetricsResponse(BaseModel):
+    """Response model for database connection pool metrics."""
+
+    checkout_wait: dict[str, Any]
+    checkout_hold: dict[str, Any]
+    in_use: int
+    peak_in_use: int
+    checkout_timeouts: int
+    invalidations: int
+    recommended: dict[str, int]
+    units_of_work: dict[str, dict[str, float]] = {}
+    player_loads: dict[str, float] = {}
+    timestamp: str
+
+
 class TaskMetricsResponse(BaseModel):
     """Response model for TaskRegistry metrics."""
 
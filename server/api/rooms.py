@@ -14,8 +14,10 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..auth.users import get_current_user
+from ..caching.cache_invalidation import publish_cache_invalidation
 from ..database import get_async_session
 from ..dependencies import AsyncPersistenceDep, ExplorationServiceDep, RoomServiceDep
+from ..events.event_types import RoomDefinitionChanged
 from ..exceptions import LoggedHTTPException
 from ..game.room_service import RoomService
 from ..models.user import User
@@ -124,10 +126,13 @@ async def _update_room_position_in_db(
     await session.commit()
 
 
-async def _invalidate_room_cache(room_service: RoomService, room_id: str) -> None:
-    """Invalidate room cache to force reload."""
+async def _invalidate_room_cache(room_service: RoomService, room_id: str, request: Request | None = None) -> None:
+    """Invalidate room cache to force reload, and tell every other room cache (and instance) via the EventBus."""
     if room_service.room_cache:
         room_service.room_cache.invalidate_room(room_id)
+    if request is not None:
+        container = getattr(request.app.state, "container", None)
+        publish_cache_invalidation(getattr(container, "event_bus", None), RoomDefinitionChanged(room_id=room_id))
 
 
 # IMPORTANT: /list route must come BEFORE /{room_id} route
@@ -268,7 +273,7 @@ async def update_room_position(  # pylint: disable=too-many-arguments,too-many-p
         )
 
         # Invalidate room cache
-        await _invalidate_room_cache(room_service, room_id)
+        await _invalidate_room_cache(room_service, room_id, _request)
 
         return RoomPositionUpdateResponse(
             room_id=room_id,
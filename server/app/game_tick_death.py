@@ -19,9 +19,7 @@ from ..utils.int_coercion import coerce_int
 from .game_tick_protocols import (
     _app_container,
     _online_player_ids,
-    _tick_online_players,
     _TickContainer,
-    _TickMpRegen,
 )
 
 logger = get_logger("server.game_tick")
@@ -38,7 +36,6 @@ __all__ = [
     "_process_mp_regeneration",
     "_process_passive_lucidity_flux",
     "_process_session_dp_decay_and_death",
-    "_process_single_player_mp_regeneration",
     "_validate_mp_regeneration_services",
     "process_dp_decay_and_death",
 ]
@@ -180,26 +177,6 @@ def _validate_mp_regeneration_services(container: _TickContainer) -> bool:
     return container.mp_regeneration_service is not None and container.connection_manager is not None
 
 
-async def _process_single_player_mp_regeneration(mp_service: _TickMpRegen, player_id_str: str) -> bool:
-    """
-    Process MP regeneration for a single player.
-
-    Args:
-        mp_service: MP regeneration service instance
-        player_id_str: Player ID as string
-
-    Returns:
-        True if MP was restored, False otherwise
-    """
-    try:
-        player_uuid = uuid.UUID(player_id_str)
-        result = await mp_service.process_tick_regeneration(player_uuid)
-        return coerce_int(result.get("mp_restored", 0), default=0) > 0
-    except (ValueError, AttributeError, TypeError) as e:
-        logger.warning("Error processing MP regeneration for player", player_id=player_id_str, error=str(e))
-        return False
-
-
 async def _process_mp_regeneration(container: _TickContainer, _session: AsyncSession, tick_count: int) -> None:
     """Process MP regeneration for online players."""
     if not _validate_mp_regeneration_services(container) or not container.connection_manager:
@@ -210,12 +187,9 @@ async def _process_mp_regeneration(container: _TickContainer, _session: AsyncSes
         if not mp_service:
             return
 
-        await _tick_online_players(
-            _online_player_ids(container),
-            tick_count,
-            "Processed MP regeneration",
-            lambda player_id_str: _process_single_player_mp_regeneration(mp_service, player_id_str),
-        )
+        processed_count = await mp_service.process_online_tick(_online_player_ids(container), tick_count)
+        if processed_count > 0:
+            logger.debug("Processed MP regeneration", tick_count=tick_count, players_processed=processed_count)
     except (AttributeError, KeyError, TypeError, ValueError, RuntimeError) as mp_regen_error:
         logger.error("Error processing MP regeneration", tick_count=tick_count, error=str(mp_regen_error))
 
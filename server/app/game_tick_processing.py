@@ -29,7 +29,6 @@ from .game_tick_death import (
     _process_mortally_wounded_player,
     _process_mp_regeneration,
     _process_passive_lucidity_flux,
-    _process_single_player_mp_regeneration,
     _validate_mp_regeneration_services,
     process_dp_decay_and_death,
 )
@@ -60,7 +59,6 @@ __all__ = [
     "_process_mp_regeneration",
     "_process_passive_lucidity_flux",
     "_process_single_effect",
-    "_process_single_player_mp_regeneration",
     "_update_player_status_effects",
     "_validate_and_get_player",
     "_validate_app_state_for_status_effects",
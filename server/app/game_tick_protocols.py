@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, Protocol, cast
 
 from fastapi import FastAPI
@@ -80,7 +80,7 @@ class _TickEventBus(Protocol):
 
 
 class _TickMpRegen(Protocol):
-    async def process_tick_regeneration(self, player_id: uuid.UUID) -> Mapping[str, object]: ...
+    async def process_online_tick(self, online_player_ids: Iterable[uuid.UUID], tick_count: int) -> int: ...
 
 
 class _TickNpcLifecycle(Protocol):
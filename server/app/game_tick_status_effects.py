@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
 
+from ..database_unit_of_work import unit_of_work
+from ..exceptions import DatabaseError
 from ..realtime.login_grace_period import handle_login_grace_period_expiration, is_player_in_login_grace_period
 from ..structured_logging.enhanced_logging_config import get_logger
 from ..utils.int_coercion import coerce_int
@@ -262,9 +264,10 @@ async def process_player_effects_expiration(app: FastAPI, tick_count: int) -> No
         return
 
     try:
-        expired = await container.async_persistence.expire_player_effects_for_tick(tick_count)
-        await _handle_login_warded_expirations(expired, container.connection_manager)
-    except (AttributeError, KeyError, TypeError, ValueError, RuntimeError) as e:
+        async with unit_of_work("tick.player_effects_expiration"):
+            expired = await container.async_persistence.expire_player_effects_for_tick(tick_count)
+            await _handle_login_warded_expirations(expired, container.connection_manager)
+    except (AttributeError, KeyError, TypeError, ValueError, RuntimeError, DatabaseError) as e:
         logger.warning(
             "Error processing player effects expiration",
             tick_count=tick_count,
@@ -279,11 +282,17 @@ async def process_status_effects(app: FastAPI, tick_count: int) -> None:
         return
 
     try:
-        await _tick_online_players(
-            _online_player_ids(container),
-            tick_count,
-            "Processed status effects",
-            lambda player_id_str: _process_player_status_effects(app, container, player_id_str),
-        )
-    except (AttributeError, KeyError, TypeError, ValueError, RuntimeError) as e:
+        online_player_ids = _online_player_ids(container)
+        # One session and one commit for all online players' effect updates
+        async with unit_of_work("tick.status_effects"):
+            if container.async_persistence and online_player_ids:
+                # One query for every online player; the per-player loads below hit the unit's identity map
+                _ = await container.async_persistence.get_players_batch(online_player_ids)
+            await _tick_online_players(
+                online_player_ids,
+                tick_count,
+                "Processed status effects",
+                lambda player_id_str: _process_player_status_effects(app, container, player_id_str),
+            )
+    except (AttributeError, KeyError, TypeError, ValueError, RuntimeError, DatabaseError) as e:
         logger.warning("Error processing status/effect ticks", tick_count=tick_count, error=str(e))
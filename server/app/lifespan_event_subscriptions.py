@@ -36,6 +36,18 @@ def subscribe_room_occupants_refresh(container: ApplicationContainer) -> None:
     logger.debug("Subscribed to RoomOccupantsRefreshRequested for Occupants panel updates")
 
 
+def subscribe_room_target_index(container: ApplicationContainer) -> None:
+    """Keep the room target index (used by target resolution) in step with room occupancy events."""
+    if not container.event_bus:
+        return
+
+    from server.services.room_target_index import room_target_index
+
+    # The index outlives app instances (tests start several); start from empty rooms
+    room_target_index.clear()
+    room_target_index.subscribe(container.event_bus)
+
+
 def subscribe_quest_events(container: ApplicationContainer) -> None:
     """Subscribe to room events for quest triggers and progress (start on enter, complete_activity on exit)."""
     from server.game.quest.quest_events import subscribe_quest_events as _subscribe_room_quest_events
@@ -15,6 +15,7 @@ from ..events.event_bus import EventBus
 from ..realtime.connection_manager import ConnectionManager
 from ..realtime.memory_monitor import MemoryMonitor
 from ..realtime.nats_message_handler import NATSMessageHandler
+from ..services.user_manager import UserManager
 from ..time.tick_scheduler import MythosTickScheduler
 
 T = TypeVar("T")
@@ -113,6 +114,11 @@ def lifespan_event_bus(container: ApplicationContainer) -> EventBus | None:
     return _resolve_container_field(container, "event_bus", EventBus)
 
 
+def lifespan_user_manager(container: ApplicationContainer) -> UserManager | None:
+    """Return the user manager from the application container."""
+    return _resolve_container_field(container, "user_manager", UserManager)
+
+
 def nats_is_connected(nats_service: object) -> bool:
     """Return True when nats_service exposes is_connected() and it is true."""
     checker = getattr(nats_service, "is_connected", None)
@@ -5,6 +5,7 @@ This module handles graceful shutdown of all services in the MythosMUD server.
 
 from fastapi import FastAPI
 
+from ..auth.argon2_pool import shutdown_password_hashing_pool
 from ..container import ApplicationContainer
 from ..structured_logging.enhanced_logging_config import get_logger
 from ..time.time_service import get_mythos_chronicle
@@ -15,6 +16,7 @@ from .lifespan_protocols import (
     lifespan_nats_handler,
     lifespan_task_registry,
     lifespan_tick_scheduler,
+    lifespan_user_manager,
 )
 
 logger = get_logger("server.lifespan.shutdown")
@@ -68,6 +70,12 @@ async def _shutdown_connection_manager(app: FastAPI) -> None:
     except (AttributeError, KeyError, TypeError, ValueError, RuntimeError) as e:
         logger.error("Error stopping connection manager health checks", error=str(e))
 
+    logger.info("Stopping room occupant broadcasts")
+    try:
+        connection_manager.shutdown_room_event_handler()
+    except (AttributeError, TypeError, RuntimeError) as e:
+        logger.error("Error stopping room occupant broadcasts", error=str(e))
+
     logger.info("Cleaning up connection manager tasks")
     try:
         await connection_manager.force_cleanup()
@@ -88,6 +96,57 @@ async def _shutdown_mythos_tick_scheduler(app: FastAPI) -> None:
         logger.error("Error stopping Mythos tick scheduler", error=str(e))
 
 
+async def _shutdown_combat_dp_writes(app: FastAPI) -> None:
+    """Persist player DP changes still waiting in the combat DP write pipeline."""
+    combat_service = getattr(app.state, "combat_service", None)
+    if not combat_service:
+        return
+
+    logger.info("Flushing pending combat DP writes")
+    try:
+        await combat_service.shutdown_dp_writes()
+    except (AttributeError, TypeError, ValueError, RuntimeError, OSError) as e:
+        logger.error("Error flushing combat DP writes", error=str(e))
+
+
+async def _shutdown_exploration_writes(container: ApplicationContainer) -> None:
+    """Write room discoveries still waiting for the next exploration flush."""
+    exploration_service = getattr(container, "exploration_service", None)
+    if not exploration_service:
+        return
+
+    logger.info("Flushing pending room discoveries")
+    try:
+        await exploration_service.shutdown()
+    except (AttributeError, TypeError, ValueError, RuntimeError, OSError) as e:
+        logger.error("Error flushing room discoveries", error=str(e))
+
+
+async def _shutdown_room_drops(app: FastAPI) -> None:
+    """Write the room drop snapshot if drops changed since it was last written."""
+    connection_manager = lifespan_connection_manager(app)
+    if not connection_manager:
+        return
+    room_drops = connection_manager.room_manager.room_drops
+    if room_drops.snapshot_path is None:
+        return
+
+    logger.info("Writing room drop snapshot")
+    try:
+        await room_drops.shutdown()
+    except (AttributeError, TypeError, ValueError, RuntimeError, OSError) as e:
+        logger.error("Error writing room drop snapshot", error=str(e))
+
+
+def _shutdown_password_hashing() -> None:
+    """Stop the Argon2 worker threads; hashes still queued are cancelled."""
+    logger.info("Shutting down password hashing pool")
+    try:
+        shutdown_password_hashing_pool()
+    except RuntimeError as e:
+        logger.error("Error shutting down password hashing pool", error=str(e))
+
+
 async def _shutdown_task_registry(container: ApplicationContainer) -> None:
     """Shutdown task registry if present."""
     task_registry = lifespan_task_registry(container)
@@ -105,6 +164,19 @@ async def _shutdown_task_registry(container: ApplicationContainer) -> None:
         logger.error("TaskRegistry shutdown coordination error", error=str(e))
 
 
+async def _shutdown_user_manager(container: ApplicationContainer) -> None:
+    """Persist pending mute index changes."""
+    user_manager = lifespan_user_manager(container)
+    if not user_manager:
+        return
+
+    logger.info("Flushing mute index")
+    try:
+        await user_manager.shutdown()
+    except (AttributeError, TypeError, ValueError, RuntimeError, OSError) as e:
+        logger.error("Error flushing mute index", error=str(e))
+
+
 async def _shutdown_event_bus(container: ApplicationContainer) -> None:
     """Shutdown event bus and clean up all service subscriptions."""
     event_bus = lifespan_event_bus(container)
@@ -132,7 +204,12 @@ async def shutdown_services(app: FastAPI, container: ApplicationContainer) -> No
     await _shutdown_nats_handler(app)
     await _shutdown_connection_manager(app)
     await _shutdown_mythos_tick_scheduler(app)
+    await _shutdown_combat_dp_writes(app)
+    await _shutdown_exploration_writes(container)
+    await _shutdown_room_drops(app)
+    _shutdown_password_hashing()
     await _shutdown_task_registry(container)
+    await _shutdown_user_manager(container)
     await _shutdown_event_bus(container)
 
     logger.info("Shutting down ApplicationContainer")
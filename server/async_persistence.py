@@ -26,6 +26,7 @@ from .models.player import Player
 from .models.profession import Profession
 from .models.user import User
 from .persistence.container_create_params import ContainerCreateParams
+from .persistence.player_loader import PlayerLoader
 from .persistence.protocols import PlayerRepositoryProtocol, RoomRepositoryProtocol
 from .persistence.repositories import (
     ContainerRepository,
@@ -41,6 +42,7 @@ from .structured_logging.enhanced_logging_config import get_logger
 
 if TYPE_CHECKING:
     from .models.room import Room
+    from .persistence.repositories.health_repository import PlayerMPRow
 
 logger = get_logger(__name__)
 
@@ -85,7 +87,7 @@ class AsyncPersistenceLayer:  # pylint: disable=too-many-instance-attributes  #
         self._event_bus = event_bus
         self._logger = get_logger(__name__)
         self._room_cache: dict[str, Room] = {}
-        self._room_mappings: dict[str, Any] = {}
+        self._room_mappings: dict[str, uuid.UUID] = {}
         self._room_cache_loaded: bool = False
         self._room_cache_loading: asyncio.Lock | None = None  # Will be created on first async access
         # Don't load room cache during __init__ - use lazy loading instead
@@ -105,6 +107,8 @@ class AsyncPersistenceLayer:  # pylint: disable=too-many-instance-attributes  #
         self._player_effect_repo = PlayerEffectRepository()
         self._instance_manager: Any = None
         self._room_loader = RoomCacheLoader(self._room_cache, self._room_mappings, self._logger, event_bus)
+        # Coalesces concurrent get_player_by_id calls; resolves the repository per batch so it can be swapped
+        self._player_loader = PlayerLoader(lambda: self._player_repo)
 
     def set_instance_manager(self, instance_manager: Any) -> None:
         """Set the instance manager for instanced room lookup (instance-first)."""
@@ -233,10 +237,32 @@ class AsyncPersistenceLayer:  # pylint: disable=too-many-instance-attributes  #
         return await self._player_repo.get_player_by_name(name)
 
     async def get_player_by_id(self, player_id: uuid.UUID) -> Player | None:
-        """Get a player by ID. Delegates to PlayerRepository."""
-        # Ensure room cache is loaded before validation (validate_and_fix_player_room checks cache)
+        """
+        Get a player by ID. Delegates to PlayerRepository through the PlayerLoader.
+
+        Calls made in the same event-loop iteration share one batch query, and
+        inside a unit of work the same player object is returned for the rest
+        of the unit. Hot read: no room validation and no room cache check
+        (rooms are validated by validate_player_room when the player is
+        loaded into memory).
+        """
+        return await self._player_loader.load(player_id)
+
+    async def validate_player_room(self, player: Player) -> bool:
+        """
+        Validate the player's room against the room cache, persisting any fix.
+
+        Called when a player is loaded into memory (websocket connect).
+
+        Returns:
+            bool: True if the player was moved out of an unknown room
+        """
         await self._ensure_room_cache_loaded()
-        return await self._player_repo.get_player_by_id(player_id)
+        return await self._player_repo.validate_player_room(player)
+
+    def get_player_loader_stats(self) -> dict[str, Any]:
+        """Batching and identity map statistics for get_player_by_id (reported by /monitoring/database-pool)."""
+        return self._player_loader.get_stats()
 
     async def get_players_by_user_id(self, user_id: str) -> list[Player]:
         """Get all players (including deleted) for a user ID. Delegates to PlayerRepository."""
@@ -258,6 +284,7 @@ class AsyncPersistenceLayer:  # pylint: disable=too-many-instance-attributes  #
 
     async def soft_delete_player(self, player_id: uuid.UUID) -> bool:
         """Soft delete a player (sets is_deleted=True). Delegates to PlayerRepository."""
+        self._player_loader.forget(player_id)
         return await self._player_repo.soft_delete_player(player_id)
 
     async def get_user_by_username_case_insensitive(self, username: str) -> User | None:
@@ -270,14 +297,21 @@ class AsyncPersistenceLayer:  # pylint: disable=too-many-instance-attributes  #
 
     async def save_player(self, player: Player) -> None:
         """Save a player. Delegates to PlayerRepository."""
-        return await self._player_repo.save_player(player)
+        await self._player_repo.save_player(player)
+        self._player_loader.remember(player)
 
     async def list_players(self) -> list[Player]:
-        """List all players. Delegates to PlayerRepository."""
-        # Ensure room cache is loaded before validation (validate_and_fix_player_room checks cache)
-        await self._ensure_room_cache_loaded()
+        """List all players. Delegates to PlayerRepository (hot read, no room validation)."""
         return await self._player_repo.list_players()
 
+    def get_room_uuid(self, stable_id: str) -> uuid.UUID | None:
+        """
+        Get a room's database UUID by stable_id from the room cache.
+
+        Returns None for unknown rooms and before the room cache has loaded.
+        """
+        return self._room_mappings.get(stable_id)
+
     def get_room_by_id(self, room_id: str) -> "Room | None":
         """
         Get a room by ID. Checks instance manager first, then cache.
@@ -324,9 +358,7 @@ class AsyncPersistenceLayer:  # pylint: disable=too-many-instance-attributes  #
         return self._room_repo.list_rooms()
 
     async def get_players_in_room(self, room_id: str) -> list[Player]:
-        """Get all players in a specific room. Delegates to PlayerRepository."""
-        # Ensure room cache is loaded before validation (validate_and_fix_player_room checks cache)
-        await self._ensure_room_cache_loaded()
+        """Get all players in a specific room. Delegates to PlayerRepository (hot read, no room validation)."""
         return await self._player_repo.get_players_in_room(room_id)
 
     async def get_players_batch(self, player_ids: list[uuid.UUID]) -> dict[uuid.UUID, Player]:
@@ -342,14 +374,17 @@ class AsyncPersistenceLayer:  # pylint: disable=too-many-instance-attributes  #
         Returns:
             dict: Mapping of player_id (as UUID) to Player object (only includes found players)
         """
-        # Ensure room cache is loaded before validation (validate_and_fix_player_room checks cache)
-        await self._ensure_room_cache_loaded()
+        # Hot read: no room validation (see validate_player_room)
         if not player_ids:
             return {}
 
         # Use repository batch method which uses single query with IN clause
         players_list = await self._player_repo.get_players_batch(player_ids)
 
+        # Inside a unit of work, later get_player_by_id calls for these players reuse the objects
+        for player in players_list:
+            self._player_loader.remember(player)
+
         # Convert list to dict keyed by UUID (Player.player_id is str type, convert to UUID for dict key)
         return {uuid.UUID(player.player_id): player for player in players_list}
 
@@ -359,6 +394,7 @@ class AsyncPersistenceLayer:  # pylint: disable=too-many-instance-attributes  #
 
     async def delete_player(self, player_id: uuid.UUID) -> bool:
         """Delete a player. Delegates to PlayerRepository."""
+        self._player_loader.forget(player_id)
         return await self._player_repo.delete_player(player_id)
 
     async def update_player_last_active(self, player_id: uuid.UUID, last_active: datetime | None = None) -> None:
@@ -421,6 +457,14 @@ class AsyncPersistenceLayer:  # pylint: disable=too-many-instance-attributes  #
         """Async alias for damage_player. Delegates to HealthRepository."""
         await self._health_repo.damage_player(player, amount, damage_type)
 
+    async def set_players_dp(self, dp_by_player: dict[uuid.UUID, int]) -> dict[uuid.UUID, tuple[str, int]]:
+        """Set current_dp for several players in one set_players_dp call. Delegates to HealthRepository."""
+        return await self._health_repo.set_players_dp(dp_by_player)
+
+    async def regenerate_players_mp(self, gains: dict[uuid.UUID, int]) -> dict[uuid.UUID, "PlayerMPRow"]:
+        """Add regenerated MP for several players in one call. Delegates to HealthRepository."""
+        return await self._health_repo.regenerate_players_mp(gains)
+
     # Player effects (ADR-009)
     async def add_player_effect(
         self,
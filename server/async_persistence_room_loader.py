@@ -6,6 +6,7 @@ Loads rooms from PostgreSQL via get_rooms_with_exits() and builds in-memory Room
 """
 
 import json
+import uuid
 from typing import Any, cast
 
 from sqlalchemy import text
@@ -43,6 +44,7 @@ class RoomCacheLoader:
                 result_container: dict[str, Any] = {"rooms": {}}
                 self._build_room_objects(room_data_list, exits_by_room, result_container)
                 self._apply_rooms_to_cache(result_container.get("rooms"))
+                self._apply_room_uuids(combined_rows)
                 self._log_room_cache_after_load()
             except (DatabaseError, OSError, RuntimeError, ConnectionError, TimeoutError, SQLAlchemyError) as e:
                 self._handle_room_load_error(e)
@@ -55,6 +57,20 @@ class RoomCacheLoader:
         else:
             self._room_cache.clear()
 
+    def _apply_room_uuids(self, combined_rows: list[dict[str, Any]]) -> None:
+        """Map each room's stable_id to its UUID so callers can skip the rooms table lookup."""
+        self._room_mappings.clear()
+        for row in combined_rows:
+            stable_id = row.get("stable_id")
+            room_uuid = row.get("room_uuid")
+            if not stable_id or not room_uuid:
+                continue
+            try:
+                # asyncpg returns pgproto.UUID objects; normalize to uuid.UUID
+                self._room_mappings[str(stable_id)] = uuid.UUID(str(room_uuid))
+            except ValueError:
+                self._logger.warning("Room has an invalid UUID", stable_id=stable_id, room_uuid=str(room_uuid))
+
     def _log_room_cache_after_load(self) -> None:
         self._logger.info(
             "Loaded rooms into cache from PostgreSQL database",
@@ -0,0 +1,198 @@
+"""
+Off-loop Argon2 hashing with admission control.
+
+Argon2id is deliberately slow and memory-hard (64MB and tens of milliseconds per
+hash at the defaults). Run on the event loop, every login stalls every websocket
+on the instance for that long. This module runs hash/verify on a bounded thread
+pool instead (argon2-cffi releases the GIL while hashing, so threads run in
+parallel without pickling passwords to another process). The number of hashes
+that may run at once is sized from available memory, so a login burst cannot
+make the server swap; a bounded number more may wait, and anything past that is
+refused at once with PasswordHashingBusyError for the client to retry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from ..exceptions import RateLimitError
+from ..structured_logging.enhanced_logging_config import get_logger
+from . import argon2_utils
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Hashes allowed to wait for a worker before new ones are refused; override with ARGON2_MAX_QUEUED
+MAX_QUEUED = int(os.getenv("ARGON2_MAX_QUEUED", "32"))
+# Optional fixed worker count; by default it is sized from available memory (ARGON2_MAX_WORKERS)
+MAX_WORKERS = int(os.getenv("ARGON2_MAX_WORKERS", "0"))
+# Share of currently available memory that concurrent Argon2 hashes may use
+MEMORY_BUDGET_FRACTION = 0.25
+# Seconds a refused client is told to wait before retrying
+RETRY_AFTER_SECONDS = 1
+
+
+class PasswordHashingBusyError(RateLimitError):
+    """Raised when the password hashing pool and its queue are full; the client should retry shortly."""
+
+    def __init__(self, message: str = "Password hashing is busy, try again shortly") -> None:
+        super().__init__(
+            message,
+            limit_type="password_hashing",
+            retry_after=RETRY_AFTER_SECONDS,
+            user_friendly="The server is busy, please try again in a moment",
+            # The pool logs the refusal with its occupancy
+            skip_log=True,
+        )
+
+
+def _available_memory_bytes() -> int | None:
+    """Memory currently available to the process, or None where the platform does not report it."""
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        # Windows/macOS builds without these sysconf names: fall back to CPU count alone
+        return None
+
+
+def memory_bounded_workers(memory_cost_kib: int, available_bytes: int | None = None, cpus: int | None = None) -> int:
+    """
+    Number of Argon2 hashes that may run at once.
+
+    Each hash allocates memory_cost_kib; concurrent hashes may use MEMORY_BUDGET_FRACTION
+    of available memory, and never more than there are CPUs to run them on.
+
+    Args:
+        memory_cost_kib: Argon2 memory cost per hash, in KiB
+        available_bytes: Available memory (default: read from the OS)
+        cpus: CPU count (default: os.cpu_count())
+    """
+    limit = cpus or os.cpu_count() or 1
+    available = available_bytes if available_bytes is not None else _available_memory_bytes()
+    if available is not None:
+        limit = min(limit, int(available * MEMORY_BUDGET_FRACTION) // (memory_cost_kib * 1024))
+    return max(1, limit)
+
+
+class PasswordHashingPool:
+    """
+    Bounded worker pool for Argon2 hash/verify with a capped wait queue.
+
+    The executor's worker count is the concurrency limit; admission is counted on
+    the event loop, so a request that would exceed workers + max_queued fails
+    immediately instead of waiting behind a login storm.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_queued: int = MAX_QUEUED) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Hashes run at once (default: ARGON2_MAX_WORKERS, else sized from memory)
+            max_queued: Hashes allowed to wait for a worker before new ones are refused
+        """
+        self._max_workers = max_workers or MAX_WORKERS or memory_bounded_workers(argon2_utils.MEMORY_COST)
+        self._max_admitted = self._max_workers + max(0, max_queued)
+        self._admitted = 0
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="argon2")
+        logger.info("Password hashing pool created", max_workers=self._max_workers, max_queued=max_queued)
+
+    @property
+    def max_workers(self) -> int:
+        """Hashes that may run at once."""
+        return self._max_workers
+
+    @property
+    def admitted(self) -> int:
+        """Hashes running or waiting for a worker."""
+        return self._admitted
+
+    async def _run(self, func: Callable[..., T], *args: str) -> T:
+        if self._admitted >= self._max_admitted:
+            logger.warning("Password hashing pool full, refusing request", admitted=self._admitted)
+            raise PasswordHashingBusyError()
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(func, *args)
+        self._admitted += 1
+        # Release the slot when the worker is done, not when the awaiting request is: a
+        # cancelled login leaves its hash running, and that memory is still in use
+        future.add_done_callback(lambda _: self._release(loop))
+        return await asyncio.wrap_future(future)
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            loop.call_soon_threadsafe(self._decrement)
+        except RuntimeError:
+            # Loop already closed (shutdown); nothing is left to admit on it
+            pass
+
+    def _decrement(self) -> None:
+        self._admitted -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash password with argon2_utils.hash_password on a worker thread."""
+        return await self._run(argon2_utils.hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        """Verify password with argon2_utils.verify_password on a worker thread."""
+        return await self._run(argon2_utils.verify_password, password, hashed)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once running hashes finish; queued ones are cancelled."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: PasswordHashingPool | None = None  # pylint: disable=invalid-name  # Reason: Private module-level singleton, intentionally uses _ prefix
+
+
+def get_password_hashing_pool() -> PasswordHashingPool:
+    """Return the process-wide hashing pool, creating it on first use."""
+    global _pool  # pylint: disable=global-statement  # Reason: Lazily created singleton so importing auth does not start threads
+    if _pool is None:
+        _pool = PasswordHashingPool()
+    return _pool
+
+
+def shutdown_password_hashing_pool() -> None:
+    """Shut down the process-wide hashing pool if it was ever created (called on server shutdown)."""
+    global _pool  # pylint: disable=global-statement  # Reason: Lazily created singleton is released so a restart in-process gets a fresh pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password off the event loop.
+
+    Raises:
+        PasswordHashingBusyError: If the pool and its queue are full
+        AuthenticationError: As argon2_utils.hash_password
+    """
+    return await get_password_hashing_pool().hash(password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """
+    Verify a password against an Argon2 hash off the event loop.
+
+    Raises:
+        PasswordHashingBusyError: If the pool and its queue are full
+    """
+    return await get_password_hashing_pool().verify(password, hashed)
+
+
+__all__ = [
+    "PasswordHashingBusyError",
+    "PasswordHashingPool",
+    "get_password_hashing_pool",
+    "hash_password_async",
+    "memory_bounded_workers",
+    "shutdown_password_hashing_pool",
+    "verify_password_async",
+]
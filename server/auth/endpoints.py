@@ -26,6 +26,7 @@ from ..models.user import User
 from ..schemas.auth import InviteRead
 from ..schemas.players import CharacterInfo
 from ..structured_logging.enhanced_logging_config import get_logger
+from .argon2_pool import PasswordHashingBusyError, hash_password_async
 from .dependencies import get_current_active_user, get_current_superuser
 from .invites import InviteManager, get_invite_manager
 from .token_epoch import get_auth_epoch
@@ -161,14 +162,10 @@ async def _check_username_exists(session: AsyncSession, username: str, _request:
         )
 
 
-def _create_user_object(user_create_clean: UserCreate) -> User:
+def _create_user_object(user_create_clean: UserCreate, hashed_password: str) -> User:
     """Create and configure a new User object."""
     from datetime import UTC, datetime
 
-    from .argon2_utils import hash_password
-
-    hashed_password = hash_password(user_create_clean.password)
-
     user = User()
     user.username = user_create_clean.username
     user.display_name = user_create_clean.username
@@ -297,7 +294,8 @@ async def register_user(
     try:
         await _check_username_exists(session, user_create_clean.username, request)
 
-        user = _create_user_object(user_create_clean)
+        hashed_password = await hash_password_async(user_create_clean.password)
+        user = _create_user_object(user_create_clean, hashed_password)
 
         session.add(user)
         await session.commit()
@@ -307,6 +305,8 @@ async def register_user(
 
     except LoggedHTTPException:
         raise
+    except PasswordHashingBusyError as e:
+        raise _hashing_busy_exc(e, user_create_clean.username, "register_user") from None
     except IntegrityError as e:
         _handle_integrity_error(e, user_create_clean.username, request)
     except HTTPException:
@@ -366,6 +366,13 @@ def _invalid_credentials_exc(username: str, **context: str) -> LoggedHTTPExcepti
     )
 
 
+def _hashing_busy_exc(error: PasswordHashingBusyError, username: str, operation: str) -> LoggedHTTPException:
+    """Build a 503 with Retry-After for a request refused by the password hashing pool."""
+    exc = LoggedHTTPException(status_code=503, detail=error.user_friendly, operation=operation, username=username)
+    exc.headers = {"Retry-After": str(error.retry_after)}
+    return exc
+
+
 async def _authenticate_user_credentials(
     user: User, password: str, username: str, user_manager: UserManager, _http_request: Request
 ) -> None:
@@ -398,6 +405,8 @@ async def _authenticate_user_credentials(
             )
     except (LoggedHTTPException, HTTPException):
         raise
+    except PasswordHashingBusyError as e:
+        raise _hashing_busy_exc(e, username, "login_user") from None
     except Exception as e:
         logger.error("Authentication failed", error=str(e), error_type=type(e).__name__)
         raise _invalid_credentials_exc(username, error=str(e)) from None
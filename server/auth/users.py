@@ -8,16 +8,18 @@ for user authentication and management.
 import os
 import uuid
 from collections.abc import AsyncGenerator
-from typing import Annotated, override
+from typing import Annotated, Any, cast, override
 
 from fastapi import Depends, HTTPException, Request
 from fastapi.params import Depends as DependsParam
-from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin, exceptions
 from fastapi_users.authentication import AuthenticationBackend, BearerTransport
 from fastapi_users.authentication.strategy.base import Strategy
 from fastapi_users.db import SQLAlchemyUserDatabase
 from fastapi_users.exceptions import InvalidID
 from fastapi_users.jwt import SecretType
+from fastapi_users.schemas import BaseUserCreate
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import Response
 
@@ -26,7 +28,8 @@ from server.auth.jwt_strategy import RestartInvalidatingJWTStrategy
 from ..database import get_async_session
 from ..models.user import User
 from ..structured_logging.enhanced_logging_config import get_logger
-from .argon2_utils import hash_password, verify_password
+from .argon2_pool import hash_password_async, verify_password_async
+from .argon2_utils import hash_password, needs_rehash, verify_password
 from .email_utils import is_bogus_email
 
 logger = get_logger(__name__)
@@ -68,6 +71,65 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         """Verify password using Argon2 instead of bcrypt."""
         return verify_password(plain_password, hashed_password)
 
+    @override
+    async def authenticate(self, credentials: OAuth2PasswordRequestForm) -> User | None:
+        """
+        Authenticate by email and password, verifying the Argon2 hash off the event loop.
+
+        Same contract as BaseUserManager.authenticate, whose password helper hashes
+        synchronously on the loop. Hashes made with outdated Argon2 parameters are
+        upgraded on successful login.
+
+        Raises:
+            PasswordHashingBusyError: If the hashing pool is full; the client should retry
+        """
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # Run the hasher anyway so unknown emails take as long as wrong passwords
+            await hash_password_async(credentials.password)
+            return None
+
+        if not await verify_password_async(credentials.password, user.hashed_password):
+            return None
+        if needs_rehash(user.hashed_password):
+            new_hash = await hash_password_async(credentials.password)
+            await self.user_db.update(user, {"hashed_password": new_hash})
+        return user
+
+    @override
+    async def create(self, user_create: object, safe: bool = False, request: Request | None = None) -> User:
+        """
+        Create a user, hashing the password on the hashing pool instead of the event loop.
+
+        Same steps as BaseUserManager.create, whose password helper hashes synchronously.
+
+        Raises:
+            UserAlreadyExists: If a user with the email already exists
+            PasswordHashingBusyError: If the hashing pool is full; the client should retry
+        """
+        create_schema = cast(BaseUserCreate, user_create)
+        await self.validate_password(create_schema.password, create_schema)
+        if await self.user_db.get_by_email(create_schema.email) is not None:
+            raise exceptions.UserAlreadyExists()
+
+        user_dict = create_schema.create_update_dict() if safe else create_schema.create_update_dict_superuser()
+        user_dict["hashed_password"] = await hash_password_async(user_dict.pop("password"))
+        created_user = await self.user_db.create(user_dict)
+        await self.on_after_register(created_user, request)
+        return created_user
+
+    @override
+    async def _update(self, user: User, update_dict: dict[str, Any]) -> User:
+        """Apply an update (PATCH /users, password reset), hashing a new password on the hashing pool."""
+        password = update_dict.get("password")
+        if password is None:
+            return await super()._update(user, update_dict)
+        await self.validate_password(password, user)
+        pooled_update = {field: value for field, value in update_dict.items() if field != "password"}
+        pooled_update["hashed_password"] = await hash_password_async(password)
+        return await super()._update(user, pooled_update)
+
     @override
     async def on_after_register(self, user: User, request: Request | None = None) -> None:
         """Handle post-registration logic."""
@@ -5,17 +5,21 @@ This module provides comprehensive caching functionality including LRU caches
 for room data, NPC definitions, and profession data to improve performance.
 """
 
+from .async_cache import AsyncLRUCache
+from .cache_invalidation import CacheInvalidationListener, publish_cache_invalidation
 from .cache_service import (
     CacheService,
     NPCCacheService,
     ProfessionCacheService,
     RoomCacheService,
     cached,
+    make_cache_key,
 )
 from .lru_cache import CacheManager, LRUCache, get_cache_manager, reset_cache_manager
 
 __all__ = [
     "LRUCache",
+    "AsyncLRUCache",
     "CacheManager",
     "get_cache_manager",
     "reset_cache_manager",
@@ -24,4 +28,7 @@ __all__ = [
     "NPCCacheService",
     "ProfessionCacheService",
     "cached",
+    "make_cache_key",
+    "CacheInvalidationListener",
+    "publish_cache_invalidation",
 ]
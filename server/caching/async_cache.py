@@ -0,0 +1,380 @@
+"""
+Asyncio-native LRU/TTL cache for MythosMUD server.
+
+This module provides an LRU cache intended for use from the event loop. Unlike
+``LRUCache`` it takes no locks (all access happens on one loop), expires entries
+lazily on read plus through coarse time buckets on write (O(1) amortized instead
+of a full scan), coalesces concurrent misses for the same key into a single load
+(single-flight), and can cache negative results so repeated lookups for missing
+data do not hit the database.
+"""
+
+# pylint: disable=too-many-instance-attributes  # Reason: Cache keeps configuration, storage, expiry buckets, in-flight loads and metrics counters; splitting them would scatter tightly coupled state
+
+import asyncio
+import heapq
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, cast
+
+from ..structured_logging.enhanced_logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Marker stored in place of a value when a loader returned None and negative caching is enabled
+_NEGATIVE: Any = object()
+
+
+class AsyncLRUCache[K: Hashable, V]:
+    """
+    Event-loop LRU cache with bucketed TTL expiry and single-flight loading.
+
+    Entries are stored as ``(value, deadline)`` in an ``OrderedDict`` kept in
+    recency order. Each deadline is also registered in a time bucket of width
+    ``bucket_seconds``; when a write happens, buckets whose time has fully
+    passed are drained, so expired data is reclaimed without scanning the
+    whole cache. Reads check the entry deadline directly (lazy expiry).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: float | None = None,
+        negative_ttl_seconds: float | None = None,
+        bucket_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the async cache.
+
+        Args:
+            max_size: Maximum number of entries (positive and negative) to keep
+            ttl_seconds: Time-to-live for loaded values (None for no expiration)
+            negative_ttl_seconds: Time-to-live for cached misses (None disables negative caching)
+            bucket_seconds: Width of the expiry buckets used for proactive cleanup
+            clock: Monotonic clock used for deadlines (injectable for tests)
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.bucket_seconds = bucket_seconds
+        self._clock = clock
+        self._cache: OrderedDict[K, tuple[Any, float | None]] = OrderedDict()
+        self._buckets: dict[int, set[K]] = {}
+        self._bucket_heap: list[int] = []
+        self._inflight: dict[K, asyncio.Future[Any]] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._negative_hits = 0
+        self._evictions = 0
+        self._expired_count = 0
+        self._loads = 0
+        self._load_failures = 0
+        self._coalesced_loads = 0
+        self._load_time_total = 0.0
+        self._load_time_max = 0.0
+
+        logger.info(
+            "Async LRU cache initialized",
+            max_size=max_size,
+            ttl_seconds=ttl_seconds,
+            negative_ttl_seconds=negative_ttl_seconds,
+        )
+
+    # --- expiry bookkeeping -------------------------------------------------
+
+    def _bucket_for(self, deadline: float) -> int:
+        return int(deadline // self.bucket_seconds)
+
+    def _track_deadline(self, key: K, deadline: float | None) -> None:
+        if deadline is None:
+            return
+        bucket = self._bucket_for(deadline)
+        keys = self._buckets.get(bucket)
+        if keys is None:
+            keys = set()
+            self._buckets[bucket] = keys
+            heapq.heappush(self._bucket_heap, bucket)
+        keys.add(key)
+
+    def _untrack_deadline(self, key: K, deadline: float | None) -> None:
+        if deadline is None:
+            return
+        keys = self._buckets.get(self._bucket_for(deadline))
+        if keys is not None:
+            keys.discard(key)
+
+    def _expire_due_buckets(self, now: float) -> int:
+        """Drain every bucket whose time window has fully elapsed."""
+        current_bucket = self._bucket_for(now)
+        removed = 0
+        while self._bucket_heap and self._bucket_heap[0] < current_bucket:
+            bucket = heapq.heappop(self._bucket_heap)
+            for key in self._buckets.pop(bucket, ()):
+                entry = self._cache.get(key)
+                if entry is not None and entry[1] is not None and entry[1] <= now:
+                    del self._cache[key]
+                    removed += 1
+        self._expired_count += removed
+        return removed
+
+    def _store(self, key: K, value: Any, ttl: float | None) -> None:
+        now = self._clock()
+        deadline = now + ttl if ttl is not None else None
+
+        existing = self._cache.get(key)
+        if existing is not None:
+            self._untrack_deadline(key, existing[1])
+            self._cache[key] = (value, deadline)
+            self._cache.move_to_end(key)
+            self._track_deadline(key, deadline)
+            return
+
+        self._expire_due_buckets(now)
+        if len(self._cache) >= self.max_size:
+            oldest_key, (_value, oldest_deadline) = self._cache.popitem(last=False)
+            self._untrack_deadline(oldest_key, oldest_deadline)
+            self._evictions += 1
+
+        self._cache[key] = (value, deadline)
+        self._track_deadline(key, deadline)
+
+    def _lookup(self, key: K) -> tuple[bool, Any]:
+        """Return ``(found, raw_value)`` applying lazy expiry and recency update."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return False, None
+        value, deadline = entry
+        if deadline is not None and deadline <= self._clock():
+            del self._cache[key]
+            self._untrack_deadline(key, deadline)
+            self._expired_count += 1
+            return False, None
+        self._cache.move_to_end(key)
+        return True, value
+
+    # --- public API ----------------------------------------------------------
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            The cached value, or None on a miss or a cached negative result
+        """
+        found, value = self._lookup(key)
+        if not found:
+            self._misses += 1
+            return None
+        if value is _NEGATIVE:
+            self._negative_hits += 1
+            return None
+        self._hits += 1
+        return cast(V, value)
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Store a value in the cache using the default TTL.
+
+        Args:
+            key: The key to store
+            value: The value to store
+        """
+        self._store(key, value, self.ttl_seconds)
+
+    def put_negative(self, key: K) -> None:
+        """
+        Record that ``key`` has no value, if negative caching is enabled.
+
+        Args:
+            key: The key that resolved to nothing
+        """
+        if self.negative_ttl_seconds is not None:
+            self._store(key, _NEGATIVE, self.negative_ttl_seconds)
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V | None]]) -> V | None:
+        """
+        Get a value, loading it once if missing.
+
+        Concurrent callers that miss on the same key while a load is running
+        await the same future instead of calling ``loader`` again. A loader
+        result of None is stored as a negative entry when negative caching is
+        enabled. Loader exceptions propagate to every waiter and are not cached.
+
+        Args:
+            key: The key to look up
+            loader: Zero-argument coroutine factory producing the value
+
+        Returns:
+            The cached or freshly loaded value, or None if it does not exist
+        """
+        found, value = self._lookup(key)
+        if found:
+            if value is _NEGATIVE:
+                self._negative_hits += 1
+                return None
+            self._hits += 1
+            return cast(V, value)
+
+        self._misses += 1
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await self._await_inflight(key, pending, loader)
+        return await self._load(key, loader)
+
+    async def _await_inflight(
+        self, key: K, pending: asyncio.Future[Any], loader: Callable[[], Awaitable[V | None]]
+    ) -> V | None:
+        """Wait for another caller's load of ``key`` to finish."""
+        self._coalesced_loads += 1
+        try:
+            return cast(V | None, await asyncio.shield(pending))
+        except asyncio.CancelledError:
+            # The leader was cancelled, not us: retry (one of the waiters becomes the new leader)
+            current = asyncio.current_task()
+            if pending.cancelled() and current is not None and not current.cancelling():
+                return await self.get_or_load(key, loader)
+            raise
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V | None]]) -> V | None:
+        """Run ``loader`` as the single in-flight load for ``key`` and cache its result."""
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        started = time.perf_counter()
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self._load_failures += 1
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure does not log "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._loads += 1
+            self._load_time_total += elapsed
+            self._load_time_max = max(self._load_time_max, elapsed)
+            # A delete()/clear() during the load detaches it: waiters still get the result, but it is not stored
+            current = self._inflight.get(key) is future
+            if current:
+                del self._inflight[key]
+
+        if current:
+            if result is None:
+                self.put_negative(key)
+            else:
+                self.put(key, result)
+        future.set_result(result)
+        return result
+
+    def delete(self, key: K) -> bool:
+        """
+        Delete an entry from the cache.
+
+        A load of ``key`` already in flight still answers its callers but does
+        not store its (possibly stale) result.
+
+        Args:
+            key: The key to delete
+
+        Returns:
+            True if the entry existed, False otherwise
+        """
+        self._inflight.pop(key, None)
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._untrack_deadline(key, entry[1])
+        return True
+
+    def clear(self) -> None:
+        """Clear all entries and reset statistics (in-flight loads finish for their callers but are not stored)."""
+        self._inflight.clear()
+        self._cache.clear()
+        self._buckets.clear()
+        self._bucket_heap.clear()
+        self._hits = 0
+        self._misses = 0
+        self._negative_hits = 0
+        self._evictions = 0
+        self._expired_count = 0
+        self._loads = 0
+        self._load_failures = 0
+        self._coalesced_loads = 0
+        self._load_time_total = 0.0
+        self._load_time_max = 0.0
+        logger.info("Async cache cleared")
+
+    def size(self) -> int:
+        """Get the current number of entries, including unexpired negative entries."""
+        return len(self._cache)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        The keys are a superset of ``LRUCache.get_stats`` so both cache kinds
+        can be reported side by side by the monitoring endpoints.
+
+        Returns:
+            Dictionary containing cache statistics
+        """
+        total_requests = self._hits + self._negative_hits + self._misses
+        hit_rate = ((self._hits + self._negative_hits) / total_requests) if total_requests > 0 else 0.0
+        expiration_rate = (self._expired_count / total_requests) if total_requests > 0 else 0.0
+        expired_vs_lru_ratio = (
+            self._expired_count / self._evictions
+            if self._evictions > 0
+            else float("inf")
+            if self._expired_count > 0
+            else 0.0
+        )
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "negative_hits": self._negative_hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": hit_rate,
+            "ttl_seconds": self.ttl_seconds,
+            "negative_ttl_seconds": self.negative_ttl_seconds,
+            "expired_count": self._expired_count,
+            "expiration_rate": expiration_rate,
+            "expired_vs_lru_ratio": expired_vs_lru_ratio,
+            "total_evictions": self._evictions + self._expired_count,
+            "capacity_utilization": (len(self._cache) / self.max_size) if self.max_size > 0 else 0.0,
+            "loads": self._loads,
+            "load_failures": self._load_failures,
+            "coalesced_loads": self._coalesced_loads,
+            "inflight_loads": len(self._inflight),
+            "avg_load_ms": (self._load_time_total / self._loads * 1000) if self._loads > 0 else 0.0,
+            "max_load_ms": self._load_time_max * 1000,
+        }
+
+    def __len__(self) -> int:
+        """Get the number of entries in the cache."""
+        return len(self._cache)
+
+    def __contains__(self, key: K) -> bool:
+        """Check whether a live (positive or negative) entry exists for ``key``."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return False
+        deadline = entry[1]
+        return deadline is None or deadline > self._clock()
+
+    def __repr__(self) -> str:
+        """String representation of the cache."""
+        stats = self.get_stats()
+        return f"AsyncLRUCache(size={stats['size']}, max_size={stats['max_size']}, hit_rate={stats['hit_rate']:.2f})"
@@ -0,0 +1,136 @@
+"""
+Event-driven cache invalidation for MythosMUD server.
+
+Reference-data caches (rooms, NPC definitions and spawn rules) have no TTL;
+instead, code that changes the underlying data publishes a typed invalidation
+event on the EventBus and ``CacheInvalidationListener`` drops the affected
+entries (for NPCs, the population controller reloads them). With the distributed EventBus these events also reach other
+server instances over NATS, so every process invalidates together.
+"""
+
+from typing import Any
+
+from ..events.event_types import (
+    BaseEvent,
+    NPCDefinitionsChanged,
+    NPCSpawnRulesChanged,
+    RoomDefinitionChanged,
+)
+from ..structured_logging.enhanced_logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_INVALIDATION_SERVICE_ID = "cache_invalidation"
+
+
+def publish_cache_invalidation(event_bus: Any, event: BaseEvent) -> bool:
+    """
+    Publish an invalidation event, tolerating a missing EventBus.
+
+    Args:
+        event_bus: EventBus instance (None when running without one, e.g. in scripts)
+        event: Invalidation event to publish
+
+    Returns:
+        True if the event was handed to the bus, False otherwise
+    """
+    if event_bus is None:
+        logger.debug("No EventBus available, cache invalidation not published", event_type=event.event_type)
+        return False
+    try:
+        event_bus.publish(event)
+        return True
+    except (RuntimeError, ValueError, AttributeError) as e:
+        logger.warning("Failed to publish cache invalidation", event_type=event.event_type, error=str(e))
+        return False
+
+
+class CacheInvalidationListener:
+    """
+    Subscribes reference-data caches to typed invalidation events.
+
+    Every cache argument is optional so the listener can be wired with
+    whichever caches a process actually owns.
+    """
+
+    def __init__(
+        self,
+        event_bus: Any,
+        room_cache: Any | None = None,
+        npc_cache: Any | None = None,
+        room_data_cache: Any | None = None,
+    ) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            event_bus: EventBus to subscribe to
+            room_cache: RoomCacheService (or compatible) instance
+            npc_cache: Holder of NPC definitions and spawn rules exposing ``invalidate_npc_definitions()``
+                and ``invalidate_spawn_rules()`` (NPCDefinitionLoader, NPCCacheService)
+            room_data_cache: Holder of room sync snapshots exposing ``clear_cache(room_id)``
+        """
+        self._event_bus = event_bus
+        self._room_cache = room_cache
+        self._npc_cache = npc_cache
+        self._room_data_cache = room_data_cache
+        self._started = False
+        self._invalidation_counts: dict[str, int] = {}
+
+    def start(self) -> None:
+        """Subscribe to all invalidation event types (idempotent)."""
+        if self._started:
+            return
+        self._event_bus.subscribe(
+            RoomDefinitionChanged, self._on_room_definition_changed, service_id=CACHE_INVALIDATION_SERVICE_ID
+        )
+        self._event_bus.subscribe(
+            NPCDefinitionsChanged, self._on_npc_definitions_changed, service_id=CACHE_INVALIDATION_SERVICE_ID
+        )
+        self._event_bus.subscribe(
+            NPCSpawnRulesChanged, self._on_npc_spawn_rules_changed, service_id=CACHE_INVALIDATION_SERVICE_ID
+        )
+        self._started = True
+        logger.info("Cache invalidation listener started")
+
+    def stop(self) -> None:
+        """Unsubscribe from the EventBus."""
+        if not self._started:
+            return
+        self._event_bus.unsubscribe_all_for_service(CACHE_INVALIDATION_SERVICE_ID)
+        self._started = False
+        logger.info("Cache invalidation listener stopped")
+
+    def set_npc_cache(self, npc_cache: Any) -> None:
+        """Attach the NPC cache once it exists (NPC services start after the game bundle)."""
+        self._npc_cache = npc_cache
+
+    def get_stats(self) -> dict[str, int]:
+        """Get the number of invalidation events applied, by event type."""
+        return dict(self._invalidation_counts)
+
+    def _count(self, event: BaseEvent) -> None:
+        self._invalidation_counts[event.event_type] = self._invalidation_counts.get(event.event_type, 0) + 1
+
+    def _on_room_definition_changed(self, event: RoomDefinitionChanged) -> None:
+        self._count(event)
+        if self._room_cache is not None:
+            if event.room_id is None:
+                self._room_cache.invalidate_all_rooms()
+            else:
+                self._room_cache.invalidate_room(event.room_id)
+        if self._room_data_cache is not None:
+            self._room_data_cache.clear_cache(event.room_id)
+        logger.debug("Room caches invalidated by event", room_id=event.room_id)
+
+    def _on_npc_definitions_changed(self, event: NPCDefinitionsChanged) -> None:
+        self._count(event)
+        if self._npc_cache is not None:
+            self._npc_cache.invalidate_npc_definitions()
+        logger.debug("NPC definition cache invalidated by event", definition_id=event.definition_id)
+
+    def _on_npc_spawn_rules_changed(self, event: NPCSpawnRulesChanged) -> None:
+        self._count(event)
+        if self._npc_cache is not None:
+            self._npc_cache.invalidate_spawn_rules()
+        logger.debug("NPC spawn rule cache invalidated by event", rule_id=event.rule_id)
@@ -8,12 +8,13 @@ persistence layer to cache frequently accessed data like rooms, NPCs, and profes
 # pylint: disable=too-many-lines  # Reason: Cache service requires extensive caching logic for multiple entity types and cache management operations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Hashable
 from functools import wraps
 from typing import Any, TypeVar, cast
 
 from ..structured_logging.enhanced_logging_config import get_logger
-from .lru_cache import LRUCache, get_cache_manager
+from .async_cache import AsyncLRUCache
+from .lru_cache import get_cache_manager
 
 logger = get_logger(__name__)
 
@@ -21,12 +22,67 @@ logger = get_logger(__name__)
 T = TypeVar("T")
 
 
+def make_cache_key(func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    """
+    Build the default cache key for a decorated call.
+
+    The key is a tuple of the function's qualified name and its arguments, so
+    equal arguments hash equally without formatting them into a string. Calls
+    with unhashable arguments fall back to a ``repr``-based string key.
+
+    Args:
+        func: The decorated function
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+
+    Returns:
+        Hashable cache key
+    """
+    key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return f"{func.__module__}.{func.__qualname__}:{args!r}:{sorted(kwargs.items())!r}"
+    return key
+
+
+async def _run_single_flight(
+    inflight: dict[Hashable, asyncio.Future[Any]], key: Hashable, call: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Run ``call`` for ``key``, or join the call already in flight for it."""
+    pending = inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+    inflight[key] = future
+    try:
+        result = await call()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved; waiters (if any) re-raise it themselves
+        raise
+    finally:
+        if inflight.get(key) is future:
+            del inflight[key]
+    future.set_result(result)
+    return result
+
+
 def cached(
-    cache_name: str, key_func: Callable[..., str] | None = None, _ttl_seconds: int | None = None
+    cache_name: str, key_func: Callable[..., Hashable] | None = None, _ttl_seconds: int | None = None
 ) -> Callable[..., Any]:  # pylint: disable=unused-argument  # Reason: Parameter reserved for future TTL implementation
     """
     Decorator to cache function results.
 
+    Coroutine functions prefer an async cache registered under ``cache_name``
+    (see ``CacheManager.create_async_cache``), which coalesces concurrent misses
+    into a single call. When only a regular ``LRUCache`` exists, concurrent
+    misses for the same key are still coalesced per decorated function.
+
     Args:
         cache_name: Name of the cache to use
         key_func: Function to generate cache key from function arguments
@@ -37,36 +93,31 @@ def cached(
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        def build_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+            return key_func(*args, **kwargs) if key_func else make_cache_key(func, args, kwargs)
+
+        inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
             cache_manager = get_cache_manager()
-            cache = cache_manager.get_cache(cache_name)
+            async_cache = cache_manager.get_async_cache(cache_name)
+            if async_cache is not None:
+                return await async_cache.get_or_load(build_key(args, kwargs), lambda: func(*args, **kwargs))
 
-            if not cache:
+            cache = cache_manager.get_cache(cache_name)
+            if cache is None:
                 logger.warning("Cache not found, calling function directly", cache_name=cache_name)
                 return await func(*args, **kwargs)
 
-            # Generate cache key
-            if key_func:
-                cache_key = key_func(*args, **kwargs)
-            else:
-                # Default key generation
-                cache_key = f"{func.__name__}:{str(args)}:{str(sorted(kwargs.items()))}"
-
-            # Try to get from cache
+            cache_key = build_key(args, kwargs)
             cached_result = cache.get(cache_key)
             if cached_result is not None:
-                logger.debug("Cache hit", function=func.__name__, cache_key=cache_key)
                 return cached_result
 
-            # Call function and cache result
-            logger.debug("Cache miss, calling function", function=func.__name__, cache_key=cache_key)
-            result = await func(*args, **kwargs)
-
-            # Cache the result
+            # Share an in-progress call for the same key instead of starting another one
+            result = await _run_single_flight(inflight, cache_key, lambda: func(*args, **kwargs))
             cache.put(cache_key, result)
-            logger.debug("Result cached", function=func.__name__, cache_key=cache_key)
-
             return result
 
         @wraps(func)
@@ -74,31 +125,17 @@ def cached(
             cache_manager = get_cache_manager()
             cache = cache_manager.get_cache(cache_name)
 
-            if not cache:
+            if cache is None:
                 logger.warning("Cache not found, calling function directly", cache_name=cache_name)
                 return func(*args, **kwargs)
 
-            # Generate cache key
-            if key_func:
-                cache_key = key_func(*args, **kwargs)
-            else:
-                # Default key generation
-                cache_key = f"{func.__name__}:{str(args)}:{str(sorted(kwargs.items()))}"
-
-            # Try to get from cache
+            cache_key = build_key(args, kwargs)
             cached_result = cache.get(cache_key)
             if cached_result is not None:
-                logger.debug("Cache hit", function=func.__name__, cache_key=cache_key)
                 return cached_result
 
-            # Call function and cache result
-            logger.debug("Cache miss, calling function", function=func.__name__, cache_key=cache_key)
             result = func(*args, **kwargs)
-
-            # Cache the result
             cache.put(cache_key, result)
-            logger.debug("Result cached", function=func.__name__, cache_key=cache_key)
-
             return result
 
         # Return appropriate wrapper based on function type
@@ -109,6 +146,45 @@ def cached(
     return decorator
 
 
+def _named_async_cache(name: str, max_size: int) -> AsyncLRUCache[Any, Any]:
+    """
+    Return the manager's async cache ``name``, creating it if it does not exist yet.
+
+    Args:
+        name: Cache name
+        max_size: Capacity used when the cache has to be created
+
+    Returns:
+        The shared async cache
+
+    Raises:
+        RuntimeError: If ``name`` is registered as a regular LRUCache
+    """
+    cache_manager = get_cache_manager()
+    cache = cache_manager.get_async_cache(name)
+    if cache is not None:
+        return cache
+    try:
+        # Lazily initialize the cache to avoid spurious startup warnings
+        cache = cache_manager.create_async_cache(name, max_size=max_size)
+        logger.info("Async cache created lazily", cache_name=name)
+        return cache
+    except ValueError:
+        # Cache was created concurrently; retrieve it now
+        cache = cache_manager.get_async_cache(name)
+        if cache is None:
+            raise RuntimeError(f"Cache {name!r} exists but is not an async cache") from None
+        logger.debug("Async cache already existed; using existing instance", cache_name=name)
+        return cache
+
+
+def _room_to_dict(room: Any) -> dict[str, Any]:
+    """Convert a persistence room to the cached dictionary form."""
+    if hasattr(room, "to_dict"):
+        return cast(dict[str, Any], room.to_dict())
+    return cast(dict[str, Any], room)
+
+
 class RoomCacheService:
     """Service for caching room data."""
 
@@ -121,20 +197,7 @@ class RoomCacheService:
         """
         self.persistence = persistence
         self.cache_manager = get_cache_manager()
-        cache = self.cache_manager.get_cache("rooms")
-        if not cache:
-            # Lazily initialize the rooms cache to avoid spurious startup warnings
-            try:
-                cache = self.cache_manager.create_cache("rooms", max_size=5000, ttl_seconds=None)
-                logger.info("Rooms cache created lazily by RoomCacheService")
-            except ValueError:
-                # Cache was created concurrently; retrieve it now
-                cache = self.cache_manager.get_cache("rooms")
-                logger.debug("Rooms cache already existed; using existing instance")
-        if cache is None:
-            # Defensive check for type safety and runtime correctness
-            raise RuntimeError("Rooms cache not initialized")
-        self.rooms_cache: LRUCache[Any, Any] = cache
+        self.rooms_cache: AsyncLRUCache[Any, Any] = _named_async_cache("rooms", max_size=5000)
 
         logger.info("RoomCacheService initialized")
 
@@ -142,49 +205,31 @@ class RoomCacheService:
         """
         Get room data with caching.
 
+        Concurrent misses for the same room share one persistence load, and a
+        load racing ``invalidate_room`` is returned but not cached.
+
         Args:
             room_id: The room ID
 
         Returns:
             Room data dictionary or None if not found
         """
-        # Try cache first
         import time
 
         start_time = time.perf_counter()
-        cached_room = self.rooms_cache.get(room_id)
-        if cached_room is not None:
-            logger.debug("Room cache hit", room_id=room_id)
-            logger.debug(
-                "Room cache timing",
-                room_id=room_id,
-                cache_hit=True,
-                duration_ms=round((time.perf_counter() - start_time) * 1000, 3),
-            )
-            return cast(dict[str, Any], cached_room)
+        room_dict = await self.rooms_cache.get_or_load(room_id, lambda: self._load_room(room_id))
+        logger.debug(
+            "Room cache timing",
+            room_id=room_id,
+            found=room_dict is not None,
+            duration_ms=round((time.perf_counter() - start_time) * 1000, 3),
+        )
+        return cast(dict[str, Any] | None, room_dict)
 
-        # Load from persistence
+    async def _load_room(self, room_id: str) -> dict[str, Any] | None:
         logger.debug("Room cache miss, loading from persistence", room_id=room_id)
         room = await self.persistence.async_get_room(room_id)
-
-        if room:
-            # Convert to dictionary if needed
-            if hasattr(room, "to_dict"):
-                room_dict: dict[str, Any] = room.to_dict()
-            else:
-                room_dict = cast(dict[str, Any], room)
-
-            # Cache the result
-            self.rooms_cache.put(room_id, room_dict)
-            logger.debug(
-                "Room cached",
-                room_id=room_id,
-                cache_hit=False,
-                duration_ms=round((time.perf_counter() - start_time) * 1000, 3),
-            )
-            return room_dict
-
-        return None
+        return _room_to_dict(room) if room else None
 
     def get_room_sync(self, room_id: str) -> dict[str, Any] | None:
         """
@@ -215,11 +260,7 @@ class RoomCacheService:
         room = self.persistence.get_room_by_id(room_id)
 
         if room:
-            # Convert to dictionary if needed
-            if hasattr(room, "to_dict"):
-                room_dict: dict[str, Any] = room.to_dict()
-            else:
-                room_dict = cast(dict[str, Any], room)
+            room_dict = _room_to_dict(room)
 
             # Cache the result
             self.rooms_cache.put(room_id, room_dict)
@@ -243,6 +284,11 @@ class RoomCacheService:
         self.rooms_cache.delete(room_id)
         logger.debug("Room cache invalidated", room_id=room_id)
 
+    def invalidate_all_rooms(self) -> None:
+        """Invalidate every cached room."""
+        self.rooms_cache.clear()
+        logger.debug("Room cache fully invalidated")
+
     def preload_rooms(self, room_ids: list[str]) -> None:
         """
         Preload multiple rooms into cache.
@@ -256,11 +302,7 @@ class RoomCacheService:
             if room_id not in self.rooms_cache:
                 room = self.persistence.get_room_by_id(room_id)
                 if room:
-                    if hasattr(room, "to_dict"):
-                        room_dict = room.to_dict()
-                    else:
-                        room_dict = room
-                    self.rooms_cache.put(room_id, room_dict)
+                    self.rooms_cache.put(room_id, _room_to_dict(room))
 
         logger.info("Room preloading completed", requested=len(room_ids), cached=self.rooms_cache.size())
 
@@ -277,40 +319,11 @@ class NPCCacheService:
         """
         self.npc_service = npc_service
         self.cache_manager = get_cache_manager()
-
-        # Lazily initialize NPC definitions cache
-        definitions_cache_opt = self.cache_manager.get_cache("npc_definitions")
-        if not definitions_cache_opt:
-            try:
-                definitions_cache_opt = self.cache_manager.create_cache(
-                    "npc_definitions", max_size=1000, ttl_seconds=None
-                )
-                logger.info("NPC definitions cache created lazily by NPCCacheService")
-            except ValueError:
-                # Cache was created concurrently; retrieve it now
-                definitions_cache_opt = self.cache_manager.get_cache("npc_definitions")
-                logger.debug("NPC definitions cache already existed; using existing instance")
-
-        # Lazily initialize NPC spawn rules cache
-        spawn_rules_cache_opt = self.cache_manager.get_cache("npc_spawn_rules")
-        if not spawn_rules_cache_opt:
-            try:
-                spawn_rules_cache_opt = self.cache_manager.create_cache(
-                    "npc_spawn_rules", max_size=500, ttl_seconds=None
-                )
-                logger.info("NPC spawn rules cache created lazily by NPCCacheService")
-            except ValueError:
-                # Cache was created concurrently; retrieve it now
-                spawn_rules_cache_opt = self.cache_manager.get_cache("npc_spawn_rules")
-                logger.debug("NPC spawn rules cache already existed; using existing instance")
-
-        # Assign with precise types (check non-None after creation/retrieval)
-        if definitions_cache_opt is None:
-            raise RuntimeError("NPC definitions cache must exist after initialization")
-        if spawn_rules_cache_opt is None:
-            raise RuntimeError("NPC spawn rules cache must exist after initialization")
-        self.definitions_cache: LRUCache[Any, Any] = definitions_cache_opt
-        self.spawn_rules_cache: LRUCache[Any, Any] = spawn_rules_cache_opt
+        self.definitions_cache: AsyncLRUCache[Any, Any] = _named_async_cache("npc_definitions", max_size=1000)
+        self.spawn_rules_cache: AsyncLRUCache[Any, Any] = _named_async_cache("npc_spawn_rules", max_size=500)
+        # Bumped on invalidation; the per-id entries of a list loaded under an older version are not cached
+        self.definitions_version = 0
+        self.spawn_rules_version = 0
 
         logger.info("NPCCacheService initialized")
 
@@ -324,34 +337,27 @@ class NPCCacheService:
         Returns:
             List of NPC definitions
         """
-        # Try cache first
-        cache_key = "all_definitions"
         import time
 
         start_time = time.perf_counter()
-        cached_definitions = self.definitions_cache.get(cache_key)
-        if cached_definitions is not None:
-            logger.debug(
-                "NPC definitions cache hit",
-                duration_ms=round((time.perf_counter() - start_time) * 1000, 3),
-            )
-            return cast(list[Any], cached_definitions)
-
-        # Load from database
-        logger.debug("NPC definitions cache miss, loading from database")
-        definitions = await self.npc_service.get_npc_definitions(session)
-
-        # Cache individual definitions and the full list
-        for definition in definitions:
-            self.definitions_cache.put(definition.id, definition)
-
-        self.definitions_cache.put(cache_key, definitions)
+        definitions = await self.definitions_cache.get_or_load(
+            "all_definitions", lambda: self._load_npc_definitions(session)
+        )
         logger.debug(
-            "NPC definitions cached",
-            count=len(definitions),
+            "NPC definitions cache lookup",
+            count=len(definitions or []),
             duration_ms=round((time.perf_counter() - start_time) * 1000, 3),
         )
+        return cast(list[Any], definitions)
 
+    async def _load_npc_definitions(self, session: Any) -> list[Any]:
+        logger.debug("NPC definitions cache miss, loading from database")
+        version = self.definitions_version
+        definitions = await self.npc_service.get_npc_definitions(session)
+        if version == self.definitions_version:
+            # Cache individual definitions alongside the full list
+            for definition in definitions:
+                self.definitions_cache.put(definition.id, definition)
         return cast(list[Any], definitions)
 
     async def get_npc_definition(self, session: Any, definition_id: int) -> Any | None:
@@ -365,21 +371,9 @@ class NPCCacheService:
         Returns:
             NPC definition or None if not found
         """
-        # Try cache first
-        cached_definition = self.definitions_cache.get(definition_id)
-        if cached_definition is not None:
-            logger.debug("NPC definition cache hit", definition_id=definition_id)
-            return cached_definition
-
-        # Load from database
-        logger.debug("NPC definition cache miss, loading from database", definition_id=definition_id)
-        definition = await self.npc_service.get_npc_definition(session, definition_id)
-
-        if definition:
-            self.definitions_cache.put(definition_id, definition)
-            logger.debug("NPC definition cached", definition_id=definition_id)
-
-        return definition
+        return await self.definitions_cache.get_or_load(
+            definition_id, lambda: self.npc_service.get_npc_definition(session, definition_id)
+        )
 
     async def get_spawn_rules(self, session: Any) -> list[Any]:
         """
@@ -391,43 +385,36 @@ class NPCCacheService:
         Returns:
             List of NPC spawn rules
         """
-        # Try cache first
-        cache_key = "all_spawn_rules"
         import time
 
         start_time = time.perf_counter()
-        cached_rules = self.spawn_rules_cache.get(cache_key)
-        if cached_rules is not None:
-            logger.debug(
-                "NPC spawn rules cache hit",
-                duration_ms=round((time.perf_counter() - start_time) * 1000, 3),
-            )
-            return cast(list[Any], cached_rules)
-
-        # Load from database
-        logger.debug("NPC spawn rules cache miss, loading from database")
-        rules = await self.npc_service.get_spawn_rules(session)
-
-        # Cache individual rules and the full list
-        for rule in rules:
-            self.spawn_rules_cache.put(rule.id, rule)
-
-        self.spawn_rules_cache.put(cache_key, rules)
+        rules = await self.spawn_rules_cache.get_or_load("all_spawn_rules", lambda: self._load_spawn_rules(session))
         logger.debug(
-            "NPC spawn rules cached",
-            count=len(rules),
+            "NPC spawn rules cache lookup",
+            count=len(rules or []),
             duration_ms=round((time.perf_counter() - start_time) * 1000, 3),
         )
+        return cast(list[Any], rules)
 
+    async def _load_spawn_rules(self, session: Any) -> list[Any]:
+        logger.debug("NPC spawn rules cache miss, loading from database")
+        version = self.spawn_rules_version
+        rules = await self.npc_service.get_spawn_rules(session)
+        if version == self.spawn_rules_version:
+            # Cache individual rules alongside the full list
+            for rule in rules:
+                self.spawn_rules_cache.put(rule.id, rule)
         return cast(list[Any], rules)
 
     def invalidate_npc_definitions(self) -> None:
         """Invalidate all NPC definition caches."""
+        self.definitions_version += 1
         self.definitions_cache.clear()
         logger.debug("NPC definitions cache invalidated")
 
     def invalidate_spawn_rules(self) -> None:
         """Invalidate all NPC spawn rule caches."""
+        self.spawn_rules_version += 1
         self.spawn_rules_cache.clear()
         logger.debug("NPC spawn rules cache invalidated")
 
@@ -444,22 +431,7 @@ class ProfessionCacheService:
         """
         self.persistence = persistence
         self.cache_manager = get_cache_manager()
-        professions_cache_opt = self.cache_manager.get_cache("professions")
-
-        if not professions_cache_opt:
-            # Lazily initialize professions cache to avoid startup warnings
-            try:
-                professions_cache_opt = self.cache_manager.create_cache("professions", max_size=100, ttl_seconds=None)
-                logger.info("Professions cache created lazily by ProfessionCacheService")
-            except ValueError:
-                # Cache was created concurrently; retrieve it now
-                professions_cache_opt = self.cache_manager.get_cache("professions")
-                logger.debug("Professions cache already existed; using existing instance")
-
-        # Assign with precise types, asserting non-None for type safety
-        if professions_cache_opt is None:
-            raise RuntimeError("Professions cache not initialized")
-        self.professions_cache: LRUCache[Any, Any] = professions_cache_opt
+        self.professions_cache: AsyncLRUCache[Any, Any] = _named_async_cache("professions", max_size=100)
 
         logger.info("ProfessionCacheService initialized")
 
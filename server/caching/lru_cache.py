@@ -12,6 +12,7 @@ from collections.abc import Callable
 from typing import Any, TypeVar
 
 from ..structured_logging.enhanced_logging_config import get_logger
+from .async_cache import AsyncLRUCache
 
 logger = get_logger(__name__)
 
@@ -39,6 +40,9 @@ class LRUCache[K, V]:  # pylint: disable=too-many-instance-attributes  # Reason:
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
         self._cache: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        # Keys in write order (oldest timestamp first) so expired entries can be
+        # popped from the front instead of scanning the whole cache
+        self._write_order: OrderedDict[K, None] = OrderedDict()
         self._lock = threading.RLock()
         self._hits = 0
         self._misses = 0
@@ -58,59 +62,56 @@ class LRUCache[K, V]:  # pylint: disable=too-many-instance-attributes  # Reason:
             The cached value if found and not expired, None otherwise
         """
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 self._misses += 1
-                logger.debug("Cache miss", key=key)
                 return None
 
-            value, timestamp = self._cache[key]
+            value, timestamp = entry
 
             # Check TTL if set
             if self.ttl_seconds is not None:
                 if time.time() - timestamp > self.ttl_seconds:
-                    del self._cache[key]
+                    self._remove(key)
                     self._misses += 1
                     self._expired_count += 1  # Track expiration for metrics
-                    logger.debug("Cache miss due to TTL expiration", key=key, age=time.time() - timestamp)
                     return None
 
             # Move to end (most recently used)
             self._cache.move_to_end(key)
             self._hits += 1
-            logger.debug("Cache hit", key=key)
             return value
 
+    def _remove(self, key: K) -> None:
+        """Remove a key from both the recency and write-order indexes (caller holds the lock)."""
+        del self._cache[key]
+        self._write_order.pop(key, None)
+
     def _evict_expired_entries(self) -> int:
         """
         Remove expired entries from cache.
 
+        Entries are popped from the front of the write-order index until the
+        first unexpired one, so the cost is proportional to the number of
+        expired entries (O(1) amortized per put) rather than the cache size.
+
         Returns:
             Count of expired entries removed
         """
         if self.ttl_seconds is None:
             return 0
 
-        current_time = time.time()
-        expired_keys: list[K] = []
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        while self._write_order:
+            oldest_key = next(iter(self._write_order))
+            if self._cache[oldest_key][1] >= cutoff:
+                break
+            self._remove(oldest_key)
+            removed += 1
 
-        # Collect expired keys
-        for key, (_value, timestamp) in self._cache.items():
-            if current_time - timestamp > self.ttl_seconds:
-                expired_keys.append(key)
-
-        # Remove expired entries
-        for key in expired_keys:
-            del self._cache[key]
-            self._expired_count += 1
-
-        if expired_keys:
-            logger.debug(
-                "Evicted expired cache entries",
-                expired_count=len(expired_keys),
-                cache_size=len(self._cache),
-            )
-
-        return len(expired_keys)
+        self._expired_count += removed
+        return removed
 
     def put(self, key: K, value: V) -> None:
         """
@@ -127,26 +128,21 @@ class LRUCache[K, V]:  # pylint: disable=too-many-instance-attributes  # Reason:
             if key in self._cache:
                 self._cache[key] = (value, current_time)
                 self._cache.move_to_end(key)
-                logger.debug("Cache update", key=key)
+                self._write_order.move_to_end(key)
                 return
 
             # Evict expired entries before checking capacity (Task 3: Proactive Expiration)
-            expired_count = self._evict_expired_entries()
+            self._evict_expired_entries()
 
             # If cache is still full after removing expired entries, evict LRU
             if len(self._cache) >= self.max_size:
                 oldest_key, _ = self._cache.popitem(last=False)
+                self._write_order.pop(oldest_key, None)
                 self._evictions += 1
-                logger.debug(
-                    "Cache eviction",
-                    evicted_key=oldest_key,
-                    cache_size=len(self._cache),
-                    expired_removed=expired_count,
-                )
 
             # Add new item
             self._cache[key] = (value, current_time)
-            logger.debug("Cache put", key=key, cache_size=len(self._cache))
+            self._write_order[key] = None
 
     def delete(self, key: K) -> bool:
         """
@@ -160,8 +156,7 @@ class LRUCache[K, V]:  # pylint: disable=too-many-instance-attributes  # Reason:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                logger.debug("Cache delete", key=key)
+                self._remove(key)
                 return True
             return False
 
@@ -169,6 +164,7 @@ class LRUCache[K, V]:  # pylint: disable=too-many-instance-attributes  # Reason:
         """Clear all items from the cache."""
         with self._lock:
             self._cache.clear()
+            self._write_order.clear()
             self._hits = 0
             self._misses = 0
             self._evictions = 0
@@ -270,7 +266,7 @@ class LRUCache[K, V]:  # pylint: disable=too-many-instance-attributes  # Reason:
             if self.ttl_seconds is not None:
                 _value, timestamp = self._cache[key]  # pylint: disable=unused-variable  # noqa: F841  # Reason: value is part of tuple unpacking, only timestamp is used
                 if time.time() - timestamp > self.ttl_seconds:
-                    del self._cache[key]
+                    self._remove(key)
                     return False
 
             return True
@@ -292,6 +288,7 @@ class CacheManager:
     def __init__(self) -> None:
         """Initialize the cache manager."""
         self._caches: dict[str, LRUCache[Any, Any]] = {}
+        self._async_caches: dict[str, AsyncLRUCache[Any, Any]] = {}
         self._lock = threading.RLock()
 
         # Initialize default caches
@@ -301,29 +298,19 @@ class CacheManager:
 
     def _initialize_default_caches(self) -> None:
         """Initialize default caches with appropriate configurations."""
-        # Room data cache - large capacity, no TTL (rooms are static)
-        self._caches["rooms"] = LRUCache[str, Any](
-            max_size=5000,  # Large capacity for room data
-            ttl_seconds=None,  # No expiration for static room data
-        )
+        # Reference data read from the event loop uses async caches: concurrent misses share one load
+        # and a load racing an invalidation is not cached. None of these expire; edits invalidate them.
+        # Room data cache - large capacity (rooms are static)
+        self._async_caches["rooms"] = AsyncLRUCache[str, Any](max_size=5000)
 
-        # NPC definitions cache - medium capacity, no TTL (definitions are static)
-        self._caches["npc_definitions"] = LRUCache[int, Any](
-            max_size=1000,  # Medium capacity for NPC definitions
-            ttl_seconds=None,  # No expiration for static definitions
-        )
+        # NPC definitions cache - medium capacity
+        self._async_caches["npc_definitions"] = AsyncLRUCache[Any, Any](max_size=1000)
 
-        # NPC spawn rules cache - medium capacity, no TTL (rules are static)
-        self._caches["npc_spawn_rules"] = LRUCache[int, Any](
-            max_size=1000,  # Medium capacity for spawn rules
-            ttl_seconds=None,  # No expiration for static rules
-        )
+        # NPC spawn rules cache - medium capacity
+        self._async_caches["npc_spawn_rules"] = AsyncLRUCache[Any, Any](max_size=1000)
 
-        # Profession data cache - small capacity, no TTL (professions are static)
-        self._caches["professions"] = LRUCache[int, Any](
-            max_size=100,  # Small capacity for profession data
-            ttl_seconds=None,  # No expiration for static profession data
-        )
+        # Profession data cache - small capacity (professions are static)
+        self._async_caches["professions"] = AsyncLRUCache[Any, Any](max_size=100)
 
         # Player data cache - medium capacity, short TTL (player data changes frequently)
         self._caches["players"] = LRUCache[str, Any](
@@ -331,7 +318,7 @@ class CacheManager:
             ttl_seconds=300,  # 5 minutes TTL for player data
         )
 
-        logger.info("Default caches initialized", cache_names=list(self._caches.keys()))
+        logger.info("Default caches initialized", cache_names=[*self._caches.keys(), *self._async_caches.keys()])
 
     def get_cache(self, name: str) -> LRUCache[Any, Any] | None:
         """
@@ -362,7 +349,7 @@ class CacheManager:
             ValueError: If a cache with the same name already exists
         """
         with self._lock:
-            if name in self._caches:
+            if name in self._caches or name in self._async_caches:
                 raise ValueError(f"Cache '{name}' already exists")
 
             cache: LRUCache[Any, Any] = LRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
@@ -370,6 +357,58 @@ class CacheManager:
             logger.info("Cache created", name=name, max_size=max_size, ttl_seconds=ttl_seconds)
             return cache
 
+    def get_async_cache(self, name: str) -> AsyncLRUCache[Any, Any] | None:
+        """
+        Get an async cache by name.
+
+        Args:
+            name: The name of the cache
+
+        Returns:
+            The async cache instance or None if not found
+        """
+        with self._lock:
+            return self._async_caches.get(name)
+
+    def create_async_cache(
+        self,
+        name: str,
+        max_size: int = 1000,
+        ttl_seconds: float | None = None,
+        negative_ttl_seconds: float | None = None,
+    ) -> AsyncLRUCache[Any, Any]:
+        """
+        Create a new event-loop cache with single-flight loading.
+
+        Args:
+            name: The name of the cache
+            max_size: Maximum number of items to store
+            ttl_seconds: Time-to-live in seconds (None for no expiration)
+            negative_ttl_seconds: Time-to-live for cached misses (None disables negative caching)
+
+        Returns:
+            The created cache instance
+
+        Raises:
+            ValueError: If a cache with the same name already exists
+        """
+        with self._lock:
+            if name in self._caches or name in self._async_caches:
+                raise ValueError(f"Cache '{name}' already exists")
+
+            cache: AsyncLRUCache[Any, Any] = AsyncLRUCache(
+                max_size=max_size, ttl_seconds=ttl_seconds, negative_ttl_seconds=negative_ttl_seconds
+            )
+            self._async_caches[name] = cache
+            logger.info(
+                "Async cache created",
+                name=name,
+                max_size=max_size,
+                ttl_seconds=ttl_seconds,
+                negative_ttl_seconds=negative_ttl_seconds,
+            )
+            return cache
+
     def delete_cache(self, name: str) -> bool:
         """
         Delete a cache.
@@ -385,6 +424,10 @@ class CacheManager:
                 del self._caches[name]
                 logger.info("Cache deleted", name=name)
                 return True
+            if name in self._async_caches:
+                del self._async_caches[name]
+                logger.info("Async cache deleted", name=name)
+                return True
             return False
 
     def clear_all_caches(self) -> None:
@@ -392,6 +435,8 @@ class CacheManager:
         with self._lock:
             for cache in self._caches.values():
                 cache.clear()
+            for async_cache in self._async_caches.values():
+                async_cache.clear()
             logger.info("All caches cleared")
 
     def get_all_stats(self) -> dict[str, dict[str, Any]]:
@@ -402,12 +447,14 @@ class CacheManager:
             Dictionary mapping cache names to their statistics
         """
         with self._lock:
-            return {name: cache.get_stats() for name, cache in self._caches.items()}
+            stats = {name: cache.get_stats() for name, cache in self._caches.items()}
+            stats.update({name: cache.get_stats() for name, cache in self._async_caches.items()})
+            return stats
 
     def get_cache_names(self) -> list[str]:
         """Get all cache names."""
         with self._lock:
-            return list(self._caches.keys())
+            return [*self._caches.keys(), *self._async_caches.keys()]
 
 
 # Global cache manager instance
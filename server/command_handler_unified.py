@@ -32,6 +32,7 @@ from .command_handler import (
 from .command_handler.command_execution_request import CommandExecutionRequest, command_request_app_state
 from .commands.command_service import CommandService
 from .config import get_config
+from .database_unit_of_work import unit_of_work
 from .help.help_content import get_help_content as get_help_content_new
 from .middleware.command_rate_limiter import command_rate_limiter
 from .realtime.disconnect_grace_period import is_player_in_grace_period
@@ -196,18 +197,22 @@ async def process_command_unified(
     if error_result:
         return error_result
 
-    block_result = await _check_all_command_blocks(cmd, player_name, request)
-    if block_result:
-        return block_result
+    # One database session and one commit for everything the command does; each
+    # repository call runs in its own savepoint, so a failed call is undone on its own.
+    # Events and connection-manager sends are held until the commit and dropped if it fails.
+    async with unit_of_work("command"):
+        block_result = await _check_all_command_blocks(cmd, player_name, request)
+        if block_result:
+            return block_result
 
-    special_result = await _handle_special_command_routing(
-        cmd, args, command_line, alias_storage, player_name, current_user, request
-    )
-    if special_result:
-        return special_result
+        special_result = await _handle_special_command_routing(
+            cmd, args, command_line, alias_storage, player_name, current_user, request
+        )
+        if special_result:
+            return special_result
 
-    logger.debug("Processing command with validation system", player=player_name, command=cmd)
-    return await process_command_with_validation(command_line, current_user, request, alias_storage, player_name)
+        logger.debug("Processing command with validation system", player=player_name, command=cmd)
+        return await process_command_with_validation(command_line, current_user, request, alias_storage, player_name)
 
 
 def _check_rate_limit(player_name: str) -> dict[str, Any] | None:
@@ -17,6 +17,8 @@ class RoomDropManager(Protocol):
 
     def list_room_drops(self, room_id: str) -> list[dict[str, object]]: ...
 
-    def take_room_drop(self, room_id: str, index: int, quantity: int) -> dict[str, object] | None: ...
+    def take_room_drop(
+        self, room_id: str, index: int, quantity: int, expected: Mapping[str, object] | None = None
+    ) -> dict[str, object] | None: ...
 
     def add_room_drop(self, room_id: str, stack: dict[str, object]) -> None: ...
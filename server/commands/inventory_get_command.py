@@ -82,7 +82,7 @@ async def _handle_get_from_room(
         qty = coerce_int(quantity, default=1)
     if qty <= 0:
         return {"result": "Quantity must be a positive number."}
-    extracted_stack = rm.take_room_drop(room_id, idx0, qty)
+    extracted_stack = rm.take_room_drop(room_id, idx0, qty, expected=drop_list[idx0])
     if not extracted_stack:
         return {"result": "That item is no longer available."}
     env = FloorPickupEnvironment(
@@ -2,6 +2,8 @@
 
 from collections.abc import Mapping
 
+from ..realtime.room_drop_store import RoomDropList
+
 
 def extract_item_identifier(stack: dict[str, object], key: str) -> str | None:
     """Extract and normalize item identifier from stack."""
@@ -63,7 +65,11 @@ def match_room_drop_by_name(drop_list: list[dict[str, object]], search_term: str
     Human collaborators: we prefer exact identifiers, then courteous prefix matches, before falling back
     to substring containment—echoing the cataloguing rites described in Dr. Wilmarth's Restricted Archives.
     Agentic aides: return a zero-based index for the best candidate or None if no alignment is found.
+    Drop lists from the room drop store carry a name index that resolves the same match without a scan.
     """
+    if isinstance(drop_list, RoomDropList):
+        return drop_list.name_index.match(search_term)
+
     normalized = search_term.strip().lower()
     if not normalized:
         return None
@@ -148,7 +148,7 @@ def _pickup_resolve_floor_stack_or_error(
     if qty <= 0:
         return {"result": "Quantity must be a positive number."}
 
-    extracted_stack = room_manager.take_room_drop(room_id, idx0, qty)
+    extracted_stack = room_manager.take_room_drop(room_id, idx0, qty, expected=drop_list[idx0])
     if not extracted_stack:
         return {"result": "That item is no longer available."}
 
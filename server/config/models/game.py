@@ -22,6 +22,10 @@ class GameConfig(BaseSettings):
     max_aliases_per_player: int = Field(default=50, description="Maximum aliases per player")
     aliases_dir: str = Field(..., description="Directory for alias storage (required)")
     motd_file: str = Field(default="data/motd.html", description="Message of the day file")
+    room_drops_snapshot_file: str | None = Field(
+        default=None,
+        description="File room floor drops are persisted to so they survive restarts (unset keeps them in memory only)",
+    )
 
     # Game mechanics
     dp_regen_rate: int = Field(default=1, description="Determination regeneration rate")
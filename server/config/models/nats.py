@@ -48,6 +48,12 @@ class NATSConfig(BaseSettings):
         default=False, description="Enable strict subject validation (reject invalid subjects)"
     )
 
+    # Distributed EventBus configuration
+    domain_event_zones: list[str] = Field(
+        default_factory=list,
+        description="Zones whose zone-sharded domain events this instance receives (empty = all zones)",
+    )
+
     # Message acknowledgment configuration
     manual_ack: bool = Field(default=False, description="Enable manual message acknowledgment (ack/nak)")
 
@@ -43,6 +43,17 @@ class DatabaseConfig(BaseSettings):
     pool_size: int = Field(default=5, description="Number of connections to maintain in pool")
     max_overflow: int = Field(default=10, description="Additional connections that can be created beyond pool_size")
     pool_timeout: int = Field(default=30, description="Seconds to wait for connection from pool")
+    pool_pre_ping: bool = Field(
+        default=False,
+        description=(
+            "Ping each connection on checkout. When off, a stale connection fails its first query "
+            "and SQLAlchemy invalidates the pool (see /monitoring/database-pool invalidations)"
+        ),
+    )
+    prepared_statement_cache_size: int = Field(
+        default=500,
+        description="Prepared statements asyncpg keeps per connection (0 disables the cache)",
+    )
 
     # AsyncPG connection pool configuration
     asyncpg_pool_min_size: int = Field(default=1, description="Minimum connections in asyncpg pool")
@@ -83,6 +94,14 @@ class DatabaseConfig(BaseSettings):
             raise ValueError("Pool configuration values must be at least 1")
         return v
 
+    @field_validator("prepared_statement_cache_size")
+    @classmethod
+    def validate_prepared_statement_cache_size(cls, v: int) -> int:
+        """Validate the prepared statement cache size is not negative."""
+        if v < 0:
+            raise ValueError("prepared_statement_cache_size must be at least 0")
+        return v
+
     @model_validator(mode="before")
     @classmethod
     def ensure_url_set(cls, data: Any) -> Any:
@@ -16,7 +16,6 @@ from server.container.utils import decode_json_column
 from server.structured_logging.enhanced_logging_config import get_logger
 from server.utils.project_paths import (
     get_calendar_paths_for_environment,
-    get_environment_data_dir,
     normalize_environment,
 )
 
@@ -40,6 +39,7 @@ GAME_ATTRS = (
     "skill_service",
     "room_cache_service",
     "profession_cache_service",
+    "cache_invalidation_listener",
     "holiday_service",
     "schedule_service",
     "mythos_tick_scheduler",
@@ -70,6 +70,7 @@ class GameBundle:  # pylint: disable=too-many-instance-attributes,too-few-public
     skill_service: Any = None
     room_cache_service: Any = None
     profession_cache_service: Any = None
+    cache_invalidation_listener: Any = None
     holiday_service: Any = None
     schedule_service: Any = None
     mythos_tick_scheduler: Any = None
@@ -121,7 +122,7 @@ class GameBundle:  # pylint: disable=too-many-instance-attributes,too-few-public
         if self.item_prototype_registry and self.player_service:
             self.player_service.set_item_prototype_registry(self.item_prototype_registry)
 
-    def _initialize_caching_services(self, persistence: Any) -> None:
+    def _initialize_caching_services(self, persistence: Any, event_bus: Any = None) -> None:
         """Create room and profession cache services; set to None on RuntimeError."""
         try:
             from server.caching.cache_service import ProfessionCacheService, RoomCacheService
@@ -133,6 +134,20 @@ class GameBundle:  # pylint: disable=too-many-instance-attributes,too-few-public
             logger.warning("Caching services initialization failed - will use persistence directly", error=str(e))
             self.room_cache_service = None
             self.profession_cache_service = None
+        if event_bus is not None:
+            self._start_cache_invalidation_listener(event_bus)
+
+    def _start_cache_invalidation_listener(self, event_bus: Any) -> None:
+        """Subscribe the reference-data caches to invalidation events on the EventBus."""
+        from server.caching.cache_invalidation import CacheInvalidationListener
+        from server.services.room_sync_service import get_room_sync_service
+
+        self.cache_invalidation_listener = CacheInvalidationListener(
+            event_bus,
+            room_cache=self.room_cache_service,
+            room_data_cache=get_room_sync_service(),
+        )
+        self.cache_invalidation_listener.start()
 
     def _init_movement_layer(self, container: ApplicationContainer) -> None:
         """Wire exploration, movement, follow, and party services."""
@@ -141,7 +156,9 @@ class GameBundle:  # pylint: disable=too-many-instance-attributes,too-few-public
         from server.game.movement_service import MovementService
         from server.services.exploration_service import ExplorationService
 
-        self.exploration_service = ExplorationService(database_manager=container.database_manager)
+        self.exploration_service = ExplorationService(
+            database_manager=container.database_manager, room_uuid_lookup=async_persistence.get_room_uuid
+        )
         from server.game.instance_manager import InstanceManager
 
         instance_manager = InstanceManager(
@@ -230,18 +247,19 @@ class GameBundle:  # pylint: disable=too-many-instance-attributes,too-few-public
             async_persistence=container.async_persistence,
         )
 
-    def _init_player_quest_layer(self, container: ApplicationContainer, normalized_environment: str) -> None:
+    def _init_player_quest_layer(self, container: ApplicationContainer) -> None:
         """Wire player/room/user, container, skill, level, and quest services."""
         persistence = container.persistence
         async_persistence = container.async_persistence
         from server.game.player_service import PlayerService
         from server.game.room_service import RoomService
-        from server.services.user_manager import UserManager
+        from server.services.user_manager import user_manager
 
         self.player_service = PlayerService(persistence=persistence, instance_manager=self.instance_manager)
         self.room_service = RoomService(persistence=persistence)
-        user_management_dir = get_environment_data_dir(normalized_environment) / "user_management"
-        self.user_manager = UserManager(data_dir=user_management_dir)
+        # The module-level manager is the one chat, websocket and NATS code import; a second
+        # instance would load and rewrite the same mute index behind its back
+        self.user_manager = user_manager
         self._wire_user_manager_after_init(self.follow_service, container.nats_message_handler, self.user_manager)
         from server.services.container_service import ContainerService
 
@@ -294,12 +312,12 @@ class GameBundle:  # pylint: disable=too-many-instance-attributes,too-few-public
         logger.debug("Initializing temporal services...")
         self._init_temporal_layer(container, normalized_environment)
         logger.debug("Initializing game services...")
-        self._init_player_quest_layer(container, normalized_environment)
+        self._init_player_quest_layer(container)
         logger.info("Game services initialized")
         await self._initialize_item_services(container)
         self._wire_item_registry_to_player_service()
         logger.debug("Initializing caching services...")
-        self._initialize_caching_services(container.persistence)
+        self._initialize_caching_services(container.persistence, getattr(container, "event_bus", None))
         logger.debug("Initializing emote service...")
         await self._init_emote_service()
 
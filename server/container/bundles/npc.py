@@ -61,22 +61,15 @@ class NPCBundle:  # pylint: disable=too-few-public-methods
             event_bus=container.event_bus,
         )
 
-    async def _load_npc_definitions(self) -> None:
-        from server.npc_database import get_npc_session
-        from server.services.npc_service import NPCService
-
-        npc_service = NPCService()
-        async for npc_session in get_npc_session():
-            try:
-                definitions = await npc_service.get_npc_definitions(npc_session)
-                self.npc_population_controller.load_npc_definitions(definitions)
-                logger.info("NPC definitions loaded", count=len(definitions))
-                spawn_rules = await npc_service.get_spawn_rules(npc_session)
-                self.npc_population_controller.load_spawn_rules(spawn_rules)
-                logger.info("NPC spawn rules loaded", count=len(spawn_rules))
-            except (ValueError, TypeError, AttributeError, KeyError, RuntimeError) as e:
-                logger.error("Error loading NPC definitions and spawn rules", error=str(e))
-            break
+    async def _load_npc_definitions(self, container: ApplicationContainer) -> None:
+        from server.npc.npc_definition_loader import NPCDefinitionLoader
+
+        definition_loader = NPCDefinitionLoader(self.npc_population_controller)
+        await definition_loader.load()
+        # Admin edits to definitions and spawn rules reload the population controller
+        cache_invalidation_listener = getattr(container, "cache_invalidation_listener", None)
+        if cache_invalidation_listener is not None:
+            cache_invalidation_listener.set_npc_cache(definition_loader)
 
     async def _start_npc_threads(self) -> None:
         if not hasattr(self.npc_lifecycle_manager, "thread_manager"):
@@ -106,6 +99,6 @@ class NPCBundle:  # pylint: disable=too-few-public-methods
 
         logger.debug("Initializing NPC services...")
         await self._create_npc_services(container)
-        await self._load_npc_definitions()
+        await self._load_npc_definitions(container)
         logger.info("NPC services initialized")
         await self._start_npc_threads()
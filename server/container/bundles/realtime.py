@@ -7,6 +7,7 @@ Depends on CoreBundle (config, event_bus, task_registry, async_persistence).
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from server.structured_logging.enhanced_logging_config import get_logger
@@ -107,7 +108,7 @@ class RealtimeBundle:
 
         logger.info("NATS service connected")
         if hasattr(event_bus, "set_nats_service"):
-            event_bus.set_nats_service(nats_service)
+            event_bus.set_nats_service(nats_service, zones=getattr(config.nats, "domain_event_zones", None))
             logger.info("NATS EventBus bridge enabled for distributed domain events")
         return nats_service
 
@@ -144,6 +145,9 @@ class RealtimeBundle:
         self.connection_manager = ConnectionManager()
         self.connection_manager.async_persistence = async_persistence
         self.connection_manager.room_manager.async_persistence = async_persistence
+        drops_snapshot_file = config.game.room_drops_snapshot_file
+        if drops_snapshot_file:
+            _ = self.connection_manager.room_manager.enable_drop_snapshots(Path(drops_snapshot_file))
         self.connection_manager.set_event_bus(event_bus)
 
         self.real_time_event_handler = RealTimeEventHandler(
@@ -156,7 +160,10 @@ class RealtimeBundle:
         logger.info("Real-time communication initialized")
 
     async def shutdown(self, _container: ApplicationContainer) -> None:
-        """Shutdown NATS-related services."""
+        """Shutdown NATS-related services and the real-time event handler."""
+        if self.real_time_event_handler is not None:
+            self.real_time_event_handler.shutdown()
+
         if self.nats_message_handler is not None:
             try:
                 await self.nats_message_handler.stop()
@@ -311,6 +311,7 @@ class ApplicationContainer:
             realtime = RealtimeBundle()
             realtime.nats_message_handler = self.nats_message_handler
             realtime.nats_service = self.nats_service
+            realtime.real_time_event_handler = self.real_time_event_handler
             await realtime.shutdown(self)
 
             core = CoreBundle()
@@ -28,6 +28,7 @@ from sqlalchemy.ext.asyncio import (
 
 from .database_config_helpers import (
     configure_pool_settings,
+    configure_statement_cache_args,
     get_postgres_connect_args,
     get_test_database_url,
     load_database_url,
@@ -35,7 +36,9 @@ from .database_config_helpers import (
     set_test_database_url,
     validate_database_url,
 )
+from .database_unit_of_work import UnitOfWorkSessionMaker
 from .exceptions import DatabaseError, ValidationError
+from .monitoring.database_pool_metrics import instrument_pool
 from .structured_logging.enhanced_logging_config import get_logger
 from .utils.error_logging import log_and_raise
 
@@ -107,12 +110,15 @@ def _create_engine_or_raise(
         engine = create_async_engine(
             database_url,
             echo=False,
-            pool_pre_ping=True,
             connect_args=connect_args,
             **pool_kwargs,
         )
-        pool_type = "NullPool" if "test" in database_url else "AsyncAdaptedQueuePool"
-        logger.info("Database engine created", pool_type=pool_type)
+        instrument_pool(engine.pool)
+        logger.info(
+            "Database engine created",
+            pool_type=type(engine.pool).__name__,
+            pool_pre_ping=bool(pool_kwargs.get("pool_pre_ping", False)),
+        )
         return engine
     except (ValueError, TypeError) as e:
         log_and_raise(
@@ -243,10 +249,14 @@ class DatabaseManager:
         logger.info("Using PostgreSQL database URL from environment", database_url=self.database_url)
 
         pool_kwargs = configure_pool_settings(self.database_url)
-        connect_args = _normalize_connect_args_search_path(self.database_url, get_postgres_connect_args())
+        connect_args = {
+            **_normalize_connect_args_search_path(self.database_url, get_postgres_connect_args()),
+            **configure_statement_cache_args(),
+        }
         self.engine = _create_engine_or_raise(self.database_url, connect_args, pool_kwargs)
 
-        self.session_maker = async_sessionmaker(
+        # Repository sessions join the running unit of work, if any (see database_unit_of_work)
+        self.session_maker = UnitOfWorkSessionMaker(
             self.engine,
             class_=AsyncSession,
             expire_on_commit=False,
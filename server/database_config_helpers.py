@@ -6,6 +6,7 @@ database URLs and connection pool settings.
 """
 
 import os
+from typing import Any
 
 from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.pool import NullPool
@@ -101,12 +102,24 @@ def normalize_database_url(database_url: str) -> str:
 
 
 # Default pool settings when config is unavailable (e.g. scripts with only DATABASE_URL set).
-# Matches DatabaseConfig defaults in config/models.py.
-_DEFAULT_POOL_SETTINGS: dict[str, int] = {
+# Matches DatabaseConfig defaults in config/models/server_db.py.
+_DEFAULT_POOL_SETTINGS: dict[str, object] = {
     "pool_size": 5,
     "max_overflow": 10,
     "pool_timeout": 30,
+    "pool_pre_ping": False,
 }
+_DEFAULT_PREPARED_STATEMENT_CACHE_SIZE = 500
+
+
+def _load_database_config() -> dict[str, Any] | None:
+    """Return the database config as a dict, or None when AppConfig cannot be loaded (scripts)."""
+    try:
+        from .config import get_config
+
+        return get_config().database.model_dump()
+    except (PydanticValidationError, ImportError, RuntimeError):
+        return None
 
 
 def get_postgres_connect_args() -> dict[str, dict[str, str]]:
@@ -156,6 +169,8 @@ def configure_pool_settings(database_url: str) -> dict[str, object]:
 
     When full config is not available (e.g. script with only DATABASE_URL),
     uses default pool settings so the script can run without AppConfig.
+    Pooled engines use InstrumentedAsyncQueuePool so checkout waits are
+    measured (see server.monitoring.database_pool_metrics).
 
     Args:
         database_url: Database URL
@@ -163,23 +178,35 @@ def configure_pool_settings(database_url: str) -> dict[str, object]:
     Returns:
         Dictionary of pool configuration kwargs
     """
+    from .monitoring.database_pool_metrics import InstrumentedAsyncQueuePool
+
     pool_kwargs: dict[str, object] = {}
     if "test" in database_url:
         pool_kwargs["poolclass"] = NullPool
+        return pool_kwargs
+
+    pool_kwargs["poolclass"] = InstrumentedAsyncQueuePool
+    db_config_dict = _load_database_config()
+    if db_config_dict is None:
+        # Script or minimal env: use defaults so DB can connect without full AppConfig
+        pool_kwargs.update(_DEFAULT_POOL_SETTINGS)
     else:
-        try:
-            from .config import get_config
-
-            config = get_config()
-            db_config_dict = config.database.model_dump()
-            pool_kwargs.update(
-                {
-                    "pool_size": db_config_dict["pool_size"],
-                    "max_overflow": db_config_dict["max_overflow"],
-                    "pool_timeout": db_config_dict["pool_timeout"],
-                }
-            )
-        except (PydanticValidationError, ImportError, RuntimeError):
-            # Script or minimal env: use defaults so DB can connect without full AppConfig
-            pool_kwargs.update(_DEFAULT_POOL_SETTINGS)
+        pool_kwargs.update({key: db_config_dict.get(key, default) for key, default in _DEFAULT_POOL_SETTINGS.items()})
     return pool_kwargs
+
+
+def configure_statement_cache_args() -> dict[str, int]:
+    """
+    Build connect_args for the per-connection prepared statement cache.
+
+    SQLAlchemy's asyncpg dialect prepares every statement and keeps an LRU
+    of prepared statements per connection (100 by default). Repository SQL
+    is module-level ``text()`` constants, so the cache holds the hot queries
+    once it is large enough for the application's full statement set.
+
+    Returns:
+        Dict to merge into create_async_engine(..., connect_args=...).
+    """
+    db_config_dict = _load_database_config()
+    size = (db_config_dict or {}).get("prepared_statement_cache_size", _DEFAULT_PREPARED_STATEMENT_CACHE_SIZE)
+    return {"prepared_statement_cache_size": size}
@@ -0,0 +1,358 @@
+"""
+Unit of work: one session and one commit per command or tick phase.
+
+Repositories open a session from ``get_session_maker()`` for every call, so
+a single command (load player, save player, mark exploration, update quest
+progress, ...) checked out several connections and committed several times.
+Inside ``async with unit_of_work("command"):`` the session maker hands
+every repository call made by the same task the unit's shared session:
+
+- Each ``async with session_maker() as session:`` block runs in its own
+  SAVEPOINT. A block that raises rolls back to it, so one failed statement
+  neither aborts the unit's transaction nor discards the writes of the
+  calls before it.
+- ``commit()`` on the shared session only flushes; the unit commits once
+  when the block exits (and rolls back if it raises).
+- ``close()`` is deferred to the end of the unit.
+- ``rollback()`` rolls back to the current block's savepoint. Outside any
+  block there is no savepoint, so it rolls back the unit's transaction and
+  the unit fails instead of committing a partial result.
+- EventBus events published inside the unit are delivered after the
+  commit (dropped on rollback), so subscribers never read rows the unit
+  has not committed yet. Websocket messages sent through the connection
+  manager are held the same way, so a player is never told about a
+  result whose commit then fails.
+
+Only the task that opened the unit joins it. Tasks spawned inside the
+block inherit the context variable but get their own sessions, because an
+AsyncSession must not be used concurrently.
+
+Units are opt-in; code outside a unit is unchanged. Per-unit statistics
+(sessions requested vs. the one connection used) are exported through
+/monitoring/database-pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import AsyncIterator, Callable, Hashable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Self, override
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction, async_sessionmaker
+
+from .exceptions import DatabaseError
+from .structured_logging.enhanced_logging_config import get_logger
+from .utils.error_logging import log_and_raise
+
+logger = get_logger(__name__)
+
+_current_unit: ContextVar[UnitOfWork | None] = ContextVar("mythos_unit_of_work", default=None)
+
+
+@dataclass(slots=True)
+class _UnitStats:
+    """Totals for all units of work with the same name."""
+
+    units: int = 0
+    # Sessions repositories asked for (the sessions they opened before units existed)
+    sessions_requested: int = 0
+    max_sessions_requested: int = 0
+    # Units that touched the database (each used one connection and one commit)
+    connections: int = 0
+    deferred_commits: int = 0
+    rollbacks: int = 0
+    failed: int = 0
+
+
+_unit_stats: dict[str, _UnitStats] = {}
+
+
+class UnitOfWorkSession(AsyncSession):  # pylint: disable=abstract-method  # Reason: _no_async_engine_events is a SQLAlchemy guard meant to stay unimplemented
+    """
+    AsyncSession shared by a unit of work; commit and close wait for the unit to finish.
+
+    Every ``async with`` block on the session is a savepoint, so a repository call
+    that fails is undone on its own and the unit carries on.
+    """
+
+    def __init__(self, *args: Any, unit: UnitOfWork, **kwargs: Any) -> None:
+        """Initialize the shared session for a unit."""
+        super().__init__(*args, **kwargs)
+        self._unit = unit
+        self._deferring = True
+        # One savepoint per open ``async with`` block; blocks nest within the owning task
+        self._savepoints: list[AsyncSessionTransaction] = []
+
+    @override
+    async def __aenter__(self) -> Self:
+        if self._deferring:
+            self._savepoints.append(await self.begin_nested())
+        return self
+
+    @override
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._deferring and self._savepoints:
+            savepoint = self._savepoints.pop()
+            if exc_type is None:
+                await self._release(savepoint)
+            else:
+                self._unit.rollbacks += 1
+                await self._rollback_to(savepoint)
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _release(self, savepoint: AsyncSessionTransaction) -> None:
+        if not savepoint.is_active:
+            return
+        try:
+            await savepoint.commit()
+        except BaseException:
+            # The flush on release failed: undo this block's writes and let the caller see the error
+            self._unit.rollbacks += 1
+            await self._rollback_to(savepoint)
+            raise
+
+    @staticmethod
+    async def _rollback_to(savepoint: AsyncSessionTransaction) -> None:
+        if savepoint.is_active:
+            await savepoint.rollback()
+
+    @override
+    async def commit(self) -> None:
+        """Flush while the unit is open; commit when the unit finishes."""
+        if self._deferring:
+            self._unit.deferred_commits += 1
+            await self.flush()
+            return
+        await super().commit()
+
+    @override
+    async def rollback(self) -> None:
+        """
+        Roll back to the current block's savepoint and start a new one for the rest of the block.
+
+        Without an open block this rolls back the unit's transaction, and the unit fails
+        rather than commit whatever was written after it.
+        """
+        if not self._deferring:
+            await super().rollback()
+            return
+        self._unit.rollbacks += 1
+        if not self._savepoints:
+            self._unit.rolled_back = True
+            await super().rollback()
+            return
+        await self._rollback_to(self._savepoints[-1])
+        self._savepoints[-1] = await self.begin_nested()
+
+    @override
+    async def close(self) -> None:
+        """Close only when the unit finishes."""
+        if self._deferring:
+            return
+        await super().close()
+
+    async def finish(self, *, commit: bool) -> None:
+        """Commit or roll back and close the session (called by the unit)."""
+        self._deferring = False
+        try:
+            if commit:
+                await super().commit()
+            else:
+                await super().rollback()
+        finally:
+            await super().close()
+
+
+class UnitOfWork:
+    """One command's or tick phase's shared session and after-commit callbacks."""
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize a unit of work.
+
+        Args:
+            name: Unit name for statistics ("command", "tick.status_effects", ...)
+        """
+        self.name = name
+        self.sessions_requested = 0
+        self.deferred_commits = 0
+        self.rollbacks = 0
+        # Set when the unit's whole transaction was rolled back; the unit then cannot commit
+        self.rolled_back = False
+        self._owner = asyncio.current_task()
+        # Entities loaded in this unit, so repeated loads return the same object
+        self.identity_map: dict[Hashable, object] = {}
+        self._session: UnitOfWorkSession | None = None
+        self._after_commit: list[Callable[[], object]] = []
+
+    def owned_by_current_task(self) -> bool:
+        """Whether the running task opened this unit."""
+        return asyncio.current_task() is self._owner
+
+    def join(self, session_maker: async_sessionmaker[AsyncSession]) -> UnitOfWorkSession:
+        """Return the unit's session, creating it from the session maker's settings on first use."""
+        self.sessions_requested += 1
+        if self._session is None:
+            self._session = UnitOfWorkSession(unit=self, **session_maker.kw)
+        return self._session
+
+    def call_after_commit(self, callback: Callable[[], object]) -> None:
+        """
+        Run a callback once the unit has committed (it is dropped if the unit rolls back).
+
+        Callbacks run in order; one that returns an awaitable (an async send) is awaited.
+        """
+        self._after_commit.append(callback)
+
+    async def finish(self, *, failed: bool) -> None:
+        """
+        Commit (or roll back) the shared session, then run the after-commit callbacks.
+
+        Raises:
+            DatabaseError: If the commit fails, or the unit's transaction was rolled back
+                outside a savepoint and there is no complete result to commit
+        """
+        if self.rolled_back and not failed:
+            if self._session is not None:
+                await self._session.finish(commit=False)
+            self._record(failed=True)
+            log_and_raise(
+                DatabaseError,
+                "Unit of work was rolled back outside a savepoint; not committing a partial result",
+                operation="unit_of_work",
+                details={"unit": self.name, "sessions_requested": self.sessions_requested},
+            )
+        try:
+            if self._session is not None:
+                await self._session.finish(commit=not failed)
+        except (SQLAlchemyError, OSError) as e:
+            self._record(failed=True)
+            log_and_raise(
+                DatabaseError,
+                f"Database error finishing unit of work: {e}",
+                operation="unit_of_work",
+                details={"unit": self.name, "sessions_requested": self.sessions_requested, "error": str(e)},
+            )
+        self._record(failed)
+        if failed:
+            return
+        for callback in self._after_commit:
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except (RuntimeError, ValueError, OSError) as e:
+                logger.warning("After-commit callback failed", unit=self.name, error=str(e))
+
+    def _record(self, failed: bool) -> None:
+        stats = _unit_stats.setdefault(self.name, _UnitStats())
+        stats.units += 1
+        stats.sessions_requested += self.sessions_requested
+        stats.max_sessions_requested = max(stats.max_sessions_requested, self.sessions_requested)
+        stats.connections += 1 if self._session is not None else 0
+        stats.deferred_commits += self.deferred_commits
+        stats.rollbacks += self.rollbacks
+        stats.failed += 1 if failed else 0
+
+
+class UnitOfWorkSessionMaker(async_sessionmaker[AsyncSession]):
+    """Session maker that hands out the current unit of work's session when there is one."""
+
+    @override
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        unit = _current_unit.get()
+        if unit is not None and not local_kw and unit.owned_by_current_task():
+            return unit.join(self)
+        return super().__call__(**local_kw)
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    """The unit of work opened by the running task, if any."""
+    unit = _current_unit.get()
+    return unit if unit is not None and unit.owned_by_current_task() else None
+
+
+def defer_until_commit(callback: Callable[[], object]) -> bool:
+    """
+    Schedule a callback for after the current unit of work commits.
+
+    Returns:
+        True if deferred, False if there is no unit (the caller runs it now)
+    """
+    unit = current_unit_of_work()
+    if unit is None:
+        return False
+    unit.call_after_commit(callback)
+    return True
+
+
+@asynccontextmanager
+async def unit_of_work(name: str) -> AsyncIterator[UnitOfWork]:
+    """
+    Share one session and one commit across the repository calls in this block.
+
+    A unit opened inside another unit of the same task joins the outer one.
+
+    Args:
+        name: Unit name for statistics
+    """
+    outer = current_unit_of_work()
+    if outer is not None:
+        yield outer
+        return
+
+    unit = UnitOfWork(name)
+    token = _current_unit.set(unit)
+    try:
+        yield unit
+    except BaseException:
+        _current_unit.reset(token)
+        await unit.finish(failed=True)
+        raise
+    _current_unit.reset(token)
+    await unit.finish(failed=False)
+
+
+def get_unit_of_work_stats() -> dict[str, dict[str, float]]:
+    """Per-unit-name totals with the average sessions requested per unit."""
+    return {
+        name: {
+            "units": stats.units,
+            "connections": stats.connections,
+            "sessions_requested": stats.sessions_requested,
+            "avg_sessions_requested": round(stats.sessions_requested / stats.units, 2) if stats.units else 0.0,
+            "max_sessions_requested": stats.max_sessions_requested,
+            "deferred_commits": stats.deferred_commits,
+            "rollbacks": stats.rollbacks,
+            "failed": stats.failed,
+        }
+        for name, stats in _unit_stats.items()
+    }
+
+
+def reset_unit_of_work_stats() -> None:
+    """Clear unit of work statistics."""
+    _unit_stats.clear()
+
+
+__all__ = [
+    "UnitOfWork",
+    "UnitOfWorkSession",
+    "UnitOfWorkSessionMaker",
+    "current_unit_of_work",
+    "defer_until_commit",
+    "get_unit_of_work_stats",
+    "reset_unit_of_work_stats",
+    "unit_of_work",
+]
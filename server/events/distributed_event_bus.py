@@ -9,8 +9,10 @@ from __future__ import annotations
 
 import asyncio
 import uuid
+from collections.abc import Iterable
 from typing import Any, TypeVar
 
+from ..database_unit_of_work import defer_until_commit
 from ..structured_logging.enhanced_logging_config import get_logger
 from .event_bus import EventBus
 from .event_types import BaseEvent
@@ -25,9 +27,11 @@ class DistributedEventBus(EventBus):
     """
     EventBus that distributes domain events via NATS for horizontal scaling.
 
-    When nats_service is set, events published locally are also published to
-    NATS. Events received from NATS (from other instances) are injected into
-    the local queue for dispatch. When nats_service is None, behaves exactly
+    When nats_service is set, events published locally whose class is
+    allowlisted in the bridge's distribution registry are also published to
+    NATS (instance-local events such as the Mythos hour tick are not).
+    Events received from NATS (from other instances) are injected into the
+    local queue for dispatch. When nats_service is None, behaves exactly
     like a plain EventBus (single-instance mode).
     """
 
@@ -43,14 +47,20 @@ class DistributedEventBus(EventBus):
         self._nats_bridge: NATSEventBusBridge | None = None
         self._instance_id = str(uuid.uuid4())
 
-    def set_nats_service(self, nats_service: Any) -> None:
-        """Set NATS service and start the bridge (call after NATS connects)."""
+    def set_nats_service(self, nats_service: Any, zones: Iterable[str] | None = None) -> None:
+        """
+        Set NATS service and start the bridge (call after NATS connects).
+
+        Args:
+            nats_service: Connected NATS service
+            zones: Zones whose zone-sharded events this instance receives (None = all zones)
+        """
         if self._nats_service is nats_service:
             return
         self._nats_service = nats_service
         if nats_service:
             self._nats_bridge = NATSEventBusBridge(
-                event_bus=self, nats_service=nats_service, instance_id=self._instance_id
+                event_bus=self, nats_service=nats_service, instance_id=self._instance_id, zones=zones
             )
             # Start bridge - fire and forget; it subscribes to NATS
             try:
@@ -61,13 +71,12 @@ class DistributedEventBus(EventBus):
 
     def publish(self, event: BaseEvent) -> None:
         """Publish event locally and to NATS when bridge is active."""
+        if defer_until_commit(lambda: self.publish(event)):
+            return
         super().publish(event)
         if self._nats_bridge and self._nats_service:
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(self._nats_bridge.publish(event))
-            except RuntimeError:
-                pass
+            # Queued for the bridge's single writer task; local-only event types are skipped
+            _ = self._nats_bridge.enqueue(event)
 
     async def shutdown(self) -> None:
         """Shutdown EventBus and stop NATS bridge."""
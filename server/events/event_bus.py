@@ -22,13 +22,15 @@ occur throughout our eldritch architecture.
 import asyncio
 import time
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from typing import TypedDict, TypeVar, cast, override
 
 from anyio import Event
 from structlog.stdlib import BoundLogger
 
 from ..structured_logging.enhanced_logging_config import get_logger
+from .event_bus_base import SubscriberTable
+from .event_bus_lanes import DEFAULT_MAX_LANE_BACKLOG, DEFAULT_MAX_QUEUE_SIZE, EventBusLaneDispatchMixin
 from .event_bus_lifecycle import EventBusLifecycleMixin
 from .event_bus_processing import EventBusProcessingMixin
 from .event_types import BaseEvent
@@ -61,7 +63,7 @@ class SubscriberLifecycleMetrics(TypedDict):
     recent_unsubscriptions_last_hour: int
 
 
-class EventBus(EventBusProcessingMixin, EventBusLifecycleMixin):  # pylint: disable=too-many-instance-attributes  # Reason: Event bus requires multiple subscription maps and state tracking
+class EventBus(EventBusProcessingMixin, EventBusLaneDispatchMixin, EventBusLifecycleMixin):  # pylint: disable=too-many-instance-attributes  # Reason: Event bus requires multiple subscription maps and state tracking
     """
     Pure asyncio event bus for MythosMUD.
 
@@ -70,16 +72,34 @@ class EventBus(EventBusProcessingMixin, EventBusLifecycleMixin):  # pylint: disa
     to maintain computational dimensional integrity without dangerous
     threading.antipatterns.
 
-    Events are processed using pure asyncio.Queue with properly managed
+    Published events go through a bounded asyncio.Queue and are then handed
+    to per-key dispatch lanes (see event_bus_lanes), with properly managed
     task lifecycle and graceful shutdown capabilities.
     """
 
-    def __init__(self) -> None:
-        """Initialize the pure async event bus."""
-        self._subscribers: dict[type[BaseEvent], list[Callable[[BaseEvent], object]]] = defaultdict(list)
-        # Pure asyncio.Queue replaces threading.Queue - Task 1.2: Replace queue
-        self._event_queue: asyncio.Queue[BaseEvent | None] = asyncio.Queue()
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_lane_backlog: int = DEFAULT_MAX_LANE_BACKLOG,
+        lane_key: Callable[[BaseEvent], Hashable] | None = None,
+    ) -> None:
+        """
+        Initialize the pure async event bus.
+
+        Args:
+            max_queue_size: Capacity of the intake queue (and of all lane backlogs together)
+            max_lane_backlog: Events one lane may hold before its new events are dropped
+            lane_key: Maps an event to its dispatch lane (default: player, NPC, room, then event type)
+        """
         self._running: bool = False
+        if max_queue_size <= 0 or max_lane_backlog <= 0:
+            raise ValueError("max_queue_size and max_lane_backlog must be positive")
+        self._subscribers: dict[type[BaseEvent], list[Callable[[BaseEvent], object]]] = defaultdict(list)
+        # Subscribers pre-split into (async, sync), rebuilt on subscribe/unsubscribe
+        self._subscriber_tables: dict[type[BaseEvent], SubscriberTable] = {}
+        # Bounded intake queue: publish drops (and counts) events when dispatch cannot keep up
+        self._event_queue: asyncio.Queue[BaseEvent | None] = asyncio.Queue(maxsize=max_queue_size)
+        self._init_lane_dispatch(max_queue_size, max_lane_backlog, lane_key)
         self._logger: BoundLogger = get_logger("EventBus")
         # Task references for proper lifecycle management - Task 1.5
         self._active_tasks: set[asyncio.Task[object]] = set()
@@ -131,6 +151,7 @@ class EventBus(EventBusProcessingMixin, EventBusLifecycleMixin):  # pylint: disa
         # level for simple operations like this, sufficient for single-threaded async
         stored = cast(Callable[[BaseEvent], object], handler)
         self._subscribers[event_type].append(stored)
+        self._rebuild_subscriber_table(event_type)
         # Track subscription for metrics
         self._subscription_count += 1
         self._subscription_timestamps.append(time.time())
@@ -163,6 +184,7 @@ class EventBus(EventBusProcessingMixin, EventBusLifecycleMixin):  # pylint: disa
         stored = cast(Callable[[BaseEvent], object], handler)
         try:
             subscribers.remove(stored)
+            self._rebuild_subscriber_table(event_type)
             # Track unsubscription for metrics
             self._unsubscription_count += 1
             self._unsubscription_timestamps.append(time.time())
@@ -215,10 +237,6 @@ class EventBus(EventBusProcessingMixin, EventBusLifecycleMixin):  # pylint: disa
         """
         return len(self._active_tasks)
 
-    def get_queue_depth(self) -> int:
-        """Return the number of events waiting for the sole async consumer."""
-        return self._event_queue.qsize()
-
     def get_active_task_details(self) -> list[dict[str, object]]:
         """
         Get details of active tasks for debugging.
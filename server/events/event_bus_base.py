@@ -16,11 +16,16 @@ from structlog.stdlib import BoundLogger
 
 from .event_types import BaseEvent
 
+# (handler, display name) pairs, pre-split into (async, sync) when subscriptions change
+SubscriberEntry = tuple[Callable[[BaseEvent], object], str]
+SubscriberTable = tuple[tuple[SubscriberEntry, ...], tuple[SubscriberEntry, ...]]
+
 
 class EventBusMixinBase:  # pylint: disable=too-few-public-methods  # Reason: Mixin; methods are _-prefixed by design
     """Attrs/methods provided by EventBus when mixed in."""
 
     _subscribers: dict[type[BaseEvent], list[Callable[[BaseEvent], object]]]
+    _subscriber_tables: dict[type[BaseEvent], SubscriberTable]
     _event_queue: asyncio.Queue[BaseEvent | None]
     _running: bool
     _logger: BoundLogger
@@ -37,6 +42,34 @@ class EventBusMixinBase:  # pylint: disable=too-few-public-methods  # Reason: Mi
         """Drain the event queue. Real impl is EventBusProcessingMixin."""
         return None
 
+    async def _handle_event_async(self, event: BaseEvent) -> None:
+        """Dispatch one event to its subscribers. Real impl is EventBusProcessingMixin."""
+        del event
+
+    async def _dispatch_to_lane(self, event: BaseEvent) -> None:
+        """Queue an event on its dispatch lane. Real impl is EventBusLaneDispatchMixin."""
+        del event
+
+    def get_queue_depth(self) -> int:
+        """Return events waiting for dispatch. Real impl is EventBusLaneDispatchMixin."""
+        return 0
+
+    def _record_enqueued(self) -> None:
+        """Update queue metrics after a publish. Real impl is EventBusLaneDispatchMixin."""
+        return None
+
+    def _record_overload(self, event: BaseEvent) -> None:
+        """Count a rejected event. Real impl is EventBusLaneDispatchMixin."""
+        del event
+
+    def _record_subscriber_latency(self, name: str, elapsed: float, *, failed: bool = False) -> None:
+        """Record subscriber latency. Real impl is EventBusLaneDispatchMixin."""
+        del name, elapsed, failed
+
+    def _track_async_latency(self, task: asyncio.Task[object], name: str) -> None:
+        """Record latency when a subscriber task ends. Real impl is EventBusLaneDispatchMixin."""
+        del task, name
+
     def unsubscribe_all_for_service(self, service_id: str) -> int:
         """Drop tracked service handlers. Real impl is EventBus."""
         del service_id
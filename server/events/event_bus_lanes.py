@@ -0,0 +1,273 @@
+"""Keyed dispatch lanes, backpressure and subscriber latency accounting for EventBus.
+
+Events leave the intake queue through dispatch lanes. Each lane is keyed by
+the entity the event is about (player, NPC, room) or, failing that, by event
+type. Events in one lane are handled strictly in publish order; different
+lanes run concurrently, so a slow subscriber only delays events that share
+its lane instead of the whole bus. Each lane's backlog is capped: once a lane
+is full its new events are dropped and counted, and the other lanes keep
+dispatching.
+"""
+
+# pyright: reportUninitializedInstanceVariable=false
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import TypedDict, cast, override
+
+from ..structured_logging.enhanced_logging_config import get_logger
+from .event_bus_base import EventBusMixinBase
+from .event_types import BaseEvent
+
+logger = get_logger("server.events.event_bus")
+
+# Maximum events held by the intake queue, and separately by all lane backlogs together
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+# Maximum events waiting in one lane; a lane this far behind drops new events instead of growing
+DEFAULT_MAX_LANE_BACKLOG = 1_000
+# Fraction of the queue capacity at which a backpressure warning is logged
+HIGH_WATERMARK_RATIO = 0.8
+# Subscribers slower than this are logged as slow
+SLOW_SUBSCRIBER_THRESHOLD_SECONDS = 0.25
+
+
+def default_lane_key(event: BaseEvent) -> Hashable:
+    """
+    Pick the dispatch lane for an event.
+
+    Events about the same player, NPC or room (checked in that order) share a
+    lane and keep their relative order; anything else is ordered per event type.
+    """
+    for attribute in ("player_id", "npc_id", "room_id"):
+        value = getattr(event, attribute, None)
+        if value is not None:
+            return (attribute, str(value))
+    # cast: classes are hashable; mypy checks the dataclass instance __hash__ instead
+    return cast(Hashable, type(event))
+
+
+@dataclass(slots=True)
+class DispatchLane:
+    """Ordered backlog of events for one lane key and the task draining it."""
+
+    key: Hashable
+    backlog: deque[BaseEvent] = field(default_factory=deque)
+    task: asyncio.Task[None] | None = None
+    # Set while the lane drops events, so the overflow is logged once per episode
+    overflowing: bool = False
+
+
+@dataclass(slots=True)
+class SubscriberLatency:
+    """Running latency totals for one subscriber."""
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class DispatchStats(TypedDict):
+    """Dispatch metrics returned by get_dispatch_stats()."""
+
+    queue_depth: int
+    intake_depth: int
+    lane_backlog: int
+    max_queue_size: int
+    queue_high_watermark: int
+    backpressure_warnings: int
+    max_lane_backlog: int
+    lane_overflow_events: int
+    overloaded_events: int
+    active_lanes: int
+    lanes_started: int
+    subscriber_latency: dict[str, dict[str, float | int]]
+
+
+class EventBusLaneDispatchMixin(EventBusMixinBase):
+    """Mixin: route dequeued events to keyed lanes and record subscriber latency."""
+
+    _max_queue_size: int
+    _max_lane_backlog: int
+    _lane_key: Callable[[BaseEvent], Hashable]
+    _lanes: dict[Hashable, DispatchLane]
+    _lane_backlog_total: int
+    _lanes_started: int
+    _queue_high_watermark: int
+    _backpressure_warnings: int
+    _lane_overflow_events: int
+    _above_high_watermark: bool
+    _overloaded_events: int
+    _subscriber_latency: dict[str, SubscriberLatency]
+
+    def _init_lane_dispatch(
+        self, max_queue_size: int, max_lane_backlog: int, lane_key: Callable[[BaseEvent], Hashable] | None
+    ) -> None:
+        """Initialize lane and metrics state (called from EventBus.__init__)."""
+        self._max_queue_size = max_queue_size
+        self._max_lane_backlog = min(max_lane_backlog, max_queue_size)
+        self._lane_key = lane_key or default_lane_key
+        self._lanes = {}
+        self._lane_backlog_total = 0
+        self._lanes_started = 0
+        self._queue_high_watermark = 0
+        self._backpressure_warnings = 0
+        self._lane_overflow_events = 0
+        self._above_high_watermark = False
+        self._overloaded_events = 0
+        self._subscriber_latency = {}
+
+    def get_queue_depth(self) -> int:
+        """Return the number of events waiting for dispatch (intake queue plus lane backlogs)."""
+        return self._event_queue.qsize() + self._lane_backlog_total
+
+    @override
+    def _record_enqueued(self) -> None:
+        """Update the high-watermark metrics after an event was queued."""
+        depth = self.get_queue_depth()
+        self._queue_high_watermark = max(self._queue_high_watermark, depth)
+        threshold = int(self._max_queue_size * HIGH_WATERMARK_RATIO)
+        if depth >= threshold and not self._above_high_watermark:
+            self._above_high_watermark = True
+            self._backpressure_warnings += 1
+            self._logger.warning(
+                "EventBus queue above high watermark", queue_depth=depth, max_queue_size=self._max_queue_size
+            )
+        elif depth < threshold // 2:
+            self._above_high_watermark = False
+
+    @override
+    def _record_overload(self, event: BaseEvent) -> None:
+        """Count an event dropped because the intake queue is full."""
+        self._overloaded_events += 1
+        self._logger.warning("Event queue at capacity - dropping event", event_type=type(event).__name__)
+
+    @override
+    async def _dispatch_to_lane(self, event: BaseEvent) -> None:
+        """
+        Append an event to its lane, starting the lane task if it is idle.
+
+        Never waits: an event whose lane is full (or that would push all lanes
+        past max_queue_size) is dropped and counted, so one stalled lane cannot
+        hold up dispatch for the others.
+        """
+        key = self._lane_key(event)
+        lane = self._lanes.get(key)
+        if self._lane_backlog_total >= self._max_queue_size:
+            # Every lane together is at capacity (the high-watermark warning has already been logged)
+            self._lane_overflow_events += 1
+            return
+        if lane is None:
+            lane = DispatchLane(key)
+            self._lanes[key] = lane
+        elif len(lane.backlog) >= self._max_lane_backlog:
+            self._record_lane_overflow(lane, event)
+            return
+        lane.backlog.append(event)
+        self._lane_backlog_total += 1
+        if lane.task is None:
+            self._lanes_started += 1
+            task = asyncio.create_task(self._run_lane(lane))
+            lane.task = task
+            self._active_tasks.add(task)
+            task.add_done_callback(self._active_tasks.discard)
+
+    def _record_lane_overflow(self, lane: DispatchLane, event: BaseEvent) -> None:
+        """Count an event dropped because its lane is full."""
+        self._lane_overflow_events += 1
+        if not lane.overflowing:
+            lane.overflowing = True
+            self._logger.warning(
+                "Event dispatch lane full - dropping events",
+                lane=str(lane.key),
+                event_type=type(event).__name__,
+                lane_backlog=len(lane.backlog),
+            )
+
+    async def _run_lane(self, lane: DispatchLane) -> None:
+        """Handle a lane's events one at a time until its backlog is empty."""
+        try:
+            while lane.backlog:
+                event = lane.backlog.popleft()
+                self._lane_backlog_total -= 1
+                if lane.overflowing and len(lane.backlog) < self._max_lane_backlog // 2:
+                    lane.overflowing = False
+                try:
+                    await self._handle_event_async(event)
+                except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: One failing event must not stall the rest of its lane
+                    self._logger.error(
+                        "Error processing event in dispatch lane",
+                        event_type=type(event).__name__,
+                        error=str(e),
+                        exc_info=True,
+                    )
+        finally:
+            lane.task = None
+            if lane.backlog:
+                # Cancelled mid-lane: discard what is left so the counters stay consistent
+                self._lane_backlog_total -= len(lane.backlog)
+                lane.backlog.clear()
+            if self._lanes.get(lane.key) is lane:
+                del self._lanes[lane.key]
+
+    @override
+    def _record_subscriber_latency(self, name: str, elapsed: float, *, failed: bool = False) -> None:
+        """Add one subscriber invocation to the latency totals."""
+        stats = self._subscriber_latency.get(name)
+        if stats is None:
+            stats = SubscriberLatency()
+            self._subscriber_latency[name] = stats
+        stats.calls += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        if failed:
+            stats.errors += 1
+        if elapsed >= SLOW_SUBSCRIBER_THRESHOLD_SECONDS:
+            self._logger.warning("Slow event subscriber", subscriber_name=name, elapsed_ms=round(elapsed * 1000, 1))
+
+    @override
+    def _track_async_latency(self, task: asyncio.Task[object], name: str) -> None:
+        """Record a subscriber task's latency when it finishes."""
+        started = time.perf_counter()
+
+        def _done(finished: asyncio.Task[object]) -> None:
+            failed = finished.cancelled() or finished.exception() is not None
+            self._record_subscriber_latency(name, time.perf_counter() - started, failed=failed)
+
+        task.add_done_callback(_done)
+
+    def get_dispatch_stats(self) -> DispatchStats:
+        """
+        Get queue, lane and per-subscriber latency metrics for monitoring.
+
+        Returns:
+            Dictionary with queue depth/high watermark, backpressure counters,
+            lane counts and per-subscriber call counts and latencies
+        """
+        return {
+            "queue_depth": self.get_queue_depth(),
+            "intake_depth": self._event_queue.qsize(),
+            "lane_backlog": self._lane_backlog_total,
+            "max_queue_size": self._max_queue_size,
+            "queue_high_watermark": self._queue_high_watermark,
+            "backpressure_warnings": self._backpressure_warnings,
+            "max_lane_backlog": self._max_lane_backlog,
+            "lane_overflow_events": self._lane_overflow_events,
+            "overloaded_events": self._overloaded_events,
+            "active_lanes": len(self._lanes),
+            "lanes_started": self._lanes_started,
+            "subscriber_latency": {
+                name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "avg_ms": stats.total_seconds / stats.calls * 1000 if stats.calls else 0.0,
+                    "max_ms": stats.max_seconds * 1000,
+                }
+                for name, stats in self._subscriber_latency.items()
+            },
+        }
@@ -11,16 +11,24 @@ from __future__ import annotations
 import asyncio
 import inspect
 import os
+import time
 from collections.abc import Callable
 from typing import override
 
+from ..database_unit_of_work import defer_until_commit
 from ..structured_logging.enhanced_logging_config import get_logger
-from .event_bus_base import EventBusMixinBase
+from .event_bus_base import EventBusMixinBase, SubscriberEntry, SubscriberTable
 from .event_types import BaseEvent
 
 logger = get_logger("server.events.event_bus")
 
 
+def _subscriber_name(subscriber: Callable[[BaseEvent], object]) -> str:
+    """Return a readable name for a subscriber (qualified name for bound methods)."""
+    name = getattr(subscriber, "__qualname__", None) or getattr(subscriber, "__name__", None)
+    return name if isinstance(name, str) else "unknown"
+
+
 class EventBusProcessingMixin(EventBusMixinBase):
     """Mixin: queue loop, subscriber dispatch, publish, and inject."""
 
@@ -51,8 +59,8 @@ class EventBusProcessingMixin(EventBusMixinBase):
                     if event is None:
                         break
 
-                    # Process the event with proper async handling
-                    await self._handle_event_async(event)
+                    # Hand the event to its dispatch lane; lanes run concurrently
+                    await self._dispatch_to_lane(event)
 
                 except TimeoutError:
                     # Timeout is expected when no events are available - allows periodic shutdown check
@@ -80,7 +88,7 @@ class EventBusProcessingMixin(EventBusMixinBase):
         """
         Separate async and sync subscribers for appropriate execution.
 
-        Uses inspect.iscoroutinefunction to detect async callables at runtime. This allows
+        Uses inspect.iscoroutinefunction to detect async callables. This allows
         the event bus to handle mixed subscriber lists, executing sync subscribers immediately
         and async subscribers concurrently via asyncio tasks.
 
@@ -101,9 +109,33 @@ class EventBusProcessingMixin(EventBusMixinBase):
 
         return async_subscribers, sync_subscribers
 
-    def _process_sync_subscribers(
-        self, sync_subscribers: list[Callable[[BaseEvent], object]], event: BaseEvent
-    ) -> None:
+    def _rebuild_subscriber_table(self, event_type: type[BaseEvent]) -> None:
+        """
+        Re-classify the subscribers of one event type.
+
+        Called on subscribe/unsubscribe so dispatch never has to inspect
+        handlers per event.
+        """
+        subscribers = self._subscribers.get(event_type)
+        if not subscribers:
+            _ = self._subscriber_tables.pop(event_type, None)
+            return
+        async_subscribers, sync_subscribers = self._separate_subscribers(subscribers)
+        self._subscriber_tables[event_type] = (
+            tuple((s, _subscriber_name(s)) for s in async_subscribers),
+            tuple((s, _subscriber_name(s)) for s in sync_subscribers),
+        )
+
+    def _get_subscriber_table(self, event_type: type[BaseEvent]) -> SubscriberTable | None:
+        """Return the pre-classified subscribers for an event type, if any."""
+        table = self._subscriber_tables.get(event_type)
+        if table is None and self._subscribers.get(event_type):
+            # Subscribers added without subscribe() (tests poke _subscribers directly)
+            self._rebuild_subscriber_table(event_type)
+            table = self._subscriber_tables.get(event_type)
+        return table
+
+    def _process_sync_subscribers(self, sync_subscribers: tuple[SubscriberEntry, ...], event: BaseEvent) -> None:
         """
         Execute sync subscribers sequentially with error isolation.
 
@@ -113,18 +145,21 @@ class EventBusProcessingMixin(EventBusMixinBase):
         other subscribers.
 
         Args:
-            sync_subscribers: List of synchronous subscriber callables
+            sync_subscribers: (subscriber, name) pairs for synchronous subscribers
             event: Event to pass to each subscriber
         """
-        for subscriber in sync_subscribers:
+        for subscriber, subscriber_name in sync_subscribers:
+            started = time.perf_counter()
             try:
                 _ = subscriber(event)
             except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Subscriber errors unpredictable, must not fail event processing
-                subscriber_name = getattr(subscriber, "__name__", "unknown")
+                self._record_subscriber_latency(subscriber_name, time.perf_counter() - started, failed=True)
                 self._logger.error("Error in sync event subscriber", subscriber_name=subscriber_name, error=str(e))
+            else:
+                self._record_subscriber_latency(subscriber_name, time.perf_counter() - started)
 
     def _create_async_subscriber_tasks(
-        self, async_subscribers: list[Callable[[BaseEvent], object]], event: BaseEvent
+        self, async_subscribers: tuple[SubscriberEntry, ...], event: BaseEvent
     ) -> tuple[list[asyncio.Task[object]], dict[asyncio.Task[object], str]]:
         """
         Create asyncio tasks for async event subscribers and track their lifecycle.
@@ -138,7 +173,7 @@ class EventBusProcessingMixin(EventBusMixinBase):
         failed without maintaining task-to-subscriber references separately.
 
         Args:
-            async_subscribers: List of async callable subscribers to invoke
+            async_subscribers: (subscriber, name) pairs for async subscribers to invoke
             event: Event to pass to each subscriber
 
         Returns:
@@ -147,8 +182,7 @@ class EventBusProcessingMixin(EventBusMixinBase):
         tasks: list[asyncio.Task[object]] = []
         subscriber_names: dict[asyncio.Task[object], str] = {}
 
-        for subscriber in async_subscribers:
-            subscriber_name = getattr(subscriber, "__name__", "unknown")
+        for subscriber, subscriber_name in async_subscribers:
             try:
                 coro = subscriber(event)
                 if not inspect.iscoroutine(coro):
@@ -161,12 +195,8 @@ class EventBusProcessingMixin(EventBusMixinBase):
                 tasks.append(task)
                 subscriber_names[task] = subscriber_name
                 self._active_tasks.add(task)
-
-                def remove_task(t: asyncio.Task[object], _sn: str = subscriber_name) -> None:  # pylint: disable=unused-argument  # Reason: Parameter required for callback signature, subscriber_name captured in closure
-                    self._active_tasks.discard(t)
-
-                task.add_done_callback(remove_task)
-                self._logger.debug("Created tracked task for async subscriber", subscriber_name=subscriber_name)
+                task.add_done_callback(self._active_tasks.discard)
+                self._track_async_latency(task, subscriber_name)
             except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Task creation errors unpredictable, must continue with other subscribers
                 self._logger.error(
                     "Failed to create task for subscriber", subscriber_name=subscriber_name, error=str(e)
@@ -206,43 +236,32 @@ class EventBusProcessingMixin(EventBusMixinBase):
                         error_type=type(result).__name__,
                         exc_info=True,
                     )
-                else:
-                    self._logger.debug(
-                        "Async subscriber completed successfully",
-                        subscriber_name=subscriber_name,
-                        has_result=result is not None,
-                    )
         except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Gather operation errors unpredictable, must handle defensively
             self._logger.error("Unexpected error in subscriber task group", error=str(e), error_type=type(e).__name__)
 
+    @override
     async def _handle_event_async(self, event: BaseEvent) -> None:
         """
-        Handle a single event by calling all registered subscribers with structured concurrency.
+        Handle a single event by calling all registered subscribers.
 
-        Uses asyncio.TaskGroup (Python 3.11+) for structured concurrency to ensure:
-        - Proper exception propagation
-        - Automatic cancellation of all tasks if one fails
-        - Clean resource management
-        - No orphaned tasks
-
-        AnyIO Pattern: Task groups provide structured concurrency similar to anyio.create_task_group()
+        Sync subscribers run inline; async subscribers run concurrently as
+        tracked tasks and are awaited before the event's lane moves on, so
+        events in the same lane are handled in order.
         """
         event_type = type(event)
-        subscribers = self._subscribers.get(event_type, [])
+        table = self._get_subscriber_table(event_type)
 
-        if not subscribers:
+        if table is None:
             self._logger.debug("No subscribers for event type", event_type=event_type.__name__)
             return
 
-        self._logger.info(
+        async_subscribers, sync_subscribers = table
+        self._logger.debug(
             "Processing event for subscribers",
             event_type=event_type.__name__,
-            subscriber_count=len(subscribers),
-            subscriber_names=[getattr(s, "__name__", "unknown") for s in subscribers],
+            subscriber_count=len(async_subscribers) + len(sync_subscribers),
         )
 
-        async_subscribers, sync_subscribers = self._separate_subscribers(subscribers)
-
         self._process_sync_subscribers(sync_subscribers, event)
 
         if async_subscribers:
@@ -297,6 +316,9 @@ class EventBusProcessingMixin(EventBusMixinBase):
         """
         if not isinstance(event, BaseEvent):
             raise ValueError("Event must inherit from BaseEvent")
+        # Inside a unit of work, deliver after its commit so subscribers see the committed rows
+        if defer_until_commit(lambda: self.publish(event)):
+            return
 
         is_test_mode = (
             os.getenv("PYTEST_CURRENT_TEST") is not None
@@ -314,16 +336,17 @@ class EventBusProcessingMixin(EventBusMixinBase):
         # Use put_nowait for non-blocking publish (pure asyncio.Queue) - Task 1.2
         try:
             self._event_queue.put_nowait(event)
-            self._logger.info(
-                "Published event to queue",
-                event_type=type(event).__name__,
-                queue_size=self._event_queue.qsize(),
-                processing_running=self._running,
-            )
-        except asyncio.QueueFull as exc:
-            # Rare case where queue is at capacity - indicates very high load
-            self._logger.warning("Event queue at capacity - dropping event", event_type=type(event).__name__)
-            raise RuntimeError("Event bus overloaded") from exc
+        except asyncio.QueueFull:
+            # Dispatch cannot keep up: drop and count rather than fail the publisher
+            self._record_overload(event)
+            return
+        self._record_enqueued()
+        self._logger.debug(
+            "Published event to queue",
+            event_type=type(event).__name__,
+            queue_depth=self.get_queue_depth(),
+            processing_running=self._running,
+        )
 
     def inject(self, event: BaseEvent) -> None:
         """
@@ -337,11 +360,8 @@ class EventBusProcessingMixin(EventBusMixinBase):
         self._ensure_async_processing()
         try:
             self._event_queue.put_nowait(event)
-            self._logger.debug(
-                "Injected remote event",
-                event_type=type(event).__name__,
-                queue_size=self._event_queue.qsize(),
-            )
-        except asyncio.QueueFull as exc:
-            self._logger.warning("Event queue at capacity - dropping injected event", event_type=type(event).__name__)
-            raise RuntimeError("Event bus overloaded") from exc
+        except asyncio.QueueFull:
+            self._record_overload(event)
+            return
+        self._record_enqueued()
+        self._logger.debug("Injected remote event", event_type=type(event).__name__, queue_depth=self.get_queue_depth())
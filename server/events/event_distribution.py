@@ -0,0 +1,174 @@
+"""
+Distribution policies for domain events crossing instances over NATS.
+
+Not every event published on an instance's EventBus means anything to other
+instances: the Mythos hour tick fires on every instance's own scheduler, a
+room occupant refresh is a local nudge, and room occupancy is tracked by each
+instance from the movements it handles. The registry is an allowlist: only
+event classes registered here leave the instance, either broadcast on
+``events.domain.{event_type}`` or sharded by zone on
+``events.domain.{event_type}.{zone}`` so an instance can subscribe to just the
+zones it hosts. Everything else stays local.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from ..utils.room_utils import get_zone_from_room_id
+from .event_types import BaseEvent
+
+DOMAIN_EVENTS_SUBJECT_PREFIX = "events.domain"
+DOMAIN_EVENTS_SUBJECT_PATTERN = "events.domain.>"
+# Broadcast subjects only (one token after the prefix); zone shards add one more token
+DOMAIN_EVENTS_BROADCAST_PATTERN = "events.domain.*"
+
+
+class DistributionPolicy(StrEnum):
+    """Where an event class's events go beyond the local EventBus."""
+
+    LOCAL_ONLY = "local_only"
+    BROADCAST = "broadcast"
+    ZONE = "zone"
+
+
+@dataclass(frozen=True, slots=True)
+class _Route:
+    policy: DistributionPolicy
+    # Attributes tried in order for the room whose zone shards a ZONE event
+    room_fields: tuple[str, ...] = ()
+
+
+_LOCAL_ONLY_ROUTE = _Route(DistributionPolicy.LOCAL_ONLY)
+
+
+def zone_subject_token(room_id: str | None) -> str | None:
+    """Zone token for a room's shard subject, or None when the room id has no zone."""
+    if not room_id:
+        return None
+    return get_zone_from_room_id(room_id)
+
+
+class EventDistributionRegistry:
+    """
+    Per-event-class distribution policy, keyed by class.
+
+    Unregistered classes are LOCAL_ONLY. A ZONE event whose room has no zone
+    (or that carries no room at all) is broadcast instead of being dropped.
+    """
+
+    def __init__(self) -> None:
+        self._routes: dict[type[BaseEvent], _Route] = {}
+
+    def register(
+        self,
+        event_class: type[BaseEvent],
+        policy: DistributionPolicy,
+        *,
+        room_fields: Iterable[str] = ("room_id",),
+    ) -> None:
+        """
+        Set the distribution policy for an event class (replacing any earlier one).
+
+        Args:
+            event_class: Event class to route
+            policy: LOCAL_ONLY, BROADCAST or ZONE
+            room_fields: For ZONE, the event attributes naming its room, tried in order
+        """
+        fields_tuple = tuple(room_fields) if policy is DistributionPolicy.ZONE else ()
+        self._routes[event_class] = _Route(policy, fields_tuple)
+
+    def policy_for(self, event_class: type[BaseEvent]) -> DistributionPolicy:
+        """Return the policy registered for event_class (LOCAL_ONLY when none is)."""
+        return self._routes.get(event_class, _LOCAL_ONLY_ROUTE).policy
+
+    def subject_for(self, event: BaseEvent) -> str | None:
+        """Return the NATS subject to publish event on, or None when it stays local."""
+        route = self._routes.get(type(event), _LOCAL_ONLY_ROUTE)
+        if route.policy is DistributionPolicy.LOCAL_ONLY:
+            return None
+        base = f"{DOMAIN_EVENTS_SUBJECT_PREFIX}.{event.event_type or type(event).__name__}"
+        if route.policy is DistributionPolicy.BROADCAST:
+            return base
+        for room_field in route.room_fields:
+            zone = zone_subject_token(getattr(event, room_field, None))
+            if zone:
+                return f"{base}.{zone}"
+        return base
+
+
+def subscription_subjects(zones: Iterable[str] | None) -> list[str]:
+    """
+    Subjects an instance subscribes to: everything, or broadcasts plus its zones' shards.
+
+    Args:
+        zones: Zones this instance hosts; None or empty means all zones
+    """
+    hosted = sorted(set(zones or ()))
+    if not hosted:
+        return [DOMAIN_EVENTS_SUBJECT_PATTERN]
+    return [DOMAIN_EVENTS_BROADCAST_PATTERN, *(f"{DOMAIN_EVENTS_SUBJECT_PREFIX}.*.{zone}" for zone in hosted)]
+
+
+def default_event_distribution() -> EventDistributionRegistry:
+    """Build the registry of domain events other instances need to see."""
+    from . import event_types as et
+
+    registry = EventDistributionRegistry()
+    # Content and cache invalidation: every instance holds the caches.
+    # Player-scoped events without a room: party members and quest trackers may be anywhere.
+    broadcast: tuple[type[BaseEvent], ...] = (
+        et.RoomDefinitionChanged,
+        et.NPCDefinitionsChanged,
+        et.NPCSpawnRulesChanged,
+        et.PartyUpdated,
+        et.QuestCompleted,
+    )
+    # PlayerXPAwardEvent lives with the combat service - lazy import to avoid pulling config
+    try:
+        from ..services.player_combat_service import PlayerXPAwardEvent
+
+        broadcast = (*broadcast, PlayerXPAwardEvent)
+    except ImportError:
+        # Optional combat XP event type unavailable in this import context
+        pass
+    # Room-scoped events: only instances hosting the zone care
+    zoned: tuple[type[BaseEvent], ...] = (
+        et.ObjectAddedToRoom,
+        et.ObjectRemovedFromRoom,
+        et.NPCAttacked,
+        et.NPCTookDamage,
+        et.NPCDied,
+        et.NPCSpoke,
+        et.NPCListened,
+        et.PlayerDPUpdated,
+        et.PlayerMortallyWoundedEvent,
+        et.PlayerDPDecayEvent,
+        et.PlayerDiedEvent,
+    )
+    respawns: tuple[type[BaseEvent], ...] = (et.PlayerRespawnedEvent, et.PlayerDeliriumRespawnedEvent)
+    for cls in broadcast:
+        registry.register(cls, DistributionPolicy.BROADCAST)
+    for cls in zoned:
+        registry.register(cls, DistributionPolicy.ZONE)
+    for cls in respawns:
+        registry.register(cls, DistributionPolicy.ZONE, room_fields=("respawn_room_id",))
+    # Deliberately absent, so LOCAL_ONLY: MythosHourTickEvent (every instance runs its
+    # own tick scheduler), RoomOccupantsRefreshRequested (a local nudge), and room
+    # occupancy (PlayerEnteredRoom/PlayerLeftRoom, NPCEnteredRoom/NPCLeftRoom), which
+    # each instance derives from the movements it handles and its own room state
+    return registry
+
+
+__all__ = [
+    "DOMAIN_EVENTS_BROADCAST_PATTERN",
+    "DOMAIN_EVENTS_SUBJECT_PATTERN",
+    "DOMAIN_EVENTS_SUBJECT_PREFIX",
+    "DistributionPolicy",
+    "EventDistributionRegistry",
+    "default_event_distribution",
+    "subscription_subjects",
+    "zone_subject_token",
+]
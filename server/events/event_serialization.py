@@ -3,14 +3,21 @@ Event serialization for distributed EventBus over NATS.
 
 Serializes and deserializes domain events to/from JSON-compatible dicts for
 cross-instance distribution. Handles UUID, datetime, and nested structures.
+
+Each event class gets a codec compiled once, when the registry is built (or on
+first use for classes outside it), that already knows which converter every
+field needs; serializing an event is then one pass over its fields instead of
+``dataclasses.asdict`` plus a recursive walk and per-field type inspection.
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict, fields, is_dataclass
+import json
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from datetime import datetime
-from types import ModuleType, NoneType  # pylint: disable=unused-import  # Used in generator on line 84
-from typing import TypeVar, cast, get_args
+from types import ModuleType, NoneType, UnionType
+from typing import TypeVar, Union, cast, get_args, get_origin, get_type_hints
 from uuid import UUID
 
 from .event_types import BaseEvent
@@ -21,6 +28,27 @@ T = TypeVar("T", bound=BaseEvent)
 # Combat events are published directly to NATS via CombatEventPublisher, not EventBus.
 _EVENT_CLASS_REGISTRY: dict[str, type[BaseEvent]] = {}
 
+_JSON_SCALAR_TYPES: frozenset[type] = frozenset({str, int, float, bool, NoneType})
+
+FieldConverter = Callable[[object], object]
+
+
+@dataclass(frozen=True, slots=True)
+class _EventCodec:
+    """Field converters for one event class, resolved from its annotations once."""
+
+    cls: type[BaseEvent]
+    # (name, encoder) for every dataclass field, in declaration order
+    encoders: tuple[tuple[str, FieldConverter], ...]
+    # (name, decoder or None for pass-through) for __init__ fields
+    init_decoders: tuple[tuple[str, FieldConverter | None], ...]
+    # (name, decoder or None) for init=False fields (timestamp, event_type, sequence_number)
+    state_decoders: tuple[tuple[str, FieldConverter | None], ...]
+
+
+# Codec cache: event class -> compiled codec
+_EVENT_CODECS: dict[type[BaseEvent], _EventCodec] = {}
+
 
 def _register_event_class(registry: dict[str, type[BaseEvent]], obj: object) -> None:
     if not (isinstance(obj, type) and issubclass(obj, BaseEvent) and obj is not BaseEvent):
@@ -46,7 +74,7 @@ def _register_module_events(module: ModuleType, registry: dict[str, type[BaseEve
 
 
 def _register_event_types() -> None:
-    """Populate the event class registry. Lazy import to avoid circular deps."""
+    """Populate the event class registry and compile a codec per class. Lazy import to avoid circular deps."""
     if _EVENT_CLASS_REGISTRY:
         return
 
@@ -66,28 +94,8 @@ def _register_event_types() -> None:
 
     _register_module_events(combat_events, _EVENT_CLASS_REGISTRY, include_base=True)
 
-
-def _copy_public_event_attrs(event: BaseEvent) -> dict[str, object]:
-    data: dict[str, object] = {}
-    for field_name in dir(event):
-        if field_name.startswith("_") or field_name in ("event_type",):
-            continue
-        try:
-            value = cast(object, getattr(event, field_name))  # getattr is typed Any
-            if not callable(value) and not isinstance(value, type):
-                data[field_name] = value
-        except (AttributeError, TypeError):
-            pass
-    return data
-
-
-def _extract_event_fields(event: BaseEvent) -> dict[str, object]:
-    if is_dataclass(event) and not isinstance(event, type):
-        return asdict(event)
-    data = _copy_public_event_attrs(event)
-    if hasattr(event, "event_type"):
-        data["event_type"] = getattr(event, "event_type", type(event).__name__)
-    return data
+    for cls in _EVENT_CLASS_REGISTRY.values():
+        _ = _codec_for(cls)
 
 
 def _convert_value_for_json(value: object) -> object:
@@ -100,33 +108,86 @@ def _convert_value_for_json(value: object) -> object:
         return {k: _convert_value_for_json(v) for k, v in value.items()}
     if isinstance(value, list | tuple):
         return [_convert_value_for_json(v) for v in value]
+    if is_dataclass(value) and not isinstance(value, type):
+        return _convert_value_for_json(asdict(value))
     return value
 
 
+def _encode_scalar(value: object) -> object:
+    return value if type(value) in _JSON_SCALAR_TYPES else _convert_value_for_json(value)
+
+
+def _encode_uuid(value: object) -> object:
+    return str(value) if isinstance(value, UUID) else _encode_scalar(value)
+
+
+def _encode_datetime(value: object) -> object:
+    return value.isoformat() if isinstance(value, datetime) else _encode_scalar(value)
+
+
+def _decode_uuid(value: object) -> object:
+    return UUID(value) if isinstance(value, str) else value
+
+
+def _decode_datetime(value: object) -> object:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")) if isinstance(value, str) else value
+
+
 def _unwrap_optional_type(field_type: object) -> object:
-    args_raw: object = get_args(field_type)
-    if not isinstance(args_raw, tuple) or not args_raw:
+    """Return the first non-None member of a union annotation, or the annotation itself."""
+    if get_origin(field_type) not in (Union, UnionType):
         return field_type
-    real_type = next((a for a in args_raw if a is not NoneType), None)
-    return field_type if real_type is None else real_type
+    return next((arg for arg in get_args(field_type) if arg is not NoneType), field_type)
 
 
-def _parse_typed_json_value(value: object, field_type: object) -> object:
-    if field_type is UUID:
-        return UUID(value) if isinstance(value, str) else value
-    if field_type is datetime and isinstance(value, str):
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    return value
+def _field_encoder(field_type: object) -> FieldConverter:
+    real_type = _unwrap_optional_type(field_type)
+    if real_type is UUID:
+        return _encode_uuid
+    if real_type is datetime:
+        return _encode_datetime
+    if real_type in _JSON_SCALAR_TYPES:
+        return _encode_scalar
+    # Containers and Any: values may nest UUIDs/datetimes, so walk them
+    return _convert_value_for_json
 
 
-def _convert_value_from_json(value: object, field_type: object) -> object:
-    """Convert a JSON value back to the expected Python type."""
-    if value is None:
-        return None
-    unwrapped = _unwrap_optional_type(field_type)
-    if unwrapped is not field_type:
-        return _convert_value_from_json(value, unwrapped)
-    return _parse_typed_json_value(value, field_type)
+def _field_decoder(field_type: object) -> FieldConverter | None:
+    real_type = _unwrap_optional_type(field_type)
+    if real_type is UUID:
+        return _decode_uuid
+    if real_type is datetime:
+        return _decode_datetime
+    return None
+
+
+def _resolved_field_types(cls: type[BaseEvent]) -> dict[str, object]:
+    declared: dict[str, object] = {f.name: f.type for f in fields(cls)}
+    try:
+        hints = cast(dict[str, object], get_type_hints(cls))
+    except (NameError, TypeError):
+        # Unresolvable string annotation: convert what we can from the raw annotations
+        return declared
+    return {name: hints.get(name, field_type) for name, field_type in declared.items()}
+
+
+def _compile_codec(cls: type[BaseEvent]) -> _EventCodec:
+    field_types = _resolved_field_types(cls)
+    cls_fields = fields(cls)
+    return _EventCodec(
+        cls=cls,
+        encoders=tuple((f.name, _field_encoder(field_types[f.name])) for f in cls_fields),
+        init_decoders=tuple((f.name, _field_decoder(field_types[f.name])) for f in cls_fields if f.init),
+        state_decoders=tuple((f.name, _field_decoder(field_types[f.name])) for f in cls_fields if not f.init),
+    )
+
+
+def _codec_for(cls: type[BaseEvent]) -> _EventCodec:
+    codec = _EVENT_CODECS.get(cls)
+    if codec is None:
+        codec = _compile_codec(cls)
+        _EVENT_CODECS[cls] = codec
+    return codec
 
 
 def serialize_event(event: BaseEvent) -> dict[str, object]:
@@ -143,16 +204,33 @@ def serialize_event(event: BaseEvent) -> dict[str, object]:
         raise ValueError("Event must inherit from BaseEvent")
 
     _register_event_types()
+    codec = _codec_for(type(event))
 
     try:
-        data = _extract_event_fields(event)
+        data: dict[str, object] = {name: encode(getattr(event, name)) for name, encode in codec.encoders}
     except (TypeError, AttributeError):
         data = {"event_type": type(event).__name__}
 
-    data["_event_type"] = getattr(event, "event_type", type(event).__name__)
-    converted = _convert_value_for_json(data)
-    # Cast: converter returns object; dict input always yields a dict of JSON-safe values.
-    return cast(dict[str, object], converted)
+    # Events that never set event_type (the combat events) are registered under their class name
+    data["_event_type"] = _encode_scalar(getattr(event, "event_type", None) or type(event).__name__)
+    return data
+
+
+def encode_event(event: BaseEvent, extra: Mapping[str, object] | None = None) -> bytes:
+    """
+    Serialize a BaseEvent straight to the UTF-8 JSON bytes published on NATS.
+
+    Args:
+        event: Domain event to serialize
+        extra: Envelope keys to add alongside the event fields (e.g. _origin_instance_id)
+
+    Returns:
+        Encoded payload, decodable by deserialize_event after json.loads
+    """
+    data = serialize_event(event)
+    if extra:
+        data.update(extra)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
 
 def _event_class_from_payload(data: dict[str, object]) -> type[BaseEvent]:
@@ -165,23 +243,30 @@ def _event_class_from_payload(data: dict[str, object]) -> type[BaseEvent]:
     return cls
 
 
-def _init_kwargs_from_event_data(cls: type[BaseEvent], data: dict[str, object]) -> dict[str, object]:
-    kwargs: dict[str, object] = {}
-    init_fields = {f.name: f for f in fields(cls) if f.init}
-    for key, value in list(data.items()):
-        if key == "_event_type" or key not in init_fields:
+def _decoded_fields(
+    decoders: tuple[tuple[str, FieldConverter | None], ...], data: dict[str, object]
+) -> dict[str, object]:
+    decoded: dict[str, object] = {}
+    for name, decode in decoders:
+        if name not in data:
             continue
-        try:
-            kwargs[key] = _convert_value_from_json(value, init_fields[key].type)
-        except (StopIteration, TypeError):
-            kwargs[key] = value
-    return kwargs
+        value = data[name]
+        if decode is not None and value is not None:
+            try:
+                value = decode(value)
+            except TypeError:
+                pass
+        decoded[name] = value
+    return decoded
 
 
 def deserialize_event(data: dict[str, object]) -> BaseEvent:
     """
     Deserialize a dict back to a BaseEvent instance.
 
+    The event keeps the timestamp (and sequence number) it was serialized with,
+    so events received from other instances report when they actually happened.
+
     Args:
         data: Dict from serialize_event (must include _event_type)
 
@@ -192,5 +277,8 @@ def deserialize_event(data: dict[str, object]) -> BaseEvent:
         ValueError: If event type unknown or deserialization fails
     """
     _register_event_types()
-    cls = _event_class_from_payload(data)
-    return cls(**_init_kwargs_from_event_data(cls, data))
+    codec = _codec_for(_event_class_from_payload(data))
+    event = codec.cls(**_decoded_fields(codec.init_decoders, data))
+    for name, value in _decoded_fields(codec.state_decoders, data).items():
+        setattr(event, name, value)
+    return event
@@ -478,3 +478,50 @@ class QuestCompleted(BaseEvent):
     def __post_init__(self) -> None:
         super().__post_init__()
         self.event_type = "QuestCompleted"
+
+
+@dataclass
+class RoomDefinitionChanged(BaseEvent):
+    """
+    Event fired when a room's static definition is edited (e.g. map position, exits).
+
+    Cache invalidation event: room caches drop the entry for ``room_id``, or
+    every entry when ``room_id`` is None. Travels to other instances through
+    the distributed EventBus like any other domain event.
+    """
+
+    room_id: str | None = None
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.event_type = "RoomDefinitionChanged"
+
+
+@dataclass
+class NPCDefinitionsChanged(BaseEvent):
+    """
+    Event fired when an NPC definition is created, updated or deleted.
+
+    Cache invalidation event: NPC definition caches are rebuilt on next read.
+    """
+
+    definition_id: int | None = None
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.event_type = "NPCDefinitionsChanged"
+
+
+@dataclass
+class NPCSpawnRulesChanged(BaseEvent):
+    """
+    Event fired when an NPC spawn rule is created or deleted.
+
+    Cache invalidation event: NPC spawn rule caches are rebuilt on next read.
+    """
+
+    rule_id: int | None = None
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.event_type = "NPCSpawnRulesChanged"
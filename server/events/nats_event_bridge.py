@@ -3,21 +3,37 @@ NATS EventBus bridge for distributed event distribution.
 
 Publishes domain events to NATS and subscribes to receive events from other
 instances, enabling horizontal scaling of the EventBus across multiple servers.
+Only event classes allowlisted in the distribution registry leave the instance;
+they are encoded when published and sent by one writer task in batches.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+from collections import deque
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING, Any
 
 from ..structured_logging.enhanced_logging_config import get_logger
-from .event_serialization import deserialize_event, serialize_event
+from .event_distribution import (
+    DistributionPolicy,
+    EventDistributionRegistry,
+    default_event_distribution,
+    subscription_subjects,
+)
+from .event_serialization import deserialize_event, encode_event
 from .event_types import BaseEvent
 
 if TYPE_CHECKING:
     from ..services.nats_service import NATSService
 
-DOMAIN_EVENTS_SUBJECT_PREFIX = "events.domain"
-DOMAIN_EVENTS_SUBJECT_PATTERN = "events.domain.>"
+# NATS header carrying the publishing instance id, checked before a payload is decoded
+ORIGIN_HEADER = "Mythos-Origin-Instance"
+# Most events the writer sends per publish_encoded_batch call
+WRITER_BATCH_SIZE = 256
+# Events queued for the writer beyond this are dropped (distribution is best effort)
+MAX_PENDING_EVENTS = 10_000
 
 logger = get_logger(__name__)
 
@@ -26,12 +42,19 @@ class NATSEventBusBridge:
     """
     Bridges domain events between local EventBus and NATS for distribution.
 
-    When events are published locally, they are also published to NATS.
-    When events are received from NATS (from other instances), they are
+    When events are published locally, allowlisted ones are also published to
+    NATS. When events are received from NATS (from other instances), they are
     injected into the local EventBus for dispatch to subscribers.
     """
 
-    def __init__(self, event_bus: Any, nats_service: NATSService, instance_id: str = "") -> None:
+    def __init__(
+        self,
+        event_bus: Any,
+        nats_service: NATSService,
+        instance_id: str = "",
+        distribution: EventDistributionRegistry | None = None,
+        zones: Iterable[str] | None = None,
+    ) -> None:
         """
         Initialize the NATS EventBus bridge.
 
@@ -39,44 +62,115 @@ class NATSEventBusBridge:
             event_bus: Local EventBus instance (must have inject method)
             nats_service: NATS service for publish/subscribe
             instance_id: Unique ID for this instance; used to skip injecting our own echoed messages
+            distribution: Per-event-class distribution policies (default: default_event_distribution())
+            zones: Zones whose sharded events this instance receives (None = all zones)
         """
         self._event_bus = event_bus
         self._nats_service = nats_service
         self._instance_id = instance_id
-        self._subscription: Any = None
+        self._distribution = distribution if distribution is not None else default_event_distribution()
+        self._zones = tuple(zones or ())
+        self._headers: dict[str, str] | None = {ORIGIN_HEADER: instance_id} if instance_id else None
+        self._pending: deque[tuple[str, bytes]] = deque()
+        self._writer_task: asyncio.Task[None] | None = None
+        self._dropped = 0
         self._running = False
 
-    def _subject_for_event(self, event: BaseEvent) -> str:
-        """Build NATS subject for an event."""
-        event_type = getattr(event, "event_type", type(event).__name__)
-        return f"{DOMAIN_EVENTS_SUBJECT_PREFIX}.{event_type}"
+    @property
+    def distribution(self) -> EventDistributionRegistry:
+        """Distribution policies this bridge publishes and accepts events by."""
+        return self._distribution
+
+    def enqueue(self, event: BaseEvent) -> bool:
+        """
+        Queue event for the writer task if its class is distributed.
+
+        The event is encoded now, so later changes to the object are not sent.
+        Must be called from the event loop thread.
+
+        Returns:
+            True if the event was queued, False if it stays local or was dropped
+        """
+        subject = self._distribution.subject_for(event)
+        if subject is None:
+            return False
+        if len(self._pending) >= MAX_PENDING_EVENTS:
+            self._dropped += 1
+            return False
+        try:
+            origin = {"_origin_instance_id": self._instance_id} if self._instance_id else None
+            payload = encode_event(event, origin)
+        except (TypeError, ValueError) as e:
+            logger.warning("Failed to encode domain event for NATS", event_type=type(event).__name__, error=str(e))
+            return False
+        self._pending.append((subject, payload))
+        if self._writer_task is None:
+            try:
+                self._writer_task = asyncio.get_running_loop().create_task(self._run_writer())
+            except RuntimeError:
+                # No running loop (sync context): nothing could publish it
+                self._pending.pop()
+                return False
+        return True
 
     async def publish(self, event: BaseEvent) -> None:
         """
-        Publish event to NATS for distribution to other instances.
+        Publish event to NATS for distribution to other instances, and wait until it is sent.
 
         Args:
             event: Domain event to publish
         """
+        if self.enqueue(event):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been handed to NATS (or failed)."""
+        task = self._writer_task
+        if task is not None:
+            await asyncio.shield(task)
+
+    async def _run_writer(self) -> None:
+        """Send queued events in batches until the queue is empty."""
         try:
-            data = serialize_event(event)
-            if self._instance_id:
-                data["_origin_instance_id"] = self._instance_id
-            subject = self._subject_for_event(event)
-            await self._nats_service.publish(subject, data)
-            logger.debug(
-                "Published domain event to NATS",
-                subject=subject,
-                event_type=type(event).__name__,
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904
+            # Let the rest of this loop iteration queue its events into the same batch
+            await asyncio.sleep(0)
+            while self._pending:
+                batch = [self._pending.popleft() for _ in range(min(len(self._pending), WRITER_BATCH_SIZE))]
+                await self._send_batch(batch)
+            if self._dropped:
+                logger.warning("Dropped domain events while the NATS writer was backlogged", dropped=self._dropped)
+                self._dropped = 0
+        finally:
+            self._writer_task = None
+
+    async def _send_batch(self, batch: list[tuple[str, bytes]]) -> None:
+        try:
+            await self._nats_service.publish_encoded_batch(batch, self._headers)
+            logger.debug("Published domain events to NATS", count=len(batch), first_subject=batch[0][0])
+        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Distribution is best effort; a failed batch must not stop the writer
             logger.warning(
-                "Failed to publish domain event to NATS",
-                event_type=type(event).__name__,
+                "Failed to publish domain events to NATS",
+                count=len(batch),
+                first_subject=batch[0][0],
                 error=str(e),
                 exc_info=True,
             )
 
+    async def handle_encoded_message(self, payload: bytes, headers: Mapping[str, str] | None) -> None:
+        """Process a raw NATS message: drop our own echoes by header, then decode and inject."""
+        # NATS delivers to the publisher too; skip our own messages before decoding them
+        if headers and self._instance_id and headers.get(ORIGIN_HEADER) == self._instance_id:
+            return
+        try:
+            message_data = json.loads(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning("Failed to decode domain event from NATS", error=str(e), payload_size=len(payload))
+            return
+        if not isinstance(message_data, dict):
+            logger.warning("Domain event from NATS is not a JSON object", payload_size=len(payload))
+            return
+        await self._handle_nats_message_impl(message_data)
+
     async def handle_nats_message(self, message_data: dict[str, Any]) -> None:
         """Process a NATS message - deserialize and inject into local EventBus. Public for testing."""
         await self._handle_nats_message_impl(message_data)
@@ -84,12 +178,15 @@ class NATSEventBusBridge:
     async def _handle_nats_message_impl(self, message_data: dict[str, Any]) -> None:
         """Handle message received from NATS - deserialize and inject into local EventBus."""
         try:
-            # Skip injecting our own echoed messages (NATS delivers to publisher by default)
+            # Messages from instances that predate the origin header carry it in the body
             origin = message_data.get("_origin_instance_id")
             if origin and self._instance_id and origin == self._instance_id:
                 logger.debug("Skipping NATS echo - event originated from this instance")
                 return
             event = deserialize_event(message_data)
+            if self._distribution.policy_for(type(event)) is DistributionPolicy.LOCAL_ONLY:
+                logger.debug("Ignoring local-only domain event from NATS", event_type=type(event).__name__)
+                return
             self._event_bus.inject(event)
             logger.debug(
                 "Injected domain event from NATS",
@@ -109,19 +206,15 @@ class NATSEventBusBridge:
             )
 
     async def start(self) -> None:
-        """Subscribe to NATS domain events and start receiving."""
+        """Subscribe to NATS domain events (all zones, or broadcasts plus hosted zones) and start receiving."""
         if self._running:
             return
+        subjects = subscription_subjects(self._zones)
         try:
-            await self._nats_service.subscribe(
-                DOMAIN_EVENTS_SUBJECT_PATTERN,
-                self._handle_nats_message_impl,
-            )
+            for subject in subjects:
+                await self._nats_service.subscribe_encoded(subject, self.handle_encoded_message)
             self._running = True
-            logger.info(
-                "NATS EventBus bridge started",
-                subject_pattern=DOMAIN_EVENTS_SUBJECT_PATTERN,
-            )
+            logger.info("NATS EventBus bridge started", subjects=subjects)
         except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904
             logger.error(
                 "Failed to start NATS EventBus bridge",
@@ -130,6 +223,10 @@ class NATSEventBusBridge:
             )
 
     async def stop(self) -> None:
-        """Stop the bridge and unsubscribe from NATS."""
+        """Send events still queued, then stop the bridge."""
         self._running = False
+        try:
+            await self.flush()
+        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Shutdown must continue even if the last batch fails
+            logger.debug("Error flushing NATS bridge writer", error=str(e))
         logger.debug("NATS EventBus bridge stopped")
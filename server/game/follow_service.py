@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import asyncio
 import uuid
-from collections.abc import Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Iterator, MutableMapping
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal, TypeGuard
 
@@ -30,6 +30,8 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 FOLLOW_REQUEST_TTL_SECONDS = 60
+# Followers of one mover are moved concurrently, at most this many at a time.
+FOLLOW_MOVE_CONCURRENCY = 8
 TargetType = Literal["player", "npc"]
 # Stored value: (target_id, target_type) for player; (target_id, target_type, display_name) for NPC.
 _FollowTargetValue = tuple[str, TargetType] | tuple[str, TargetType, str]
@@ -45,6 +47,47 @@ def _str_id(value: uuid.UUID | str) -> str:
     return str(value) if isinstance(value, uuid.UUID) else value
 
 
+class _FollowTable(MutableMapping[str, _FollowTargetValue]):
+    """
+    follower_id -> follow target, with a target_id -> follower_ids reverse index.
+
+    Every PlayerEnteredRoom / NPCEnteredRoom looks up the mover's followers; the
+    reverse index answers that in O(1) instead of scanning every follow relationship.
+    All writes go through __setitem__/__delitem__, so the index cannot drift.
+    """
+
+    def __init__(self) -> None:
+        self._targets: dict[str, _FollowTargetValue] = {}
+        self._followers: dict[str, set[str]] = {}
+
+    def __getitem__(self, follower_id: str) -> _FollowTargetValue:
+        return self._targets[follower_id]
+
+    def __setitem__(self, follower_id: str, value: _FollowTargetValue) -> None:
+        if follower_id in self._targets:
+            del self[follower_id]
+        self._targets[follower_id] = value
+        self._followers.setdefault(value[0], set()).add(follower_id)
+
+    def __delitem__(self, follower_id: str) -> None:
+        target_id = self._targets.pop(follower_id)[0]
+        followers = self._followers.get(target_id)
+        if followers is not None:
+            followers.discard(follower_id)
+            if not followers:
+                del self._followers[target_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def followers_of(self, target_id: str) -> frozenset[str]:
+        """IDs of everyone following target_id."""
+        return frozenset(self._followers.get(target_id, ()))
+
+
 class FollowService:
     """
     In-memory follow state and movement propagation.
@@ -70,7 +113,7 @@ class FollowService:
         self._player_position_service = player_position_service
         self._logger = get_logger(__name__)
         # follower_id -> (target_id, target_type) or (target_id, target_type, display_name)
-        self._follow_target: dict[str, _FollowTargetValue] = {}
+        self._follow_target = _FollowTable()
         # request_id -> { requestor_id, requestor_name, target_id, created_at }
         self._pending_requests: dict[str, dict[str, Any]] = {}
         self._service_id = "follow_service"
@@ -351,8 +394,7 @@ class FollowService:
 
     def get_followers(self, target_id: str) -> list[str]:
         """Return list of follower player IDs (for movement propagation)."""
-        target_id_str = _str_id(target_id)
-        return [f for f, v in self._follow_target.items() if v[0] == target_id_str]
+        return list(self._follow_target.followers_of(_str_id(target_id)))
 
     def get_following(self, follower_id: uuid.UUID | str) -> tuple[str, TargetType] | None:
         """Return (target_id, target_type) if following someone, else None."""
@@ -413,15 +455,26 @@ class FollowService:
             lines.append("No one is following you.")
         return "\n".join(lines)
 
-    async def _ensure_follower_standing(self, follower_id: str) -> bool:
+    async def _load_follower(self, follower_id: str) -> Any | None:
+        """Load a follower once for the standing and idempotency checks of a follow move."""
+        if not self._async_persistence:
+            return None
+        try:
+            return await self._async_persistence.get_player_by_id(uuid.UUID(follower_id))
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+    async def _ensure_follower_standing(self, follower_id: str, player: Any | None = None) -> bool:
         """
         If follower is sitting or prone, try to stand them so they can move.
         Returns True if follower is or can be standing, False if unable to stand.
+        Pass the already-loaded follower as player to avoid loading it again.
         """
         if not self._async_persistence or not self._player_position_service:
             return True
         try:
-            player = await self._async_persistence.get_player_by_id(uuid.UUID(follower_id))
+            if player is None:
+                player = await self._async_persistence.get_player_by_id(uuid.UUID(follower_id))
             if not player or not hasattr(player, "get_stats"):
                 return True
             stats = player.get_stats() or {}
@@ -461,19 +514,31 @@ class FollowService:
 
     async def _on_player_entered_room(self, event: PlayerEnteredRoom) -> None:
         """Move followers when the followed player moves."""
-        if not event.from_room_id or not self._movement_service:
+        followers = self._follow_target.followers_of(_str_id(event.player_id))
+        if not followers or not event.from_room_id or not self._movement_service:
             return
-        followers = self.get_followers(event.player_id)
-        for follower_id in followers:
-            await self._handle_player_follower_move(follower_id, event)
+        await self._move_followers(followers, lambda follower_id: self._handle_player_follower_move(follower_id, event))
 
     async def _on_npc_entered_room(self, event: NPCEnteredRoom) -> None:
         """Move followers when the followed NPC moves."""
-        if not event.from_room_id or not self._movement_service:
+        followers = self._follow_target.followers_of(_str_id(event.npc_id))
+        if not followers or not event.from_room_id or not self._movement_service:
+            return
+        await self._move_followers(followers, lambda follower_id: self._handle_npc_follower_move(follower_id, event))
+
+    async def _move_followers(self, followers: frozenset[str], move: Callable[[str], Awaitable[None]]) -> None:
+        """Move a mover's followers concurrently, at most FOLLOW_MOVE_CONCURRENCY at a time."""
+        if len(followers) == 1:
+            await move(next(iter(followers)))
             return
-        followers = self.get_followers(event.npc_id)
-        for follower_id in followers:
-            await self._handle_npc_follower_move(follower_id, event)
+        semaphore = asyncio.Semaphore(FOLLOW_MOVE_CONCURRENCY)
+
+        async def bounded_move(follower_id: str) -> None:
+            async with semaphore:
+                await move(follower_id)
+
+        # Each move handles its own errors (auto-unfollow); gather only runs them side by side.
+        _ = await asyncio.gather(*(bounded_move(follower_id) for follower_id in followers), return_exceptions=True)
 
     async def _handle_player_follower_move(self, follower_id: str, event: PlayerEnteredRoom) -> None:
         """
@@ -486,7 +551,8 @@ class FollowService:
             return
         movement_service = self._movement_service
         try:
-            if not await self._ensure_follower_standing(follower_id):
+            follower = await self._load_follower(follower_id)
+            if not await self._ensure_follower_standing(follower_id, follower):
                 self.unfollow(follower_id)
                 self._send_result_to_player(
                     follower_id,
@@ -500,19 +566,13 @@ class FollowService:
                 return
             # Idempotency: if follower is already in target room (e.g. duplicate
             # PlayerEnteredRoom event), skip move and do not unfollow.
-            if self._async_persistence:
-                try:
-                    follower = await self._async_persistence.get_player_by_id(uuid.UUID(follower_id))
-                    if follower and getattr(follower, "current_room_id", None):
-                        if str(follower.current_room_id) == event.room_id:
-                            self._logger.debug(
-                                "Follower already in target room, skipping move",
-                                follower_id=follower_id,
-                                room_id=event.room_id,
-                            )
-                            return
-                except (ValueError, TypeError, AttributeError):
-                    pass
+            if follower and str(getattr(follower, "current_room_id", None) or "") == event.room_id:
+                self._logger.debug(
+                    "Follower already in target room, skipping move",
+                    follower_id=follower_id,
+                    room_id=event.room_id,
+                )
+                return
             success = await movement_service.move_player(
                 follower_id,
                 event.from_room_id,
@@ -559,7 +619,8 @@ class FollowService:
             return
         movement_service = self._movement_service
         try:
-            if not await self._ensure_follower_standing(follower_id):
+            follower = await self._load_follower(follower_id)
+            if not await self._ensure_follower_standing(follower_id, follower):
                 self.unfollow(follower_id)
                 self._send_result_to_player(
                     follower_id,
@@ -572,19 +633,13 @@ class FollowService:
                 )
                 return
             # Idempotency: skip move if follower already in target room.
-            if self._async_persistence:
-                try:
-                    follower = await self._async_persistence.get_player_by_id(uuid.UUID(follower_id))
-                    if follower and getattr(follower, "current_room_id", None):
-                        if str(follower.current_room_id) == event.room_id:
-                            self._logger.debug(
-                                "Follower already in target room, skipping move (NPC)",
-                                follower_id=follower_id,
-                                room_id=event.room_id,
-                            )
-                            return
-                except (ValueError, TypeError, AttributeError):
-                    pass
+            if follower and str(getattr(follower, "current_room_id", None) or "") == event.room_id:
+                self._logger.debug(
+                    "Follower already in target room, skipping move (NPC)",
+                    follower_id=follower_id,
+                    room_id=event.room_id,
+                )
+                return
             success = await movement_service.move_player(
                 follower_id,
                 event.from_room_id,
@@ -622,7 +677,7 @@ class FollowService:
     def on_player_disconnect(self, player_id: uuid.UUID | str) -> None:
         """Remove player from follow state and cancel any pending requests involving them."""
         pid = _str_id(player_id)
-        self._follow_target.pop(pid, None)
+        _ = self._follow_target.pop(pid, None)
         to_remove = [
             req_id
             for req_id, data in self._pending_requests.items()
@@ -630,8 +685,6 @@ class FollowService:
         ]
         for req_id in to_remove:
             self._pending_requests.pop(req_id, None)
-        for fid, v in list(self._follow_target.items()):
-            target_id = v[0]
-            if target_id == pid:
-                self._follow_target.pop(fid, None)
+        for fid in self._follow_target.followers_of(pid):
+            _ = self._follow_target.pop(fid, None)
         self._logger.debug("Cleaned up follow state for disconnected player", player_id=pid)
@@ -0,0 +1,185 @@
+"""
+Columnar MP regeneration state for online players.
+
+Passive regeneration used to load, update and save each online player on
+every tick (the fractional accumulator was stored in stats, so almost every
+tick wrote every player). The ledger keeps each online player's fractional
+accumulator, regeneration multiplier and last known MP in NumPy arrays, so a
+tick is one vectorized pass regardless of the number of players. Whole MP
+gained is written, and every online player's MP, maximum and posture read
+back, by one batched call per flush interval.
+
+Rows are dense: slot ``i`` of every array belongs to ``self._ids[i]`` and
+players leaving are swap-removed.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+# Regeneration multipliers by posture (see MPRegenerationService)
+REST_MP_REGEN_MULTIPLIER = 3.0  # 3x faster when resting
+LYING_MP_REGEN_MULTIPLIER = REST_MP_REGEN_MULTIPLIER * 1.2  # Slightly better when lying
+
+_INITIAL_CAPACITY = 64
+
+
+def regen_multiplier_for_position(position: object) -> float:
+    """MP regeneration multiplier for a posture."""
+    if position == "sitting":
+        return REST_MP_REGEN_MULTIPLIER
+    if position == "lying":
+        return LYING_MP_REGEN_MULTIPLIER
+    return 1.0
+
+
+class MPChange(NamedTuple):
+    """A player whose stored MP differs from what the ledger last saw."""
+
+    player_id: uuid.UUID
+    magic_points: int
+    max_magic_points: int
+
+
+class OnlineMPLedger:  # pylint: disable=too-many-instance-attributes  # Reason: One array per column plus the slot index
+    """Per-player MP regeneration columns for the online players."""
+
+    def __init__(self, regen_rate: float) -> None:
+        """
+        Initialize an empty ledger.
+
+        Args:
+            regen_rate: Base MP regenerated per tick
+        """
+        self._regen_rate = regen_rate
+        self._ids: list[uuid.UUID] = []
+        self._slots: dict[uuid.UUID, int] = {}
+        self._fraction: npt.NDArray[np.float64] = np.zeros(_INITIAL_CAPACITY, dtype=np.float64)
+        self._multiplier: npt.NDArray[np.float64] = np.ones(_INITIAL_CAPACITY, dtype=np.float64)
+        self._pending: npt.NDArray[np.int64] = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._current: npt.NDArray[np.int64] = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._maximum: npt.NDArray[np.int64] = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        # Whether the player's MP has been read from the database yet
+        self._known: npt.NDArray[np.bool_] = np.zeros(_INITIAL_CAPACITY, dtype=np.bool_)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._slots
+
+    def _grow(self) -> None:
+        capacity = len(self._fraction) * 2
+        self._fraction = np.resize(self._fraction, capacity)
+        self._multiplier = np.resize(self._multiplier, capacity)
+        self._pending = np.resize(self._pending, capacity)
+        self._current = np.resize(self._current, capacity)
+        self._maximum = np.resize(self._maximum, capacity)
+        self._known = np.resize(self._known, capacity)
+
+    def _add(self, player_id: uuid.UUID) -> None:
+        slot = len(self._ids)
+        if slot == len(self._fraction):
+            self._grow()
+        self._ids.append(player_id)
+        self._slots[player_id] = slot
+        self._fraction[slot] = 0.0
+        self._multiplier[slot] = 1.0
+        self._pending[slot] = 0
+        self._current[slot] = 0
+        self._maximum[slot] = 0
+        self._known[slot] = False
+
+    def _remove(self, player_id: uuid.UUID) -> None:
+        slot = self._slots.pop(player_id)
+        last = len(self._ids) - 1
+        if slot != last:
+            moved = self._ids[last]
+            self._ids[slot] = moved
+            self._slots[moved] = slot
+            for column in (self._fraction, self._multiplier, self._pending, self._current, self._maximum, self._known):
+                column[slot] = column[last]
+        _ = self._ids.pop()
+
+    def sync_online(self, player_ids: Iterable[uuid.UUID]) -> None:
+        """Add players who came online and drop those who left (their unwritten fractions are discarded)."""
+        online = set(player_ids)
+        for player_id in [player_id for player_id in self._ids if player_id not in online]:
+            self._remove(player_id)
+        for player_id in online:
+            if player_id not in self._slots:
+                self._add(player_id)
+
+    def accrue(self) -> None:
+        """Regenerate one tick for every player below maximum MP (pending whole MP counts toward it)."""
+        count = len(self._ids)
+        if not count:
+            return
+        regenerating = self._known[:count] & (self._current[:count] + self._pending[:count] < self._maximum[:count])
+        fraction = self._fraction[:count]
+        fraction += np.where(regenerating, self._regen_rate * self._multiplier[:count], 0.0)
+        whole = np.floor(fraction)
+        fraction -= whole
+        headroom = np.maximum(self._maximum[:count] - self._current[:count], 0)
+        np.minimum(self._pending[:count] + whole.astype(np.int64), headroom, out=self._pending[:count])
+
+    def take_gains(self) -> dict[uuid.UUID, int]:
+        """
+        Remove the whole MP gained since the last flush.
+
+        Every online player is included (most with a zero gain), so the flush
+        also reads back MP spent elsewhere and posture changes.
+        """
+        count = len(self._ids)
+        gains = dict(zip(self._ids, self._pending[:count].tolist(), strict=True))
+        self._pending[:count] = 0
+        return gains
+
+    def restore_gains(self, gains: Mapping[uuid.UUID, int]) -> None:
+        """Put back gains whose write failed, so the next flush retries them."""
+        for player_id, gain in gains.items():
+            slot = self._slots.get(player_id)
+            if slot is not None:
+                self._pending[slot] += gain
+
+    def apply_readings(self, readings: Mapping[uuid.UUID, tuple[int, int, str]]) -> list[MPChange]:
+        """
+        Record the MP read back from the database.
+
+        Args:
+            readings: (magic_points, max_magic_points, position) per player
+
+        Returns:
+            Players whose MP differs from what the ledger knew before
+        """
+        changes: list[MPChange] = []
+        for player_id, (magic_points, max_magic_points, position) in readings.items():
+            slot = self._slots.get(player_id)
+            if slot is None:
+                continue
+            if self._known[slot] and magic_points != self._current[slot]:
+                changes.append(MPChange(player_id, magic_points, max_magic_points))
+            self._current[slot] = magic_points
+            self._maximum[slot] = max_magic_points
+            self._multiplier[slot] = regen_multiplier_for_position(position)
+            self._known[slot] = True
+        return changes
+
+    def pending_gain(self, player_id: uuid.UUID) -> int:
+        """Whole MP regenerated for a player and not yet written."""
+        slot = self._slots.get(player_id)
+        return int(self._pending[slot]) if slot is not None else 0
+
+
+__all__ = [
+    "LYING_MP_REGEN_MULTIPLIER",
+    "MPChange",
+    "OnlineMPLedger",
+    "REST_MP_REGEN_MULTIPLIER",
+    "regen_multiplier_for_position",
+]
@@ -7,10 +7,18 @@ with rest/meditation commands for accelerated recovery.
 
 import math
 import uuid
+from collections.abc import Iterable
 from typing import Any, cast
 
 from sqlalchemy.exc import SQLAlchemyError
 
+from server.exceptions import DatabaseError
+from server.game.magic.mp_regeneration_ledger import (
+    REST_MP_REGEN_MULTIPLIER,
+    MPChange,
+    OnlineMPLedger,
+    regen_multiplier_for_position,
+)
 from server.game.player_service import PlayerService
 from server.structured_logging.enhanced_logging_config import get_logger
 
@@ -19,7 +27,8 @@ logger = get_logger(__name__)
 # Default MP regeneration rates (per tick)
 # NOTE: Server tick rate is 0.1 seconds, so 0.01 MP per tick = 0.1 MP per second = 6 MP per minute
 DEFAULT_MP_REGEN_RATE = 0.01  # 0.01 MP per tick (tick = 0.1s, so ~6 MP per minute)
-REST_MP_REGEN_MULTIPLIER = 3.0  # 3x faster when resting
+# Online players' regenerated MP is written (and read back) once per this many ticks
+DEFAULT_MP_FLUSH_INTERVAL_TICKS = 10
 MEDITATION_MP_REGEN_MULTIPLIER = 5.0  # 5x faster when meditating
 
 
@@ -31,18 +40,74 @@ class MPRegenerationService:
     during rest/meditation.
     """
 
-    def __init__(self, player_service: PlayerService, regen_rate: float = DEFAULT_MP_REGEN_RATE) -> None:
+    def __init__(
+        self,
+        player_service: PlayerService,
+        regen_rate: float = DEFAULT_MP_REGEN_RATE,
+        flush_interval_ticks: int = DEFAULT_MP_FLUSH_INTERVAL_TICKS,
+    ) -> None:
         """
         Initialize the MP regeneration service.
 
         Args:
             player_service: Player service for stat modifications
             regen_rate: Base MP regeneration rate per tick (default 0.1)
+            flush_interval_ticks: Ticks between batched writes of online players' regenerated MP
         """
         self.player_service = player_service
         self.regen_rate = regen_rate
+        self.flush_interval_ticks = max(1, flush_interval_ticks)
+        self._online_ledger = OnlineMPLedger(regen_rate)
         logger.info("MPRegenerationService initialized", regen_rate=regen_rate)
 
+    async def process_online_tick(self, online_player_ids: Iterable[uuid.UUID], tick_count: int) -> int:
+        """
+        Regenerate MP for all online players for one game tick.
+
+        The tick is one vectorized pass over the online MP ledger; whole MP
+        gained is written with a single batched call every
+        ``flush_interval_ticks`` ticks.
+
+        Args:
+            online_player_ids: IDs of the players currently online
+            tick_count: Current game tick
+
+        Returns:
+            Number of players whose MP went up in this tick's flush
+        """
+        self._online_ledger.sync_online(online_player_ids)
+        self._online_ledger.accrue()
+        if tick_count % self.flush_interval_ticks or not self._online_ledger:
+            return 0
+
+        gains = self._online_ledger.take_gains()
+        try:
+            readings = await self.player_service.persistence.regenerate_players_mp(gains)
+        except (DatabaseError, SQLAlchemyError, OSError) as e:
+            self._online_ledger.restore_gains(gains)
+            logger.warning("Failed to write regenerated MP", player_count=len(gains), error=str(e))
+            return 0
+
+        restored = 0
+        for change in self._online_ledger.apply_readings(readings):
+            if gains.get(change.player_id, 0) > 0:
+                restored += 1
+            await self._send_mp_update(change)
+        return restored
+
+    async def _send_mp_update(self, change: MPChange) -> None:
+        """Send a player_update event with a player's new MP."""
+        try:
+            from server.realtime.connection_manager_api import send_game_event
+
+            await send_game_event(
+                change.player_id,
+                "player_update",
+                {"stats": {"magic_points": change.magic_points, "max_magic_points": change.max_magic_points}},
+            )
+        except (ValueError, AttributeError, SQLAlchemyError, OSError, TypeError, RuntimeError) as e:
+            logger.warning("Failed to send MP regeneration update event", player_id=change.player_id, error=str(e))
+
     async def process_tick_regeneration(self, player_id: uuid.UUID) -> dict[str, Any]:
         """
         Process MP regeneration for a player on a game tick.
@@ -143,20 +208,9 @@ class MPRegenerationService:
         Returns:
             float: Regeneration multiplier
         """
-        position = stats.get("position", "standing")
-
-        # Check for meditation (would be in status effects or a flag)
-        # For now, check position - sitting/lying = rest, meditation would be a status effect
-        if position == "sitting":
-            return REST_MP_REGEN_MULTIPLIER
-        if position == "lying":
-            return REST_MP_REGEN_MULTIPLIER * 1.2  # Slightly better when lying
-
-        # Check for meditation status effect
+        # Sitting/lying = rest, meditation would be a status effect
         # TODO: Check status effects for meditation when status effect system supports it  # pylint: disable=fixme  # Reason: Feature placeholder for status effect system integration
-        # For now, base rate only
-
-        return 1.0  # Base rate
+        return regen_multiplier_for_position(stats.get("position", "standing"))
 
     async def restore_mp_from_rest(self, player_id: uuid.UUID, duration_seconds: int = 60) -> dict[str, Any]:
         """
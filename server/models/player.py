@@ -12,19 +12,21 @@ from __future__ import annotations
 # runtime imports are acyclic via SQLAlchemy string relationship targets.
 # pylint: disable=too-few-public-methods,too-many-lines  # Reason: SQLAlchemy models are data classes; Player aggregates stats, combat, lucidity, containers - splitting would fragment domain cohesion
 import json
-import uuid as uuid_lib
 from collections.abc import Mapping, Sequence
+from copy import deepcopy
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, cast, override
 
 from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Integer, String, Text, event, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.mutable import MutableDict, MutableList
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, synonym
 
 from ..utils.int_coercion import coerce_int
 from .base import Base  # ARCHITECTURE FIX Phase 3.1: Use shared Base
 from .game import PositionState
+from .player_json_columns import JSONColumnCache, JSONColumnCacheStats
 
 if TYPE_CHECKING:
     from .lucidity import (
@@ -44,6 +46,88 @@ def _stats_int(stats: Mapping[str, object], key: str, default: int = 0) -> int:
     return coerce_int(stats.get(key, default), default=default)
 
 
+# Columns compared against the last persisted snapshot (stats and equipped items are tracked separately)
+TRACKED_PLAYER_COLUMNS: tuple[str, ...] = (
+    "user_id",
+    "name",
+    "inventory",
+    "status_effects",
+    "current_room_id",
+    "respawn_room_id",
+    "tutorial_instance_id",
+    "experience_points",
+    "level",
+    "is_admin",
+    "profession_id",
+    "is_deleted",
+    "deleted_at",
+    "created_at",
+    "last_active",
+)
+
+
+# Sentinel distinguishing a stats key that was absent from one stored as None
+_MISSING = object()
+
+
+def _snapshot_value(value: object) -> object:
+    """Freeze a column value for later comparison (containers are serialized, scalars kept)."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def _json_column_cache(player: Player) -> JSONColumnCache:
+    """The player's parsed JSON column cache (created lazily: SQLAlchemy loads skip __init__)."""
+    cache = cast(JSONColumnCache | None, player.__dict__.get("_json_columns"))
+    if cache is None:
+        cache = JSONColumnCache()
+        player.__dict__["_json_columns"] = cache
+    return cache
+
+
+def _json_text_column(column: str) -> property:
+    """
+    Descriptor for a JSON text column backed by ``_<column>_text``.
+
+    Reading the raw text first serializes a parsed list that changed (see
+    player_json_columns); assigning raw text drops the parsed list.
+    """
+    text_attr = f"_{column}_text"
+
+    def _get(player: Player) -> str:
+        pending = _json_column_cache(player).pending_text(column)
+        if pending is not None:
+            setattr(player, text_attr, pending)
+        return cast(str, getattr(player, text_attr))
+
+    def _set(player: Player, value: str) -> None:
+        _json_column_cache(player).discard(column)
+        setattr(player, text_attr, value)
+
+    return property(_get, _set)
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerDirtyFields:
+    """
+    What changed on a Player since it was last loaded from or saved to the database.
+
+    ``columns`` names every changed column, including ``"stats"`` and
+    ``"equipped"``; for stats the changed and removed top-level keys are
+    listed so a save can patch them instead of rewriting the whole document.
+    """
+
+    columns: frozenset[str]
+    stats_set: Mapping[str, object]
+    stats_removed: tuple[str, ...]
+
+    @property
+    def is_clean(self) -> bool:
+        """True when nothing needs to be written."""
+        return not self.columns
+
+
 class Player(Base):
     """
     Player model for game data.
@@ -93,8 +177,11 @@ class Player(Base):
             "position": "standing",
         },
     )
-    inventory: Mapped[str] = mapped_column(Text(), nullable=False, default="[]")
-    status_effects: Mapped[str] = mapped_column(Text(), nullable=False, default="[]")
+    # JSON lists kept as TEXT; get_inventory/get_status_effects cache the parsed lists
+    _inventory_text: Mapped[str] = mapped_column("inventory", Text(), nullable=False, default="[]")
+    _status_effects_text: Mapped[str] = mapped_column("status_effects", Text(), nullable=False, default="[]")
+    inventory: Mapped[str] = synonym("_inventory_text", descriptor=_json_text_column("inventory"))
+    status_effects: Mapped[str] = synonym("_status_effects_text", descriptor=_json_text_column("status_effects"))
 
     # Location and progression
     # CRITICAL FIX: Increased from 50 to 255 to accommodate hierarchical room IDs
@@ -153,6 +240,8 @@ class Player(Base):
         super().__init__(*args, **kwargs)
         # Initialize instance attributes
         self._equipped_items: dict[str, object] | None = None
+        # Column values as last loaded/saved; None until the repository marks the player persisted
+        self._persisted_snapshot: dict[str, object] | None = None
 
     @override
     def __repr__(self) -> str:
@@ -217,45 +306,28 @@ class Player(Base):
     def get_inventory(self) -> list[dict[str, object]]:
         """Get player inventory as list.
 
-        Handles both JSON string (from database) and list (in-memory) formats.
+        The list is parsed once and cached, so every caller gets the same list
+        and row dicts: copy a row before changing it speculatively. Changes to
+        the list or its rows, and set_inventory, are serialized back to the
+        column on its next read (at save time).
         """
-        try:
-            # At runtime, self.inventory is the actual value (string), not the Column descriptor
-            # SQLAlchemy columns return their values at runtime, not the Column object
-            # We need to access the value directly, which mypy doesn't understand
-            inventory_value = getattr(self, "inventory", "[]")
-            if isinstance(inventory_value, list):
-                # Already a list (in-memory format after persistence fix)
-                return cast(list[dict[str, object]], inventory_value)
-            if isinstance(inventory_value, str):
-                # JSON string (from database or legacy format)
-                return cast(list[dict[str, object]], json.loads(inventory_value))
-            # Handle None or other types
-            return []
-        except (json.JSONDecodeError, TypeError, AttributeError):
-            return []
+        return _json_column_cache(self).get("inventory", getattr(self, "_inventory_text", "[]"))
 
     def set_inventory(self, inventory: Sequence[Mapping[str, object]]) -> None:
         """Set player inventory from list."""
-
-        def _inventory_json_default(value: object) -> str:
-            if isinstance(value, uuid_lib.UUID):
-                return str(value)
-            msg = f"Object of type {type(value).__name__} is not JSON serializable"
-            raise TypeError(msg)
-
-        self.inventory = json.dumps(list(inventory), default=_inventory_json_default)
+        _json_column_cache(self).set("inventory", cast(Sequence[dict[str, object]], inventory))
 
     def get_status_effects(self) -> list[dict[str, object]]:
-        """Get player status effects as list."""
-        try:
-            return cast(list[dict[str, object]], json.loads(self.status_effects))
-        except (json.JSONDecodeError, TypeError):
-            return []
+        """Get player status effects as list (parsed once and cached like the inventory)."""
+        return _json_column_cache(self).get("status_effects", getattr(self, "_status_effects_text", "[]"))
 
     def set_status_effects(self, status_effects: list[dict[str, object]]) -> None:
         """Set player status effects from list."""
-        self.status_effects = json.dumps(status_effects)
+        _json_column_cache(self).set("status_effects", status_effects)
+
+    def get_json_column_stats(self) -> JSONColumnCacheStats:
+        """Get how often the inventory and status effects columns were parsed and serialized."""
+        return _json_column_cache(self).get_stats()
 
     def get_equipped_items(self) -> dict[str, object]:
         """Return equipped items mapping.
@@ -290,6 +362,41 @@ class Player(Base):
         """Assign equipped items mapping."""
         self._equipped_items = dict(equipped)
 
+    def mark_persisted(self) -> None:
+        """Record the current values as what the database holds (called after load and save)."""
+        snapshot = {column: _snapshot_value(getattr(self, column, None)) for column in TRACKED_PLAYER_COLUMNS}
+        snapshot["stats"] = deepcopy(dict(self.get_stats()))
+        snapshot["equipped"] = _snapshot_value(self.get_equipped_items())
+        self._persisted_snapshot = snapshot
+
+    def get_dirty_fields(self) -> PlayerDirtyFields | None:
+        """
+        Compare the player against its persisted snapshot.
+
+        Returns:
+            The changed columns and stats keys, or None when the player has
+            never been marked persisted (a full save is required)
+        """
+        # Players loaded by the ORM skip __init__, so the attribute may not exist yet
+        snapshot = cast(dict[str, object] | None, self.__dict__.get("_persisted_snapshot"))
+        if snapshot is None:
+            return None
+        columns = {
+            column
+            for column in TRACKED_PLAYER_COLUMNS
+            if _snapshot_value(getattr(self, column, None)) != snapshot[column]
+        }
+        if _snapshot_value(self.get_equipped_items()) != snapshot["equipped"]:
+            columns.add("equipped")
+
+        persisted_stats = cast(dict[str, object], snapshot["stats"])
+        stats = self.get_stats()
+        stats_set = {key: value for key, value in stats.items() if persisted_stats.get(key, _MISSING) != value}
+        stats_removed = tuple(key for key in persisted_stats if key not in stats)
+        if stats_set or stats_removed:
+            columns.add("stats")
+        return PlayerDirtyFields(frozenset(columns), stats_set, stats_removed)
+
     def add_experience(self, amount: int) -> None:
         """Add experience points to the player."""
         self.experience_points += amount
@@ -620,3 +727,10 @@ def _convert_legacy_stats_string(target: Player, _context: object) -> None:  # p
                 "current_dp": 100,
                 "position": "standing",
             }
+
+
+@event.listens_for(Player, "before_insert")
+@event.listens_for(Player, "before_update")
+def _serialize_json_columns(_mapper: object, _connection: object, target: Player) -> None:  # pyright: ignore[reportUnusedFunction]  # Reason: SQLAlchemy registers this listener; static analysis does not see the hookup
+    """Write parsed inventory/status effects changes back to their columns before an ORM flush."""
+    _ = (target.inventory, target.status_effects)
@@ -0,0 +1,270 @@
+"""
+Parsed JSON text columns for the Player model.
+
+players.inventory and players.status_effects are TEXT columns holding JSON
+lists. Player.get_inventory/get_status_effects used to ``json.loads`` the
+text on every call and the setters ``json.dumps`` it back on every write,
+although tick, combat and command code read them several times per
+operation. JSONColumnCache keeps the parsed list per column and serializes
+it only when the raw column text is next read, which in practice is the
+save (dirty-field snapshot or upsert).
+
+Writes are tracked the way SQLAlchemy's MutableList tracks them: replacing
+the list (the setters) or mutating it in place (append, remove, slice
+assignment, ...) marks the column for serialization. The list and its rows
+are shared by every caller, so edits inside a row (``inv[0]["quantity"] = 2``)
+cannot be seen as they happen; instead, a list that was handed out is
+serialized again when the raw text is read and written back only if the
+result differs. Callers that change rows speculatively must copy them
+first, as the inventory commands already do.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid as uuid_lib
+from collections.abc import Callable, Iterable
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import SupportsIndex, TypedDict, TypeVar, overload, override
+
+_T = TypeVar("_T")
+
+JSONRow = dict[str, object]
+
+
+def _json_default(value: object) -> str:
+    if isinstance(value, uuid_lib.UUID):
+        return str(value)
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _with_uuid_strings(row: JSONRow) -> JSONRow:
+    """Return a row with UUID values as strings, as they read back from JSON (the row itself if none)."""
+    if not any(isinstance(value, uuid_lib.UUID) for value in row.values()):
+        return row
+    return {key: str(value) if isinstance(value, uuid_lib.UUID) else value for key, value in row.items()}
+
+
+class TrackedJSONList(list[_T]):
+    """List that reports in-place mutations to its owner; copies and pickles are plain lists."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, items: Iterable[_T], on_change: Callable[[], None]) -> None:
+        """Initialize with items and the callback run after each mutation."""
+        super().__init__(items)
+        self._on_change = on_change
+
+    @overload
+    def __setitem__(self, index: SupportsIndex, value: _T, /) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[_T], /) -> None: ...
+
+    @override
+    def __setitem__(self, index: SupportsIndex | slice, value: object, /) -> None:
+        super().__setitem__(index, value)  # type: ignore[index,assignment]  # Reason: Overloads above type both forms
+        self._on_change()
+
+    @override
+    def __delitem__(self, index: SupportsIndex | slice, /) -> None:
+        super().__delitem__(index)
+        self._on_change()
+
+    @override
+    def __iadd__(self, values: Iterable[_T], /) -> TrackedJSONList[_T]:  # type: ignore[override]  # Reason: In-place add keeps the tracked type
+        super().__iadd__(values)
+        self._on_change()
+        return self
+
+    @override
+    def __imul__(self, count: SupportsIndex, /) -> TrackedJSONList[_T]:
+        super().__imul__(count)
+        self._on_change()
+        return self
+
+    @override
+    def append(self, value: _T, /) -> None:
+        super().append(value)
+        self._on_change()
+
+    @override
+    def extend(self, values: Iterable[_T], /) -> None:
+        super().extend(values)
+        self._on_change()
+
+    @override
+    def insert(self, index: SupportsIndex, value: _T, /) -> None:
+        super().insert(index, value)
+        self._on_change()
+
+    @override
+    def pop(self, index: SupportsIndex = -1, /) -> _T:
+        value = super().pop(index)
+        self._on_change()
+        return value
+
+    @override
+    def remove(self, value: _T, /) -> None:
+        super().remove(value)
+        self._on_change()
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self._on_change()
+
+    @override
+    def sort(self, *args: object, **kwargs: object) -> None:
+        super().sort(*args, **kwargs)  # type: ignore[call-overload]  # Reason: Forwards list.sort arguments unchanged
+        self._on_change()
+
+    @override
+    def reverse(self) -> None:
+        super().reverse()
+        self._on_change()
+
+    def __copy__(self) -> list[_T]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, object]) -> list[_T]:
+        return deepcopy(list(self), memo)
+
+    @override
+    def __reduce_ex__(self, protocol: SupportsIndex, /) -> tuple[type[list[_T]], tuple[list[_T]]]:
+        return (list, (list(self),))
+
+
+@dataclass(slots=True)
+class _ParsedColumn:
+    """Parsed value of one JSON text column."""
+
+    # Raw column text the value was parsed from or last serialized to
+    text: str | None
+    dirty: bool
+    value: TrackedJSONList[JSONRow] = field(init=False)
+    # Whether callers hold the list (and its rows), so it may have changed without a mutation callback
+    shared: bool = False
+    # value serialized as of text, once known; compared against to detect edits inside rows
+    serialized: str | None = None
+
+    def mark_dirty(self) -> None:
+        """Record that value changed since text was parsed or serialized (TrackedJSONList callback)."""
+        self.dirty = True
+
+
+class JSONColumnCacheStats(TypedDict):
+    """Counters returned by JSONColumnCache.get_stats()."""
+
+    parses: int
+    serializations: int
+
+
+class JSONColumnCache:
+    """Parsed lists of a Player's JSON text columns, serialized back lazily."""
+
+    __slots__ = ("_columns", "_parses", "_serializations")
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._columns: dict[str, _ParsedColumn] = {}
+        self._parses = 0
+        self._serializations = 0
+
+    def _store(self, column: str, text: str | None, items: Iterable[JSONRow], dirty: bool) -> _ParsedColumn:
+        parsed = _ParsedColumn(text, dirty)
+        parsed.value = TrackedJSONList(items, parsed.mark_dirty)
+        self._columns[column] = parsed
+        return parsed
+
+    def get(self, column: str, raw: object) -> list[JSONRow]:
+        """
+        Return the parsed list for a column, parsing the raw text only when it changed.
+
+        Args:
+            column: Column name
+            raw: Current raw column value (JSON text; a list is used as is)
+
+        Returns:
+            The cached list (invalid JSON or a non-list document reads as empty)
+        """
+        parsed = self._columns.get(column)
+        if parsed is None or not (parsed.dirty or parsed.text is raw):
+            parsed = self._parse(column, raw)
+        parsed.shared = True
+        return parsed.value
+
+    def _parse(self, column: str, raw: object) -> _ParsedColumn:
+        if isinstance(raw, list):
+            return self._store(column, None, raw, dirty=True)
+        items: object = []
+        if isinstance(raw, str):
+            self._parses += 1
+            try:
+                items = json.loads(raw)
+            except json.JSONDecodeError:
+                items = []
+        return self._store(
+            column, raw if isinstance(raw, str) else None, items if isinstance(items, list) else [], False
+        )
+
+    def set(self, column: str, items: Iterable[JSONRow]) -> None:
+        """Replace a column's list; the text is serialized on the next raw read."""
+        parsed = self._columns.get(column)
+        if parsed is not None and items is parsed.value:
+            for index, row in enumerate(parsed.value):
+                normalized = _with_uuid_strings(row)
+                if normalized is not row:
+                    parsed.value[index] = normalized
+            parsed.dirty = True
+            return
+        # The caller keeps its row dicts, which now live in the cached list
+        self._store(column, None, [_with_uuid_strings(row) for row in items], dirty=True).shared = True
+
+    def pending_text(self, column: str) -> str | None:
+        """
+        Serialize a column whose list changed since it was parsed or last serialized.
+
+        A list handed out to callers is serialized and compared with the stored
+        text even without a mutation callback, since its rows may have been
+        edited in place.
+
+        Returns:
+            The new raw text to store, or None when the stored text is current
+        """
+        parsed = self._columns.get(column)
+        if parsed is None or not (parsed.dirty or parsed.shared):
+            return None
+        text = json.dumps(list(parsed.value), default=_json_default)
+        if not parsed.dirty and self._matches_stored_text(parsed, text):
+            return None
+        self._serializations += 1
+        parsed.text = parsed.serialized = text
+        parsed.dirty = False
+        return text
+
+    def _matches_stored_text(self, parsed: _ParsedColumn, text: str) -> bool:
+        """Whether ``text`` (the list serialized now) says the same as the column's stored text."""
+        if parsed.serialized is None and parsed.text is not None:
+            # Stored text not written here (e.g. loaded from the database) may be formatted differently: compare parsed
+            self._parses += 1
+            try:
+                stored: object = json.loads(parsed.text)
+            except json.JSONDecodeError:
+                return False
+            if stored == parsed.value:
+                parsed.serialized = text
+        return text == parsed.serialized
+
+    def discard(self, column: str) -> None:
+        """Forget a column's parsed value (its raw text was replaced)."""
+        _ = self._columns.pop(column, None)
+
+    def get_stats(self) -> JSONColumnCacheStats:
+        """Get parse and serialization counts."""
+        return {"parses": self._parses, "serializations": self._serializations}
+
+
+__all__ = ["JSONColumnCache", "JSONColumnCacheStats", "JSONRow", "TrackedJSONList"]
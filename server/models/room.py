@@ -65,6 +65,8 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
         self._players: set[str] = set()
         self._objects: set[str] = set()
         self._npcs: set[str] = set()
+        # Bumped on every occupant change, including silent ones, so in-memory indexes can detect drift
+        self._occupancy_version = 0
 
         # Event system integration
         self._event_bus = event_bus
@@ -102,6 +104,7 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
         # Add player to room if not already present
         if not player_already_in_room:
             self._players.add(player_id_str)
+            self._occupancy_version += 1
             self._logger.debug("Player entered room", player_id=player_id, room_id=self.id)
         else:
             self._logger.debug("Player re-entered room (forcing event)", player_id=player_id, room_id=self.id)
@@ -132,6 +135,7 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
 
         if player_id_str not in self._players:
             self._players.add(player_id_str)
+            self._occupancy_version += 1
             self._logger.debug("Player added to room silently", player_id=player_id, room_id=self.id)
 
     def remove_player_silently(self, player_id: uuid.UUID | str) -> None:
@@ -153,6 +157,7 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
 
         if player_id_str in self._players:
             self._players.remove(player_id_str)
+            self._occupancy_version += 1
             self._logger.debug("Player removed from room silently", player_id=player_id, room_id=self.id)
 
     def player_left(self, player_id: uuid.UUID | str) -> None:
@@ -173,6 +178,7 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
             return
 
         self._players.remove(player_id_str)
+        self._occupancy_version += 1
         self._logger.debug("Player left room", player_id=player_id, room_id=self.id)
 
         # Publish event if event bus is available
@@ -197,6 +203,7 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
             return
 
         self._objects.add(object_id)
+        self._occupancy_version += 1
         self._logger.debug("Object added to room", object_id=object_id, room_id=self.id)
 
         # Publish event if event bus is available
@@ -220,6 +227,7 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
             return
 
         self._objects.remove(object_id)
+        self._occupancy_version += 1
         self._logger.debug("Object removed from room", object_id=object_id, room_id=self.id)
 
         # Publish event if event bus is available
@@ -243,6 +251,7 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
             return
 
         self._npcs.add(npc_id)
+        self._occupancy_version += 1
         self._logger.debug("NPC entered room", npc_id=npc_id, room_id=self.id, from_room_id=from_room_id)
 
         # Publish event if event bus is available
@@ -269,6 +278,7 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
             return
 
         self._npcs.remove(npc_id)
+        self._occupancy_version += 1
         self._logger.debug("NPC left room", npc_id=npc_id, room_id=self.id, to_room_id=to_room_id)
 
         # Publish event if event bus is available
@@ -277,6 +287,11 @@ class Room:  # pylint: disable=too-many-instance-attributes  # Reason: Room requ
             self._logger.debug("Publishing NPCLeftRoom event", npc_id=npc_id, room_id=self.id, to_room_id=to_room_id)
             self._event_bus.publish(event)
 
+    @property
+    def occupancy_version(self) -> int:
+        """Counter that changes whenever a player, object or NPC enters or leaves (silently or not)."""
+        return self._occupancy_version
+
     def get_players(self) -> list[str]:
         """
         Get list of player IDs currently in the room.
@@ -0,0 +1,220 @@
+"""
+Connection pool metrics for the main database engine.
+
+Pool sizes used to be static guesses and every checkout paid a pre-ping
+round trip. This module measures how the pool is actually used so it can be
+sized from data: how long callers wait for a connection, how long they hold
+it, and how many connections are checked out at once. Stale connections are
+detected on first use instead (SQLAlchemy invalidates the pool when a query
+fails with a disconnect error); those invalidations are counted here too.
+
+The histograms use fixed millisecond buckets and are exported through
+/monitoring/database-pool.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool, PoolProxiedConnection
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS_MS: tuple[float, ...] = (0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 5000.0)
+
+# Fraction of checkouts the recommended pool_size should serve without overflow
+_POOL_SIZE_PERCENTILE = 0.95
+
+_CHECKOUT_STARTED_KEY = "mythos_checkout_started"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    def __init__(self, bounds_ms: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        """Initialize an empty histogram with the given bucket upper bounds."""
+        self._bounds = bounds_ms
+        self._counts = [0] * (len(bounds_ms) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        """Record one duration."""
+        self._counts[bisect.bisect_left(self._bounds, duration_ms)] += 1
+        self._count += 1
+        self._sum_ms += duration_ms
+        self._max_ms = max(self._max_ms, duration_ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of observations (max for the open bucket)."""
+        if not self._count:
+            return 0.0
+        target = fraction * self._count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return self._bounds[index] if index < len(self._bounds) else self._max_ms
+        return self._max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        """Bucket counts (cumulative, Prometheus style) and summary values."""
+        buckets: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip(self._bounds, self._counts, strict=False):
+            cumulative += count
+            buckets[f"le_{bound:g}"] = cumulative
+        buckets["le_inf"] = self._count
+        return {
+            "buckets": buckets,
+            "count": self._count,
+            "sum_ms": round(self._sum_ms, 3),
+            "max_ms": round(self._max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+        }
+
+
+class DatabasePoolMetrics:  # pylint: disable=too-many-instance-attributes  # Reason: One counter per pool event type plus the histograms
+    """Checkout wait/hold histograms and concurrency for a connection pool."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self.wait = LatencyHistogram()
+        self.hold = LatencyHistogram()
+        # Connections checked out at the moment of each checkout (including it)
+        self._concurrency: Counter[int] = Counter()
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._checkout_timeouts = 0
+        self._invalidations = 0
+
+    def record_wait(self, duration_ms: float) -> None:
+        """Record how long a caller waited for a connection."""
+        with self._lock:
+            self.wait.observe(duration_ms)
+
+    def record_checkout_timeout(self) -> None:
+        """Record a caller that gave up waiting (pool_timeout)."""
+        with self._lock:
+            self._checkout_timeouts += 1
+
+    def on_checkout(
+        self, _dbapi_connection: DBAPIConnection, record: ConnectionPoolEntry, _proxy: PoolProxiedConnection
+    ) -> None:
+        """Pool ``checkout`` listener."""
+        record.info[_CHECKOUT_STARTED_KEY] = time.perf_counter()
+        with self._lock:
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            self._concurrency[self._in_use] += 1
+
+    def on_checkin(self, _dbapi_connection: DBAPIConnection | None, record: ConnectionPoolEntry) -> None:
+        """Pool ``checkin`` listener."""
+        started = record.info.pop(_CHECKOUT_STARTED_KEY, None)
+        if started is None:
+            return
+        with self._lock:
+            self._in_use = max(0, self._in_use - 1)
+            self.hold.observe((time.perf_counter() - started) * 1000)
+
+    def on_invalidate(
+        self, _dbapi_connection: DBAPIConnection, _record: ConnectionPoolEntry, _exception: BaseException | None
+    ) -> None:
+        """Pool ``invalidate`` listener (a connection failed and was discarded)."""
+        with self._lock:
+            self._invalidations += 1
+
+    def recommended_pool_settings(self) -> dict[str, int]:
+        """
+        Pool sizes derived from measured concurrency.
+
+        ``pool_size`` covers 95% of checkouts; ``max_overflow`` covers the
+        observed peak beyond that.
+        """
+        with self._lock:
+            total = sum(self._concurrency.values())
+            if not total:
+                return {}
+            seen = 0
+            pool_size = self._peak_in_use
+            for level in sorted(self._concurrency):
+                seen += self._concurrency[level]
+                if seen >= _POOL_SIZE_PERCENTILE * total:
+                    pool_size = level
+                    break
+            return {"pool_size": pool_size, "max_overflow": max(1, self._peak_in_use - pool_size)}
+
+    def get_stats(self) -> dict[str, Any]:
+        """Snapshot of all pool metrics."""
+        recommended = self.recommended_pool_settings()
+        with self._lock:
+            return {
+                "checkout_wait": self.wait.snapshot(),
+                "checkout_hold": self.hold.snapshot(),
+                "in_use": self._in_use,
+                "peak_in_use": self._peak_in_use,
+                "checkout_timeouts": self._checkout_timeouts,
+                "invalidations": self._invalidations,
+                "recommended": recommended,
+            }
+
+    def reset(self) -> None:
+        """Clear all metrics (connections currently checked out stay counted as in use)."""
+        with self._lock:
+            self.wait = LatencyHistogram()
+            self.hold = LatencyHistogram()
+            self._concurrency.clear()
+            self._peak_in_use = self._in_use
+            self._checkout_timeouts = 0
+            self._invalidations = 0
+
+
+_pool_metrics = DatabasePoolMetrics()
+
+
+def get_database_pool_metrics() -> DatabasePoolMetrics:
+    """Metrics for the main database engine's pool."""
+    return _pool_metrics
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waited."""
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, recording the wait (including connection creation)."""
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            _pool_metrics.record_checkout_timeout()
+            raise
+        _pool_metrics.record_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+
+def instrument_pool(pool: Pool, metrics: DatabasePoolMetrics | None = None) -> None:
+    """Attach hold-time, concurrency and invalidation listeners to a pool (they survive pool recreation)."""
+    metrics = metrics or _pool_metrics
+    event.listen(pool, "checkout", metrics.on_checkout)
+    event.listen(pool, "checkin", metrics.on_checkin)
+    event.listen(pool, "invalidate", metrics.on_invalidate)
+
+
+__all__ = [
+    "LATENCY_BUCKETS_MS",
+    "DatabasePoolMetrics",
+    "InstrumentedAsyncQueuePool",
+    "LatencyHistogram",
+    "get_database_pool_metrics",
+    "instrument_pool",
+]
@@ -0,0 +1,187 @@
+"""
+Active NPC registry with room and zone indexes.
+
+NPCLifecycleManager.active_npcs is the single source of truth for active NPC
+instances. Room occupant lists, target resolution and population statistics
+used to find "the NPCs in room X" by scanning every active NPC. The registry
+is that same dict, extended with a room -> NPC ids index and zone -> NPC ids
+sets that are maintained as NPCs are added (spawn), removed (despawn, death)
+and relocated (movement), so those queries cost O(NPCs in the room).
+
+NPC room changes are plain attribute assignments, so whoever moves an NPC
+calls ``relocate`` afterwards (lifecycle spawn, NPCMovementIntegration and
+NPCInstanceService do).
+
+The module-level helpers accept any mapping, so callers and tests that hold
+a plain dict keep working (with a linear scan).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import TypeVar, overload
+
+from .npc_base import NPCBase
+from .npc_utils import get_zone_key_from_room_id
+
+_T = TypeVar("_T")
+
+_MISSING = object()
+
+
+def npc_room_id(npc_instance: object) -> str | None:
+    """Room an NPC instance is in (``current_room``, falling back to ``current_room_id``)."""
+    room_id = getattr(npc_instance, "current_room", None) or getattr(npc_instance, "current_room_id", None)
+    return room_id if isinstance(room_id, str) and room_id else None
+
+
+class ActiveNPCRegistry(dict[str, NPCBase]):
+    """Active NPC instances by id, indexed by room and zone."""
+
+    def __init__(self, npcs: Mapping[str, NPCBase] | Iterable[tuple[str, NPCBase]] = ()) -> None:
+        """Initialize the registry, optionally from existing NPC instances."""
+        super().__init__()
+        self._room_of: dict[str, str] = {}
+        self._rooms: dict[str, dict[str, None]] = {}
+        self._zones: dict[str, set[str]] = {}
+        self.update(npcs)
+
+    def _index(self, npc_id: str, room_id: str | None) -> None:
+        if room_id is None:
+            return
+        self._room_of[npc_id] = room_id
+        self._rooms.setdefault(room_id, {})[npc_id] = None
+        self._zones.setdefault(get_zone_key_from_room_id(room_id), set()).add(npc_id)
+
+    def _unindex(self, npc_id: str) -> None:
+        room_id = self._room_of.pop(npc_id, None)
+        if room_id is None:
+            return
+        room_npcs = self._rooms[room_id]
+        del room_npcs[npc_id]
+        if not room_npcs:
+            del self._rooms[room_id]
+        zone_key = get_zone_key_from_room_id(room_id)
+        zone_npcs = self._zones[zone_key]
+        zone_npcs.discard(npc_id)
+        if not zone_npcs:
+            del self._zones[zone_key]
+
+    def __setitem__(self, npc_id: str, npc_instance: NPCBase) -> None:
+        """Add or replace an NPC; a replaced NPC moves to the end (iteration is in spawn order)."""
+        if npc_id in self:
+            del self[npc_id]
+        super().__setitem__(npc_id, npc_instance)
+        self._index(npc_id, npc_room_id(npc_instance))
+
+    def __delitem__(self, npc_id: str) -> None:
+        """Remove an NPC."""
+        super().__delitem__(npc_id)
+        self._unindex(npc_id)
+
+    @overload
+    def pop(self, npc_id: str, /) -> NPCBase: ...
+
+    @overload
+    def pop(self, npc_id: str, default: NPCBase | _T, /) -> NPCBase | _T: ...
+
+    def pop(self, npc_id: str, default: object = _MISSING, /) -> object:
+        """Remove an NPC and return it."""
+        if npc_id not in self:
+            if default is _MISSING:
+                raise KeyError(npc_id)
+            return default
+        npc_instance = super().pop(npc_id)
+        self._unindex(npc_id)
+        return npc_instance
+
+    def popitem(self) -> tuple[str, NPCBase]:
+        """Remove and return the most recently added NPC."""
+        npc_id, npc_instance = super().popitem()
+        self._unindex(npc_id)
+        return npc_id, npc_instance
+
+    def setdefault(self, npc_id: str, default: NPCBase, /) -> NPCBase:
+        """Return an NPC, adding it first if absent."""
+        if npc_id not in self:
+            self[npc_id] = default
+        return self[npc_id]
+
+    def update(self, *args: object, **kwargs: NPCBase) -> None:
+        """Add NPCs from a mapping or (npc_id, instance) pairs, keeping the indexes in step."""
+        for npc_id, npc_instance in dict(*args, **kwargs).items():
+            self[npc_id] = npc_instance
+
+    def clear(self) -> None:
+        """Remove all NPCs."""
+        super().clear()
+        self._room_of.clear()
+        self._rooms.clear()
+        self._zones.clear()
+
+    def relocate(self, npc_id: str, room_id: str | None = None) -> None:
+        """
+        Re-index an NPC after it moved.
+
+        Args:
+            npc_id: NPC that moved
+            room_id: New room; read from the instance (``current_room``/``current_room_id``) if omitted
+        """
+        npc_instance = self.get(npc_id)
+        if npc_instance is None:
+            return
+        new_room_id = room_id if room_id is not None else npc_room_id(npc_instance)
+        if self._room_of.get(npc_id) == new_room_id:
+            return
+        self._unindex(npc_id)
+        self._index(npc_id, new_room_id)
+
+    def room_of(self, npc_id: str) -> str | None:
+        """Room an active NPC is indexed in."""
+        return self._room_of.get(npc_id)
+
+    def npc_ids_in_room(self, room_id: str) -> list[str]:
+        """Ids of the active NPCs in a room, in the order they arrived."""
+        return list(self._rooms.get(room_id, ()))
+
+    def npc_ids_in_zone(self, zone_key: str) -> set[str]:
+        """Ids of the active NPCs in a zone ("zone/sub_zone", see get_zone_key_from_room_id)."""
+        return set(self._zones.get(zone_key, ()))
+
+    def zone_counts(self) -> dict[str, int]:
+        """Number of active NPCs per zone key."""
+        return {zone_key: len(npc_ids) for zone_key, npc_ids in self._zones.items()}
+
+
+def npc_ids_in_room(active_npcs: Mapping[str, object], room_id: str) -> list[str]:
+    """
+    Ids of the active NPCs in a room.
+
+    Uses the registry index when ``active_npcs`` is an ActiveNPCRegistry and
+    scans the mapping otherwise.
+    """
+    if isinstance(active_npcs, ActiveNPCRegistry):
+        return active_npcs.npc_ids_in_room(room_id)
+    return [npc_id for npc_id, npc_instance in active_npcs.items() if npc_room_id(npc_instance) == room_id]
+
+
+def npc_zone_counts(active_npcs: Mapping[str, object]) -> dict[str, int]:
+    """Number of active NPCs per zone key, from the registry index when available."""
+    if isinstance(active_npcs, ActiveNPCRegistry):
+        return active_npcs.zone_counts()
+    counts: dict[str, int] = {}
+    for npc_instance in active_npcs.values():
+        room_id = npc_room_id(npc_instance)
+        if room_id is not None:
+            zone_key = get_zone_key_from_room_id(room_id)
+            counts[zone_key] = counts.get(zone_key, 0) + 1
+    return counts
+
+
+def relocate_npc(active_npcs: Mapping[str, object], npc_id: str, room_id: str | None = None) -> None:
+    """Re-index an NPC after it moved (no-op unless ``active_npcs`` is an ActiveNPCRegistry)."""
+    if isinstance(active_npcs, ActiveNPCRegistry):
+        active_npcs.relocate(npc_id, room_id)
+
+
+__all__ = ["ActiveNPCRegistry", "npc_ids_in_room", "npc_room_id", "npc_zone_counts", "relocate_npc"]
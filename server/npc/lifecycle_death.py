@@ -11,7 +11,7 @@ from structlog.stdlib import BoundLogger
 from server.async_persistence import AsyncPersistenceLayer
 from server.events.event_bus import EventBus
 from server.events.event_types import NPCDied, RoomOccupantsRefreshRequested
-from server.npc.npc_base import NPCBase
+from server.npc.active_npc_registry import ActiveNPCRegistry
 from server.npc.population_control import NPCPopulationController
 
 from ..structured_logging.enhanced_logging_config import get_logger
@@ -24,7 +24,7 @@ class _LifecycleManagerForDeath(Protocol):  # pylint: disable=too-few-public-met
     """Structural type for NPCLifecycleManager (avoids importing lifecycle_manager: import cycle)."""
 
     lifecycle_records: dict[str, NPCLifecycleRecord]
-    active_npcs: dict[str, NPCBase]
+    active_npcs: ActiveNPCRegistry
     population_controller: NPCPopulationController | None
     persistence: AsyncPersistenceLayer | None
     event_bus: EventBus
@@ -29,6 +29,7 @@ from server.npc.population_control import NPCPopulationController
 from server.schemas.calendar import ScheduleEntry
 
 from ..structured_logging.enhanced_logging_config import get_logger
+from .active_npc_registry import ActiveNPCRegistry
 from .lifecycle_death import handle_npc_died_impl
 from .lifecycle_despawn import despawn_npc_impl
 from .lifecycle_periodic import cleanup_old_records_impl, run_periodic_maintenance_impl
@@ -123,7 +124,7 @@ class NPCLifecycleManager:  # pylint: disable=too-many-instance-attributes  # Re
 
         # Lifecycle tracking
         self.lifecycle_records: dict[str, NPCLifecycleRecord] = {}
-        self.active_npcs: dict[str, NPCBase] = {}
+        self.active_npcs: ActiveNPCRegistry = ActiveNPCRegistry()
         self.respawn_queue: dict[str, Mapping[str, object]] = {}  # npc_id -> respawn_data
         self.death_suppression: dict[str, float] = {}  # npc_id -> death_timestamp
         self.active_schedule_ids: list[str] = []
@@ -235,10 +236,11 @@ class NPCLifecycleManager:  # pylint: disable=too-many-instance-attributes  # Re
             active_schedule_ids=self.active_schedule_ids,
         )
 
-    def _set_npc_room_tracking(self, npc_instance: _SpawnTrackedNPC, _npc_id: str, room_id: str) -> None:
+    def _set_npc_room_tracking(self, npc_instance: _SpawnTrackedNPC, npc_id: str, room_id: str) -> None:
         """Set room tracking attributes on NPC instance."""
         npc_instance.current_room = room_id
         npc_instance.current_room_id = room_id
+        self.active_npcs.relocate(npc_id, room_id)
 
     def _validate_npc_room_tracking(self, npc_instance: _SpawnTrackedNPC, npc_id: str, room_id: str) -> None:
         """Validate that room tracking was set correctly."""
@@ -19,6 +19,7 @@ from ..structured_logging.enhanced_logging_config import get_logger
 
 # Removed: from ..persistence import get_persistence - now using async_persistence parameter
 from ..utils.room_utils import extract_subzone_from_room_id
+from .active_npc_registry import relocate_npc
 
 if TYPE_CHECKING:
     from ..async_persistence import AsyncPersistenceLayer
@@ -161,6 +162,7 @@ class NPCMovementIntegration:
                 if lifecycle_manager and npc_id in lifecycle_manager.active_npcs:
                     npc_instance = lifecycle_manager.active_npcs[npc_id]
                     npc_instance.current_room = to_room_id
+                    relocate_npc(lifecycle_manager.active_npcs, npc_id, to_room_id)
 
                     if not npc_instance.current_room or npc_instance.current_room != to_room_id:
                         logger.error(
@@ -0,0 +1,95 @@
+"""
+Loads NPC definitions and spawn rules into the population controller.
+
+The population controller is the NPC reference data the game actually reads
+(spawning, population limits). Definitions are loaded at startup and reloaded
+when an admin edit publishes NPCDefinitionsChanged or NPCSpawnRulesChanged;
+CacheInvalidationListener calls ``invalidate_npc_definitions()`` or
+``invalidate_spawn_rules()`` and the reload runs in the background. Edits
+arriving while a reload runs are coalesced into one more reload.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from ..exceptions import DatabaseError
+from ..structured_logging.enhanced_logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFINITIONS = "definitions"
+SPAWN_RULES = "spawn_rules"
+
+
+class NPCDefinitionLoader:
+    """Keeps the population controller's NPC definitions and spawn rules in step with the database."""
+
+    def __init__(self, population_controller: Any, npc_service: Any | None = None) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            population_controller: NPCPopulationController receiving the definitions and rules
+            npc_service: NPCService used to read them (default: a new NPCService)
+        """
+        if npc_service is None:
+            from ..services.npc_service import NPCService
+
+            npc_service = NPCService()
+        self._population_controller = population_controller
+        self._npc_service = npc_service
+        self._stale: set[str] = set()
+        self._reload_task: asyncio.Task[None] | None = None
+
+    async def load(self) -> None:
+        """Load definitions and spawn rules now (startup)."""
+        await self._load({DEFINITIONS, SPAWN_RULES})
+
+    def invalidate_npc_definitions(self) -> None:
+        """Reload NPC definitions in the background."""
+        self._mark_stale(DEFINITIONS)
+
+    def invalidate_spawn_rules(self) -> None:
+        """Reload spawn rules in the background."""
+        self._mark_stale(SPAWN_RULES)
+
+    def _mark_stale(self, kind: str) -> None:
+        self._stale.add(kind)
+        if self._reload_task is not None and not self._reload_task.done():
+            return
+        reload = self._reload_stale()
+        try:
+            self._reload_task = asyncio.create_task(reload)
+        except RuntimeError as e:
+            # Stays stale; the next edit published on the loop reloads it
+            reload.close()
+            logger.warning("Cannot schedule NPC definition reload - no event loop available", error=str(e))
+
+    async def _reload_stale(self) -> None:
+        """Reload until no edit is left unapplied."""
+        try:
+            while self._stale:
+                kinds = set(self._stale)
+                self._stale.clear()
+                await self._load(kinds)
+        finally:
+            self._reload_task = None
+
+    async def _load(self, kinds: set[str]) -> None:
+        from ..npc_database import get_npc_session
+
+        async for npc_session in get_npc_session():
+            try:
+                if DEFINITIONS in kinds:
+                    definitions = await self._npc_service.get_npc_definitions(npc_session)
+                    self._population_controller.load_npc_definitions(definitions)
+                    logger.info("NPC definitions loaded", count=len(definitions))
+                if SPAWN_RULES in kinds:
+                    spawn_rules = await self._npc_service.get_spawn_rules(npc_session)
+                    self._population_controller.load_spawn_rules(spawn_rules)
+                    logger.info("NPC spawn rules loaded", count=len(spawn_rules))
+            except (DatabaseError, ValueError, TypeError, AttributeError, KeyError, RuntimeError) as e:
+                logger.error("Error loading NPC definitions and spawn rules", error=str(e))
+            break
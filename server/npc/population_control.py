@@ -30,6 +30,7 @@ from server.events.event_types import (
 from server.models.npc import NPCDefinition, NPCSpawnRule
 
 from ..structured_logging.enhanced_logging_config import get_logger
+from .active_npc_registry import ActiveNPCRegistry, npc_zone_counts
 from .npc_base import NPCBase
 from .npc_utils import (
     extract_definition_id_from_npc,
@@ -559,6 +560,7 @@ class NPCPopulationController:  # pylint: disable=too-many-instance-attributes
         summary: dict[str, object] = {
             "total_zones": len(self.population_stats),
             "total_active_npcs": len(active_npcs),
+            "active_npcs_by_zone": npc_zone_counts(active_npcs),
             "zones": zones_payload,
         }
 
@@ -608,11 +610,15 @@ class NPCPopulationController:  # pylint: disable=too-many-instance-attributes
             return 0
 
         current_time = time.time()
-        npcs_to_remove = [
-            nid
-            for nid, ninst in active_npcs.items()
-            if self._should_remove_inactive_npc(ninst, current_time, max_age_seconds)
-        ]
+        # The registry keeps spawn order, so the scan can stop at the first NPC too young to expire
+        spawn_ordered = isinstance(active_npcs, ActiveNPCRegistry)
+        npcs_to_remove: list[str] = []
+        for nid, ninst in active_npcs.items():
+            spawned_at = getattr(ninst, "spawned_at", None)
+            if spawn_ordered and isinstance(spawned_at, int | float) and current_time - spawned_at <= max_age_seconds:
+                break
+            if self._should_remove_inactive_npc(ninst, current_time, max_age_seconds):
+                npcs_to_remove.append(nid)
 
         for npc_id in npcs_to_remove:
             _ = self.despawn_npc(npc_id)
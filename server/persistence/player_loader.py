@@ -0,0 +1,159 @@
+"""
+Batched player loading with a per-unit identity map.
+
+Status effects, combat sync, message filtering and the game state provider
+load players one at a time with ``get_player_by_id``, often from coroutines
+running side by side (``asyncio.gather`` over room occupants). The loader
+collects the IDs requested in the same event-loop iteration and resolves
+them with one ``get_players_batch`` query (a lone ID still uses
+``get_player_by_id``), so concurrent callers share the load.
+
+Inside a unit of work (see ``database_unit_of_work``) the task that owns
+the unit loads on its own, on the unit's session, so it reads what the unit
+has written but not yet committed; a batch runs in a task of its own, which
+would get a separate session and see only committed rows. Players loaded in
+a unit are also kept in the unit's identity map: loading the same player
+again in the same command or tick phase returns the same object without a
+query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from ..database_unit_of_work import current_unit_of_work
+from ..structured_logging.enhanced_logging_config import get_logger
+
+if TYPE_CHECKING:
+    from ..models.player import Player
+    from .protocols import PlayerRepositoryProtocol
+
+logger = get_logger(__name__)
+
+
+def _identity_key(player_id: uuid.UUID) -> tuple[str, uuid.UUID]:
+    return ("player", player_id)
+
+
+class PlayerLoader:
+    """Coalesces get_player_by_id calls issued in the same loop iteration into one query."""
+
+    def __init__(self, get_repository: Callable[[], PlayerRepositoryProtocol]) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            get_repository: Returns the player repository to load from (resolved per batch)
+        """
+        self._get_repository = get_repository
+        self._pending: dict[uuid.UUID, asyncio.Future[Player | None]] = {}
+        self._batches: set[asyncio.Task[None]] = set()
+        self._dispatch_scheduled = False
+        self._stats = {"loads": 0, "identity_hits": 0, "coalesced": 0, "batches": 0, "batched_ids": 0}
+
+    async def load(self, player_id: uuid.UUID | str) -> Player | None:
+        """
+        Load a player, sharing the query with other loads in the same loop iteration.
+
+        Raises:
+            DatabaseError: If the load fails
+        """
+        try:
+            key = player_id if isinstance(player_id, uuid.UUID) else uuid.UUID(str(player_id))
+        except ValueError:
+            # Not a UUID; the repository reports it as not found (or raises) as before
+            return await self._get_repository().get_player_by_id(player_id)  # type: ignore[arg-type]  # Reason: Legacy callers pass string IDs
+
+        self._stats["loads"] += 1
+        unit = current_unit_of_work()
+        if unit is not None:
+            cached = unit.identity_map.get(_identity_key(key))
+            if cached is not None:
+                self._stats["identity_hits"] += 1
+                return cached  # type: ignore[return-value]  # Reason: Only players are stored under player keys
+            # Load in this task so the query joins the unit's session and sees its writes
+            player = await self._get_repository().get_player_by_id(key)
+            if player is None:
+                return None
+            # Keep the first object loaded in the unit, so every caller shares it
+            return unit.identity_map.setdefault(_identity_key(key), player)  # type: ignore[return-value]  # Reason: Only players are stored under player keys
+
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._dispatch)
+        else:
+            self._stats["coalesced"] += 1
+
+        # Shield so one cancelled caller does not cancel the load for the others
+        return await asyncio.shield(future)
+
+    def remember(self, player: Player) -> None:
+        """Record a player (e.g. just saved) in the current unit's identity map."""
+        unit = current_unit_of_work()
+        if unit is None:
+            return
+        try:
+            unit.identity_map[_identity_key(uuid.UUID(str(player.player_id)))] = player
+        except ValueError:
+            return
+
+    def forget(self, player_id: uuid.UUID | str) -> None:
+        """Drop a player (e.g. deleted) from the current unit's identity map."""
+        unit = current_unit_of_work()
+        if unit is None:
+            return
+        try:
+            _ = unit.identity_map.pop(_identity_key(uuid.UUID(str(player_id))), None)
+        except ValueError:
+            return
+
+    def get_stats(self) -> dict[str, Any]:
+        """Load counts: requested loads, identity map hits, coalesced duplicates, batches and IDs queried."""
+        stats: dict[str, Any] = dict(self._stats)
+        stats["avg_batch_size"] = round(stats["batched_ids"] / stats["batches"], 2) if stats["batches"] else 0.0
+        return stats
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        self._dispatch_scheduled = False
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._load_batch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _load_batch(self, batch: dict[uuid.UUID, asyncio.Future[Player | None]]) -> None:
+        self._stats["batches"] += 1
+        self._stats["batched_ids"] += len(batch)
+        repository = self._get_repository()
+        try:
+            if len(batch) == 1:
+                (player_id,) = batch
+                player = await repository.get_player_by_id(player_id)
+                found = {player_id: player} if player is not None else {}
+            else:
+                found = {}
+                for player in await repository.get_players_batch(list(batch)):
+                    try:
+                        found[uuid.UUID(str(player.player_id))] = player
+                    except ValueError:
+                        logger.warning("Batch load returned a player with an invalid ID", player_id=player.player_id)
+        except Exception as e:  # pylint: disable=broad-exception-caught  # Reason: Every waiting caller must receive the load failure
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for player_id, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(player_id))
+
+
+__all__ = ["PlayerLoader"]
@@ -83,6 +83,10 @@ class PlayerRepositoryProtocol(Protocol):
         """Validate player's current room and fix if invalid."""
         ...
 
+    async def validate_player_room(self, player: Player) -> bool:
+        """Validate player's room when loading into memory, persisting any fix."""
+        ...
+
 
 class RoomRepositoryProtocol(Protocol):
     """
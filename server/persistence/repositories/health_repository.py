@@ -6,6 +6,7 @@ including damage, healing, and DP updates using SQLAlchemy ORM with PostgreSQL.
 """
 
 import uuid
+from typing import NamedTuple
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -19,6 +20,24 @@ from server.utils.error_logging import log_and_raise
 
 logger: BoundLogger = get_logger(__name__)
 
+# See set_players_dp in db/procedures/health.sql; the returned rows replace a verification read
+_SET_PLAYERS_DP_SQL = text(
+    "SELECT player_id, name, current_dp FROM set_players_dp(CAST(:player_ids AS uuid[]), CAST(:dps AS integer[]))"
+)
+# See regenerate_players_mp in db/procedures/health.sql
+_REGENERATE_PLAYERS_MP_SQL = text(
+    "SELECT player_id, magic_points, max_magic_points, position "
+    "FROM regenerate_players_mp(CAST(:player_ids AS uuid[]), CAST(:gains AS integer[]))"
+)
+
+
+class PlayerMPRow(NamedTuple):
+    """A player's MP as stored after regenerate_players_mp."""
+
+    magic_points: int
+    max_magic_points: int
+    position: str
+
 
 def _stats_int(stats: dict[str, object], key: str, default: int) -> int:
     """Convert stat values to int with a safe fallback."""
@@ -243,3 +262,84 @@ class HealthRepository:
                 details={"player_id": str(player_id), "delta": delta, "reason": reason, "error": str(e)},
                 user_friendly="Failed to update player health",
             )
+
+    async def set_players_dp(self, dp_by_player: dict[uuid.UUID, int]) -> dict[uuid.UUID, tuple[str, int]]:
+        """
+        Set current_dp for several players in one atomic set_players_dp call.
+
+        Players whose DP drops to zero or below are also set to the lying posture.
+
+        Args:
+            dp_by_player: New current_dp per player
+
+        Returns:
+            Mapping of player_id to (name, current_dp as stored) for every row
+            updated; players that no longer exist are absent
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not dp_by_player:
+            return {}
+        try:
+            session_maker = get_session_maker()
+            async with session_maker() as session:
+                result = await session.execute(
+                    _SET_PLAYERS_DP_SQL,
+                    {"player_ids": list(dp_by_player), "dps": list(dp_by_player.values())},
+                )
+                rows = result.fetchall()
+                await session.commit()
+        except (SQLAlchemyError, OSError) as e:
+            log_and_raise(
+                DatabaseError,
+                f"Database error setting player DP: {e}",
+                operation="set_players_dp",
+                player_count=len(dp_by_player),
+                details={"player_count": len(dp_by_player), "error": str(e)},
+                user_friendly="Failed to update player health",
+            )
+        return {uuid.UUID(str(row.player_id)): (row.name, row.current_dp) for row in rows}
+
+    async def regenerate_players_mp(self, gains: dict[uuid.UUID, int]) -> dict[uuid.UUID, PlayerMPRow]:
+        """
+        Add regenerated MP for several players in one regenerate_players_mp call.
+
+        Gains are capped at each player's maximum MP in the database, so MP
+        spent concurrently (spell casting) is not overwritten. A zero gain
+        only reads the player's MP.
+
+        Args:
+            gains: Whole MP to add per player
+
+        Returns:
+            Mapping of player_id to the stored MP, maximum MP and position;
+            players that no longer exist are absent
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not gains:
+            return {}
+        try:
+            session_maker = get_session_maker()
+            async with session_maker() as session:
+                result = await session.execute(
+                    _REGENERATE_PLAYERS_MP_SQL,
+                    {"player_ids": list(gains), "gains": list(gains.values())},
+                )
+                rows = result.fetchall()
+                await session.commit()
+        except (SQLAlchemyError, OSError) as e:
+            log_and_raise(
+                DatabaseError,
+                f"Database error regenerating player MP: {e}",
+                operation="regenerate_players_mp",
+                player_count=len(gains),
+                details={"player_count": len(gains), "error": str(e)},
+                user_friendly="Failed to update player magic points",
+            )
+        return {
+            uuid.UUID(str(row.player_id)): PlayerMPRow(row.magic_points, row.max_magic_points, row.position)
+            for row in rows
+        }
@@ -10,7 +10,7 @@ and inventory management using PostgreSQL stored procedures.
 
 import uuid
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -23,7 +23,7 @@ from server.persistence.repositories.player_repository_room import (
     validate_and_fix_player_room,
     validate_and_fix_player_room_with_persistence,
 )
-from server.persistence.repositories.player_repository_save import PlayerSavePreparer
+from server.persistence.repositories.player_repository_save import PartialPlayerUpdate, PlayerSavePreparer
 from server.structured_logging.enhanced_logging_config import get_logger
 from server.utils.error_logging import log_and_raise
 from server.utils.retry import retry_with_backoff
@@ -76,6 +76,33 @@ class PlayerRepository:
         """Validate and fix player room, persisting the fix if needed."""
         return await validate_and_fix_player_room_with_persistence(self._room_cache, player, session, self._logger)
 
+    async def validate_player_room(self, player: Player) -> bool:
+        """
+        Validate a player's room when the player is loaded into memory, persisting any fix.
+
+        Hot reads (by ID, batch, room, list) skip validation; login and
+        character lookups run it.
+
+        Returns:
+            bool: True if the room was fixed
+
+        Raises:
+            DatabaseError: If persisting the fix fails
+        """
+        try:
+            session_maker = get_session_maker()
+            async with session_maker() as session:
+                return await self._validate_and_fix_player_room_with_persistence(player, session)
+        except SQLAlchemyError as e:
+            log_and_raise(
+                DatabaseError,
+                f"Database error fixing room for player '{player.player_id}': {e}",
+                operation="validate_player_room",
+                player_id=player.player_id,
+                details={"player_id": player.player_id, "error": str(e)},
+                user_friendly="Failed to validate player location",
+            )
+
     @retry_with_backoff(max_attempts=3, initial_delay=1.0, max_delay=10.0)
     async def get_player_by_name(self, name: str) -> Player | None:
         """
@@ -154,9 +181,8 @@ class PlayerRepository:
                 rows = result.fetchall()
                 if not rows:
                     return None
-                player = row_to_player(rows[0])
-                await self._validate_and_fix_player_room_with_persistence(player, session)
-                return player
+                # Hot read: the room was validated when the player was loaded into memory
+                return row_to_player(rows[0])
         except (DatabaseError, SQLAlchemyError) as e:
             log_and_raise(
                 DatabaseError,
@@ -279,11 +305,31 @@ class PlayerRepository:
         players = await self.get_active_players_by_user_id(user_id)
         return players[0] if players else None
 
+    def _plan_partial_save(self, player: Player) -> PartialPlayerUpdate | Literal[False] | None:
+        """
+        Decide how to save a player from its dirty fields.
+
+        Returns:
+            False when nothing changed, a PartialPlayerUpdate for a narrow
+            UPDATE, or None when the full upsert is required
+        """
+        dirty = player.get_dirty_fields()
+        if dirty is None:
+            return None
+        if dirty.is_clean:
+            return False
+        return self._save_preparer.prepare_partial(player, dirty)
+
     @retry_with_backoff(max_attempts=3, initial_delay=1.0, max_delay=10.0)
     async def save_player(self, player: Player) -> None:
         """
         Save or update a player.
 
+        Only changed fields are written when the player was loaded or saved
+        through this repository: nothing at all if it is unchanged, a narrow
+        UPDATE for stats/location/progression changes, and the full
+        upsert_player call (with inventory validation) otherwise.
+
         Args:
             player: Player to save
 
@@ -291,12 +337,22 @@ class PlayerRepository:
             DatabaseError: If database operation fails
         """
         try:
-            params = self._save_preparer.prepare(player)
+            plan = self._plan_partial_save(player)
+            if plan is False:
+                self._logger.debug("Player unchanged, skipping save", player_id=player.player_id)
+                return
             session_maker = get_session_maker()
             async with session_maker() as session:
-                await self._save_preparer.execute(session, params)
+                if isinstance(plan, PartialPlayerUpdate) and await self._save_preparer.execute_partial(session, plan):
+                    self._logger.debug(
+                        "Player saved with partial update", player_id=player.player_id, change_type=plan.change_type
+                    )
+                else:
+                    # No partial plan, or the row is missing and must be inserted
+                    await self._save_preparer.execute(session, self._save_preparer.prepare(player))
+                    self._logger.debug("Player saved successfully", player_id=player.player_id)
                 await session.commit()
-                self._logger.debug("Player saved successfully", player_id=player.player_id)
+            player.mark_persisted()
         except (DatabaseError, SQLAlchemyError) as e:
             log_and_raise(
                 DatabaseError,
@@ -332,10 +388,8 @@ class PlayerRepository:
                     )
                 )
                 rows = result.fetchall()
-                players = [row_to_player(r) for r in rows]
-                for player in players:
-                    await self._validate_and_fix_player_room_with_persistence(player, session)
-                return players
+                # Hot read: rooms are validated when players are loaded into memory
+                return [row_to_player(r) for r in rows]
         except (DatabaseError, SQLAlchemyError) as e:
             log_and_raise(
                 DatabaseError,
@@ -373,10 +427,8 @@ class PlayerRepository:
                     {"room_id": room_id},
                 )
                 rows = result.fetchall()
-                players = [row_to_player(r) for r in rows]
-                for player in players:
-                    await self._validate_and_fix_player_room_with_persistence(player, session)
-                return players
+                # Hot read: rooms are validated when players are loaded into memory
+                return [row_to_player(r) for r in rows]
         except (DatabaseError, SQLAlchemyError) as e:
             log_and_raise(
                 DatabaseError,
@@ -391,6 +443,10 @@ class PlayerRepository:
         """
         Save multiple players in a single transaction.
 
+        Partial updates are batched into one patch_players call; players whose
+        row turns out not to exist are inserted with the full upsert, as in
+        save_player. Unchanged players are skipped.
+
         Args:
             players: List of players to save
 
@@ -398,13 +454,33 @@ class PlayerRepository:
             DatabaseError: If database operation fails
         """
         try:
-            session_maker = get_session_maker()
-            async with session_maker() as session:
-                for player in players:
-                    params = self._save_preparer.prepare(player)
-                    await self._save_preparer.execute(session, params)
-                await session.commit()
-                self._logger.debug("Batch saved players", player_count=len(players))
+            partial_updates: list[PartialPlayerUpdate] = []
+            partial_players: list[Player] = []
+            full_saves: list[Player] = []
+            for player in players:
+                plan = self._plan_partial_save(player)
+                if isinstance(plan, PartialPlayerUpdate):
+                    partial_updates.append(plan)
+                    partial_players.append(player)
+                elif plan is None:
+                    full_saves.append(player)
+            if partial_updates or full_saves:
+                session_maker = get_session_maker()
+                async with session_maker() as session:
+                    missing = await self._save_preparer.execute_partial_batch(session, partial_updates)
+                    # Rows missing for a partial update must be inserted
+                    full_saves.extend(player for player in partial_players if str(player.player_id) in missing)
+                    for player in full_saves:
+                        await self._save_preparer.execute(session, self._save_preparer.prepare(player))
+                    await session.commit()
+                self._logger.debug(
+                    "Batch saved players",
+                    player_count=len(players),
+                    partial_count=len(partial_updates) - len(missing),
+                    full_count=len(full_saves),
+                )
+            for player in players:
+                player.mark_persisted()
         except (DatabaseError, SQLAlchemyError) as e:
             log_and_raise(
                 DatabaseError,
@@ -558,9 +634,8 @@ class PlayerRepository:
                     {"ids": [str(pid) for pid in player_ids]},
                 )
                 rows = result.fetchall()
+                # Hot read: rooms are validated when players are loaded into memory
                 players = [row_to_player(r) for r in rows]
-                for player in players:
-                    await self._validate_and_fix_player_room_with_persistence(player, session)
                 self._logger.debug(
                     "Batch loaded players",
                     requested_count=len(player_ids),
@@ -89,4 +89,6 @@ def row_to_player(row: Any) -> Player:
         equipped_json=equipped_json,
     )
     player.set_equipped_items(_parse_equipped_safely(equipped_json))
+    # Later saves write only what changed relative to this row
+    player.mark_persisted()
     return player
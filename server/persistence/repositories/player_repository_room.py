@@ -2,6 +2,9 @@
 Player room validation helpers for PlayerRepository.
 
 Validates and fixes invalid player room assignments against the room cache.
+Validation runs when a player is loaded into memory (login, character
+lookups), not on hot reads; the counters below show whether it ever has
+to fix anything.
 """
 
 from typing import Any
@@ -10,6 +13,14 @@ from sqlalchemy import text
 
 from server.models.player import Player
 
+# Players whose room was checked against the cache, and those moved to the fallback room
+_room_validation_stats: dict[str, int] = {"validated": 0, "fixed": 0}
+
+
+def get_room_validation_stats() -> dict[str, int]:
+    """Counts of player room validations and fixes since startup."""
+    return dict(_room_validation_stats)
+
 
 def should_skip_room_validation(room_cache: dict[str, Any], player: Player) -> bool:
     """Return True if room validation should be skipped (cache empty, instanced, or tutorial bedroom)."""
@@ -38,6 +49,7 @@ def validate_and_fix_player_room(room_cache: dict[str, Any], player: Player, log
     """
     if should_skip_room_validation(room_cache, player):
         return False
+    _room_validation_stats["validated"] += 1
     if player.current_room_id not in room_cache:
         fallback_room_id = "earth_arkhamcity_sanitarium_room_foyer_001"
         if fallback_room_id not in room_cache:
@@ -59,6 +71,7 @@ def validate_and_fix_player_room(room_cache: dict[str, Any], player: Player, log
             fallback_room_id=fallback_room_id,
         )
         player.current_room_id = fallback_room_id
+        _room_validation_stats["fixed"] += 1
         return True
     return False
 
@@ -2,15 +2,19 @@
 Player save/upsert helpers for PlayerRepository.
 
 Handles inventory validation, timestamp normalization, and upsert_player procedure execution.
+Players whose changes are limited to stats and simple columns are saved with the
+patch_player function, which writes only their dirty fields, instead of the full upsert.
 """
 
 import json
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, cast
 
 from sqlalchemy import text
 
-from server.models.player import Player, PlayerInventory
+from server.models.player import Player, PlayerDirtyFields, PlayerInventory
 from server.schemas.shared import InventorySchemaValidationError, validate_inventory_payload
 
 UPSERT_PLAYER_SQL = text(
@@ -21,6 +25,45 @@ UPSERT_PLAYER_SQL = text(
     ":tutorial_instance_id, :inventory_json, :equipped_json)"
 )
 
+PATCH_PLAYER_SQL = text(
+    "SELECT patch_player("
+    "CAST(:player_id AS uuid), :columns, CAST(:stats_patch AS jsonb), :stats_removed, :status_effects,"
+    ":current_room_id, :respawn_room_id, :tutorial_instance_id, :experience_points, :level,"
+    ":is_admin, :profession_id, :last_active)"
+)
+
+# Applies a batch of patch_player updates in one round trip; returns the ids of missing rows
+PATCH_PLAYERS_SQL = text("SELECT patch_players(CAST(:patches AS jsonb))")
+
+# Columns a partial save may write directly. Any other change (name, inventory,
+# equipped items, deletion state) goes through upsert_player and inventory validation.
+PARTIAL_UPDATE_COLUMNS = frozenset(
+    {
+        "stats",
+        "status_effects",
+        "current_room_id",
+        "respawn_room_id",
+        "tutorial_instance_id",
+        "experience_points",
+        "level",
+        "is_admin",
+        "profession_id",
+        "last_active",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PartialPlayerUpdate:
+    """patch_player parameters for one player."""
+
+    params: dict[str, Any]
+    change_type: str
+
+
+def _to_utc(value: datetime | None) -> datetime:
+    return value.astimezone(UTC) if value and value.tzinfo else datetime.now(UTC)
+
 
 def _parse_inventory_raw(raw: Any) -> list[dict[str, Any]]:
     """Parse inventory from string or list. Raises InventorySchemaValidationError if invalid."""
@@ -166,3 +209,73 @@ class PlayerSavePreparer:
     async def execute(self, session: Any, params: dict[str, Any]) -> None:
         """Execute upsert_player procedure with given params."""
         await session.execute(UPSERT_PLAYER_SQL, params)
+
+    def _column_value(self, player: Player, column: str) -> Any:
+        """Value to write for a plain column, normalized like the full upsert."""
+        value = getattr(player, column, None)
+        if column == "last_active":
+            return _to_utc(value)
+        if column == "is_admin":
+            return int(bool(value))
+        if column == "profession_id":
+            return value or None
+        return value
+
+    def prepare_partial(self, player: Player, dirty: PlayerDirtyFields) -> PartialPlayerUpdate | None:
+        """
+        Build patch_player parameters for a player's dirty fields.
+
+        Stats are patched key by key (changed top-level keys are merged,
+        removed ones dropped) so concurrent writers of other stats keys are
+        not overwritten. Columns that did not change are passed as NULL and
+        left alone by the function.
+
+        Args:
+            player: Player to save
+            dirty: The player's dirty fields (must not be clean)
+
+        Returns:
+            The partial update, or None when a change requires the full upsert
+        """
+        if not dirty.columns <= PARTIAL_UPDATE_COLUMNS:
+            return None
+
+        params: dict[str, Any] = dict.fromkeys(PARTIAL_UPDATE_COLUMNS - {"stats"})
+        params["player_id"] = str(player.player_id)
+        params["columns"] = sorted(dirty.columns)
+        params["stats_patch"] = json.dumps(dirty.stats_set) if dirty.stats_set else None
+        params["stats_removed"] = list(dirty.stats_removed) if dirty.stats_removed else None
+        for column in dirty.columns - {"stats"}:
+            params[column] = self._column_value(player, column)
+
+        return PartialPlayerUpdate(params=params, change_type="+".join(params["columns"]))
+
+    async def execute_partial(self, session: Any, update: PartialPlayerUpdate) -> bool:
+        """
+        Execute one partial update.
+
+        Returns:
+            False if no row was updated (the player row does not exist)
+        """
+        result = await session.execute(PATCH_PLAYER_SQL, update.params)
+        return bool(result.scalar())
+
+    async def execute_partial_batch(self, session: Any, updates: Sequence[PartialPlayerUpdate]) -> set[str]:
+        """
+        Execute partial updates with a single patch_players call.
+
+        Returns:
+            Ids of players whose row does not exist (nothing was updated for them)
+        """
+        if not updates:
+            return set()
+        patches = [
+            {
+                column: value.isoformat() if isinstance(value, datetime) else value
+                for column, value in update.params.items()
+                if value is not None
+            }
+            for update in updates
+        ]
+        result = await session.execute(PATCH_PLAYERS_SQL, {"patches": json.dumps(patches)})
+        return {str(player_id) for player_id in result.scalars().all()}
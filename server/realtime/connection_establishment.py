@@ -6,7 +6,7 @@ This module handles WebSocket connection establishment operations.
 
 import time
 import uuid
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 from anyio import Lock
 from fastapi import WebSocket
@@ -60,6 +60,26 @@ class _EstablishmentConnectionManager(Protocol):  # pylint: disable=too-few-publ
         ...
 
 
+@runtime_checkable
+class _RoomValidatingPersistence(Protocol):  # pylint: disable=too-few-public-methods  # Reason: PEP 544 Protocol is a structural type, not a concrete class
+    """Persistence that can validate a player's room when the player is loaded into memory."""
+
+    async def validate_player_room(self, player: Player) -> bool:
+        """Move the player out of an unknown room, persisting the fix."""
+        ...
+
+
+async def _validate_player_room(player: Player, manager: _EstablishmentConnectionManager) -> None:
+    """Validate the room once on connect; hot player reads skip room validation."""
+    persistence = manager.async_persistence
+    if not isinstance(persistence, _RoomValidatingPersistence):
+        return
+    try:
+        _ = await persistence.validate_player_room(player)
+    except DatabaseError as e:
+        logger.warning("Could not validate player room on connect", player_id=player.player_id, error=str(e))
+
+
 def _find_dead_connections(player_id: uuid.UUID, manager: _EstablishmentConnectionManager) -> list[str]:
     """
     Find dead WebSocket connections for a player before acquiring lock.
@@ -275,6 +295,7 @@ async def _setup_player_and_room(
 
     if not hasattr(player, "current_room_id"):
         return True, player
+    await _validate_player_room(player, manager)
     canonical_room_id = player.current_room_id
     if canonical_room_id:
         _ = manager.room_manager.subscribe_to_room(str(player_id), str(canonical_room_id))
@@ -10,11 +10,13 @@ and testability.
 
 import uuid
 from collections import deque
+from collections.abc import Awaitable, Callable
 from typing import cast
 
 from anyio import Lock
 from fastapi import WebSocket
 
+from ..database_unit_of_work import defer_until_commit
 from ..events.event_bus import EventBus
 from ..models import Player
 from ..services.player_combat_service import PlayerCombatService
@@ -90,6 +92,19 @@ logger = get_logger(__name__)
 _get_npc_name_from_instance = get_npc_name_from_instance
 
 
+def _defer_send_until_commit(send: Callable[[], Awaitable[dict[str, object]]]) -> dict[str, object] | None:
+    """
+    Hold a send made inside a unit of work until the unit commits.
+
+    A command's messages must not reach players before its writes are committed;
+    if the commit fails they are dropped. Returns the status reported for a held
+    send, or None when there is no unit and the caller sends now.
+    """
+    if not defer_until_commit(send):
+        return None
+    return {"success": True, "deferred_until_commit": True}
+
+
 class ConnectionManager:
     """
     Manages real-time connections for the game.
@@ -289,7 +304,10 @@ class ConnectionManager:
         return _cmm.get_rate_limit_info_impl(self, player_id)
 
     async def send_personal_message(self, player_id: uuid.UUID, event: dict[str, object]) -> dict[str, object]:
-        """Send a personal message to a player via WebSocket."""
+        """Send a personal message to a player via WebSocket (after the commit, inside a unit of work)."""
+        deferred = _defer_send_until_commit(lambda: _cmm.send_personal_message_impl(self, player_id, event))
+        if deferred is not None:
+            return deferred
         return await _cmm.send_personal_message_impl(self, player_id, event)
 
     # Deprecated: Use send_personal_message instead
@@ -329,6 +347,10 @@ class ConnectionManager:
         """Stop the periodic health check task."""
         _cmm.stop_health_checks_impl(self)
 
+    def shutdown_room_event_handler(self) -> None:
+        """Stop the room event handler's pending occupant broadcasts."""
+        _cmm.shutdown_room_event_handler_impl(self)
+
     async def _validate_token(self, token: str, player_id: uuid.UUID) -> bool:
         """Validate a JWT token for a connection."""
         return await validate_token_impl(token, player_id, self)
@@ -343,19 +365,31 @@ class ConnectionManager:
         event: dict[str, object],
         exclude_player: uuid.UUID | str | None = None,
     ) -> dict[str, object]:
-        """Broadcast a message to all players in a room."""
+        """Broadcast a message to all players in a room (after the commit, inside a unit of work)."""
+        deferred = _defer_send_until_commit(lambda: _cmm.broadcast_to_room_impl(self, room_id, event, exclude_player))
+        if deferred is not None:
+            return deferred
         return await _cmm.broadcast_to_room_impl(self, room_id, event, exclude_player)
 
     async def broadcast_global(self, event: dict[str, object], exclude_player: str | None = None) -> dict[str, object]:
-        """Broadcast a message to all connected players."""
+        """Broadcast a message to all connected players (after the commit, inside a unit of work)."""
+        deferred = _defer_send_until_commit(lambda: _cmm.broadcast_global_impl(self, event, exclude_player))
+        if deferred is not None:
+            return deferred
         return await _cmm.broadcast_global_impl(self, event, exclude_player)
 
     async def broadcast_room_event(self, event_type: str, room_id: str, data: dict[str, object]) -> dict[str, object]:
-        """Broadcast a room-specific event to all players in the room."""
+        """Broadcast a room-specific event to all players in the room (after the commit, inside a unit of work)."""
+        deferred = _defer_send_until_commit(lambda: _cmm.broadcast_room_event_impl(self, event_type, room_id, data))
+        if deferred is not None:
+            return deferred
         return await _cmm.broadcast_room_event_impl(self, event_type, room_id, data)
 
     async def broadcast_global_event(self, event_type: str, data: dict[str, object]) -> dict[str, object]:
-        """Broadcast a global event to all connected players."""
+        """Broadcast a global event to all connected players (after the commit, inside a unit of work)."""
+        deferred = _defer_send_until_commit(lambda: _cmm.broadcast_global_event_impl(self, event_type, data))
+        if deferred is not None:
+            return deferred
         return await _cmm.broadcast_global_event_impl(self, event_type, data)
 
     def get_pending_messages(self, player_id: uuid.UUID) -> list[dict[str, object]]:
@@ -13,7 +13,7 @@ to reduce file complexity and improve maintainability.
 
 from __future__ import annotations
 
-from typing import Protocol, cast
+from typing import TYPE_CHECKING, Protocol, cast
 from uuid import UUID
 
 from anyio import Lock
@@ -37,6 +37,9 @@ from .monitoring.statistics_aggregator import MemoryStatsSnapshot, StatisticsAgg
 from .rate_limiter import RateLimiter
 from .room_subscription_manager import RoomSubscriptionManager
 
+if TYPE_CHECKING:
+    from .integration.room_event_handler import RoomEventHandler
+
 # Protocol stub bodies use Ellipsis per PEP 544; Pylint W2301 conflicts with pyright if replaced with pass.
 # pylint: disable=unnecessary-ellipsis,too-few-public-methods,missing-function-docstring
 # Reason: PEP 544 Protocol surface for this module; docs live on ConnectionManager.
@@ -441,6 +444,14 @@ def stop_health_checks_impl(manager: ConnectionManager) -> None:
     manager.health_monitor.stop_periodic_checks()
 
 
+def shutdown_room_event_handler_impl(manager: ConnectionManager) -> None:
+    """Shutdown the room event handler (cancels its pending coalesced occupant broadcasts)."""
+    if manager.room_event_handler is None:
+        logger.error("Room event handler not initialized")
+        return
+    cast("RoomEventHandler", manager.room_event_handler).shutdown()
+
+
 # ============================================================================
 # Game State Provider Methods
 # ============================================================================
@@ -36,6 +36,7 @@ from .message_builders import MessageBuilder
 from .npc_event_handlers import NPCEventHandler
 from .player_event_handlers import PlayerEventHandler
 from .player_name_utils import PlayerNameExtractor
+from .room_occupancy_coalescer import RoomOccupancyCoalescer
 from .room_occupant_manager import RoomOccupantManager
 
 if TYPE_CHECKING:
@@ -104,6 +105,9 @@ class RealTimeEventHandler:
         # Message building utilities
         self.message_builder = MessageBuilder(self._get_next_sequence)
 
+        # Enter/leave bursts in one room (group follows, bulk NPC spawns) share occupant broadcasts
+        self.occupancy_coalescer = RoomOccupancyCoalescer(self._send_room_occupants_update_internal)
+
         # Player event handler
         self.player_handler = PlayerEventHandler(
             connection_manager=self.connection_manager,
@@ -121,7 +125,7 @@ class RealTimeEventHandler:
             connection_manager=self.connection_manager,
             task_registry=self.task_registry,
             message_builder=self.message_builder,
-            send_occupants_update=self._send_room_occupants_update_internal,
+            send_occupants_update=self.occupancy_coalescer.request_update,
         )
 
     def _get_next_sequence(self) -> int:
@@ -164,11 +168,11 @@ class RealTimeEventHandler:
     # Event handler delegation methods
     async def _handle_player_entered(self, event: PlayerEnteredRoom) -> None:
         """Delegate player entered event to specialized handler."""
-        await self.player_handler.handle_player_entered(event, self._send_room_occupants_update_internal)
+        await self.player_handler.handle_player_entered(event, self.occupancy_coalescer.request_update)
 
     async def _handle_player_left(self, event: PlayerLeftRoom) -> None:
         """Delegate player left event to specialized handler."""
-        await self.player_handler.handle_player_left(event, self._send_room_occupants_update_internal)
+        await self.player_handler.handle_player_left(event, self.occupancy_coalescer.request_update)
 
     async def _handle_npc_entered(self, event: NPCEnteredRoom) -> None:
         """Delegate NPC entered event to specialized handler."""
@@ -207,8 +211,9 @@ class RealTimeEventHandler:
         """
         Internal implementation for sending room occupants update.
 
-        This method is used as a callback for the NPC handler and is also
-        called by the public send_room_occupants_update method.
+        This method is the flush callback of the occupancy coalescer (used for
+        enter/leave events) and is also called by the public
+        send_room_occupants_update method.
 
         Args:
             room_id: The room ID
@@ -309,4 +314,5 @@ class RealTimeEventHandler:
     def shutdown(self) -> None:
         """Shutdown the event handler."""
         self._logger.info("Shutting down RealTimeEventHandler")
+        self.occupancy_coalescer.close()
         # Note: EventBus will handle its own shutdown
@@ -16,6 +16,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from ...structured_logging.enhanced_logging_config import get_logger
+from ..room_occupancy_coalescer import RoomOccupancyCoalescer
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable
@@ -34,7 +35,7 @@ class RoomEventHandler:
     - PlayerEnteredRoom event handling
     - PlayerLeftRoom event handling
     - NATS event publishing
-    - Room occupant broadcasting
+    - Room occupant broadcasting (coalesced per room)
 
     AI Agent: Single Responsibility - Room event integration only.
     """
@@ -64,6 +65,8 @@ class RoomEventHandler:
         self.get_event_publisher = get_event_publisher
         self.broadcast_to_room = broadcast_to_room_callback
         self.get_online_players = get_online_players
+        # Back-to-back enters/leaves in one room share a single occupant broadcast
+        self.occupancy_coalescer = RoomOccupancyCoalescer(self._broadcast_room_occupants)
 
     async def subscribe_to_events(self) -> None:
         """Subscribe to room movement events for occupant broadcasting."""
@@ -97,6 +100,11 @@ class RoomEventHandler:
         except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Event unsubscription errors unpredictable, must handle gracefully
             logger.error("Error unsubscribing from room events", error=str(e), exc_info=True)
 
+    def shutdown(self) -> None:
+        """Shutdown the handler, dropping occupant broadcasts still waiting in the coalescer."""
+        logger.info("Shutting down RoomEventHandler")
+        self.occupancy_coalescer.close()
+
     async def handle_player_entered_room(self, event_data: dict[str, Any]) -> None:
         """Handle PlayerEnteredRoom events by broadcasting updated occupant count."""
         try:
@@ -118,41 +126,7 @@ class RoomEventHandler:
                 except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: NATS event publishing errors unpredictable, must handle gracefully
                     logger.error("Failed to publish player_entered NATS event", error=str(e))
 
-            # Get current room occupants
-            # CRITICAL: Convert UUID keys to strings for room_manager compatibility
-            online_players = self.get_online_players()
-            online_players_str = {str(k): v for k, v in online_players.items()}
-            occ_infos = await self.room_manager.get_room_occupants(room_id, online_players_str)
-            names: list[str] = []
-            for occ in occ_infos:
-                name = occ.get("player_name") if isinstance(occ, dict) else None
-                # CRITICAL: Validate name is not a UUID before adding
-                if name and isinstance(name, str):
-                    # Skip if it looks like a UUID (36 chars, 4 dashes, hex)
-                    is_uuid = (
-                        len(name) == 36 and name.count("-") == 4 and all(c in "0123456789abcdefABCDEF-" for c in name)
-                    )
-                    if not is_uuid:
-                        names.append(name)
-                    else:
-                        logger.warning(
-                            "Skipping UUID as player name in room_occupants event",
-                            name=name,
-                            room_id=room_id,
-                        )
-
-            # Build and broadcast room_occupants event
-            from ..envelope import build_event
-
-            occ_event = build_event(
-                "room_occupants",
-                {"occupants": names, "count": len(names)},
-                room_id=room_id,
-            )
-
-            await self.broadcast_to_room(room_id, occ_event, None)
-
-            logger.debug("Broadcasted room_occupants event for room", room_id=room_id, occupant_count=len(names))
+            await self.occupancy_coalescer.request_update(room_id)
 
         except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Player entered event handling errors unpredictable, must handle gracefully
             logger.error("Error handling PlayerEnteredRoom event", error=str(e), exc_info=True)
@@ -178,40 +152,41 @@ class RoomEventHandler:
                 except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: NATS event publishing errors unpredictable, must handle gracefully
                     logger.error("Failed to publish player_left NATS event", error=str(e))
 
-            # Get current room occupants
-            # CRITICAL: Convert UUID keys to strings for room_manager compatibility
-            online_players = self.get_online_players()
-            online_players_str = {str(k): v for k, v in online_players.items()}
-            occ_infos = await self.room_manager.get_room_occupants(room_id, online_players_str)
-            names: list[str] = []
-            for occ in occ_infos:
-                name = occ.get("player_name") if isinstance(occ, dict) else None
-                # CRITICAL: Validate name is not a UUID before adding
-                if name and isinstance(name, str):
-                    # Skip if it looks like a UUID (36 chars, 4 dashes, hex)
-                    is_uuid = (
-                        len(name) == 36 and name.count("-") == 4 and all(c in "0123456789abcdefABCDEF-" for c in name)
-                    )
-                    if not is_uuid:
-                        names.append(name)
-                    else:
-                        logger.warning(
-                            "Skipping UUID as player name in room_occupants event",
-                            name=name,
-                            room_id=room_id,
-                        )
-
-            # Build and broadcast room_occupants event
-            from ..envelope import build_event
-
-            occ_event = build_event(
-                "room_occupants",
-                {"occupants": names, "count": len(names)},
-                room_id=room_id,
-            )
-            await self.broadcast_to_room(room_id, occ_event, None)
-
-            logger.debug("Broadcasted room_occupants event for room", room_id=room_id, occupant_count=len(names))
+            await self.occupancy_coalescer.request_update(room_id)
 
         except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Player left event handling errors unpredictable, must handle gracefully
             logger.error("Error handling PlayerLeftRoom event", error=str(e), exc_info=True)
+
+    async def _broadcast_room_occupants(self, room_id: str, exclude_player: str | None = None) -> None:
+        """Broadcast the current occupant names of a room (flush callback of the occupancy coalescer)."""
+        # CRITICAL: Convert UUID keys to strings for room_manager compatibility
+        online_players = self.get_online_players()
+        online_players_str = {str(k): v for k, v in online_players.items()}
+        occ_infos = await self.room_manager.get_room_occupants(room_id, online_players_str)
+        names: list[str] = []
+        for occ in occ_infos:
+            name = occ.get("player_name") if isinstance(occ, dict) else None
+            # CRITICAL: Validate name is not a UUID before adding
+            if name and isinstance(name, str):
+                # Skip if it looks like a UUID (36 chars, 4 dashes, hex)
+                is_uuid = len(name) == 36 and name.count("-") == 4 and all(c in "0123456789abcdefABCDEF-" for c in name)
+                if not is_uuid:
+                    names.append(name)
+                else:
+                    logger.warning(
+                        "Skipping UUID as player name in room_occupants event",
+                        name=name,
+                        room_id=room_id,
+                    )
+
+        # Build and broadcast room_occupants event
+        from ..envelope import build_event
+
+        occ_event = build_event(
+            "room_occupants",
+            {"occupants": names, "count": len(names)},
+            room_id=room_id,
+        )
+        await self.broadcast_to_room(room_id, occ_event, exclude_player)
+
+        logger.debug("Broadcasted room_occupants event for room", room_id=room_id, occupant_count=len(names))
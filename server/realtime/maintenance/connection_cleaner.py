@@ -273,9 +273,7 @@ class ConnectionCleaner:
                 "large_rate_limits": 0,
             }
 
-            # Clean up rate limiting data
-            self.rate_limiter.cleanup_old_attempts()
-            self.rate_limiter.cleanup_large_structures(self.memory_monitor.max_rate_limit_entries)
+            # Rate limiting data needs no sweep: the limiter evicts idle keys as it checks
 
             # Clean up message queue data
             self.message_queue.cleanup_old_messages()
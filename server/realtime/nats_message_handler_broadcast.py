@@ -8,12 +8,14 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING, Any
 
+from ..services.lucidity_tier_registry import lucidity_tier_registry, read_lucidity_tier
 from ..services.nats_exceptions import NATSError
 from ..structured_logging.enhanced_logging_config import get_logger
 from .message_formatters import format_message_content
 from .nats_message_handler_base import NATSMessageHandlerMixinBase
 
 if TYPE_CHECKING:
+    from ..services.lucidity_communication_dampening import DampeningResult
     from ..services.user_manager import UserManager
 
 logger = get_logger("communications.nats_message_handler")
@@ -72,7 +74,12 @@ class NATSMessageBroadcastMixin(  # pylint: disable=too-few-public-methods  # Re
         self, filtered_targets: list[str], chat_event: dict[str, Any], room_id: str, sender_id: str, channel: str
     ) -> None:
         """
-        Send messages to filtered target players, applying communication dampening per receiver.
+        Send messages to filtered target players, applying communication dampening per receiver tier.
+
+        The sender's effects are decided once per message. Receivers are then grouped by
+        lucidity tier and each tier's dampened event is built once and shared by every
+        receiver in it; only deranged receivers (whose scrambling is per receiver, seeded
+        by message and receiver ID) can get an event of their own.
 
         Args:
             filtered_targets: List of filtered player IDs
@@ -84,7 +91,6 @@ class NATSMessageBroadcastMixin(  # pylint: disable=too-few-public-methods  # Re
         # Get original content and sender info from chat event
         event_data = chat_event.get("data", {})
         original_content = event_data.get("original_content", "")
-        sender_name = event_data.get("player_name", "")
 
         if not original_content:
             # Fallback: try to extract from formatted message (less reliable)
@@ -96,54 +102,87 @@ class NATSMessageBroadcastMixin(  # pylint: disable=too-few-public-methods  # Re
             )
             original_content = formatted_message
 
-        # Get sender tier once (used for all receivers)
-        sender_tier = await self._get_player_lucidity_tier(sender_id)
+        from ..services.lucidity_communication_dampening import apply_sender_dampening
 
-        # Apply communication dampening per receiver (function handles both outgoing and incoming effects)
-        from ..services.lucidity_communication_dampening import apply_communication_dampening
+        sender_tier = await self._get_player_lucidity_tier(sender_id)
+        sender_result = apply_sender_dampening(original_content, sender_tier, channel)
+        if sender_result["blocked"]:
+            # Message blocked (e.g., Deranged player trying to shout)
+            logger.debug("Message blocked by communication dampening", sender_id=sender_id, channel=channel)
+            return
 
-        # Send message to each receiver with per-receiver dampening
+        receivers_by_tier: dict[str, list[str]] = {}
         for player_id in filtered_targets:
-            logger.debug(
-                "=== BROADCAST FILTERING DEBUG: Sending message to player ===",
-                room_id=room_id,
-                sender_id=sender_id,
-                target_player_id=player_id,
-                channel=channel,
-            )
-            try:
-                # Get receiver tier for incoming dampening
-                receiver_tier = await self._get_player_lucidity_tier(player_id)
+            receiver_tier = await self._get_player_lucidity_tier(player_id)
+            receivers_by_tier.setdefault(receiver_tier, []).append(player_id)
+        logger.debug(
+            "Sending dampened message by receiver tier",
+            room_id=room_id,
+            sender_id=sender_id,
+            channel=channel,
+            receivers_by_tier={tier: len(receivers) for tier, receivers in receivers_by_tier.items()},
+        )
 
-                # Apply communication dampening (handles both outgoing sender effects and incoming receiver effects)
-                dampening_result = apply_communication_dampening(original_content, sender_tier, receiver_tier, channel)
+        for receiver_tier, receivers in receivers_by_tier.items():
+            await self._send_tier_bucket(receivers, receiver_tier, sender_result, chat_event, channel)
 
-                if dampening_result["blocked"]:
-                    # Message blocked (e.g., Deranged player trying to shout)
-                    logger.debug("Message blocked by communication dampening", receiver_id=player_id, channel=channel)
+    async def _send_tier_bucket(
+        self,
+        receivers: list[str],
+        receiver_tier: str,
+        sender_result: DampeningResult,
+        chat_event: dict[str, Any],
+        channel: str,
+    ) -> None:
+        """Send one tier's dampened variant to every receiver in that tier."""
+        from ..services.lucidity_communication_dampening import apply_receiver_dampening, receiver_random
+
+        sender_name = chat_event.get("data", {}).get("player_name", "")
+        message_id = chat_event.get("data", {}).get("message_id")
+        shared_event: dict[str, Any] | None = None
+        for player_id in receivers:
+            result: DampeningResult | None = None
+            if receiver_tier == "deranged" and message_id:
+                # Scrambling is decided per receiver, reproducibly for this message
+                result = apply_receiver_dampening(
+                    sender_result, receiver_tier, channel, rng=receiver_random(message_id, player_id)
+                )
+                if "scrambled" in result["tags"]:
+                    await self._send_to_receiver(
+                        player_id, self._build_receiver_event(chat_event, sender_name, channel, result)
+                    )
                     continue
+            if shared_event is None:
+                if result is None:
+                    result = apply_receiver_dampening(sender_result, receiver_tier, channel)
+                shared_event = self._build_receiver_event(chat_event, sender_name, channel, result)
+            await self._send_to_receiver(player_id, shared_event)
+
+    def _build_receiver_event(
+        self, chat_event: dict[str, Any], sender_name: str, channel: str, dampening_result: DampeningResult
+    ) -> dict[str, Any]:
+        """Copy the chat event with the dampened message (and tags) for its receivers."""
+        receiver_event = chat_event.copy()
+        receiver_event["data"] = chat_event.get("data", {}).copy()
+        receiver_event["data"]["message"] = self._format_message_for_receiver(
+            channel, sender_name, dampening_result["message"]
+        )
+        # Add tags if any (e.g., 'strained', 'muffled', 'scrambled')
+        if dampening_result.get("tags"):
+            receiver_event["data"]["tags"] = dampening_result["tags"]
+        return receiver_event
 
-                # Create modified chat event for this receiver
-                receiver_content = dampening_result["message"]
-                receiver_formatted = self._format_message_for_receiver(channel, sender_name, receiver_content)
-
-                # Create copy of chat_event with modified message
-                receiver_event = chat_event.copy()
-                receiver_event["data"] = event_data.copy()
-                receiver_event["data"]["message"] = receiver_formatted
-
-                # Add tags if any (e.g., 'strained', 'muffled', 'scrambled')
-                if dampening_result.get("tags"):
-                    receiver_event["data"]["tags"] = dampening_result["tags"]
-
-                player_id_uuid = uuid.UUID(player_id) if isinstance(player_id, str) else player_id
-                await self.connection_manager.send_personal_message(player_id_uuid, receiver_event)
-            except (ValueError, AttributeError, TypeError) as e:
-                logger.warning(
-                    "Invalid player_id format for send_personal_message",
-                    player_id=player_id,
-                    error=str(e),
-                )
+    async def _send_to_receiver(self, player_id: str, receiver_event: dict[str, Any]) -> None:
+        """Send a prepared chat event to one receiver."""
+        try:
+            player_id_uuid = uuid.UUID(player_id) if isinstance(player_id, str) else player_id
+            await self.connection_manager.send_personal_message(player_id_uuid, receiver_event)
+        except (ValueError, AttributeError, TypeError) as e:
+            logger.warning(
+                "Invalid player_id format for send_personal_message",
+                player_id=player_id,
+                error=str(e),
+            )
 
     def _should_echo_to_sender(
         self,
@@ -388,7 +427,11 @@ class NATSMessageBroadcastMixin(  # pylint: disable=too-few-public-methods  # Re
 
     async def _get_player_lucidity_tier(self, player_id: str) -> str:
         """
-        Get a player's current lucidity tier from database.
+        Get a player's current lucidity tier.
+
+        Players connected to this server are answered from the in-memory tier
+        registry (no I/O); others (e.g. a sender on another server) are read
+        from the database.
 
         Args:
             player_id: Player ID (string or UUID)
@@ -396,37 +439,10 @@ class NATSMessageBroadcastMixin(  # pylint: disable=too-few-public-methods  # Re
         Returns:
             Lucidity tier string (defaults to 'lucid' if not found)
         """
-        try:
-            from ..database import get_async_session
-            from ..services.lucidity_service import LucidityService
-
-            player_id_uuid = uuid.UUID(player_id) if isinstance(player_id, str) else player_id
-
-            async for session in get_async_session():
-                try:
-                    lucidity_service = LucidityService(session)
-                    lucidity_record = await lucidity_service.get_player_lucidity(player_id_uuid)
-                    tier = lucidity_record.current_tier if lucidity_record else "lucid"
-                    return tier
-                except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Lucidity tier retrieval errors unpredictable, optional metadata
-                    logger.debug(
-                        "Error getting player lucidity tier",
-                        player_id=player_id,
-                        error=str(e),
-                        error_type=type(e).__name__,
-                    )
-                    return "lucid"
-
-        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Session creation errors unpredictable, must return fallback
-            logger.debug(
-                "Error in _get_player_lucidity_tier (session creation)",
-                player_id=player_id,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            return "lucid"
-
-        return "lucid"
+        tier = lucidity_tier_registry.get(player_id)
+        if tier is not None:
+            return tier
+        return await read_lucidity_tier(player_id)
 
     def _compare_canonical_rooms(self, player_room_id: str, message_room_id: str) -> bool:
         """Compare two room IDs using canonical room ID resolution."""
@@ -6,10 +6,12 @@ This module handles querying and processing NPC occupants for rooms.
 As documented in "Dimensional Occupancy Tracking" - Dr. Armitage, 1929
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 from sqlalchemy.exc import SQLAlchemyError
 
+from ..npc.active_npc_registry import ActiveNPCRegistry
 from ..structured_logging.enhanced_logging_config import get_logger
 from .room_id_utils import RoomIDUtils
 
@@ -159,8 +161,25 @@ class NPCOccupantProcessor:
 
         return room_matches, npc_room_id
 
+    @staticmethod
+    def _candidate_npcs(
+        active_npcs_dict: Mapping[str, Any], room_id: str, canonical_room_id: str
+    ) -> list[tuple[str, Any]]:
+        """
+        NPCs that may be in the target room.
+
+        An ActiveNPCRegistry answers from its room index (under both the room ID
+        and its canonical ID); any other mapping is scanned in full.
+        """
+        if not isinstance(active_npcs_dict, ActiveNPCRegistry):
+            # Snapshot to prevent "dictionary changed size during iteration" errors
+            return list(active_npcs_dict.items())
+        npc_ids = dict.fromkeys(active_npcs_dict.npc_ids_in_room(room_id))
+        npc_ids.update(dict.fromkeys(active_npcs_dict.npc_ids_in_room(canonical_room_id)))
+        return [(npc_id, active_npcs_dict[npc_id]) for npc_id in npc_ids]
+
     def _scan_active_npcs_for_room(
-        self, active_npcs_dict: dict[str, Any], room_id: str, canonical_room_id: str
+        self, active_npcs_dict: Mapping[str, Any], room_id: str, canonical_room_id: str
     ) -> list[str]:
         """
         Scan active NPCs to find those in the target room.
@@ -178,8 +197,7 @@ class NPCOccupantProcessor:
         npcs_matched = 0
         npcs_without_room = 0
 
-        # BUGFIX: Create snapshot of dict to prevent "dictionary changed size during iteration" errors
-        for npc_id, npc_instance in list(active_npcs_dict.items()):
+        for npc_id, npc_instance in self._candidate_npcs(active_npcs_dict, room_id, canonical_room_id):
             npcs_checked += 1
 
             should_include, npc_room_id = self._should_include_npc_in_room(
@@ -15,6 +15,7 @@ from structlog.stdlib import BoundLogger
 from ..async_persistence import AsyncPersistenceLayer
 from ..models import Player
 from ..models.room import Room
+from ..services.lucidity_tier_registry import lucidity_tier_registry
 from ..structured_logging.enhanced_logging_config import get_logger
 from .player_presence_utils import extract_player_name
 
@@ -142,6 +143,7 @@ def _cleanup_player_references(player_id: uuid.UUID, manager: "ConnectionManager
     _ = manager.last_active_update_times.pop(player_id, None)
     manager.rate_limiter.remove_player_data(str(player_id))
     manager.message_queue.remove_player_messages(str(player_id))
+    lucidity_tier_registry.discard(player_id)
 
     # H2 fix: Mark session for aging (5 min TTL). Reconnects purge old sessions immediately.
     player_sessions = manager.player_sessions
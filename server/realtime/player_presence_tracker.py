@@ -10,6 +10,7 @@ import uuid
 from typing import Any, cast
 
 from ..exceptions import DatabaseError
+from ..services.lucidity_tier_registry import lucidity_tier_registry
 from ..structured_logging.enhanced_logging_config import get_logger
 from .disconnect_grace_period import start_grace_period
 from .player_connection_setup import handle_new_connection_setup
@@ -213,6 +214,8 @@ async def track_player_connected_impl(
         manager.mark_player_seen(player_id)
 
         if needs_enter_setup:
+            # Chat dampening reads tiers from memory; lucidity change events keep the entry current
+            _ = await lucidity_tier_registry.load(player_id)
             room_id = await _resolve_room_id_for_tutorial_reconnect(player, manager)
             if not room_id:
                 room_id = _resolve_room_id(player, manager)
@@ -3,15 +3,70 @@ Rate limiting for MythosMUD connections.
 
 This module provides rate limiting functionality for connection attempts,
 message sending, and other operations that need throttling.
+
+Limits are exact sliding windows on the monotonic clock, so wall-clock
+jumps (NTP corrections, suspend/resume) neither lock players out nor reset
+their budget. Each key keeps at most ``limit`` accepted timestamps in a deque
+trimmed from the left, which makes a check O(1) amortized. Keys are kept in
+least-recently-checked order and every check forgets a couple of keys at the
+front whose window has fully expired, so idle keys are evicted as a side
+effect of traffic instead of by periodic sweeps.
 """
 
 import time
+from collections import OrderedDict, deque
+from time import monotonic
 from typing import Any
 
 from ..structured_logging.enhanced_logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Idle keys forgotten per check; above 1 so eviction outpaces key creation
+IDLE_EVICTIONS_PER_CHECK = 2
+
+
+def _evict_idle(attempts: OrderedDict[str, deque[float]], horizon: float) -> None:
+    """Forget least recently checked keys whose newest attempt is at or before horizon."""
+    for _ in range(IDLE_EVICTIONS_PER_CHECK):
+        if not attempts:
+            return
+        key, history = next(iter(attempts.items()))
+        if history and history[-1] > horizon:
+            return
+        del attempts[key]
+
+
+def _admit(attempts: OrderedDict[str, deque[float]], key: str, limit: int, window: float) -> tuple[bool, int]:
+    """
+    Record an attempt for key unless limit attempts already fall within the window.
+
+    Returns:
+        (allowed, attempts in the window before this one)
+    """
+    now = monotonic()
+    horizon = now - window
+    _evict_idle(attempts, horizon)
+    history = attempts.get(key)
+    if history is None or history.maxlen != limit:
+        history = attempts[key] = deque(history or (), maxlen=limit)
+    attempts.move_to_end(key)
+    while history and history[0] <= horizon:
+        _ = history.popleft()
+    count = len(history)
+    if count >= limit:
+        return False, count
+    history.append(now)
+    return True, count
+
+
+def _recent_count(history: deque[float] | None, window: float) -> int:
+    """Attempts in history that are still inside the window (history holds at most the limit)."""
+    if not history:
+        return 0
+    horizon = monotonic() - window
+    return sum(1 for attempt_time in history if attempt_time > horizon)
+
 
 class RateLimiter:
     """
@@ -37,13 +92,13 @@ class RateLimiter:
             max_messages_per_minute: Maximum messages per minute per connection (default: 100)
             message_window: Message rate limit window in seconds (default: 60)
         """
-        # Connection rate limiting
-        self.connection_attempts: dict[str, list[float]] = {}
+        # Connection rate limiting (player_id -> monotonic times of recent attempts, least recently checked first)
+        self.connection_attempts: OrderedDict[str, deque[float]] = OrderedDict()
         self.max_connection_attempts = max_connection_attempts
         self.connection_window = connection_window
 
         # Message rate limiting (per connection)
-        self.message_attempts: dict[str, list[float]] = {}  # connection_id -> list of timestamps
+        self.message_attempts: OrderedDict[str, deque[float]] = OrderedDict()  # connection_id -> attempt times
         self.max_messages_per_minute = max_messages_per_minute
         self.message_window = message_window
 
@@ -57,25 +112,10 @@ class RateLimiter:
         Returns:
             bool: True if rate limit not exceeded, False if exceeded
         """
-        current_time = time.time()
-        if player_id not in self.connection_attempts:
-            self.connection_attempts[player_id] = []
-
-        # Remove old attempts outside the window
-        self.connection_attempts[player_id] = [
-            attempt_time
-            for attempt_time in self.connection_attempts[player_id]
-            if current_time - attempt_time < self.connection_window
-        ]
-
-        # Check if limit exceeded
-        if len(self.connection_attempts[player_id]) >= self.max_connection_attempts:
+        allowed, _ = _admit(self.connection_attempts, player_id, self.max_connection_attempts, self.connection_window)
+        if not allowed:
             logger.warning("Rate limit exceeded", player_id=player_id)
-            return False
-
-        # Add current attempt
-        self.connection_attempts[player_id].append(current_time)
-        return True
+        return allowed
 
     def get_rate_limit_info(self, player_id: str) -> dict[str, Any]:
         """
@@ -87,83 +127,16 @@ class RateLimiter:
         Returns:
             dict: Rate limit information including attempts, limits, and reset time
         """
-        current_time = time.time()
-        attempts = self.connection_attempts.get(player_id, [])
-
-        # Filter recent attempts
-        recent_attempts = [
-            attempt_time for attempt_time in attempts if current_time - attempt_time < self.connection_window
-        ]
+        recent = _recent_count(self.connection_attempts.get(player_id), self.connection_window)
 
         return {
-            "attempts": len(recent_attempts),
+            "attempts": recent,
             "max_attempts": self.max_connection_attempts,
             "window_seconds": self.connection_window,
-            "attempts_remaining": max(0, self.max_connection_attempts - len(recent_attempts)),
-            "reset_time": current_time + self.connection_window if recent_attempts else 0,
+            "attempts_remaining": max(0, self.max_connection_attempts - recent),
+            "reset_time": time.time() + self.connection_window if recent else 0,
         }
 
-    def cleanup_old_attempts(self, max_age_seconds: int = 3600) -> None:
-        """
-        Clean up old rate limit attempts to prevent memory bloat.
-
-        Args:
-            max_age_seconds: Maximum age of attempts to keep (default: 1 hour)
-        """
-        try:
-            current_time = time.time()
-            orphaned_players = []
-
-            for player_id, attempts in list(self.connection_attempts.items()):
-                # Remove attempts older than max_age_seconds
-                self.connection_attempts[player_id] = [
-                    attempt_time for attempt_time in attempts if current_time - attempt_time < max_age_seconds
-                ]
-
-                # Remove empty entries
-                if not self.connection_attempts[player_id]:
-                    orphaned_players.append(player_id)
-
-            for player_id in orphaned_players:
-                del self.connection_attempts[player_id]
-
-            if orphaned_players:
-                logger.debug("Cleaned up rate limit data", player_count=len(orphaned_players))
-
-        except (OSError, ValueError, TypeError, KeyError) as e:
-            logger.error(
-                "Error cleaning up rate limit attempts",
-                error=str(e),
-                error_type=type(e).__name__,
-                exc_info=True,
-            )
-
-    def cleanup_large_structures(self, max_entries: int = 1000) -> None:
-        """
-        Clean up large data structures to prevent memory bloat.
-
-        Args:
-            max_entries: Maximum number of entries per player to keep (default: 1000)
-        """
-        try:
-            for player_id, attempts in list(self.connection_attempts.items()):
-                if len(attempts) > max_entries:
-                    # Keep only the most recent attempts
-                    self.connection_attempts[player_id] = attempts[-max_entries:]
-                    logger.debug(
-                        "Cleaned up large rate limit structure for player",
-                        player_id=player_id,
-                        kept_entries=max_entries,
-                    )
-
-        except (OSError, ValueError, TypeError, KeyError) as e:
-            logger.error(
-                "Error cleaning up large rate limit structures",
-                error=str(e),
-                error_type=type(e).__name__,
-                exc_info=True,
-            )
-
     def remove_player_data(self, player_id: str) -> None:
         """
         Remove all rate limit data for a specific player.
@@ -192,17 +165,14 @@ class RateLimiter:
             dict: Statistics about current rate limiting state
         """
         try:
-            current_time = time.time()
             total_attempts = 0
             active_players = 0
 
             for _player_id, attempts in self.connection_attempts.items():
-                recent_attempts = [
-                    attempt_time for attempt_time in attempts if current_time - attempt_time < self.connection_window
-                ]
-                if recent_attempts:
+                recent = _recent_count(attempts, self.connection_window)
+                if recent:
                     active_players += 1
-                    total_attempts += len(recent_attempts)
+                    total_attempts += recent
 
             return {
                 "total_players": len(self.connection_attempts),
@@ -232,30 +202,17 @@ class RateLimiter:
 
         AI: Per-connection rate limiting prevents DoS attacks from individual connections.
         """
-        current_time = time.time()
-        if connection_id not in self.message_attempts:
-            self.message_attempts[connection_id] = []
-
-        # Remove old attempts outside the window
-        self.message_attempts[connection_id] = [
-            attempt_time
-            for attempt_time in self.message_attempts[connection_id]
-            if current_time - attempt_time < self.message_window
-        ]
-
-        # Check if limit exceeded
-        if len(self.message_attempts[connection_id]) >= self.max_messages_per_minute:
+        allowed, message_count = _admit(
+            self.message_attempts, connection_id, self.max_messages_per_minute, self.message_window
+        )
+        if not allowed:
             logger.warning(
                 "Message rate limit exceeded",
                 connection_id=connection_id,
-                message_count=len(self.message_attempts[connection_id]),
+                message_count=message_count,
                 max_messages=self.max_messages_per_minute,
             )
-            return False
-
-        # Add current attempt
-        self.message_attempts[connection_id].append(current_time)
-        return True
+        return allowed
 
     def get_message_rate_limit_info(self, connection_id: str) -> dict[str, Any]:
         """
@@ -267,21 +224,15 @@ class RateLimiter:
         Returns:
             dict: Rate limit information including attempts, limits, and reset time
         """
-        current_time = time.time()
-        attempts = self.message_attempts.get(connection_id, [])
-
-        # Filter recent attempts
-        recent_attempts = [
-            attempt_time for attempt_time in attempts if current_time - attempt_time < self.message_window
-        ]
+        recent = _recent_count(self.message_attempts.get(connection_id), self.message_window)
 
         return {
-            "attempts": len(recent_attempts),
-            "current_attempts": len(recent_attempts),  # Alias for test compatibility
+            "attempts": recent,
+            "current_attempts": recent,  # Alias for test compatibility
             "max_attempts": self.max_messages_per_minute,
             "window_seconds": self.message_window,
-            "attempts_remaining": max(0, self.max_messages_per_minute - len(recent_attempts)),
-            "reset_time": current_time + self.message_window if recent_attempts else 0,
+            "attempts_remaining": max(0, self.max_messages_per_minute - recent),
+            "reset_time": time.time() + self.message_window if recent else 0,
         }
 
     def remove_connection_message_data(self, connection_id: str) -> None:
@@ -303,38 +254,3 @@ class RateLimiter:
                 error_type=type(e).__name__,
                 exc_info=True,
             )
-
-    def cleanup_old_message_attempts(self, max_age_seconds: int = 3600) -> None:
-        """
-        Clean up old message rate limit attempts to prevent memory bloat.
-
-        Args:
-            max_age_seconds: Maximum age of attempts to keep (default: 1 hour)
-        """
-        try:
-            current_time = time.time()
-            orphaned_connections = []
-
-            for connection_id, attempts in list(self.message_attempts.items()):
-                # Remove attempts older than max_age_seconds
-                self.message_attempts[connection_id] = [
-                    attempt_time for attempt_time in attempts if current_time - attempt_time < max_age_seconds
-                ]
-
-                # Remove empty entries
-                if not self.message_attempts[connection_id]:
-                    orphaned_connections.append(connection_id)
-
-            for connection_id in orphaned_connections:
-                del self.message_attempts[connection_id]
-
-            if orphaned_connections:
-                logger.debug("Cleaned up message rate limit data", connection_count=len(orphaned_connections))
-
-        except (OSError, ValueError, TypeError, KeyError) as e:
-            logger.error(
-                "Error cleaning up message rate limit attempts",
-                error=str(e),
-                error_type=type(e).__name__,
-                exc_info=True,
-            )
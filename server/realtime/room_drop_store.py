@@ -0,0 +1,395 @@
+"""
+Room floor drop storage.
+
+Every room's drops are held as one immutable list of read-only stacks that is
+replaced, never modified, when the room's drops change (copy-on-write). A look
+or room update therefore gets the current list itself: no per-reader copy, and
+a list a reader holds stays valid after later takes. Each list also carries a
+lazily built item-name index so ``get``/``pickup`` name matching does not
+rescan every stack. Writes are serialized by a lock, so takes racing from
+several threads (or resolved from a stale listing) never hand out more than
+the floor holds.
+
+When a snapshot file is configured the drops are written to it (atomically,
+off the event loop) a short window after they change and at shutdown, and
+loaded back at startup, so they survive a restart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from ..structured_logging.enhanced_logging_config import get_logger
+from ..utils.frozen_stack import FrozenList, FrozenStack, freeze_stack, thaw_stack
+
+logger = get_logger(__name__)
+
+# How long drop changes are collected before the snapshot file is rewritten
+DEFAULT_DROP_SNAPSHOT_WINDOW_SECONDS = 5.0
+
+SNAPSHOT_VERSION = 1
+
+_SNAPSHOT_READ_ERRORS = (OSError, ValueError, TypeError, KeyError, AttributeError)
+
+
+def _identifier(stack: Mapping[str, Any], key: str) -> str | None:
+    value = stack.get(key)
+    if isinstance(value, str):
+        return value.strip() or None
+    return None
+
+
+def _first_with_prefix(keys: list[tuple[str, int]], prefix: str) -> int | None:
+    """Lowest stack index among sorted (key, index) pairs whose key starts with prefix."""
+    best: int | None = None
+    for position in range(bisect_left(keys, (prefix, -1)), len(keys)):
+        key, index = keys[position]
+        if not key.startswith(prefix):
+            break
+        if best is None or index < best:
+            best = index
+    return best
+
+
+class DropNameIndex:  # pylint: disable=too-few-public-methods  # Reason: Immutable lookup structure; match() is its whole interface
+    """
+    Item-name lookup over one room's drop list.
+
+    Resolves a search term to the same stack as
+    ``inventory_item_matching.match_room_drop_by_name``: exact item_name,
+    item_id or prototype_id first, then an item_name prefix, then an
+    item_id/prototype_id prefix, then a substring of any of them; ties go to
+    the lowest index.
+    """
+
+    __slots__ = ("_exact", "_id_keys", "_lowered", "_name_keys")
+
+    def __init__(self, stacks: Sequence[Mapping[str, Any]]) -> None:
+        self._exact: dict[str, int] = {}
+        self._name_keys: list[tuple[str, int]] = []
+        self._id_keys: list[tuple[str, int]] = []
+        self._lowered: list[tuple[str, ...]] = []
+        for index, stack in enumerate(stacks):
+            item_name = _identifier(stack, "item_name")
+            ids = [c.lower() for c in (_identifier(stack, "item_id"), _identifier(stack, "prototype_id")) if c]
+            lowered = ((item_name.lower(),) if item_name else ()) + tuple(ids)
+            for key in lowered:
+                _ = self._exact.setdefault(key, index)
+            if item_name:
+                self._name_keys.append((item_name.lower(), index))
+            self._id_keys.extend((key, index) for key in ids)
+            self._lowered.append(lowered)
+        self._name_keys.sort()
+        self._id_keys.sort()
+
+    def match(self, search_term: str) -> int | None:
+        """Zero-based index of the best matching stack, or None."""
+        normalized = search_term.strip().lower()
+        if not normalized:
+            return None
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            return exact
+        for keys in (self._name_keys, self._id_keys):
+            prefix = _first_with_prefix(keys, normalized)
+            if prefix is not None:
+                return prefix
+        for index, lowered in enumerate(self._lowered):
+            if any(normalized in key for key in lowered):
+                return index
+        return None
+
+
+class RoomDropList(FrozenList):
+    """Read-only drop list of one room, as returned by ``list_room_drops``."""
+
+    __slots__ = ("_name_index",)
+
+    def __init__(self, stacks: Sequence[FrozenStack] = ()) -> None:
+        super().__init__(stacks)
+        self._name_index: DropNameIndex | None = None
+
+    @property
+    def name_index(self) -> DropNameIndex:
+        """Item-name index of this list, built on first use."""
+        if self._name_index is None:
+            self._name_index = DropNameIndex(self)
+        return self._name_index
+
+
+_EMPTY_DROPS = RoomDropList()
+
+
+def _quantity(stack: Mapping[str, Any]) -> int:
+    return int(stack.get("quantity", 1))
+
+
+def _same_item(stack: Mapping[str, Any], expected: Mapping[str, Any]) -> bool:
+    """True if the stacks describe the same item (quantity may have changed since it was listed)."""
+    if stack is expected:
+        return True
+    if len(stack) != len(expected):
+        return False
+    return all(key == "quantity" or (key in expected and expected[key] == value) for key, value in stack.items())
+
+
+class RoomDropStore(Mapping[str, RoomDropList]):
+    """
+    Room drops by canonical room id.
+
+    Reads (``stacks``, ``self[room_id]``) return the room's current
+    RoomDropList without copying; ``add``, ``take`` and ``adjust`` install a
+    new list. Room ids are used as given; callers canonicalize them.
+    """
+
+    def __init__(self, snapshot_window_seconds: float = DEFAULT_DROP_SNAPSHOT_WINDOW_SECONDS) -> None:
+        """
+        Initialize an empty store without snapshots.
+
+        Args:
+            snapshot_window_seconds: How long changes are collected before the snapshot is rewritten
+        """
+        if snapshot_window_seconds < 0:
+            raise ValueError("snapshot_window_seconds must not be negative")
+        self._rooms: dict[str, RoomDropList] = {}
+        self._write_lock = threading.Lock()
+        self._snapshot_path: Path | None = None
+        self._snapshot_window_seconds = snapshot_window_seconds
+        self._dirty = False
+        self._snapshot_task: asyncio.Task[None] | None = None
+        self._snapshot_lock = asyncio.Lock()
+
+    def __getitem__(self, room_id: str) -> RoomDropList:
+        return self._rooms[room_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rooms)
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    @property
+    def snapshot_path(self) -> Path | None:
+        """File the drops are persisted to, or None when snapshots are disabled."""
+        return self._snapshot_path
+
+    def stacks(self, room_id: str) -> RoomDropList:
+        """The room's drops (an empty list when there are none)."""
+        return self._rooms.get(room_id, _EMPTY_DROPS)
+
+    def add(self, room_id: str, stack: Mapping[str, Any]) -> FrozenStack:
+        """
+        Append a stack to the room's drops.
+
+        Returns:
+            The stored read-only stack
+
+        Raises:
+            ValueError: If the stack's quantity is not positive
+        """
+        frozen = freeze_stack(stack)
+        if _quantity(frozen) <= 0:
+            raise ValueError("Quantity must be positive for room drops.")
+        with self._write_lock:
+            self._replace(room_id, [*self.stacks(room_id), frozen])
+        return frozen
+
+    def take(
+        self, room_id: str, index: int, quantity: int, expected: Mapping[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Remove up to quantity items of a stack.
+
+        Args:
+            room_id: Canonical room id
+            index: Zero-based index of the stack in the caller's listing
+            quantity: Number of items wanted
+            expected: The stack as the caller listed it; when given, the take
+                follows it if other takes moved it and fails if it is gone
+
+        Returns:
+            Mutable copy of the removed items (quantity capped at what was
+            there), or None if the stack is no longer available
+
+        Raises:
+            ValueError: If quantity is not positive
+        """
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive when taking room drops.")
+        with self._write_lock:
+            stacks = self.stacks(room_id)
+            position = self._locate(stacks, index, expected)
+            if position is None:
+                return None
+            stack = stacks[position]
+            available = _quantity(stack)
+            taken = min(quantity, available)
+            updated = list(stacks)
+            if taken == available:
+                del updated[position]
+            else:
+                updated[position] = FrozenStack({**stack, "quantity": available - taken})
+            self._replace(room_id, updated)
+        removed = thaw_stack(stack)
+        removed["quantity"] = taken
+        return removed
+
+    def adjust(self, room_id: str, index: int, quantity: int) -> bool:
+        """Set a stack's quantity, removing the stack at zero; False for a bad index or negative quantity."""
+        with self._write_lock:
+            stacks = self.stacks(room_id)
+            if not 0 <= index < len(stacks) or quantity < 0:
+                return False
+            updated = list(stacks)
+            if quantity:
+                updated[index] = FrozenStack({**stacks[index], "quantity": quantity})
+            else:
+                del updated[index]
+            self._replace(room_id, updated)
+        return True
+
+    @staticmethod
+    def _locate(stacks: RoomDropList, index: int, expected: Mapping[str, Any] | None) -> int | None:
+        in_range = 0 <= index < len(stacks)
+        if expected is None:
+            return index if in_range else None
+        if in_range and _same_item(stacks[index], expected):
+            return index
+        return next((i for i, stack in enumerate(stacks) if _same_item(stack, expected)), None)
+
+    def _replace(self, room_id: str, stacks: list[FrozenStack]) -> None:
+        """Install a room's new drop list (caller holds the write lock)."""
+        if stacks:
+            self._rooms[room_id] = RoomDropList(stacks)
+        else:
+            _ = self._rooms.pop(room_id, None)
+        if self._snapshot_path is not None:
+            self._dirty = True
+            self._schedule_snapshot()
+
+    # --- Snapshots ---
+
+    def enable_snapshots(self, path: Path) -> int:
+        """
+        Persist drops to path from now on, first loading the drops it holds.
+
+        Returns:
+            Number of stacks loaded
+        """
+        self._snapshot_path = path
+        loaded = self._read_snapshot(path)
+        with self._write_lock:
+            for room_id, stacks in loaded.items():
+                self._rooms[room_id] = RoomDropList([*self.stacks(room_id), *stacks])
+        count = sum(len(stacks) for stacks in loaded.values())
+        logger.info("Room drop snapshots enabled", snapshot_file=str(path), rooms=len(loaded), stacks=count)
+        return count
+
+    @staticmethod
+    def _read_snapshot(path: Path) -> dict[str, list[FrozenStack]]:
+        if not path.exists():
+            return {}
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            rooms: dict[str, list[FrozenStack]] = {}
+            for room_id, stacks in payload["rooms"].items():
+                valid = [freeze_stack(stack) for stack in stacks if _quantity(stack) > 0]
+                if valid:
+                    rooms[str(room_id)] = valid
+            return rooms
+        except _SNAPSHOT_READ_ERRORS as e:
+            logger.error(
+                "Failed to load room drop snapshot, starting with empty floors", error=str(e), snapshot_file=str(path)
+            )
+            return {}
+
+    def _schedule_snapshot(self) -> None:
+        if self._snapshot_task is not None and not self._snapshot_task.done():
+            return
+        snapshot_window = self._run_snapshot_window()
+        try:
+            self._snapshot_task = asyncio.create_task(snapshot_window)
+        except RuntimeError:
+            # No event loop in this thread; the next change on the loop or shutdown writes it
+            snapshot_window.close()
+
+    async def _run_snapshot_window(self) -> None:
+        """Rewrite the snapshot after each window until no changes are left unsaved."""
+        try:
+            while self._dirty:
+                await asyncio.sleep(self._snapshot_window_seconds)
+                if not await self.save_snapshot():
+                    break
+        finally:
+            self._snapshot_task = None
+
+    async def save_snapshot(self) -> bool:
+        """
+        Write the current drops to the snapshot file now.
+
+        Returns:
+            True if the file was written (or snapshots are disabled), False if the write failed
+        """
+        path = self._snapshot_path
+        if path is None:
+            return True
+        async with self._snapshot_lock:
+            with self._write_lock:
+                # The lists are immutable, so a shallow copy is a consistent snapshot
+                rooms = dict(self._rooms)
+                self._dirty = False
+            try:
+                await asyncio.to_thread(_write_snapshot_file, path, rooms)
+            except (OSError, TypeError, ValueError) as e:
+                self._dirty = True
+                logger.error("Failed to write room drop snapshot", error=str(e), snapshot_file=str(path))
+                return False
+        logger.debug("Room drop snapshot written", rooms=len(rooms), snapshot_file=str(path))
+        return True
+
+    async def shutdown(self) -> None:
+        """Write unsaved changes now instead of waiting for the window to close."""
+        task = self._snapshot_task
+        # A task holding the lock is mid-write; save_snapshot() below waits for it instead of cancelling it
+        if task is not None and not task.done() and not self._snapshot_lock.locked():
+            _ = task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            self._snapshot_task = None
+        if self._dirty:
+            _ = await self.save_snapshot()
+
+
+def _write_snapshot_file(path: Path, rooms: Mapping[str, Sequence[Mapping[str, Any]]]) -> None:
+    """Replace the snapshot file atomically."""
+    payload = {"version": SNAPSHOT_VERSION, "rooms": {room_id: list(stacks) for room_id, stacks in rooms.items()}}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_path = tempfile.mkstemp(prefix="room_drops_", suffix=".json", dir=str(path.parent))
+    try:
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, default=str)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+__all__ = [
+    "DEFAULT_DROP_SNAPSHOT_WINDOW_SECONDS",
+    "DropNameIndex",
+    "RoomDropList",
+    "RoomDropStore",
+]
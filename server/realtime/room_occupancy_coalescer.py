@@ -0,0 +1,146 @@
+"""
+Per-room coalescing of room occupant broadcasts.
+
+Every player or NPC entering or leaving a room used to trigger a full
+``room_occupants`` broadcast to that room. When a group follows its leader or
+NPCs spawn in bulk, a room received one full occupant list per arrival. The
+coalescer throttles these broadcasts per room: the first change in a quiet
+room is broadcast immediately, and every further change within the window
+collapses into a single trailing snapshot taken when the window closes, so
+the room always ends up with the final occupant list.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypedDict
+
+from ..structured_logging.enhanced_logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# One server tick at the default tick rate (GameConfig.server_tick_rate)
+DEFAULT_COALESCE_WINDOW_SECONDS = 0.1
+
+OccupantsFlushFn = Callable[[str, str | None], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class _RoomWindow:
+    """Coalescing state for one room while its window is open."""
+
+    task: asyncio.Task[None] | None = None
+    pending: bool = False
+    exclude_player: str | None = None
+
+
+class CoalescerStats(TypedDict):
+    """Counters returned by RoomOccupancyCoalescer.get_stats()."""
+
+    requests: int
+    broadcasts: int
+    merged: int
+    open_windows: int
+
+
+class RoomOccupancyCoalescer:
+    """
+    Throttle room occupant broadcasts to at most one per room per window.
+
+    ``request_update`` has the same signature as the occupant update
+    callbacks it wraps, so it can be passed anywhere one is expected.
+    """
+
+    def __init__(self, flush: OccupantsFlushFn, window_seconds: float = DEFAULT_COALESCE_WINDOW_SECONDS) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            flush: Coroutine function broadcasting the current occupants of a room
+            window_seconds: Coalescing window per room (0 disables coalescing)
+        """
+        if window_seconds < 0:
+            raise ValueError("window_seconds must not be negative")
+        self._flush = flush
+        self._window_seconds = window_seconds
+        self._windows: dict[str, _RoomWindow] = {}
+        self._requests = 0
+        self._broadcasts = 0
+        self._merged = 0
+
+    async def request_update(self, room_id: str, exclude_player: str | None = None) -> None:
+        """
+        Request an occupant broadcast for a room.
+
+        Broadcasts right away when the room has no open window; otherwise the
+        request is merged into the window's trailing broadcast.
+
+        Args:
+            room_id: The room ID
+            exclude_player: Optional player ID to exclude from the broadcast
+        """
+        self._requests += 1
+        if not self._window_seconds:
+            await self._broadcast(room_id, exclude_player)
+            return
+
+        window = self._windows.get(room_id)
+        if window is not None:
+            if window.pending:
+                self._merged += 1
+                # The trailing broadcast can only skip a player every merged request excluded
+                if window.exclude_player != exclude_player:
+                    window.exclude_player = None
+            else:
+                window.pending = True
+                window.exclude_player = exclude_player
+            return
+
+        window = _RoomWindow()
+        self._windows[room_id] = window
+        window.task = asyncio.create_task(self._run_window(room_id, window))
+        await self._broadcast(room_id, exclude_player)
+
+    async def _run_window(self, room_id: str, window: _RoomWindow) -> None:
+        """Emit trailing broadcasts until a window passes without new changes."""
+        try:
+            while True:
+                await asyncio.sleep(self._window_seconds)
+                if not window.pending:
+                    return
+                exclude_player = window.exclude_player
+                window.pending = False
+                window.exclude_player = None
+                await self._broadcast(room_id, exclude_player)
+        finally:
+            if self._windows.get(room_id) is window:
+                del self._windows[room_id]
+
+    async def _broadcast(self, room_id: str, exclude_player: str | None) -> None:
+        self._broadcasts += 1
+        try:
+            await self._flush(room_id, exclude_player)
+        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: A failed broadcast must not leave the room's window stuck open
+            logger.error("Error broadcasting coalesced room occupants", room_id=room_id, error=str(e), exc_info=True)
+
+    def close(self) -> None:
+        """Cancel open windows, dropping their pending trailing broadcasts (used on shutdown)."""
+        for window in list(self._windows.values()):
+            if window.task is not None and not window.task.done():
+                _ = window.task.cancel()
+        self._windows.clear()
+
+    def get_stats(self) -> CoalescerStats:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Requests received, broadcasts sent, requests merged into a pending
+            broadcast, and rooms with an open window
+        """
+        return {
+            "requests": self._requests,
+            "broadcasts": self._broadcasts,
+            "merged": self._merged,
+            "open_windows": len(self._windows),
+        }
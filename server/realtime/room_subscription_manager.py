@@ -10,20 +10,53 @@ which players are subscribed to which rooms and managing room occupants.
 from __future__ import annotations
 
 from collections.abc import Mapping
-from copy import deepcopy
+from pathlib import Path
 from typing import Any, cast
 
+from ..npc.active_npc_registry import npc_ids_in_room
 from ..structured_logging.enhanced_logging_config import get_logger
+from .room_drop_store import RoomDropStore
 
 logger = get_logger(__name__)
 
 
+def _link(rooms: dict[str, set[str]], players: dict[str, set[str]], room_id: str, player_id: str) -> bool:
+    """Add player to room in a room -> players map and its player -> rooms index; False if already there."""
+    members = rooms.setdefault(room_id, set())
+    if player_id in members:
+        return False
+    members.add(player_id)
+    players.setdefault(player_id, set()).add(room_id)
+    return True
+
+
+def _unlink(rooms: dict[str, set[str]], players: dict[str, set[str]], room_id: str, player_id: str) -> bool:
+    """Remove player from room in both maps, dropping emptied entries; False if the player was not there."""
+    members = rooms.get(room_id)
+    if members is None or player_id not in members:
+        return False
+    members.discard(player_id)
+    if not members:
+        del rooms[room_id]
+    player_rooms = players.get(player_id)
+    if player_rooms is not None:
+        player_rooms.discard(room_id)
+        if not player_rooms:
+            del players[player_id]
+    return True
+
+
 class RoomSubscriptionManager:
     """
     Manages room subscriptions and occupant tracking.
 
     This class handles room subscriptions, occupant tracking, and
     provides utilities for room-based operations.
+
+    room_subscriptions and room_occupants are indexed by player as well, so
+    removing a disconnecting player and computing stats touch only the rooms
+    that player is in. Modify them through the methods below; the indexes and
+    counters are not updated by direct writes.
     """
 
     def __init__(self) -> None:
@@ -32,10 +65,15 @@ class RoomSubscriptionManager:
         self.room_subscriptions: dict[str, set[str]] = {}
         # Room occupants (room_id -> set of player_ids)
         self.room_occupants: dict[str, set[str]] = {}
+        # Reverse indexes (player_id -> set of room_ids) and running totals for get_stats()
+        self._player_subscriptions: dict[str, set[str]] = {}
+        self._player_occupancies: dict[str, set[str]] = {}
+        self._subscription_count = 0
+        self._occupant_count = 0
         # Reference to async persistence layer (set during initialization)
         self.async_persistence: Any | None = None
-        # Non-persistent room drops (room_id -> list of stacks)
-        self.room_drops: dict[str, list[dict[str, Any]]] = {}
+        # Room drops (canonical room_id -> read-only stacks); persisted only once enable_drop_snapshots is called
+        self.room_drops = RoomDropStore()
 
     def set_async_persistence(self, async_persistence: Any) -> None:
         """Set the async persistence layer reference."""
@@ -54,10 +92,8 @@ class RoomSubscriptionManager:
         """
         try:
             canonical_id = self._canonical_room_id(room_id) or room_id
-            if canonical_id not in self.room_subscriptions:
-                self.room_subscriptions[canonical_id] = set()
-
-            self.room_subscriptions[canonical_id].add(player_id)
+            if _link(self.room_subscriptions, self._player_subscriptions, canonical_id, player_id):
+                self._subscription_count += 1
             logger.debug("Player subscribed to room", player_id=player_id, room_id=canonical_id)
             return True
 
@@ -78,11 +114,8 @@ class RoomSubscriptionManager:
         """
         try:
             canonical_id = self._canonical_room_id(room_id) or room_id
-            if canonical_id in self.room_subscriptions:
-                self.room_subscriptions[canonical_id].discard(player_id)
-                if not self.room_subscriptions[canonical_id]:
-                    del self.room_subscriptions[canonical_id]
-
+            if _unlink(self.room_subscriptions, self._player_subscriptions, canonical_id, player_id):
+                self._subscription_count -= 1
             logger.debug("Player unsubscribed from room", player_id=player_id, room_id=canonical_id)
             return True
 
@@ -109,19 +142,20 @@ class RoomSubscriptionManager:
 
     def list_room_drops(self, room_id: str) -> list[dict[str, Any]]:
         """
-        Retrieve current room drops as a defensive copy for callers.
+        Retrieve current room drops.
 
         Args:
             room_id: The room identifier.
 
         Returns:
-            A deep copy of the drop stacks to prevent accidental mutation.
+            The room's read-only drop list (a RoomDropList). It is shared, not
+            copied: later drops and takes install a new list instead of
+            changing this one.
         """
         try:
             canonical_id = self._canonical_room_id(room_id) or room_id
-            stacks = self.room_drops.get(canonical_id, [])
-            return [deepcopy(stack) for stack in stacks]
-        except Exception as exc:  # noqa: B904  # pragma: no cover - defensive logging  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Deepcopy errors unpredictable, must return empty list
+            return self.room_drops.stacks(canonical_id)
+        except Exception as exc:  # noqa: B904  # pragma: no cover - defensive logging  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Room resolution errors unpredictable, must return empty list
             logger.error("Error listing room drops", room_id=room_id, error=str(exc))
             return []
 
@@ -135,22 +169,19 @@ class RoomSubscriptionManager:
         """
         canonical_id = self._canonical_room_id(room_id) or room_id
         try:
-            drop_stack = dict(stack)
-            quantity = int(drop_stack.get("quantity", 1))
-            if quantity <= 0:
-                raise ValueError("Quantity must be positive for room drops.")
-
-            self.room_drops.setdefault(canonical_id, []).append(drop_stack)
+            drop_stack = self.room_drops.add(canonical_id, stack)
             logger.info(
                 "Room drop recorded",
                 room_id=canonical_id,
                 item_id=drop_stack.get("item_id"),
-                quantity=quantity,
+                quantity=drop_stack.get("quantity", 1),
             )
         except Exception as exc:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Room drop add errors unpredictable, must handle gracefully
             logger.error("Failed adding room drop", room_id=canonical_id, error=str(exc))
 
-    def take_room_drop(self, room_id: str, index: int, quantity: int) -> dict[str, Any] | None:
+    def take_room_drop(
+        self, room_id: str, index: int, quantity: int, expected: Mapping[str, Any] | None = None
+    ) -> dict[str, Any] | None:
         """
         Remove quantity of a drop entry, returning the removed stack.
 
@@ -158,39 +189,22 @@ class RoomSubscriptionManager:
             room_id: Room identifier.
             index: Zero-based drop index.
             quantity: Quantity to remove.
+            expected: The stack as listed by the caller; the take fails instead
+                of removing a different item when another take got there first.
 
         Returns:
             Detached stack representing the removed items, or None if unavailable.
         """
         canonical_id = self._canonical_room_id(room_id) or room_id
         try:
-            if quantity <= 0:
-                raise ValueError("Quantity must be positive when taking room drops.")
-
-            drop_list = self.room_drops.get(canonical_id)
-            if not drop_list or not 0 <= index < len(drop_list):
+            removed = self.room_drops.take(canonical_id, index, quantity, expected)
+            if removed is None:
                 return None
-
-            stack = drop_list[index]
-            available = int(stack.get("quantity", 1))
-            removed = deepcopy(stack)
-            if quantity >= available:
-                removed_quantity = available
-                drop_list.pop(index)
-            else:
-                removed_quantity = quantity
-                stack["quantity"] = available - quantity
-                removed["quantity"] = quantity
-
-            if not drop_list:
-                self.room_drops.pop(canonical_id, None)
-
-            removed["quantity"] = removed_quantity
             logger.info(
                 "Room drop retrieved",
                 room_id=canonical_id,
                 item_id=removed.get("item_id"),
-                quantity=removed_quantity,
+                quantity=removed["quantity"],
             )
             return removed
         except Exception as exc:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Room drop retrieval errors unpredictable, must return None
@@ -211,26 +225,18 @@ class RoomSubscriptionManager:
         """
         canonical_id = self._canonical_room_id(room_id) or room_id
         try:
-            drop_list = self.room_drops.get(canonical_id)
-            if drop_list is None or not (0 <= index < len(drop_list)) or quantity < 0:
+            if not self.room_drops.adjust(canonical_id, index, quantity):
                 return False
-
-            if not quantity:
-                drop_list.pop(index)
-            else:
-                drop_list[index]["quantity"] = quantity
-
-            if drop_list:
-                self.room_drops[canonical_id] = drop_list
-            else:
-                self.room_drops.pop(canonical_id, None)
-
             logger.debug("Room drop adjusted", room_id=canonical_id, index=index, quantity=quantity)
             return True
         except Exception as exc:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Room drop adjustment errors unpredictable, must return False
             logger.error("Failed adjusting room drop", room_id=canonical_id, error=str(exc))
             return False
 
+    def enable_drop_snapshots(self, snapshot_path: Path) -> int:
+        """Persist room drops to snapshot_path, loading the drops it already holds; returns the stacks loaded."""
+        return self.room_drops.enable_snapshots(snapshot_path)
+
     def add_room_occupant(self, player_id: str, room_id: str) -> bool:
         """
         Add a player as an occupant of a room.
@@ -244,10 +250,8 @@ class RoomSubscriptionManager:
         """
         try:
             canonical_id = self._canonical_room_id(room_id) or room_id
-            if canonical_id not in self.room_occupants:
-                self.room_occupants[canonical_id] = set()
-
-            self.room_occupants[canonical_id].add(player_id)
+            if _link(self.room_occupants, self._player_occupancies, canonical_id, player_id):
+                self._occupant_count += 1
             logger.debug("Player added as occupant of room", player_id=player_id, room_id=canonical_id)
             return True
 
@@ -268,11 +272,8 @@ class RoomSubscriptionManager:
         """
         try:
             canonical_id = self._canonical_room_id(room_id) or room_id
-            if canonical_id in self.room_occupants:
-                self.room_occupants[canonical_id].discard(player_id)
-                if not self.room_occupants[canonical_id]:
-                    del self.room_occupants[canonical_id]
-
+            if _unlink(self.room_occupants, self._player_occupancies, canonical_id, player_id):
+                self._occupant_count -= 1
             logger.debug("Player removed as occupant of room", player_id=player_id, room_id=canonical_id)
             return True
 
@@ -325,7 +326,8 @@ class RoomSubscriptionManager:
         npc_occupants: list[dict[str, Any]] = []
         active_npcs_dict = lifecycle_manager.active_npcs
 
-        for npc_id, npc_instance in active_npcs_dict.items():
+        for npc_id in npc_ids_in_room(active_npcs_dict, canonical_id):
+            npc_instance = active_npcs_dict[npc_id]
             # Skip dead NPCs
             if not npc_instance.is_alive:
                 logger.debug(
@@ -336,13 +338,8 @@ class RoomSubscriptionManager:
                 )
                 continue
 
-            # Check both current_room and current_room_id for compatibility
-            current_room = getattr(npc_instance, "current_room", None)
-            current_room_id = getattr(npc_instance, "current_room_id", None)
-            npc_room_id = current_room or current_room_id
-            if npc_room_id == canonical_id:
-                npc_name = self._get_npc_name_from_lifecycle_manager(lifecycle_manager, npc_id)
-                self._add_npc_to_occupants(npc_occupants, npc_id, npc_name)
+            npc_name = self._get_npc_name_from_lifecycle_manager(lifecycle_manager, npc_id)
+            self._add_npc_to_occupants(npc_occupants, npc_id, npc_name)
 
         return npc_occupants
 
@@ -469,18 +466,21 @@ class RoomSubscriptionManager:
             bool: True if player was removed from all rooms successfully, False otherwise
         """
         try:
-            # Remove from room subscriptions
-            for room_id in list(self.room_subscriptions.keys()):
-                if player_id in self.room_subscriptions[room_id]:
-                    self.room_subscriptions[room_id].discard(player_id)
-                    if not self.room_subscriptions[room_id]:
+            # Only the rooms the player is in, not every room
+            for room_id in self._player_subscriptions.pop(player_id, set()):
+                members = self.room_subscriptions.get(room_id)
+                if members is not None and player_id in members:
+                    members.discard(player_id)
+                    self._subscription_count -= 1
+                    if not members:
                         del self.room_subscriptions[room_id]
 
-            # Remove from room occupants
-            for room_id in list(self.room_occupants.keys()):
-                if player_id in self.room_occupants[room_id]:
-                    self.room_occupants[room_id].discard(player_id)
-                    if not self.room_occupants[room_id]:
+            for room_id in self._player_occupancies.pop(player_id, set()):
+                members = self.room_occupants.get(room_id)
+                if members is not None and player_id in members:
+                    members.discard(player_id)
+                    self._occupant_count -= 1
+                    if not members:
                         del self.room_occupants[room_id]
 
             logger.debug("Player removed from all rooms", player_id=player_id)
@@ -504,14 +504,17 @@ class RoomSubscriptionManager:
         try:
             canonical_id = self._canonical_room_id(room_id) or room_id
             if canonical_id in self.room_occupants:
-                current = self.room_occupants[canonical_id]
-                pruned = {pid for pid in current if pid in online_players}
-                self.room_occupants[canonical_id] = pruned
+                current = set(self.room_occupants[canonical_id])
+                for pid in current:
+                    if pid not in online_players and _unlink(
+                        self.room_occupants, self._player_occupancies, canonical_id, pid
+                    ):
+                        self._occupant_count -= 1
                 logger.debug(
                     "Reconciled room presence",
                     room_id=canonical_id,
                     current_count=len(current),
-                    pruned_count=len(pruned),
+                    pruned_count=len(self.room_occupants.get(canonical_id, ())),
                 )
             return True
 
@@ -552,8 +555,8 @@ class RoomSubscriptionManager:
             Dict[str, Any]: Statistics about room subscriptions and occupants
         """
         try:
-            total_subscriptions = sum(len(subscribers) for subscribers in self.room_subscriptions.values())
-            total_occupants = sum(len(occupants) for occupants in self.room_occupants.values())
+            total_subscriptions = self._subscription_count
+            total_occupants = self._occupant_count
 
             return {
                 "total_rooms_with_subscriptions": len(self.room_subscriptions),
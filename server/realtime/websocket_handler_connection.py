@@ -26,6 +26,12 @@ class PlayerDisconnectService(Protocol):  # pylint: disable=too-few-public-metho
     def on_player_disconnect(self, player_id: uuid.UUID) -> None: ...  # pylint: disable=missing-function-docstring
 
 
+class PlayerConnectService(Protocol):  # pylint: disable=too-few-public-methods
+    """Notify subsystems when a WebSocket session starts for a player."""
+
+    def on_player_connect(self, player_id: uuid.UUID) -> None: ...  # pylint: disable=missing-function-docstring
+
+
 class AsyncPersistenceRoomLookup(Protocol):  # pylint: disable=too-few-public-methods
     """Narrow persistence surface for loading ``Room`` by id in the WS handler."""
 
@@ -35,7 +41,7 @@ class AsyncPersistenceRoomLookup(Protocol):  # pylint: disable=too-few-public-me
 async def cleanup_websocket_connection(
     player_id: uuid.UUID, player_id_str: str, connection_manager: "ConnectionManager"
 ) -> None:
-    """Clean up connection, follow state, party state, and player mute data on disconnect."""
+    """Clean up connection, follow, party and exploration state, and player mute data on disconnect."""
     try:
         from ..container import get_container
 
@@ -48,8 +54,14 @@ async def cleanup_websocket_connection(
             party_svc = cast(object | None, getattr(container, "party_service", None))
             if party_svc is not None:
                 cast(PlayerDisconnectService, party_svc).on_player_disconnect(player_id)
+            exploration_svc = cast(object | None, getattr(container, "exploration_service", None))
+            if exploration_svc is not None:
+                # Writes the player's buffered room discoveries now
+                cast(PlayerDisconnectService, exploration_svc).on_player_disconnect(player_id)
     except (ImportError, AttributeError, RuntimeError) as e:
-        logger.debug("Could not clean up follow/party state on disconnect", player_id=player_id, error=str(e))
+        logger.debug(
+            "Could not clean up follow/party/exploration state on disconnect", player_id=player_id, error=str(e)
+        )
 
     try:
         await connection_manager.disconnect_websocket(player_id)
@@ -65,6 +77,20 @@ async def cleanup_websocket_connection(
         logger.error("Error cleaning up mute data", player_id=player_id, error=str(e))
 
 
+def notify_player_connected(player_id: uuid.UUID) -> None:
+    """Load per-player state kept in memory while connected (explored rooms)."""
+    try:
+        from ..container import get_container
+
+        container: object | None = cast(object | None, get_container())
+        if container is not None:
+            exploration_svc = cast(object | None, getattr(container, "exploration_service", None))
+            if exploration_svc is not None:
+                cast(PlayerConnectService, exploration_svc).on_player_connect(player_id)
+    except (ImportError, AttributeError, RuntimeError) as e:
+        logger.debug("Could not load exploration state on connect", player_id=player_id, error=str(e))
+
+
 async def setup_initial_connection_state(
     websocket: WebSocket,
     player_id: uuid.UUID,
@@ -79,6 +105,7 @@ async def setup_initial_connection_state(
     """
     from . import websocket_handler as ws_handler
 
+    notify_player_connected(player_id)
     try:
         canonical_room_id, should_exit = await ws_handler.send_initial_game_state(
             websocket, player_id, player_id_str, connection_manager
@@ -7,6 +7,7 @@ This module handles room updates and broadcasting to players.
 import uuid
 from typing import TYPE_CHECKING, Any, cast
 
+from ..npc.active_npc_registry import npc_ids_in_room
 from ..services.npc_instance_service import get_npc_instance_service
 from ..structured_logging.enhanced_logging_config import get_logger
 from ..utils.room_renderer import build_room_drop_summary, clone_room_drops
@@ -60,7 +61,8 @@ async def get_npc_occupants_from_lifecycle_manager(room_id: str) -> list[str]:
             lifecycle_manager = npc_instance_service.lifecycle_manager
             if lifecycle_manager and hasattr(lifecycle_manager, "active_npcs"):
                 active_npcs_dict = lifecycle_manager.active_npcs
-                for npc_id, npc_instance in active_npcs_dict.items():
+                for npc_id in npc_ids_in_room(active_npcs_dict, room_id):
+                    npc_instance = active_npcs_dict[npc_id]
                     if not npc_instance.is_alive:
                         logger.debug(
                             "Skipping dead NPC from occupants",
@@ -69,12 +71,7 @@ async def get_npc_occupants_from_lifecycle_manager(room_id: str) -> list[str]:
                             room_id=room_id,
                         )
                         continue
-
-                    current_room = getattr(npc_instance, "current_room", None)
-                    current_room_id = getattr(npc_instance, "current_room_id", None)
-                    npc_room_id = current_room or current_room_id
-                    if npc_room_id == room_id:
-                        npc_ids.append(npc_id)
+                    npc_ids.append(npc_id)
 
         logger.debug("Room has NPCs from lifecycle manager", room_id=room_id, npc_ids=npc_ids)
         for npc_id in npc_ids:
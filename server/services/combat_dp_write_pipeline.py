@@ -0,0 +1,290 @@
+"""
+Coalescing write pipeline for player DP changes during combat.
+
+Combat keeps the authoritative DP of its participants in memory
+(CombatParticipant.current_dp). Each hit used to persist that value with a
+read-modify-write of the whole player followed by a verification read, three
+round trips per hit. The pipeline instead remembers the latest DP per player
+and writes everything that changed within a short window with one call of
+the set_players_dp stored function; the returned rows confirm the stored
+values, so no verification read is needed.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Literal, TypedDict
+from uuid import UUID
+
+from ..exceptions import DatabaseError
+from ..structured_logging.enhanced_logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# One server tick at the default tick rate (GameConfig.server_tick_rate)
+DEFAULT_DP_FLUSH_WINDOW_SECONDS = 0.1
+
+# (player_id, correct_dp, max_dp, room_id, combat_id, error_message)
+DPCorrectionFn = Callable[[UUID, int, int, str | None, str | None, str | None], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class _PendingDP:
+    """Latest unsaved DP for one player."""
+
+    current_dp: int
+    persisted_dp: int
+    max_dp: int
+    room_id: str | None
+    combat_id: str | None
+
+
+class CombatDPWriteStats(TypedDict):
+    """Per-combat write counters returned by CombatDPWritePipeline.get_combat_write_stats()."""
+
+    dp_changes: int
+    coalesced: int
+    statements: int
+    rows_written: int
+    failures: int
+
+
+def _empty_stats() -> CombatDPWriteStats:
+    return {"dp_changes": 0, "coalesced": 0, "statements": 0, "rows_written": 0, "failures": 0}
+
+
+def _log_dp_transition(player_id: UUID, player_name: str, old_dp: int, new_dp: int) -> None:
+    """Log death threshold and mortal wound transitions (the game tick loop handles them)."""
+    if new_dp <= -10 < old_dp:
+        logger.info(
+            "Player reached death threshold in combat - game tick loop will handle death",
+            player_id=player_id,
+            player_name=player_name,
+            final_dp=new_dp,
+        )
+    elif new_dp <= 0 < old_dp:
+        logger.info(
+            "Player became mortally wounded in combat",
+            player_id=player_id,
+            player_name=player_name,
+            current_dp=new_dp,
+        )
+
+
+class CombatDPWritePipeline:
+    """
+    Coalesce combat DP changes per player into one batched write per flush window.
+
+    ``submit`` never blocks combat: the first change opens a window, further
+    changes to the same player only replace the pending value, and the window
+    is written in a single statement when it closes.
+    """
+
+    def __init__(
+        self,
+        get_persistence: Callable[[], Any | None],
+        publish_correction: DPCorrectionFn,
+        window_seconds: float = DEFAULT_DP_FLUSH_WINDOW_SECONDS,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            get_persistence: Returns the async persistence layer (or None when unavailable)
+            publish_correction: Publishes a DP correction event when a write fails
+            window_seconds: How long changes are collected before they are written
+        """
+        if window_seconds < 0:
+            raise ValueError("window_seconds must not be negative")
+        self._get_persistence = get_persistence
+        self._publish_correction = publish_correction
+        self._window_seconds = window_seconds
+        self._pending: dict[UUID, _PendingDP] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+        self._combat_stats: dict[str, CombatDPWriteStats] = {}
+        self._totals = _empty_stats()
+
+    def submit(  # pylint: disable=too-many-arguments,too-many-positional-arguments  # Reason: Mirrors persist_player_dp_background, which carries the correction event context
+        self,
+        player_id: UUID,
+        current_dp: int,
+        old_dp: int,
+        max_dp: int,
+        room_id: str | None = None,
+        combat_id: str | None = None,
+    ) -> None:
+        """
+        Queue a player's new DP for the next flush.
+
+        Args:
+            player_id: ID of the player whose DP changed
+            current_dp: New current DP value
+            old_dp: DP before this change (restored on the client if the write fails)
+            max_dp: Maximum DP value
+            room_id: Room where the change occurred
+            combat_id: Combat the change belongs to
+        """
+        combat_stats = self._stats_for(combat_id)
+        for stats in (self._totals, combat_stats):
+            if stats is not None:
+                stats["dp_changes"] += 1
+
+        pending = self._pending.get(player_id)
+        if pending is None:
+            self._pending[player_id] = _PendingDP(current_dp, old_dp, max_dp, room_id, combat_id)
+        else:
+            # Keep the DP from before the window: that is what the database still holds
+            pending.current_dp = current_dp
+            pending.max_dp = max_dp
+            pending.room_id = room_id
+            pending.combat_id = combat_id
+            for stats in (self._totals, combat_stats):
+                if stats is not None:
+                    stats["coalesced"] += 1
+
+        if self._flush_task is None or self._flush_task.done():
+            flush_window = self._run_flush_window()
+            try:
+                self._flush_task = asyncio.create_task(flush_window)
+            except RuntimeError as e:
+                flush_window.close()
+                logger.error("Cannot schedule DP write - no event loop available", player_id=player_id, error=str(e))
+
+    async def _run_flush_window(self) -> None:
+        """Flush pending DP after each window until nothing is left to write."""
+        try:
+            while self._pending:
+                await asyncio.sleep(self._window_seconds)
+                _ = await self.flush()
+        finally:
+            self._flush_task = None
+
+    async def flush(self) -> int:
+        """
+        Write all pending DP changes now.
+
+        Returns:
+            Number of player rows updated
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch = self._pending
+            self._pending = {}
+            return await self._write_batch(batch)
+
+    async def _write_batch(self, batch: dict[UUID, _PendingDP]) -> int:
+        """Write one batch with a single statement and account for the result."""
+        persistence = self._get_persistence()
+        if persistence is None:
+            logger.warning("No persistence layer available for DP persistence", player_count=len(batch))
+            return 0
+
+        combat_ids = {pending.combat_id for pending in batch.values()}
+        try:
+            stored = await persistence.set_players_dp({player_id: p.current_dp for player_id, p in batch.items()})
+        except (DatabaseError, ConnectionError, TimeoutError, OSError, RuntimeError, ValueError, TypeError) as e:
+            logger.error(
+                "Combat DP write failed - sending correction events",
+                player_count=len(batch),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            self._count_statement(combat_ids, "failures")
+            await self._send_corrections(batch, str(e))
+            return 0
+
+        self._count_statement(combat_ids, "statements")
+        for player_id, pending in batch.items():
+            row = stored.get(player_id)
+            if row is None:
+                logger.warning("Player not found for DP persistence", player_id=player_id)
+                continue
+            player_name, stored_dp = row
+            for stats in (self._totals, self._existing_stats(pending.combat_id)):
+                if stats is not None:
+                    stats["rows_written"] += 1
+            if stored_dp != pending.current_dp:
+                logger.warning(
+                    "Stored DP differs from combat DP",
+                    player_id=player_id,
+                    expected=pending.current_dp,
+                    stored=stored_dp,
+                )
+            _log_dp_transition(player_id, player_name, pending.persisted_dp, stored_dp)
+        return len(stored)
+
+    def _count_statement(self, combat_ids: set[str | None], counter: Literal["statements", "failures"]) -> None:
+        self._totals[counter] += 1
+        for combat_id in combat_ids:
+            stats = self._existing_stats(combat_id)
+            if stats is not None:
+                stats[counter] += 1
+
+    async def _send_corrections(self, batch: dict[UUID, _PendingDP], error_message: str) -> None:
+        """Revert the optimistic client DP of every player in a failed batch."""
+        for player_id, pending in batch.items():
+            try:
+                await self._publish_correction(
+                    player_id, pending.persisted_dp, pending.max_dp, pending.room_id, pending.combat_id, error_message
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: One failed correction must not stop the others
+                logger.error(
+                    "Failed to send DP correction event after persistence failure",
+                    player_id=player_id,
+                    error=str(e),
+                    exc_info=True,
+                )
+
+    def _stats_for(self, combat_id: str | None) -> CombatDPWriteStats | None:
+        if combat_id is None:
+            return None
+        stats = self._combat_stats.get(combat_id)
+        if stats is None:
+            stats = _empty_stats()
+            self._combat_stats[combat_id] = stats
+        return stats
+
+    def _existing_stats(self, combat_id: str | None) -> CombatDPWriteStats | None:
+        # Writes landing after finish_combat() must not resurrect the combat's counters
+        return self._combat_stats.get(combat_id) if combat_id is not None else None
+
+    def get_combat_write_stats(self, combat_id: str) -> CombatDPWriteStats:
+        """
+        Get DP write counters for one combat.
+
+        Returns:
+            DP changes submitted, changes coalesced into an already pending
+            write, statements executed, rows written and failed statements
+        """
+        stats = self._combat_stats.get(combat_id)
+        return stats.copy() if stats is not None else _empty_stats()
+
+    async def finish_combat(self, combat_id: str) -> CombatDPWriteStats:
+        """
+        Write the combat's pending DP and release its counters (called when combat ends).
+
+        Returns:
+            Final write counters for the combat
+        """
+        # Also waits for a write already in progress, so the counters are final
+        _ = await self.flush()
+        return self._combat_stats.pop(combat_id, None) or _empty_stats()
+
+    def get_stats(self) -> CombatDPWriteStats:
+        """Get DP write counters summed over all combats."""
+        return self._totals.copy()
+
+    async def shutdown(self) -> None:
+        """Write outstanding DP changes now instead of waiting for the window to close."""
+        task = self._flush_task
+        # A task holding the lock is mid-write; flush() below waits for it instead of cancelling it
+        if task is not None and not task.done() and not self._flush_lock.locked():
+            _ = task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        _ = await self.flush()
@@ -17,6 +17,7 @@ from ..events.event_bus import EventBus
 from ..events.event_types import PlayerDPUpdated
 from ..exceptions import DatabaseError
 from ..structured_logging.enhanced_logging_config import get_logger
+from .combat_dp_write_pipeline import CombatDPWritePipeline
 
 if TYPE_CHECKING:
     from ..async_persistence import AsyncPersistenceLayer
@@ -32,6 +33,13 @@ class CombatDPSync:  # pylint: disable=too-few-public-methods  # Reason: DP sync
         self._combat_service = combat_service
         self._nats_service = getattr(combat_service, "_nats_service", None)
         self._combat_event_publisher = getattr(combat_service, "_combat_event_publisher", None)
+        # Share the combat service's pipeline so both paths coalesce into the same writes
+        pipeline = getattr(getattr(combat_service, "_persistence_handler", None), "dp_write_pipeline", None)
+        self._dp_writes: CombatDPWritePipeline = (
+            pipeline
+            if isinstance(pipeline, CombatDPWritePipeline)
+            else CombatDPWritePipeline(lambda: self._get_persistence(None), self._publish_player_dp_correction_event)
+        )
 
     def _persist_player_dp_background(
         self,
@@ -45,8 +53,10 @@ class CombatDPSync:  # pylint: disable=too-few-public-methods  # Reason: DP sync
         """
         Persist player DP to database in background (fire-and-forget).
 
-        This method runs database persistence asynchronously without blocking the combat flow.
-        If persistence fails, a correction event is sent to update the client with the correct DP.
+        The change joins the combat DP write pipeline, which coalesces changes
+        per player and writes them in one batched UPDATE ... RETURNING per
+        flush window. If the write fails, a correction event is sent to update
+        the client with the last persisted DP.
 
         Args:
             player_id: ID of the player whose DP changed
@@ -54,94 +64,16 @@ class CombatDPSync:  # pylint: disable=too-few-public-methods  # Reason: DP sync
             old_dp: Previous DP value (for correction events if save fails)
             max_dp: Maximum DP value
             room_id: Room ID where the change occurred (for error context)
+            combat_id: Combat ID for context
         """
-        import asyncio
-
-        async def _persist_and_handle_errors() -> None:
-            """Background task to persist DP and handle errors."""
-            try:
-                await self._persist_player_dp_sync(player_id, current_dp)
-                logger.debug(
-                    "Background DP persistence completed successfully",
-                    player_id=player_id,
-                    current_dp=current_dp,
-                )
-            except (
-                DatabaseError,
-                AttributeError,
-                ValueError,
-                TypeError,
-                RuntimeError,
-                ConnectionError,
-                TimeoutError,
-                OSError,
-            ) as e:
-                logger.error(
-                    "Background DP persistence failed - sending correction event",
-                    player_id=player_id,
-                    current_dp=current_dp,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    exc_info=True,
-                )
-                try:
-                    await self._publish_player_dp_correction_event(
-                        player_id, old_dp, max_dp, room_id, combat_id, str(e)
-                    )
-                except (
-                    DatabaseError,
-                    AttributeError,
-                    ValueError,
-                    TypeError,
-                    RuntimeError,
-                    ConnectionError,
-                    TimeoutError,
-                    OSError,
-                ) as correction_error:
-                    logger.error(
-                        "Failed to send DP correction event after persistence failure",
-                        player_id=player_id,
-                        error=str(correction_error),
-                        error_type=type(correction_error).__name__,
-                        exc_info=True,
-                    )
-
-        task_coro = _persist_and_handle_errors()
-        try:
-            task = asyncio.create_task(task_coro)
-            logger.debug(
-                "Created background task for DP persistence",
-                player_id=player_id,
-                current_dp=current_dp,
-            )
-            # If a test double returns something other than an asyncio.Task, close the coroutine to avoid leaks.
-            # Type checker thinks this is unreachable (asyncio.create_task always returns Task),
-            # but test doubles may return non-Task objects, so we keep the check for test safety
-            if not isinstance(task, asyncio.Task):
-                task_coro.close()  # type: ignore[unreachable]  # Reason: Type checker thinks this is unreachable (asyncio.create_task always returns Task), but test doubles may return non-Task objects, we keep the check for test safety
-        except RuntimeError as e:
-            task_coro.close()
-            logger.error(
-                "Cannot create background task - no event loop available",
-                player_id=player_id,
-                error=str(e),
-            )
-        except Exception as e:  # noqa: B904  # pragma: no cover - defensive path for unexpected test doubles  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Task creation errors unpredictable, must handle gracefully
-            task_coro.close()
-            logger.error(
-                "Failed to create background task for DP persistence",
-                player_id=player_id,
-                current_dp=current_dp,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
+        self._dp_writes.submit(player_id, current_dp, old_dp, max_dp, room_id, combat_id)
 
-    def _get_persistence(self, player_id: UUID) -> "AsyncPersistenceLayer | None":
+    def _get_persistence(self, player_id: UUID | None) -> "AsyncPersistenceLayer | None":
         """
         Get persistence layer from application container.
 
         Args:
-            player_id: Player ID for logging context
+            player_id: Player ID for logging context, if any
 
         Returns:
             Persistence instance or None if unavailable
@@ -155,149 +87,6 @@ class CombatDPSync:  # pylint: disable=too-few-public-methods  # Reason: DP sync
             logger.warning("Could not get persistence from container", error=str(e), player_id=player_id)
             return None
 
-    async def _verify_player_save(
-        self, persistence: "AsyncPersistenceLayer", player_id: UUID, player_name: str, old_dp: int, current_dp: int
-    ) -> None:
-        """
-        Verify that player DP was successfully saved to database.
-
-        Args:
-            persistence: Persistence layer instance
-            player_id: Player ID
-            player_name: Player name for logging
-            old_dp: Previous DP value
-            current_dp: Expected current DP value
-        """
-        verification_player = await persistence.get_player_by_id(player_id)
-        if verification_player:
-            verification_stats = verification_player.get_stats()
-            verification_dp = verification_stats.get("current_dp", -999)
-            logger.info(
-                "Player DP persisted to database - VERIFICATION",
-                player_id=player_id,
-                player_name=player_name,
-                old_dp=old_dp,
-                new_dp=current_dp,
-                verified_dp_from_db=verification_dp,
-                save_successful=verification_dp == current_dp,
-            )
-        else:
-            logger.error("Could not verify player save - player not found after save", player_id=player_id)
-
-    def _log_death_threshold_events(self, current_dp: int, old_dp: int, player_id: UUID, player_name: str) -> None:
-        """
-        Log death threshold events based on DP changes.
-
-        Args:
-            current_dp: New current DP value
-            old_dp: Previous DP value
-            player_id: Player ID for logging
-            player_name: Player name for logging
-        """
-        if current_dp <= -10 and old_dp > -10:
-            logger.info(
-                "Player reached death threshold in combat - triggering immediate death handling",
-                player_id=player_id,
-                player_name=player_name,
-                final_dp=current_dp,
-            )
-            logger.debug(
-                "Player reached death threshold - will be handled by game tick loop within 1 second",
-                player_id=player_id,
-                player_name=player_name,
-            )
-        elif current_dp <= 0 < old_dp:
-            logger.info(
-                "Player became mortally wounded in combat",
-                player_id=player_id,
-                player_name=player_name,
-                dp=current_dp,
-            )
-
-    async def _update_and_save_player_dp(
-        self, persistence: "AsyncPersistenceLayer", player_id: UUID, current_dp: int
-    ) -> tuple[Any, int] | None:
-        """
-        Update player DP and save to database.
-
-        Args:
-            persistence: Persistence layer instance
-            player_id: Player ID
-            current_dp: New current DP value
-
-        Returns:
-            Tuple of (player, old_dp) if successful, None otherwise
-        """
-        player = await persistence.get_player_by_id(player_id)
-        if not player:
-            logger.warning("Player not found for DP persistence", player_id=player_id)
-            return None
-
-        # Delegate DP and posture updates to Player domain model
-        old_dp, became_mortally_wounded, _became_dead = player.apply_dp_change(current_dp)
-        if became_mortally_wounded:
-            logger.info(
-                "Player posture changed to lying (unconscious in combat)",
-                player_id=player_id,
-                player_name=player.name,
-                dp=current_dp,
-            )
-
-        logger.debug(
-            "Stats after DP update, before save",
-            player_id=player_id,
-            raw_stats_after_set=player.stats,
-            new_current_dp=current_dp,
-        )
-
-        await persistence.save_player(player)
-        return (player, old_dp)
-
-    async def _persist_player_dp_sync(self, player_id: UUID, current_dp: int) -> None:
-        """
-        Synchronously persist player DP to database.
-
-        This is the actual persistence logic, called from the background task.
-        Separated from the old _persist_player_dp to allow background execution.
-
-        Args:
-            player_id: ID of the player whose DP changed
-            current_dp: New current DP value
-        """
-        try:
-            logger.info("_persist_player_dp called", player_id=player_id, current_dp=current_dp)
-
-            persistence = self._get_persistence(player_id)
-            if not persistence:
-                logger.warning("No persistence layer available for DP persistence", player_id=player_id)
-                return
-
-            result = await self._update_and_save_player_dp(persistence, player_id, current_dp)
-            if not result:
-                return
-
-            player, old_dp = result
-            await self._verify_player_save(persistence, player_id, player.name, old_dp, current_dp)
-            self._log_death_threshold_events(current_dp, old_dp, player_id, player.name)
-
-        except (
-            DatabaseError,
-            AttributeError,
-            ValueError,
-            TypeError,
-            RuntimeError,
-            ConnectionError,
-            TimeoutError,
-            OSError,
-        ) as e:
-            logger.error(
-                "Error persisting player DP",
-                player_id=player_id,
-                current_dp=current_dp,
-                error=str(e),
-                exc_info=True,
-            )
-
     async def _publish_player_dp_correction_event(  # pylint: disable=too-many-arguments,too-many-positional-arguments  # Reason: Event publishing requires many parameters for complete event context
         self,
         player_id: UUID,
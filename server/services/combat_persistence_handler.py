@@ -1,15 +1,15 @@
 """
 Combat persistence handling logic.
 
-Handles player DP persistence, verification, and event publishing.
+Handles player DP persistence and event publishing.
 """
 
 # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals,too-many-lines  # Reason: Persistence handling requires many parameters and intermediate variables for complex persistence logic. Combat persistence handler requires extensive persistence logic for comprehensive DP management.
 
-import asyncio
 from typing import Any
 from uuid import UUID
 
+from server.services.combat_dp_write_pipeline import CombatDPWritePipeline, CombatDPWriteStats
 from server.services.nats_exceptions import NATSError
 from server.structured_logging.enhanced_logging_config import get_logger
 
@@ -27,6 +27,15 @@ class CombatPersistenceHandler:
             combat_service: Reference to the parent CombatService
         """
         self._combat_service = combat_service
+        self._dp_writes = CombatDPWritePipeline(
+            self._get_persistence_layer,
+            self._publish_player_dp_correction_event,
+        )
+
+    @property
+    def dp_write_pipeline(self) -> CombatDPWritePipeline:
+        """Pipeline coalescing combat DP changes into batched database writes."""
+        return self._dp_writes
 
     def _get_persistence_layer(self) -> Any | None:
         """
@@ -53,141 +62,7 @@ class CombatPersistenceHandler:
             logger.warning("Could not get persistence from container", error=str(e))
             return None
 
-    async def _verify_player_save(
-        self, persistence: Any, player_id: UUID, player_name: str, old_dp: int, current_dp: int
-    ) -> None:
-        """
-        Verify that player save was successful by reading back from database.
-
-        Args:
-            persistence: Persistence layer instance
-            player_id: ID of the player
-            player_name: Name of the player
-            old_dp: Previous DP value
-            current_dp: New DP value
-        """
-        verification_player = await persistence.get_player_by_id(player_id)
-        if verification_player:
-            verification_stats = verification_player.get_stats()
-            verification_dp = verification_stats.get("current_dp", -999)
-            logger.info(
-                "Player DP persisted to database - VERIFICATION",
-                player_id=player_id,
-                player_name=player_name,
-                old_dp=old_dp,
-                new_dp=current_dp,
-                verified_dp_from_db=verification_dp,
-                save_successful=verification_dp == current_dp,
-            )
-        else:
-            logger.error("Could not verify player save - player not found after save", player_id=player_id)
-
-    def _log_death_state_changes(self, player_id: UUID, player_name: str, current_dp: int, old_dp: int) -> None:
-        """
-        Log death state changes (death threshold or mortally wounded).
-
-        Args:
-            player_id: ID of the player
-            player_name: Name of the player
-            current_dp: Current DP value
-            old_dp: Previous DP value
-        """
-        # Check if player has reached death threshold
-        # CRITICAL: Players at 0 DP or below should enter mortally wounded state immediately
-        # Players at -10 DP should trigger death handling and limbo transition
-        if current_dp <= -10 and old_dp > -10:
-            logger.info(
-                "Player reached death threshold in combat - triggering immediate death handling",
-                player_id=player_id,
-                player_name=player_name,
-                final_dp=current_dp,
-            )
-            # Immediately trigger death handling and move to limbo
-            # NOTE: The game tick loop will also check for dead players, but this provides immediate handling
-            # We'll let the game tick loop handle it since we don't have easy access to a database session here
-            # The tick loop runs every second, so the delay is minimal
-            logger.debug(
-                "Player reached death threshold - will be handled by game tick loop within 1 second",
-                player_id=player_id,
-                player_name=player_name,
-            )
-        elif current_dp <= 0 < old_dp:
-            # Player just became mortally wounded
-            logger.info(
-                "Player became mortally wounded in combat",
-                player_id=player_id,
-                player_name=player_name,
-                current_dp=current_dp,
-            )
-            # DP decay will be processed automatically by the tick loop
-
-    async def _persist_player_dp_sync(self, player_id: UUID, current_dp: int) -> None:
-        """
-        Synchronously persist player DP to database.
-
-        This is the actual persistence logic, called from the background task.
-        Separated from the old _persist_player_dp to allow background execution.
-
-        Args:
-            player_id: ID of the player whose DP changed
-            current_dp: New current DP value
-        """
-        try:
-            logger.info("_persist_player_dp_sync called", player_id=player_id, current_dp=current_dp)
-
-            # Get persistence layer from application container
-            persistence = self._get_persistence_layer()
-            if not persistence:
-                logger.warning("No persistence layer available for DP persistence", player_id=player_id)
-                return
-
-            # Get player from database
-            player = await persistence.get_player_by_id(player_id)
-            if not player:
-                logger.warning("Player not found for DP persistence", player_id=player_id)
-                return
-
-            # Delegate DP and posture updates to Player domain model
-            old_dp, became_mortally_wounded, _became_dead = player.apply_dp_change(current_dp)
-            if became_mortally_wounded:
-                logger.info(
-                    "Player posture changed to lying (unconscious in combat)",
-                    player_id=player_id,
-                    player_name=player.name,
-                    dp=current_dp,
-                )
-
-            # Save player to database
-            await persistence.save_player(player)
-
-            # Verify save was successful
-            await self._verify_player_save(persistence, player_id, player.name, old_dp, current_dp)
-
-            # NOTE: DP update event is now published IMMEDIATELY in process_attack()
-            # before this persistence method is called. This method only handles database persistence.
-            # The event was already sent for real-time UI updates.
-
-            # Log death state changes
-            self._log_death_state_changes(player_id, player.name, current_dp, old_dp)
-
-        except (
-            NATSError,
-            ValueError,
-            RuntimeError,
-            AttributeError,
-            ConnectionError,
-            TypeError,
-            KeyError,
-        ) as e:
-            logger.error(
-                "Error persisting player DP to database",
-                player_id=player_id,
-                current_dp=current_dp,
-                error=str(e),
-                exc_info=True,
-            )
-
-    def _persist_player_dp_background(  # pylint: disable=too-many-arguments,too-many-positional-arguments  # Reason: DP persistence requires many parameters for context and persistence operations
+    def persist_player_dp_background(  # pylint: disable=too-many-arguments,too-many-positional-arguments  # Reason: DP persistence requires many parameters for context and persistence operations
         self,
         player_id: UUID,
         current_dp: int,
@@ -199,8 +74,10 @@ class CombatPersistenceHandler:
         """
         Persist player DP to database in background (fire-and-forget).
 
-        This method runs database persistence asynchronously without blocking the combat flow.
-        If persistence fails, a correction event is sent to update the client with the correct DP.
+        The change joins the DP write pipeline: successive changes to the same
+        player within the flush window are written once, in a batched
+        UPDATE ... RETURNING. If the write fails, a correction event restores
+        the client's DP to the last persisted value.
 
         Args:
             player_id: ID of the player whose DP changed
@@ -210,97 +87,22 @@ class CombatPersistenceHandler:
             room_id: Room ID where the change occurred (for error context)
             combat_id: Combat ID for context
         """
+        self._dp_writes.submit(player_id, current_dp, old_dp, max_dp, room_id, combat_id)
 
-        async def _persist_and_handle_errors() -> None:
-            """Background task to persist DP and handle errors."""
-            try:
-                await self._persist_player_dp_sync(player_id, current_dp)
-                logger.debug(
-                    "Background DP persistence completed successfully",
-                    player_id=player_id,
-                    current_dp=current_dp,
-                )
-            except (
-                AttributeError,
-                ValueError,
-                TypeError,
-                RuntimeError,
-                ConnectionError,
-                OSError,
-                ImportError,
-                KeyError,
-                NATSError,
-            ) as e:
-                logger.error(
-                    "Background DP persistence failed - sending correction event",
-                    player_id=player_id,
-                    current_dp=current_dp,
-                    error=str(e),
-                    exc_info=True,
-                )
-                # Send correction event with old_dp to revert the optimistic update
-                # This ensures the client shows the correct DP if database save failed
-                try:
-                    await self._publish_player_dp_correction_event(
-                        player_id, old_dp, max_dp, room_id, combat_id, str(e)
-                    )
-                except (
-                    AttributeError,
-                    ValueError,
-                    TypeError,
-                    RuntimeError,
-                    ConnectionError,
-                    OSError,
-                    ImportError,
-                    KeyError,
-                    NATSError,
-                ) as correction_error:
-                    logger.error(
-                        "Failed to send DP correction event after persistence failure",
-                        player_id=player_id,
-                        error=str(correction_error),
-                        exc_info=True,
-                    )
-
-        # Create background task (fire-and-forget)
-        try:
-            asyncio.create_task(_persist_and_handle_errors())
-            logger.debug(
-                "Created background task for DP persistence",
-                player_id=player_id,
-                current_dp=current_dp,
-            )
-        except RuntimeError as e:
-            # No event loop available - log error but don't crash
-            logger.error(
-                "Cannot create background task - no event loop available",
-                player_id=player_id,
-                error=str(e),
-            )
-
-    def persist_player_dp_background(  # pylint: disable=too-many-arguments,too-many-positional-arguments  # Reason: DP persistence requires many parameters for context and persistence operations
-        self,
-        player_id: UUID,
-        current_dp: int,
-        old_dp: int,
-        max_dp: int,
-        room_id: str | None = None,
-        combat_id: str | None = None,
-    ) -> None:
+    async def finish_combat_dp_writes(self, combat_id: str) -> CombatDPWriteStats:
         """
-        Persist player DP to database in background (fire-and-forget).
-
-        Public API method that wraps the internal implementation.
+        Write a finished combat's pending DP and log its write counters.
 
         Args:
-            player_id: ID of the player whose DP changed
-            current_dp: New current DP value
-            old_dp: Previous DP value (for correction events if save fails)
-            max_dp: Maximum DP value
-            room_id: Room ID where the change occurred (for error context)
-            combat_id: Combat ID for context
+            combat_id: ID of the combat that ended
+
+        Returns:
+            The combat's final DP write counters
         """
-        self._persist_player_dp_background(player_id, current_dp, old_dp, max_dp, room_id, combat_id)
+        stats = await self._dp_writes.finish_combat(combat_id)
+        if stats["dp_changes"]:
+            logger.info("Combat DP writes", combat_id=combat_id, **stats)
+        return stats
 
     async def publish_player_dp_update_event(  # pylint: disable=too-many-arguments,too-many-positional-arguments  # Reason: Event publishing requires many parameters for complete event context
         self,
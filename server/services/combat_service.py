@@ -22,6 +22,7 @@ from server.models.combat import (
 from server.services.combat_attack_handler import CombatAttackHandler
 from server.services.combat_cleanup_handler import CombatCleanupHandler
 from server.services.combat_death_handler import CombatDeathHandler, CombatServiceDeps
+from server.services.combat_dp_write_pipeline import CombatDPWriteStats
 from server.services.combat_event_handler import CombatEventHandler
 from server.services.combat_event_publisher import CombatEventPublisher
 from server.services.combat_flee_handler import check_involuntary_flee as check_involuntary_flee_fn
@@ -574,6 +575,18 @@ class CombatService:  # pylint: disable=too-many-instance-attributes  # Reason:
 
         await end_combat_impl(self, combat_id, reason)
 
+    async def finish_combat_dp_writes(self, combat_id: UUID) -> CombatDPWriteStats:
+        """Write a finished combat's pending player DP and return its DP write counters."""
+        return await self._persistence_handler.finish_combat_dp_writes(str(combat_id))
+
+    def get_combat_dp_write_stats(self, combat_id: UUID) -> CombatDPWriteStats:
+        """Return DP write counters (changes, coalesced changes, statements, rows) for an active combat."""
+        return self._persistence_handler.dp_write_pipeline.get_combat_write_stats(str(combat_id))
+
+    async def shutdown_dp_writes(self) -> None:
+        """Write all pending player DP changes (called on server shutdown)."""
+        await self._persistence_handler.dp_write_pipeline.shutdown()
+
     async def cleanup_stale_combats(self) -> int:
         """Clean up combats that have been inactive for too long."""
         return await self._cleanup_handler.cleanup_stale_combats(self._combat_timeout_minutes)
@@ -42,6 +42,8 @@ async def end_combat(
     combat.status = CombatStatus.ENDED
     service.cleanup_combat_tracking(combat)
     await service.notify_player_combat_ended(combat_id)
+    # Persist the final DP before anything reloads the players (death handling, respawn)
+    _ = await service.finish_combat_dp_writes(combat_id)
 
     logger.debug(
         "Preparing combat ended event",
@@ -8,11 +8,16 @@ viewer to show only explored rooms to players.
 As documented in the Pnakotic Manuscripts, proper tracking of spatial
 exploration is essential for maintaining awareness of dimensional
 territories that have been traversed.
+
+Room entries resolve the room UUID from the room cache and go through an
+ExplorationWriteBuffer, so re-entering a known room costs no database round
+trip and new discoveries are written in batches (see exploration_write_buffer).
 """
 
 # pylint: disable=too-many-return-statements  # Reason: Exploration service methods require multiple return statements for early validation returns (permission checks, validation, error handling)
 
 import asyncio
+from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -23,9 +28,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..exceptions import DatabaseError
 from ..structured_logging.enhanced_logging_config import get_logger
+from .exploration_write_buffer import DEFAULT_EXPLORATION_FLUSH_WINDOW_SECONDS, ExplorationWriteBuffer
 
 logger = get_logger(__name__)
 
+# Resolves a hierarchical room ID to the room's UUID without touching the database
+RoomUUIDLookup = Callable[[str], UUID | None]
+
 
 class ExplorationService:
     """
@@ -36,17 +45,28 @@ class ExplorationService:
     the map viewer to show only explored rooms to players.
     """
 
-    def __init__(self, database_manager: Any | None = None) -> None:
+    def __init__(
+        self,
+        database_manager: Any | None = None,
+        room_uuid_lookup: RoomUUIDLookup | None = None,
+        flush_window_seconds: float = DEFAULT_EXPLORATION_FLUSH_WINDOW_SECONDS,
+    ) -> None:
         """
         Initialize the exploration service.
 
         Args:
             database_manager: Database manager instance for database operations.
                              If not provided, uses DatabaseManager.get_instance().
+            room_uuid_lookup: Resolves room IDs to UUIDs from the room cache. Without it
+                             every mark_room_as_explored call is written immediately.
+            flush_window_seconds: How long new discoveries are collected before they are written
         """
         from ..database import DatabaseManager
 
         self._database_manager = database_manager or DatabaseManager.get_instance()
+        self._room_uuid_lookup = room_uuid_lookup
+        self._writes = ExplorationWriteBuffer(self._database_manager.get_session_maker, flush_window_seconds)
+        self._background_tasks: set[asyncio.Task[int]] = set()
         logger.info("ExplorationService initialized")
 
     async def mark_room_as_explored(self, player_id: UUID, room_id: str, session: AsyncSession | None = None) -> bool:
@@ -67,6 +87,13 @@ class ExplorationService:
         Raises:
             DatabaseError: If database operation fails
         """
+        if session is None:
+            cached_room_uuid = self._lookup_room_uuid(room_id)
+            if cached_room_uuid is not None:
+                # Rooms the player already explored cost nothing; new ones go out with the next flush
+                self._record_discovery(player_id, cached_room_uuid)
+                return True
+
         try:
             # Look up the room UUID by stable_id (hierarchical room ID)
             # Rooms table uses UUID as primary key, but game code uses hierarchical string IDs
@@ -264,6 +291,11 @@ class ExplorationService:
             if hasattr(rows, "__await__"):
                 rows = await rows
             room_ids = [str(row[0]) for row in rows]
+            # Discoveries still waiting for the next flush are explored too (they are the newest)
+            pending = self._writes.pending_rooms(player_id)
+            if pending:
+                stored = set(room_ids)
+                room_ids.extend(str(room) for room in pending if str(room) not in stored)
 
             logger.debug("Retrieved explored rooms", player_id=player_id, count=len(room_ids))
             return room_ids
@@ -302,10 +334,12 @@ class ExplorationService:
             DatabaseError: If database operation fails
         """
         try:
-            # Look up the room UUID by stable_id
-            room_uuid = await self._get_room_uuid_by_stable_id(room_id, session)
+            # Room cache first, then the rooms table
+            room_uuid = self._lookup_room_uuid(room_id) or await self._get_room_uuid_by_stable_id(room_id, session)
             if not room_uuid:
                 return False
+            if self._writes.is_explored(player_id, room_uuid):
+                return True
 
             query = text(
                 """
@@ -357,7 +391,12 @@ class ExplorationService:
         Note:
             This method is fire-and-forget. Errors are logged but don't raise exceptions.
             This ensures exploration failures don't block movement operations.
+            Rooms the room cache can resolve are buffered without creating a task.
         """
+        room_uuid = self._lookup_room_uuid(room_id)
+        if room_uuid is not None:
+            self._record_discovery(player_id, room_uuid)
+            return
 
         async def _mark_explored_async() -> None:
             """Inner async function to mark room as explored."""
@@ -430,3 +469,52 @@ class ExplorationService:
                     error=str(e),
                     error_type=type(e).__name__,
                 )
+
+    def _lookup_room_uuid(self, room_id: str) -> UUID | None:
+        """Resolve a room UUID from the room cache (None when unknown or no lookup is configured)."""
+        if self._room_uuid_lookup is None:
+            return None
+        try:
+            return self._room_uuid_lookup(room_id)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.debug("Room UUID lookup failed, falling back to database", room_id=room_id, error=str(e))
+            return None
+
+    def _record_discovery(self, player_id: UUID, room_uuid: UUID) -> None:
+        if self._writes.record(player_id, room_uuid):
+            logger.debug("Room discovery buffered", player_id=player_id, room_id=room_uuid)
+
+    async def flush(self, player_id: UUID | None = None) -> int:
+        """Write buffered discoveries now (one player's, or everyone's). Returns the number written."""
+        return await self._writes.flush(player_id)
+
+    async def load_player(self, player_id: UUID) -> int:
+        """Load a player's explored rooms into memory. Returns the number of rooms known."""
+        return await self._writes.load_player(player_id)
+
+    def _spawn(self, coro: Coroutine[Any, Any, int], player_id: UUID) -> None:
+        """Run a connect/disconnect coroutine in the background, keeping a reference until it ends."""
+        try:
+            task = asyncio.create_task(coro)
+        except RuntimeError as e:
+            coro.close()
+            logger.warning("No event loop available for exploration state", player_id=player_id, error=str(e))
+            return
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def on_player_connect(self, player_id: UUID) -> None:
+        """Load the player's explored rooms in the background."""
+        self._spawn(self._writes.load_player(player_id), player_id)
+
+    def on_player_disconnect(self, player_id: UUID) -> None:
+        """Forget the player's explored rooms and write their buffered discoveries now."""
+        self._writes.forget_player(player_id)
+        if self._writes.pending_count(player_id):
+            self._spawn(self._writes.flush(player_id), player_id)
+
+    async def shutdown(self) -> None:
+        """Write all buffered discoveries (called on server shutdown)."""
+        if self._background_tasks:
+            _ = await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self._writes.shutdown()
@@ -0,0 +1,208 @@
+"""
+Write-once buffer for player room exploration.
+
+A room only needs recording the first time a player enters it. The buffer
+keeps the explored rooms of each connected player in memory, so re-entering
+a known room costs nothing, and collects new discoveries for a short window
+before writing them with one record_player_explorations call (a multi-row
+INSERT ... ON CONFLICT DO NOTHING in db/procedures/rooms.sql).
+The in-memory set may be incomplete (a player whose rooms have not loaded
+yet) but never claims a room that is not stored or pending: an incomplete
+set only causes a redundant insert, which the conflict clause ignores.
+A crash loses at most one window of discoveries; those rooms are recorded
+again the next time the player enters them.
+"""
+
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..exceptions import DatabaseError
+from ..structured_logging.enhanced_logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# How long new discoveries are collected before they are written
+DEFAULT_EXPLORATION_FLUSH_WINDOW_SECONDS = 2.0
+
+# Rows per record_player_explorations call (bounds the size of its array parameters)
+EXPLORATION_INSERT_CHUNK_ROWS = 1000
+
+_WRITE_ERRORS = (SQLAlchemyError, DatabaseError, OSError, RuntimeError)
+
+
+class ExplorationWriteBuffer:
+    """
+    Explored rooms of connected players plus discoveries waiting to be written.
+
+    ``record`` never blocks movement: the first discovery opens a flush
+    window, and everything discovered within it is written in one statement
+    when it closes. A failed write keeps its discoveries pending for the
+    next flush.
+    """
+
+    def __init__(
+        self,
+        get_session_maker: Callable[[], Any],
+        window_seconds: float = DEFAULT_EXPLORATION_FLUSH_WINDOW_SECONDS,
+    ) -> None:
+        """
+        Initialize the buffer.
+
+        Args:
+            get_session_maker: Returns the async session maker used for reads and writes
+            window_seconds: How long discoveries are collected before they are written
+        """
+        if window_seconds < 0:
+            raise ValueError("window_seconds must not be negative")
+        self._get_session_maker = get_session_maker
+        self._window_seconds = window_seconds
+        self._explored: dict[UUID, set[UUID]] = {}
+        # player -> room UUID -> explored_at
+        self._pending: dict[UUID, dict[UUID, datetime]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+
+    def is_explored(self, player_id: UUID, room_uuid: UUID) -> bool:
+        """True if the room is known to be stored or pending for the player."""
+        return room_uuid in self._explored.get(player_id, ()) or room_uuid in self._pending.get(player_id, {})
+
+    def pending_rooms(self, player_id: UUID) -> list[UUID]:
+        """The player's discoveries not yet written, oldest first."""
+        return list(self._pending.get(player_id, {}))
+
+    def pending_count(self, player_id: UUID | None = None) -> int:
+        """Number of discoveries not yet written (for one player, or for all players)."""
+        if player_id is not None:
+            return len(self._pending.get(player_id, {}))
+        return sum(len(rooms) for rooms in self._pending.values())
+
+    def record(self, player_id: UUID, room_uuid: UUID) -> bool:
+        """
+        Remember an explored room and queue it for the next flush.
+
+        Returns:
+            True if the room was new for the player, False if it was already known
+        """
+        explored = self._explored.setdefault(player_id, set())
+        if room_uuid in explored:
+            return False
+        explored.add(room_uuid)
+        _ = self._pending.setdefault(player_id, {}).setdefault(room_uuid, datetime.now(UTC))
+        if self._flush_task is None or self._flush_task.done():
+            flush_window = self._run_flush_window()
+            try:
+                self._flush_task = asyncio.create_task(flush_window)
+            except RuntimeError as e:
+                # Stays pending; the next discovery, disconnect or shutdown writes it
+                flush_window.close()
+                logger.warning("Cannot schedule exploration flush - no event loop available", error=str(e))
+        return True
+
+    def forget_player(self, player_id: UUID) -> None:
+        """Drop the player's explored set (pending discoveries stay until flushed)."""
+        _ = self._explored.pop(player_id, None)
+
+    async def _run_flush_window(self) -> None:
+        """Flush pending discoveries after each window until nothing is left to write."""
+        try:
+            while self._pending:
+                await asyncio.sleep(self._window_seconds)
+                if not await self.flush() and self._pending:
+                    # The write failed; the next discovery, disconnect or shutdown retries it
+                    break
+        finally:
+            self._flush_task = None
+
+    async def flush(self, player_id: UUID | None = None) -> int:
+        """
+        Write pending discoveries now.
+
+        Args:
+            player_id: Only write this player's discoveries (all players when omitted)
+
+        Returns:
+            Number of discoveries written; 0 when nothing was pending or the write failed
+        """
+        async with self._flush_lock:
+            if player_id is None:
+                batch, self._pending = self._pending, {}
+            else:
+                player_rooms = self._pending.pop(player_id, None)
+                batch = {player_id: player_rooms} if player_rooms else {}
+            rows = [(pid, room, at) for pid, rooms in batch.items() for room, at in rooms.items()]
+            if not rows:
+                return 0
+            try:
+                await self._insert(rows)
+            except _WRITE_ERRORS as e:
+                self._requeue(batch)
+                logger.warning(
+                    "Exploration flush failed, discoveries kept for retry",
+                    rows=len(rows),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                return 0
+            logger.debug("Flushed room discoveries", rows=len(rows), players=len(batch))
+            return len(rows)
+
+    def _requeue(self, batch: dict[UUID, dict[UUID, datetime]]) -> None:
+        for player_id, rooms in batch.items():
+            pending = self._pending.setdefault(player_id, {})
+            for room_uuid, explored_at in rooms.items():
+                _ = pending.setdefault(room_uuid, explored_at)
+
+    async def _insert(self, rows: list[tuple[UUID, UUID, datetime]]) -> None:
+        """Insert exploration rows in one transaction, EXPLORATION_INSERT_CHUNK_ROWS rows per call."""
+        async with self._get_session_maker()() as session:
+            for start in range(0, len(rows), EXPLORATION_INSERT_CHUNK_ROWS):
+                chunk = rows[start : start + EXPLORATION_INSERT_CHUNK_ROWS]
+                player_ids, room_ids, explored_ats = (list(column) for column in zip(*chunk, strict=True))
+                _ = await session.execute(
+                    text("SELECT record_player_explorations(:player_ids, :room_ids, :explored_at)"),
+                    {"player_ids": player_ids, "room_ids": room_ids, "explored_at": explored_ats},
+                )
+            await session.commit()
+
+    async def load_player(self, player_id: UUID) -> int:
+        """
+        Load the rooms a player has explored (called when the player connects).
+
+        Returns:
+            Number of explored rooms known for the player
+        """
+        try:
+            async with self._get_session_maker()() as session:
+                query = text("SELECT room_id FROM get_player_explored_room_ids(:player_id)")
+                result = await session.execute(query, {"player_id": player_id})
+                stored = {UUID(str(row[0])) for row in result.fetchall()}
+        except _WRITE_ERRORS as e:
+            # Without the set every discovery is written; ON CONFLICT keeps that correct
+            logger.warning("Could not load explored rooms", player_id=player_id, error=str(e))
+            return len(self._explored.get(player_id, ()))
+        explored = self._explored.setdefault(player_id, set())
+        explored.update(stored)
+        logger.debug("Loaded explored rooms", player_id=player_id, count=len(explored))
+        return len(explored)
+
+    async def shutdown(self) -> None:
+        """Write outstanding discoveries now instead of waiting for the window to close."""
+        task = self._flush_task
+        # A task holding the lock is mid-write; flush() below waits for it instead of cancelling it
+        if task is not None and not task.done() and not self._flush_lock.locked():
+            _ = task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        _ = await self.flush()
+
+
+__all__ = ["DEFAULT_EXPLORATION_FLUSH_WINDOW_SECONDS", "EXPLORATION_INSERT_CHUNK_ROWS", "ExplorationWriteBuffer"]
@@ -47,33 +47,40 @@ def _apply_sender_effects(result: DampeningResult, sender_tier: str, message_typ
         logger.debug("Shout blocked for Deranged character", tier=sender_tier)
 
 
-def _maybe_muffle_fractured_message(result: DampeningResult, receiver_tier: str | None, message_type: str) -> None:
+def _maybe_muffle_fractured_message(
+    result: DampeningResult, receiver_tier: str | None, message_type: str, rng: random.Random | None = None
+) -> None:
     if receiver_tier != "fractured" or message_type not in _INCOMING_TYPES:
         return
-    if random.random() >= 0.30:  # nosec B311: Game mechanics probability check, not cryptographic
+    if (rng or random).random() >= 0.30:  # nosec B311: Game mechanics probability check, not cryptographic
         return
     result["message"] = re.sub(r'[.,!?;:"]', "", result["message"])
     result["tags"].append("muffled")
 
 
-def _maybe_scramble_deranged_message(result: DampeningResult, receiver_tier: str | None, message_type: str) -> None:
+def _maybe_scramble_deranged_message(
+    result: DampeningResult, receiver_tier: str | None, message_type: str, rng: random.Random | None = None
+) -> None:
     if receiver_tier != "deranged" or message_type not in _INCOMING_TYPES:
         return
-    if random.random() >= 0.10:  # nosec B311: Game mechanics probability check, not cryptographic
+    source = rng or random
+    if source.random() >= 0.10:  # nosec B311: Game mechanics probability check, not cryptographic
         return
     words = result["message"].split()
     if len(words) <= 1:
         return
     for _ in range(min(len(words) // 4, 3)):
-        index = random.randint(0, len(words) - 2)  # nosec B311: Game mechanics word scrambling
+        index = source.randint(0, len(words) - 2)  # nosec B311: Game mechanics word scrambling
         words[index], words[index + 1] = words[index + 1], words[index]
     result["message"] = " ".join(words)
     result["tags"].append("scrambled")
 
 
-def _apply_receiver_effects(result: DampeningResult, receiver_tier: str | None, message_type: str) -> None:
-    _maybe_muffle_fractured_message(result, receiver_tier, message_type)
-    _maybe_scramble_deranged_message(result, receiver_tier, message_type)
+def _apply_receiver_effects(
+    result: DampeningResult, receiver_tier: str | None, message_type: str, rng: random.Random | None = None
+) -> None:
+    _maybe_muffle_fractured_message(result, receiver_tier, message_type, rng)
+    _maybe_scramble_deranged_message(result, receiver_tier, message_type, rng)
 
 
 def apply_communication_dampening(
@@ -105,6 +112,51 @@ def apply_communication_dampening(
     return result
 
 
+def apply_sender_dampening(message: str, sender_tier: str, message_type: str = "chat") -> DampeningResult:
+    """
+    Apply only the sender's (outgoing) effects.
+
+    Broadcasts decide the sender's effects once per message and then apply
+    each receiver tier's effects to that result with apply_receiver_dampening.
+    """
+    result: DampeningResult = {"message": message, "tags": [], "blocked": False}
+    _apply_sender_effects(result, sender_tier, message_type)
+    return result
+
+
+def apply_receiver_dampening(
+    sender_result: DampeningResult,
+    receiver_tier: str | None,
+    message_type: str = "chat",
+    rng: random.Random | None = None,
+) -> DampeningResult:
+    """
+    Apply a receiver's (incoming) effects to a sender result, leaving it unchanged.
+
+    Args:
+        sender_result: Result of apply_sender_dampening
+        receiver_tier: Tier of the message receiver
+        message_type: Type of message (chat, whisper, shout, etc.)
+        rng: Random source for the receiver's effects (module random if omitted)
+
+    Returns:
+        A new result with the receiver's effects applied
+    """
+    result: DampeningResult = {
+        "message": sender_result["message"],
+        "tags": list(sender_result["tags"]),
+        "blocked": sender_result["blocked"],
+    }
+    if not result["blocked"]:
+        _apply_receiver_effects(result, receiver_tier, message_type, rng)
+    return result
+
+
+def receiver_random(message_id: str, receiver_id: str) -> random.Random:
+    """Random source seeded per message and receiver, so a receiver's scrambling is reproducible."""
+    return random.Random(f"{message_id}:{receiver_id}")  # nosec B311: Game mechanics word scrambling
+
+
 def should_block_shout(tier: str) -> bool:
     """Check if shout should be blocked based on tier."""
     return tier == "deranged"
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 
 from ..structured_logging.enhanced_logging_config import get_logger
 from ..utils.liability_types import LiabilityStackEntry
+from .lucidity_tier_registry import lucidity_tier_registry
 
 logger = get_logger(__name__)
 
@@ -92,7 +93,8 @@ async def send_lucidity_change_event(
     tier: str,
     extras: LucidityChangeEventExtras | None = None,
 ) -> None:
-    """Notify a player that their LCD changed."""
+    """Notify a player that their LCD changed (and keep the in-memory tier registry current)."""
+    lucidity_tier_registry.set(player_id, tier)
     event_extras = extras or LucidityChangeEventExtras()
     # Convert UUID to string for JSON payload (client expects string)
     player_id_str = str(player_id) if isinstance(player_id, uuid.UUID) else player_id
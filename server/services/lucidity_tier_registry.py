@@ -0,0 +1,112 @@
+"""
+Process-wide lucidity tier registry for online players.
+
+Communication dampening needs the sender's and every receiver's lucidity
+tier for each chat message. Reading them from the database cost one session
+per player per message (31 round trips for a room say to 30 players). The
+registry keeps the tier of every player connected to this server: it is
+filled when the player connects, updated whenever a lucidity change event is
+sent (and by respawn, which resets the tier directly), and cleared when the
+player disconnects.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from ..structured_logging.enhanced_logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TIER = "lucid"
+
+
+def _key(player_id: uuid.UUID | str) -> uuid.UUID | None:
+    if isinstance(player_id, uuid.UUID):
+        return player_id
+    try:
+        return uuid.UUID(str(player_id))
+    except ValueError:
+        return None
+
+
+class LucidityTierRegistry:
+    """Current lucidity tier of each player connected to this server."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._tiers: dict[uuid.UUID, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._tiers)
+
+    def get(self, player_id: uuid.UUID | str) -> str | None:
+        """The player's tier, or None if the player is not registered."""
+        key = _key(player_id)
+        return self._tiers.get(key) if key is not None else None
+
+    def set(self, player_id: uuid.UUID | str, tier: str) -> None:
+        """Record a player's tier (at login and on every tier change)."""
+        key = _key(player_id)
+        if key is not None:
+            self._tiers[key] = tier
+
+    def discard(self, player_id: uuid.UUID | str) -> None:
+        """Forget a player who disconnected."""
+        key = _key(player_id)
+        if key is not None:
+            _ = self._tiers.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all players."""
+        self._tiers.clear()
+
+    async def load(self, player_id: uuid.UUID | str) -> str:
+        """Read the player's tier from the database and register it (called when the player connects)."""
+        tier = await read_lucidity_tier(player_id)
+        self.set(player_id, tier)
+        return tier
+
+
+async def read_lucidity_tier(player_id: uuid.UUID | str) -> str:
+    """
+    Read a player's lucidity tier from the database.
+
+    Returns:
+        The stored tier ('lucid' if the player has no lucidity record or the read fails)
+    """
+    try:
+        from ..database import get_async_session
+        from .lucidity_service import LucidityService
+
+        player_id_uuid = player_id if isinstance(player_id, uuid.UUID) else uuid.UUID(player_id)
+
+        async for session in get_async_session():
+            try:
+                lucidity_record = await LucidityService(session).get_player_lucidity(player_id_uuid)
+                return lucidity_record.current_tier if lucidity_record else DEFAULT_TIER
+            except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Lucidity tier retrieval errors unpredictable, optional metadata
+                logger.debug(
+                    "Error getting player lucidity tier",
+                    player_id=player_id,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                return DEFAULT_TIER
+
+    except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Session creation errors unpredictable, must return fallback
+        logger.debug(
+            "Error reading lucidity tier (session creation)",
+            player_id=player_id,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return DEFAULT_TIER
+
+    return DEFAULT_TIER
+
+
+lucidity_tier_registry = LucidityTierRegistry()
+
+
+__all__ = ["DEFAULT_TIER", "LucidityTierRegistry", "lucidity_tier_registry", "read_lucidity_tier"]
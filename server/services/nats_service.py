@@ -12,7 +12,7 @@ import asyncio
 import inspect
 import json
 import time
-from collections.abc import Awaitable, Callable, Coroutine, Mapping
+from collections.abc import Awaitable, Callable, Coroutine, Mapping, Sequence
 from typing import Protocol, cast, override
 
 from anyio import sleep
@@ -59,6 +59,10 @@ class NatsMessageCallback(Protocol):
     def __call__(self, message_data: JsonMap) -> None | Awaitable[None]: ...
 
 
+class NatsEncodedMessageCallback(Protocol):
+    def __call__(self, payload: bytes, headers: Mapping[str, str] | None) -> Awaitable[None]: ...
+
+
 class _NatsSubscription(Protocol):
     async def drain(self) -> None: ...
 
@@ -554,6 +558,50 @@ class NATSService(NATSServicePoolMixin):  # pylint: disable=too-many-instance-at
         AI: Requires connection pool to be initialized. Raises exceptions instead of
             returning False for better error handling.
         """
+        await self._wait_for_pool(subject)
+
+        # Use connection pool
+        await self.publish_with_pool(subject, data)
+
+    async def publish_encoded(self, subject: str, payload: bytes, headers: Mapping[str, str] | None = None) -> None:
+        """
+        Publish an already JSON-encoded message to a NATS subject using connection pool.
+
+        For callers that encode once themselves (e.g. the domain event bridge), this
+        skips the dict-to-JSON step publish() runs in the thread pool per message.
+        Subscribers receive it exactly like a message sent with publish().
+
+        Args:
+            subject: NATS subject name (e.g., 'events.domain.PlayerEnteredRoom')
+            payload: UTF-8 JSON bytes of a JSON object
+            headers: Optional NATS message headers
+
+        Raises:
+            NATSPublishError: If publishing fails or connection pool is not available
+        """
+        await self._wait_for_pool(subject)
+        await self.publish_encoded_with_pool(subject, payload, headers)
+
+    async def publish_encoded_batch(
+        self, messages: Sequence[tuple[str, bytes]], headers: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Publish already JSON-encoded messages in order on one pooled connection.
+
+        Args:
+            messages: (subject, payload) pairs, e.g. a writer task's queued domain events
+            headers: Optional NATS message headers sent with every message
+
+        Raises:
+            NATSPublishError: If publishing fails or connection pool is not available
+        """
+        if not messages:
+            return
+        await self._wait_for_pool(messages[0][0])
+        await self.publish_encoded_batch_with_pool(messages, headers)
+
+    async def _wait_for_pool(self, subject: str) -> None:
+        """Raise unless the pool is initialized and a connection frees up within pool_wait_timeout."""
         # Require connection pool - fail if not available
         if not self._pool_initialized:
             error_msg = "Connection pool not initialized - cannot publish"
@@ -571,9 +619,6 @@ class NATSService(NATSServicePoolMixin):  # pylint: disable=too-many-instance-at
                 logger.error("No available connections in pool", subject=subject, pool_size=self.pool_size)
                 raise NATSPublishError(error_msg, subject=subject) from err
 
-        # Use connection pool
-        await self.publish_with_pool(subject, data)
-
     async def _decode_message_data(self, msg: Msg) -> JsonMap:
         """Decode message data from NATS message."""
         loop = asyncio.get_running_loop()
@@ -654,40 +699,72 @@ class NATSService(NATSServicePoolMixin):  # pylint: disable=too-many-instance-at
             and negatively acknowledged on failure. This provides at-least-once delivery semantics.
             Raises exceptions instead of returning False for better error handling.
         """
+        manual_ack_enabled = self.config.manual_ack
+
+        async def message_handler(msg: Msg) -> None:
+            message_acknowledged = False
+            try:
+                message_data = await self._decode_message_data(msg)
+                await self._call_callback(callback, message_data)
+
+                if manual_ack_enabled:
+                    message_acknowledged = await self._acknowledge_message(msg, subject, message_data)
+
+                logger.debug(
+                    "Message received from NATS subject",
+                    subject=subject,
+                    message_id=message_data.get("message_id"),
+                    sender_id=message_data.get("sender_id"),
+                    acknowledged=message_acknowledged,
+                )
+
+            except json.JSONDecodeError as e:
+                logger.error("Failed to decode NATS message", error=str(e), subject=subject)
+                if manual_ack_enabled:
+                    await self._negatively_acknowledge_message(msg, subject)
+            except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Message handling errors unpredictable, must handle gracefully
+                logger.error("Error handling NATS message", error=str(e), subject=subject)
+                if manual_ack_enabled:
+                    await self._negatively_acknowledge_message(msg, subject)
+
+        await self._subscribe_handler(subject, message_handler)
+
+    async def subscribe_encoded(self, subject: str, callback: NatsEncodedMessageCallback) -> None:
+        """
+        Subscribe to a NATS subject and hand each message's raw payload and headers to callback.
+
+        The counterpart of publish_encoded(): the payload is not JSON-decoded first, so the
+        callback can drop messages it does not want (e.g. by a header) before paying for it.
+
+        Args:
+            subject: NATS subject name (wildcards allowed) to subscribe to
+            callback: Async function called with (payload bytes, headers or None)
+
+        Raises:
+            NATSSubscribeError: If subscription fails
+        """
+        manual_ack_enabled = self.config.manual_ack
+
+        async def message_handler(msg: Msg) -> None:
+            try:
+                await callback(msg.data, msg.headers)
+                if manual_ack_enabled:
+                    _ = await self._acknowledge_message(msg, subject, {})
+            except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Message handling errors unpredictable, must handle gracefully
+                logger.error("Error handling NATS message", error=str(e), subject=subject)
+                if manual_ack_enabled:
+                    await self._negatively_acknowledge_message(msg, subject)
+
+        await self._subscribe_handler(subject, message_handler)
+
+    async def _subscribe_handler(self, subject: str, message_handler: Callable[[Msg], Awaitable[None]]) -> None:
+        """Subscribe message_handler on the primary client and track the subscription."""
         try:
             if not self.nc or not self._running:
                 error_msg = "NATS client not connected"
                 logger.error("NATS client not connected")
                 raise NATSSubscribeError(error_msg, subject=subject)
 
-            manual_ack_enabled = self.config.manual_ack
-
-            async def message_handler(msg: Msg) -> None:
-                message_acknowledged = False
-                try:
-                    message_data = await self._decode_message_data(msg)
-                    await self._call_callback(callback, message_data)
-
-                    if manual_ack_enabled:
-                        message_acknowledged = await self._acknowledge_message(msg, subject, message_data)
-
-                    logger.debug(
-                        "Message received from NATS subject",
-                        subject=subject,
-                        message_id=message_data.get("message_id"),
-                        sender_id=message_data.get("sender_id"),
-                        acknowledged=message_acknowledged,
-                    )
-
-                except json.JSONDecodeError as e:
-                    logger.error("Failed to decode NATS message", error=str(e), subject=subject)
-                    if manual_ack_enabled:
-                        await self._negatively_acknowledge_message(msg, subject)
-                except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Message handling errors unpredictable, must handle gracefully
-                    logger.error("Error handling NATS message", error=str(e), subject=subject)
-                    if manual_ack_enabled:
-                        await self._negatively_acknowledge_message(msg, subject)
-
             subscribe = cast(_NatsSubscribeFn, self.nc.subscribe)
             subscription = await subscribe(subject, cb=message_handler)
             # Track subscription for metrics
@@ -704,7 +781,7 @@ class NATSService(NATSServicePoolMixin):  # pylint: disable=too-many-instance-at
             logger.info(
                 "Subscribed to NATS subject",
                 subject=subject,
-                manual_ack=manual_ack_enabled,
+                manual_ack=self.config.manual_ack,
             )
 
         except NATSSubscribeError:
@@ -7,7 +7,7 @@ from __future__ import annotations
 import asyncio
 import json
 import time
-from collections.abc import Coroutine, Mapping
+from collections.abc import Coroutine, Mapping, Sequence
 
 from anyio import sleep
 from nats.aio.client import Client
@@ -213,6 +213,70 @@ class NATSServicePoolMixin:
 
         AI: Raises exceptions instead of returning False for better error handling.
         """
+        await self._publish_pooled(subject, data, None)
+
+    async def publish_encoded_with_pool(
+        self, subject: str, payload: bytes, headers: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Publish an already JSON-encoded payload using the connection pool.
+
+        Args:
+            subject: NATS subject name
+            payload: UTF-8 JSON bytes, published as is
+            headers: Optional NATS message headers
+
+        Raises:
+            NATSPublishError: If publishing fails
+        """
+        await self._publish_pooled(subject, {}, payload, headers)
+
+    async def publish_encoded_batch_with_pool(
+        self, messages: Sequence[tuple[str, bytes]], headers: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Publish already JSON-encoded messages, in order, on one pooled connection.
+
+        Args:
+            messages: (subject, payload) pairs
+            headers: Optional NATS message headers sent with every message
+
+        Raises:
+            NATSPublishError: If publishing fails; messages before the failing one were sent
+        """
+        start_time = time.monotonic()
+        published = 0
+        connection = None
+        try:
+            for subject, _ in messages:
+                self._validate_pool_publish_subject(subject, {})
+            connection = await self._get_connection()
+            for subject, payload in messages:
+                await connection.publish(subject, payload, headers=dict(headers) if headers else None)
+                published += 1
+        except NATSPublishError:
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Publish errors unpredictable, must handle and log
+            subject = messages[published][0] if published < len(messages) else ""
+            logger.error("Failed to publish message batch via connection pool", error=str(e), subject=subject)
+            raise NATSPublishError(
+                f"Failed to publish message batch via connection pool: {str(e)}", subject=subject, error=e
+            ) from e
+        finally:
+            if connection:
+                await self._return_connection(connection)
+            per_message_time = (time.monotonic() - start_time) / max(len(messages), 1)
+            for n in range(len(messages)):
+                self.metrics.record_publish(n < published, per_message_time)
+
+    async def _publish_pooled(
+        self,
+        subject: str,
+        data: Mapping[str, object],
+        encoded: bytes | None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Publish encoded (or data, encoded off the loop) on a pooled connection and record metrics."""
         start_time = time.monotonic()
         success = False
         connection = None
@@ -221,12 +285,14 @@ class NATSServicePoolMixin:
             self._validate_pool_publish_subject(subject, data)
             connection = await self._get_connection()
 
-            # Serialize message data using thread pool for CPU-bound operation
-            loop = asyncio.get_running_loop()
-            message_bytes = await loop.run_in_executor(None, lambda: json.dumps(data).encode("utf-8"))
+            message_bytes = encoded
+            if message_bytes is None:
+                # Serialize message data using thread pool for CPU-bound operation
+                loop = asyncio.get_running_loop()
+                message_bytes = await loop.run_in_executor(None, lambda: json.dumps(data).encode("utf-8"))
 
             # Publish to NATS subject
-            await connection.publish(subject, message_bytes)
+            await connection.publish(subject, message_bytes, headers=dict(headers) if headers else None)
             success = True
 
             logger.debug(
@@ -92,6 +92,11 @@ PREDEFINED_PATTERNS = {
         "required_params": ["event_type"],
         "description": "Distributed EventBus domain events",
     },
+    "event_domain_zone": {
+        "pattern": "events.domain.{event_type}.{zone}",
+        "required_params": ["event_type", "zone"],
+        "description": "Distributed EventBus domain events sharded by zone",
+    },
     # Combat patterns
     "combat_attack": {
         "pattern": "combat.attack.{room_id}",
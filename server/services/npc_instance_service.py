@@ -16,6 +16,7 @@ from structlog.stdlib import BoundLogger
 
 from server.events.event_bus import EventBus
 from server.models.npc import NPCDefinition
+from server.npc.active_npc_registry import relocate_npc
 from server.npc.lifecycle_manager import NPCLifecycleManager
 from server.npc.population_control import NPCPopulationController
 from server.npc.spawning_service import NPCSpawningService
@@ -265,6 +266,7 @@ class NPCInstanceService:
             else:
                 # Update the room ID directly if move_to_room method doesn't exist
                 cast(Any, npc_instance).current_room_id = new_room_id
+            relocate_npc(self.lifecycle_manager.active_npcs, npc_id)
 
             logger.info(
                 "Moved NPC instance",
@@ -202,12 +202,16 @@ class LucidityFluxService:  # pylint: disable=too-many-instance-attributes  # Re
     ) -> tuple[set[str], list[LucidityUpdateResult]]:
         processed: set[str] = set()
         adjustments: list[LucidityUpdateResult] = []
+        # Companions are same-room players; group once so each lookup is O(room size)
+        room_players: dict[object, list[Player]] = {}
+        for player in tick_base.players:
+            room_players.setdefault(player.current_room_id, []).append(player)
         for player in players:
             processed.add(str(uuid.UUID(str(player.player_id))))
             _pid, result = await self._process_single_player(
                 PlayerFluxCtx(
                     player,
-                    tick_base.players,
+                    room_players.get(player.current_room_id, [player]),
                     tick_base.lucidity_records,
                     tick_base.room_cache,
                     tick_base.timestamp,
@@ -28,6 +28,7 @@ from ..structured_logging.enhanced_logging_config import get_logger
 from ..utils.int_coercion import coerce_int
 from ..utils.liability_types import DecodeLiabilitiesFn, EncodeLiabilitiesFn
 from .lucidity_service import LucidityService
+from .lucidity_tier_registry import lucidity_tier_registry
 
 
 def _utc_now() -> datetime:
@@ -280,6 +281,7 @@ class PlayerRespawnService:
         new_lucidity = 10  # Restore to 10 lucidity after delirium respawn
         lucidity_record.current_lcd = new_lucidity
         lucidity_record.current_tier = "lucid"  # Reset tier to lucid
+        lucidity_tier_registry.set(player_id, "lucid")
         lucidity_record.last_updated_at = _utc_now()
 
         respawn_room = DEFAULT_RESPAWN_ROOM
@@ -309,6 +311,7 @@ class PlayerRespawnService:
         new_lucidity = 1  # Reset to 1 (Deranged tier) per spec
         lucidity_record.current_lcd = new_lucidity
         lucidity_record.current_tier = resolve_tier(new_lucidity)
+        lucidity_tier_registry.set(player_id, lucidity_record.current_tier)
         lucidity_record.last_updated_at = _utc_now()
 
         lucidity_service = LucidityService(session)
@@ -0,0 +1,326 @@
+"""
+In-memory per-room index of targetable players and NPCs.
+
+Target resolution used to load a room's players from the database and scan
+every active NPC in the world for each ``attack``, ``look`` or ``cast``, then
+normalize and compare every name. The index keeps each room's occupants with
+their names already normalized, so a lookup is a binary search over the
+room's sorted name keys.
+
+Every name is indexed under each of its word starts ("giant rat" under
+"giant rat" and "rat"), which makes the sorted key list a flattened prefix
+trie: a prefix of any word of a name finds it. Names shared by several
+occupants carry a precomputed disambiguation suffix ("-1", "-2", ... in
+arrival order), so ``attack rat-2`` needs no extra pass.
+
+The index follows the PlayerEnteredRoom/PlayerLeftRoom/NPCEnteredRoom/
+NPCLeftRoom events. Some occupancy changes are deliberately silent (login
+spawn, ghost cleanup), so each room also remembers the Room.occupancy_version
+it was last synchronized with; callers resynchronize a room whose version
+has moved on (see TargetResolutionService).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TypedDict
+
+from ..events.event_types import NPCEnteredRoom, NPCLeftRoom, PlayerEnteredRoom, PlayerLeftRoom
+from ..schemas.shared import TargetType
+from ..structured_logging.enhanced_logging_config import get_logger
+
+if TYPE_CHECKING:
+    from ..events.event_bus import EventBus
+
+logger = get_logger(__name__)
+
+# Targets that left a room are remembered this long (by count) so the matching
+# "entered" event can re-index them without looking their name up again
+_DEPARTED_CAPACITY = 1024
+
+
+def normalize_target_name(name: str) -> str:
+    """Normalize a name or search term for matching (drop punctuation, lowercase)."""
+    return name.replace(".", "").replace(",", "").replace("!", "").replace("?", "").lower()
+
+
+def _word_start_keys(normalized: str) -> list[str]:
+    """Return the normalized name starting at each of its words."""
+    keys = [normalized]
+    for i in range(1, len(normalized)):
+        if normalized[i - 1] == " " and normalized[i] != " ":
+            keys.append(normalized[i:])
+    return keys
+
+
+@dataclass(slots=True)
+class IndexedTarget:
+    """A targetable occupant of a room."""
+
+    target_id: str
+    name: str
+    target_type: TargetType
+    normalized_name: str = ""
+    arrival: int = 0
+    disambiguation_suffix: str | None = None
+
+
+@dataclass(slots=True)
+class _RoomTargets:
+    """Index state for one room."""
+
+    targets: dict[str, IndexedTarget] = field(default_factory=dict)
+    # Sorted (word-start key, arrival, target_id) tuples
+    keys: list[tuple[str, int, str]] = field(default_factory=list)
+    # Occupants sharing a display name, in arrival order
+    by_name: dict[str, list[IndexedTarget]] = field(default_factory=dict)
+    # Room.occupancy_version this room was last synchronized with (None: never)
+    version: int | None = None
+
+
+class RoomTargetIndexStats(TypedDict):
+    """Counters returned by RoomTargetIndex.get_stats()."""
+
+    rooms: int
+    targets: int
+    lookups: int
+    room_syncs: int
+
+
+class RoomTargetIndex:
+    """Per-room index of players and NPCs by normalized name prefix."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._rooms: dict[str, _RoomTargets] = {}
+        self._locations: dict[str, str] = {}
+        self._departed: OrderedDict[str, IndexedTarget] = OrderedDict()
+        self._arrivals = 0
+        self._lookups = 0
+        self._room_syncs = 0
+
+    def place(self, room_id: str, target_id: str, name: str, target_type: TargetType) -> None:
+        """
+        Index a target in a room, removing it from the room it was in before.
+
+        Args:
+            room_id: Room the target is now in
+            target_id: Player ID (as string) or NPC ID
+            name: Display name
+            target_type: TargetType.PLAYER or TargetType.NPC
+        """
+        current_room_id = self._locations.get(target_id)
+        if current_room_id == room_id:
+            existing = self._rooms[room_id].targets[target_id]
+            if existing.name == name and existing.target_type == target_type:
+                return
+        if current_room_id is not None:
+            _ = self.remove(target_id)
+
+        self._arrivals += 1
+        target = IndexedTarget(target_id, name, target_type, normalize_target_name(name), self._arrivals)
+        room = self._rooms.get(room_id)
+        if room is None:
+            room = _RoomTargets()
+            self._rooms[room_id] = room
+        room.targets[target_id] = target
+        for key in _word_start_keys(target.normalized_name):
+            insort(room.keys, (key, target.arrival, target_id))
+        room.by_name.setdefault(name, []).append(target)
+        self._renumber(room, name)
+        self._locations[target_id] = room_id
+        _ = self._departed.pop(target_id, None)
+
+    def remove(self, target_id: str, room_id: str | None = None) -> IndexedTarget | None:
+        """
+        Remove a target from the index.
+
+        Args:
+            target_id: Player ID (as string) or NPC ID
+            room_id: If given, only remove the target when it is indexed in this room
+
+        Returns:
+            The removed target, or None if it was not indexed (in that room)
+        """
+        current_room_id = self._locations.get(target_id)
+        if current_room_id is None or (room_id is not None and room_id != current_room_id):
+            return None
+        room = self._rooms[current_room_id]
+        target = room.targets.pop(target_id)
+        for key in _word_start_keys(target.normalized_name):
+            position = bisect_left(room.keys, (key, target.arrival, target_id))
+            del room.keys[position]
+        same_name = room.by_name[target.name]
+        same_name.remove(target)
+        if same_name:
+            self._renumber(room, target.name)
+        else:
+            del room.by_name[target.name]
+        del self._locations[target_id]
+        if not room.targets and room.version is None:
+            del self._rooms[current_room_id]
+
+        target.disambiguation_suffix = None
+        self._departed[target_id] = target
+        if len(self._departed) > _DEPARTED_CAPACITY:
+            _ = self._departed.popitem(last=False)
+        return target
+
+    @staticmethod
+    def _renumber(room: _RoomTargets, name: str) -> None:
+        """Recompute the disambiguation suffixes of the occupants sharing a name."""
+        same_name = room.by_name[name]
+        if len(same_name) == 1:
+            same_name[0].disambiguation_suffix = None
+            return
+        for number, target in enumerate(same_name, start=1):
+            target.disambiguation_suffix = f"-{number}"
+
+    def find(self, room_id: str, search_term: str) -> list[IndexedTarget]:
+        """
+        Find the targets in a room whose name matches a search term.
+
+        A match is a name with a word starting with the (normalized) term.
+        When nothing matches that way, names merely containing the term are
+        returned, so partial names still resolve.
+
+        Args:
+            room_id: Room to search
+            search_term: Name or partial name, without disambiguation suffix
+
+        Returns:
+            Matching targets in arrival order
+        """
+        self._lookups += 1
+        room = self._rooms.get(room_id)
+        term = normalize_target_name(search_term)
+        if room is None or not term:
+            return []
+
+        found: dict[str, IndexedTarget] = {}
+        position = bisect_left(room.keys, (term,))
+        keys = room.keys
+        while position < len(keys) and keys[position][0].startswith(term):
+            target_id = keys[position][2]
+            found[target_id] = room.targets[target_id]
+            position += 1
+        if found:
+            return sorted(found.values(), key=lambda target: target.arrival)
+        return [target for target in room.targets.values() if term in target.normalized_name]
+
+    def room_of(self, target_id: str) -> str | None:
+        """Return the room a target is indexed in, if any."""
+        return self._locations.get(target_id)
+
+    def known_name(self, target_id: str) -> str | None:
+        """Return a target's name if the index has seen it recently."""
+        room_id = self._locations.get(target_id)
+        if room_id is not None:
+            return self._rooms[room_id].targets[target_id].name
+        departed = self._departed.get(target_id)
+        return departed.name if departed is not None else None
+
+    def needs_sync(self, room_id: str, occupancy_version: int | None) -> bool:
+        """
+        Whether a room must be synchronized with its authoritative occupant list.
+
+        Args:
+            room_id: Room ID
+            occupancy_version: The room's current Room.occupancy_version (None if unknown)
+        """
+        if occupancy_version is None:
+            return True
+        room = self._rooms.get(room_id)
+        return room is None or room.version != occupancy_version
+
+    def sync_room(
+        self,
+        room_id: str,
+        occupancy_version: int | None,
+        members: Mapping[str, TargetType],
+        names: Mapping[str, str],
+    ) -> None:
+        """
+        Make a room's index match its authoritative occupants.
+
+        Args:
+            room_id: Room ID
+            occupancy_version: Room.occupancy_version the members were read at
+            members: Every player and NPC currently in the room, with its type
+            names: Names of members the index does not know yet (see known_name);
+                members without a known name are left out
+        """
+        self._room_syncs += 1
+        room = self._rooms.get(room_id)
+        indexed = set(room.targets) if room is not None else set()
+        for target_id in indexed - members.keys():
+            _ = self.remove(target_id)
+        for target_id, target_type in members.items():
+            if target_id in indexed:
+                continue
+            name = names.get(target_id) or self.known_name(target_id)
+            if name:
+                self.place(room_id, target_id, name, target_type)
+
+        room = self._rooms.get(room_id)
+        if room is None:
+            room = _RoomTargets()
+            self._rooms[room_id] = room
+        room.version = occupancy_version
+
+    def _mark_stale(self, room_id: str) -> None:
+        room = self._rooms.get(room_id)
+        if room is not None:
+            room.version = None
+
+    def _on_entered(self, room_id: str, target_id: str, target_type: TargetType) -> None:
+        name = self.known_name(target_id)
+        if name is None:
+            # First sighting: the next lookup resolves the name while synchronizing the room
+            self._mark_stale(room_id)
+            return
+        self.place(room_id, target_id, name, target_type)
+
+    def _on_player_entered(self, event: PlayerEnteredRoom) -> None:
+        self._on_entered(event.room_id, str(event.player_id), TargetType.PLAYER)
+
+    def _on_player_left(self, event: PlayerLeftRoom) -> None:
+        _ = self.remove(str(event.player_id), event.room_id)
+
+    def _on_npc_entered(self, event: NPCEnteredRoom) -> None:
+        self._on_entered(event.room_id, event.npc_id, TargetType.NPC)
+
+    def _on_npc_left(self, event: NPCLeftRoom) -> None:
+        _ = self.remove(event.npc_id, event.room_id)
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Follow room occupancy events on an EventBus."""
+        event_bus.subscribe(PlayerEnteredRoom, self._on_player_entered, service_id="room_target_index")
+        event_bus.subscribe(PlayerLeftRoom, self._on_player_left, service_id="room_target_index")
+        event_bus.subscribe(NPCEnteredRoom, self._on_npc_entered, service_id="room_target_index")
+        event_bus.subscribe(NPCLeftRoom, self._on_npc_left, service_id="room_target_index")
+        logger.debug("Room target index subscribed to room occupancy events")
+
+    def clear(self) -> None:
+        """Drop all indexed state."""
+        self._rooms.clear()
+        self._locations.clear()
+        self._departed.clear()
+
+    def get_stats(self) -> RoomTargetIndexStats:
+        """Get index size and usage counters."""
+        return {
+            "rooms": len(self._rooms),
+            "targets": len(self._locations),
+            "lookups": self._lookups,
+            "room_syncs": self._room_syncs,
+        }
+
+
+# Module-level singleton shared by every TargetResolutionService (follows room events once, at startup)
+room_target_index = RoomTargetIndex()
+
+__all__ = ["IndexedTarget", "RoomTargetIndex", "normalize_target_name", "room_target_index"]
@@ -3,15 +3,16 @@ Target resolution service for MythosMUD.
 
 This service provides unified target resolution for both players and NPCs,
 supporting partial name matching, disambiguation, and room-based filtering.
+Room occupants are looked up in the in-memory RoomTargetIndex, so resolving
+a target does not query the database.
 """
 
-# pylint: disable=too-few-public-methods,unnecessary-ellipsis,too-many-lines  # Reason: Protocol stubs use ellipsis per PEP 544; focused service interfaces; cohesive resolver (Protocols + matching) stays one module
+# pylint: disable=too-few-public-methods,unnecessary-ellipsis  # Reason: Protocol stubs use ellipsis per PEP 544; focused service interfaces
 
-import asyncio
 import inspect
 import re
 import uuid
-from collections.abc import Awaitable, Callable, Mapping, Sequence
+from collections.abc import Awaitable, Callable
 from typing import Protocol, cast
 
 from structlog.stdlib import BoundLogger
@@ -23,6 +24,7 @@ from ..schemas.players.player import PlayerRead
 from ..schemas.shared import TargetMatch, TargetResolutionResult, TargetType
 from ..schemas.shared.target_metadata import TargetMetadata
 from ..structured_logging.enhanced_logging_config import get_logger
+from .room_target_index import RoomTargetIndex, normalize_target_name, room_target_index
 
 logger: BoundLogger = get_logger(__name__)
 
@@ -31,7 +33,7 @@ class PersistenceProtocol(Protocol):
     """
     Persistence surface for target resolution.
 
-    Matches ``AsyncPersistenceLayer`` (async player/room queries; ``get_room_by_id`` is sync).
+    Matches ``AsyncPersistenceLayer`` (async player queries; ``get_room_by_id`` is sync).
     Runtime code still accepts legacy sync ``get_player`` / ``get_room`` via duck typing.
     """
 
@@ -45,11 +47,6 @@ class PersistenceProtocol(Protocol):
 
         ...
 
-    async def get_players_in_room(self, room_id: str) -> Sequence[Player]:
-        """Get all players in a room."""
-
-        ...
-
 
 class PlayerServiceProtocol(Protocol):
     """Protocol for player service dependency injection."""
@@ -71,16 +68,23 @@ class TargetResolutionService:  # pylint: disable=too-few-public-methods  # Reas
     persistence: PersistenceProtocol
     player_service: PlayerServiceProtocol
 
-    def __init__(self, persistence: PersistenceProtocol, player_service: PlayerServiceProtocol) -> None:
+    def __init__(
+        self,
+        persistence: PersistenceProtocol,
+        player_service: PlayerServiceProtocol,
+        target_index: RoomTargetIndex | None = None,
+    ) -> None:
         """
         Initialize the target resolution service.
 
         Args:
             persistence: Persistence layer instance
             player_service: Player service instance
+            target_index: Room target index (defaults to the shared, event-maintained index)
         """
         self.persistence = persistence
         self.player_service = player_service
+        self._target_index = target_index if target_index is not None else room_target_index
 
     async def _get_player_from_persistence(self, player_id_uuid: uuid.UUID) -> Player | None:
         """Get player from persistence layer, handling both async and sync methods."""
@@ -188,37 +192,145 @@ class TargetResolutionService:  # pylint: disable=too-few-public-methods  # Reas
             room_id=room_id,
         )
 
+    async def _get_room(self, room_id: str) -> Room | None:
+        """Get a room from persistence (``get_room_by_id`` is sync and cache-backed, but may be async)."""
+        raw: object = self.persistence
+        if not hasattr(raw, "get_room_by_id"):
+            return None
+        room_fn: object = cast(object, getattr(raw, "get_room_by_id"))  # noqa: B009
+        if inspect.iscoroutinefunction(room_fn):
+            afn = cast(Callable[[str], Awaitable[object]], room_fn)
+            return cast(Room | None, await afn(room_id))
+        sfn = cast(Callable[[str], object], room_fn)
+        return cast(Room | None, sfn(room_id))
+
+    async def _indexed_room_of(self, player_id: uuid.UUID) -> str | None:
+        """Room the target index places the acting player in, if the cached room confirms it."""
+        room_id = self._target_index.room_of(str(player_id))
+        if room_id is None:
+            return None
+        room = await self._get_room(room_id)
+        if room is None or room.has_player(str(player_id)) is not True:
+            return None
+        return room_id
+
+    async def _lookup_target_name(self, target_id: str, target_type: TargetType) -> str | None:
+        """Name of an occupant the index has not seen yet."""
+        if target_type == TargetType.NPC:
+            npc_instance = self._get_npc_instance(target_id)
+            return npc_instance.name if npc_instance is not None else None
+        try:
+            player = await self._get_player_from_persistence(uuid.UUID(target_id))
+        except ValueError:
+            return None
+        return player.name if player is not None else None
+
+    async def _sync_room_index(self, room_id: str) -> bool:
+        """
+        Bring the target index for a room up to date with the room's occupants.
+
+        Only runs when the room's occupancy_version moved since the last sync
+        (silent joins and leaves publish no events). Names are looked up once,
+        for occupants the index has never seen.
+
+        Returns:
+            False if the room does not exist
+        """
+        room = await self._get_room(room_id)
+        if room is None:
+            logger.debug("Room not found", room_id=room_id)
+            return False
+        raw_version: object = getattr(room, "occupancy_version", None)
+        version = raw_version if isinstance(raw_version, int) else None
+        if not self._target_index.needs_sync(room_id, version):
+            return True
+
+        members: dict[str, TargetType] = {str(player_id): TargetType.PLAYER for player_id in room.get_players()}
+        members.update(dict.fromkeys(room.get_npcs(), TargetType.NPC))
+        names: dict[str, str] = {}
+        for target_id, target_type in members.items():
+            if self._target_index.known_name(target_id) is None:
+                name = await self._lookup_target_name(target_id, target_type)
+                if name:
+                    names[target_id] = name
+        self._target_index.sync_room(room_id, version, members, names)
+        logger.debug("Room target index synchronized", room_id=room_id, occupants=len(members))
+        return True
+
+    async def _search_room_targets(self, room_id: str, target_name: str) -> list[TargetMatch]:
+        """Search the indexed players and NPCs of a room."""
+        try:
+            if not await self._sync_room_index(room_id):
+                return []
+        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Room sync errors unpredictable, must return empty list
+            logger.error("Error indexing room targets", room_id=room_id, error=str(e))
+            return []
+
+        matches: list[TargetMatch] = []
+        for target in self._target_index.find(room_id, target_name):
+            id_key = "player_id" if target.target_type == TargetType.PLAYER else "npc_id"
+            matches.append(
+                TargetMatch(
+                    target_id=target.target_id,
+                    target_name=target.name,
+                    target_type=target.target_type,
+                    room_id=room_id,
+                    disambiguation_suffix=target.disambiguation_suffix,
+                    metadata=TargetMetadata(additional_info={id_key: target.target_id}),
+                )
+            )
+        return matches
+
     async def _gather_room_target_matches(
         self,
         room_id: str,
         clean_target: str,
-        disambiguation_suffix: str | None,
         player_id_uuid: uuid.UUID,
         target_name: str,
     ) -> list[TargetMatch]:
-        """Run player and NPC searches and log aggregate resolution stats."""
-        logger.debug("About to search players in room", room_id=room_id, target_name=clean_target)
-        player_matches = await self._search_players_in_room(room_id, clean_target, disambiguation_suffix)
-        logger.debug("Player search completed", room_id=room_id, matches_count=len(player_matches))
-
-        logger.debug("About to search NPCs in room", room_id=room_id, target_name=clean_target)
-        npc_matches = await self._search_npcs_in_room(room_id, clean_target, disambiguation_suffix)
-        logger.debug("NPC search completed", room_id=room_id, matches_count=len(npc_matches))
-
+        """Search indexed occupants and the player's phantoms, and log aggregate resolution stats."""
+        room_matches = await self._search_room_targets(room_id, clean_target)
         phantom_matches = self._search_phantoms_in_room(player_id_uuid, room_id, clean_target)
 
-        matches = player_matches + npc_matches + phantom_matches
+        matches = room_matches + phantom_matches
         logger.debug(
             "Target resolution completed",
             player_id=player_id_uuid,
             target_name=target_name,
             room_id=room_id,
-            player_matches=len(player_matches),
-            npc_matches=len(npc_matches),
+            room_matches=len(room_matches),
+            phantom_matches=len(phantom_matches),
             total_matches=len(matches),
         )
         return matches
 
+    async def _resolve_actor_room(
+        self, player_id_uuid: uuid.UUID, target_name: str
+    ) -> tuple[str | None, TargetResolutionResult | None]:
+        """Room of the acting player: from the target index, else from persistence. Returns (room_id, error_result)."""
+        room_id = await self._indexed_room_of(player_id_uuid)
+        if room_id is not None:
+            return room_id, None
+
+        player = await self._get_player_from_persistence(player_id_uuid)
+        if player is None:
+            return None, TargetResolutionResult(
+                success=False,
+                error_message="Internal error: persistence layer not configured correctly",
+                search_term=target_name,
+                room_id="",
+            )
+
+        room_id, error_result = self._validate_player_and_room(player, player_id_uuid)
+        if error_result:
+            error_result.search_term = target_name
+            return None, error_result
+        if room_id is None:
+            return None, TargetResolutionResult(
+                success=False, error_message="Player not in a room", search_term=target_name, room_id=""
+            )
+        return room_id, None
+
     async def resolve_target(self, player_id: uuid.UUID | str, target_name: str) -> TargetResolutionResult:
         """
         Resolve a target name to specific entities.
@@ -233,22 +345,9 @@ class TargetResolutionService:  # pylint: disable=too-few-public-methods  # Reas
         player_id_uuid = uuid.UUID(player_id) if isinstance(player_id, str) else player_id
         logger.debug("Resolving target", player_id=player_id_uuid, target_name=target_name)
 
-        player = await self._get_player_from_persistence(player_id_uuid)
-        if player is None:
-            return TargetResolutionResult(
-                success=False,
-                error_message="Internal error: persistence layer not configured correctly",
-                search_term=target_name,
-                room_id="",
-            )
-
-        room_id, error_result = self._validate_player_and_room(player, player_id_uuid)
-        if error_result:
-            error_result.search_term = target_name
-            return error_result
-
-        if room_id is None:
-            return TargetResolutionResult(
+        room_id, error_result = await self._resolve_actor_room(player_id_uuid, target_name)
+        if error_result is not None or room_id is None:
+            return error_result or TargetResolutionResult(
                 success=False, error_message="Player not in a room", search_term=target_name, room_id=""
             )
 
@@ -258,269 +357,9 @@ class TargetResolutionService:  # pylint: disable=too-few-public-methods  # Reas
                 success=False, error_message="No target specified", search_term=target_name, room_id=room_id
             )
 
-        matches = await self._gather_room_target_matches(
-            room_id, clean_target, disambiguation_suffix, player_id_uuid, target_name
-        )
+        matches = await self._gather_room_target_matches(room_id, clean_target, player_id_uuid, target_name)
         return self._build_target_result(matches, target_name, room_id, disambiguation_suffix)
 
-    async def _fetch_players_in_room(self, room_id: str) -> list[Player]:
-        """Load players in room via persistence (async or sync ``get_players_in_room``)."""
-        raw: object = self.persistence
-        method: object = cast(object, getattr(raw, "get_players_in_room"))  # noqa: B009
-        logger.debug(
-            "_search_players_in_room: Checking method type",
-            room_id=room_id,
-            method="get_players_in_room",
-            persistence_type=type(raw).__name__,
-        )
-        is_async = inspect.iscoroutinefunction(method)
-        logger.debug(
-            "_search_players_in_room: Method check result",
-            room_id=room_id,
-            is_async=is_async,
-            method_type=type(method).__name__,
-        )
-        if is_async:
-            logger.debug("_search_players_in_room: Using async method", room_id=room_id)
-            afn = cast(Callable[[str], Awaitable[object]], method)
-            players_raw = await afn(room_id)
-            logger.debug("_search_players_in_room: Async method completed", room_id=room_id)
-        else:
-            logger.debug("_search_players_in_room: Using sync method in thread pool", room_id=room_id)
-            sfn = cast(Callable[[str], object], method)
-            players_raw = await asyncio.to_thread(sfn, room_id)
-            logger.debug("_search_players_in_room: Thread pool method completed", room_id=room_id)
-        return list(cast(Sequence[Player], players_raw))
-
-    async def _search_players_in_room(
-        self, room_id: str, target_name: str, disambiguation_suffix: str | None = None
-    ) -> list[TargetMatch]:
-        """Search for players in the specified room."""
-        try:
-            logger.debug("_search_players_in_room: Starting", room_id=room_id, target_name=target_name)
-            logger.debug("_search_players_in_room: Getting players in room", room_id=room_id)
-            players_in_room = await self._fetch_players_in_room(room_id)
-            logger.debug("_search_players_in_room: Got players", room_id=room_id, player_count=len(players_in_room))
-            matches: list[TargetMatch] = []
-
-            for player in players_in_room:
-                if target_name in player.name.lower():
-                    if disambiguation_suffix:
-                        continue
-
-                    matches.append(
-                        TargetMatch(
-                            target_id=str(player.player_id),
-                            target_name=player.name,
-                            target_type=TargetType.PLAYER,
-                            room_id=room_id,
-                            metadata=TargetMetadata(additional_info={"player_id": str(player.player_id)}),
-                        )
-                    )
-
-            if len(matches) > 1:
-                matches = self._add_disambiguation_suffixes(matches)
-
-            logger.debug("_search_players_in_room: Returning matches", room_id=room_id, matches_count=len(matches))
-            return matches
-
-        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: Player search errors unpredictable, must return empty list
-            logger.error("Error searching players in room", room_id=room_id, error=str(e))
-            return []
-
-    def _validate_room_exists(self, room_id: str) -> bool:
-        """Validate that a room exists using persistence layer."""
-        raw: object = self.persistence
-        if hasattr(raw, "get_room_by_id"):
-            room_fn: object = cast(object, getattr(raw, "get_room_by_id"))  # noqa: B009
-            if inspect.iscoroutinefunction(room_fn):
-                logger.debug("Using async get_room_by_id", room_id=room_id)
-                return True
-            logger.debug("Using sync get_room_by_id", room_id=room_id)
-            sfn = cast(Callable[[str], object], room_fn)
-            room = sfn(room_id)
-            return room is not None
-        if hasattr(raw, "get_room"):
-            room_fn = cast(object, getattr(raw, "get_room"))  # noqa: B009
-            if inspect.iscoroutinefunction(room_fn):
-                logger.debug("Using async get_room", room_id=room_id)
-                return True
-            logger.debug("Using sync get_room", room_id=room_id)
-            sfn = cast(Callable[[str], object], room_fn)
-            room = sfn(room_id)
-            return room is not None
-        logger.debug(
-            "Persistence layer has no get_room method, skipping room validation",
-            persistence_type=type(self.persistence).__name__,
-            room_id=room_id,
-        )
-        return True
-
-    async def _validate_room_exists_async(self, room_id: str) -> bool:
-        """Validate that a room exists using async persistence layer."""
-        raw: object = self.persistence
-        if hasattr(raw, "get_room_by_id"):
-            room_fn: object = cast(object, getattr(raw, "get_room_by_id"))  # noqa: B009
-            if inspect.iscoroutinefunction(room_fn):
-                afn = cast(Callable[[str], Awaitable[object]], room_fn)
-                room = await afn(room_id)
-                return room is not None
-            sfn = cast(Callable[[str], object], room_fn)
-            room = sfn(room_id)
-            return room is not None
-        if hasattr(raw, "get_room"):
-            room_fn = cast(object, getattr(raw, "get_room"))  # noqa: B009
-            if inspect.iscoroutinefunction(room_fn):
-                afn = cast(Callable[[str], Awaitable[object]], room_fn)
-                room = await afn(room_id)
-                return room is not None
-            sfn = cast(Callable[[str], object], room_fn)
-            room = sfn(room_id)
-            return room is not None
-        return True
-
-    def _normalize_name_for_matching(self, name: str) -> str:
-        """Normalize name by removing punctuation for better matching."""
-        return name.replace(".", "").replace(",", "").replace("!", "").replace("?", "").lower()
-
-    def _match_npcs_by_name(self, npc_ids: list[str], target_name: str, room_id: str) -> list[TargetMatch]:
-        """Match NPCs by name and create TargetMatch objects."""
-        matches: list[TargetMatch] = []
-        normalized_target = self._normalize_name_for_matching(target_name)
-
-        for npc_id in npc_ids:
-            npc_instance = self._get_npc_instance(npc_id)
-            if not npc_instance:
-                continue
-
-            normalized_npc_name = self._normalize_name_for_matching(npc_instance.name)
-
-            if normalized_target in normalized_npc_name:
-                logger.debug(
-                    "NPC match found",
-                    npc_id=npc_id,
-                    npc_name=npc_instance.name,
-                    target_name=target_name,
-                    room_id=room_id,
-                    npc_room_id=getattr(npc_instance, "current_room_id", "unknown"),
-                )
-                matches.append(
-                    TargetMatch(
-                        target_id=npc_id,
-                        target_name=npc_instance.name,
-                        target_type=TargetType.NPC,
-                        room_id=room_id,
-                        metadata=TargetMetadata(additional_info={"npc_id": npc_id}),
-                    )
-                )
-
-        return matches
-
-    def _add_disambiguation_suffixes(self, matches: list[TargetMatch]) -> list[TargetMatch]:
-        """Add disambiguation suffixes to matches with duplicate names."""
-        name_counts: dict[str, int] = {}
-        for match in matches:
-            name_counts[match.target_name] = name_counts.get(match.target_name, 0) + 1
-
-        name_suffixes: dict[str, int] = {}
-        for match in matches:
-            if name_counts[match.target_name] > 1:
-                if match.target_name not in name_suffixes:
-                    name_suffixes[match.target_name] = 1
-                else:
-                    name_suffixes[match.target_name] += 1
-                match.disambiguation_suffix = f"-{name_suffixes[match.target_name]}"
-
-        return matches
-
-    @staticmethod
-    def _npc_ids_in_room_from_active_map(active_npcs: Mapping[str, NPCBase], room_id: str) -> list[str]:
-        """Collect NPC ids whose current room matches ``room_id``."""
-        npc_ids: list[str] = []
-        for npc_id, npc in active_npcs.items():
-            current_room = getattr(npc, "current_room", None)
-            current_room_id = getattr(npc, "current_room_id", None)
-            npc_room_id = current_room or current_room_id
-            if npc_room_id == room_id:
-                npc_ids.append(npc_id)
-        return npc_ids
-
-    def _get_npcs_from_lifecycle_manager(self, room_id: str) -> list[str]:
-        """Get NPC IDs from lifecycle manager for a room."""
-        try:
-            from ..services.npc_instance_service import get_npc_instance_service
-
-            npc_instance_service = get_npc_instance_service()
-            if not npc_instance_service or not hasattr(npc_instance_service, "lifecycle_manager"):
-                return []
-            lifecycle_manager = npc_instance_service.lifecycle_manager
-            if not lifecycle_manager or not hasattr(lifecycle_manager, "active_npcs"):
-                return []
-            active_npcs_dict = cast(Mapping[str, NPCBase], lifecycle_manager.active_npcs)
-            return self._npc_ids_in_room_from_active_map(active_npcs_dict, room_id)
-        except Exception as npc_query_error:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: NPC query errors unpredictable, must fallback to room.get_npcs()
-            logger.warning(
-                "Error querying NPCs from lifecycle manager, falling back to room.get_npcs()",
-                room_id=room_id,
-                error=str(npc_query_error),
-            )
-        return []
-
-    async def _load_npc_ids_with_room_fallback(self, room_id: str) -> list[str]:
-        """NPC ids from lifecycle manager, else from room.get_npcs() via persistence."""
-        npc_ids = self._get_npcs_from_lifecycle_manager(room_id)
-        if npc_ids:
-            return npc_ids
-
-        raw: object = self.persistence
-        if not hasattr(raw, "get_room_by_id"):
-            return []
-        room_fn: object = cast(object, getattr(raw, "get_room_by_id"))  # noqa: B009
-        if inspect.iscoroutinefunction(room_fn):
-            afn = cast(Callable[[str], Awaitable[object]], room_fn)
-            room = await afn(room_id)
-        else:
-            sfn = cast(Callable[[str], object], room_fn)
-            room = sfn(room_id)
-        if room is not None and hasattr(room, "get_npcs"):
-            get_npcs = cast(Callable[[], list[str]], cast(object, getattr(room, "get_npcs")))  # noqa: B009
-            return list(get_npcs())
-        return []
-
-    async def _search_npcs_in_room(
-        self,
-        room_id: str,
-        target_name: str,
-        _disambiguation_suffix: str | None = None,  # pylint: disable=unused-argument  # Reason: Reserved for future disambiguation feature
-    ) -> list[TargetMatch]:
-        """Search for NPCs in the specified room."""
-        try:
-            room_exists = await self._validate_room_exists_async(room_id)
-            if not room_exists:
-                logger.debug("Room not found", room_id=room_id)
-                return []
-
-            npc_ids = await self._load_npc_ids_with_room_fallback(room_id)
-
-            logger.debug(
-                "Searching NPCs in room",
-                room_id=room_id,
-                target_name=target_name,
-                npc_ids=npc_ids,
-                npc_count=len(npc_ids),
-            )
-
-            matches = self._match_npcs_by_name(npc_ids, target_name, room_id)
-
-            if len(matches) > 1:
-                matches = self._add_disambiguation_suffixes(matches)
-
-            return matches
-
-        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: B904  # Reason: NPC search errors unpredictable, must return empty list
-            logger.error("Error searching NPCs in room", room_id=room_id, error=str(e))
-            return []
-
     def _search_phantoms_in_room(self, player_id: uuid.UUID, room_id: str, target_name: str) -> list[TargetMatch]:
         """
         Search the player's own active phantom hostiles in this room by name (#625).
@@ -533,13 +372,13 @@ class TargetResolutionService:  # pylint: disable=too-few-public-methods  # Reas
         """
         from ..services.phantom_hostile_service import phantom_hostile_service
 
-        normalized_target = self._normalize_name_for_matching(target_name)
+        normalized_target = normalize_target_name(target_name)
         matches: list[TargetMatch] = []
         for phantom_id in phantom_hostile_service.get_active_phantoms(player_id):
             data = phantom_hostile_service.get_phantom_data(phantom_id)
             if not data or data["room_id"] != room_id:
                 continue
-            normalized_name = self._normalize_name_for_matching(data["name"])
+            normalized_name = normalize_target_name(data["name"])
             if normalized_target in normalized_name:
                 matches.append(
                     TargetMatch(
@@ -3,6 +3,12 @@ User management service for MythosMUD chat system.
 
 This module provides comprehensive user management including muting,
 permissions, and user state tracking for the chat system.
+
+All mutes are held in memory: a forward index (muter -> muted players), a
+reverse index (muted player -> muters), channel mutes and global mutes. The
+index is loaded once from a single compact JSON file when the manager is
+created, updated incrementally on mute/unmute, and written back behind the
+caller (write-behind), so mute checks during chat fan-out never touch disk.
 """
 
 # pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-positional-arguments,too-many-lines,too-many-public-methods  # Reason: User manager requires many state tracking attributes and complex user management logic. User manager requires extensive user management operations for comprehensive chat system user management. User manager legitimately requires many public methods for comprehensive user management.
@@ -22,6 +28,12 @@ from .chat_logger import ChatLogger, chat_logger
 
 logger: BoundLogger = get_logger("communications.user_manager")
 
+# Single compact file holding the whole mute index (replaces per-player mutes_{id}.json files)
+MUTE_STORE_FILENAME = "mute_index.json"
+MUTE_STORE_VERSION = 1
+# Longest wait between retries of a failed mute index write (the delay doubles after each failure)
+MUTE_STORE_MAX_RETRY_SECONDS = 30.0
+
 
 class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: User manager requires many state tracking and configuration attributes
     """
@@ -33,20 +45,22 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
 
     chat_logger: ChatLogger
     data_dir: Path
-    _mute_cache_ttl: timedelta
 
-    def __init__(self, data_dir: Path | None = None, mute_cache_ttl: int = 300) -> None:
+    def __init__(self, data_dir: Path | None = None, flush_delay_seconds: float = 1.0) -> None:
         """
-        Initialize the user manager.
+        Initialize the user manager and load the mute index.
 
         Args:
-            data_dir: Directory for player-specific mute files
-            mute_cache_ttl: Cache TTL in seconds (default: 5 minutes)
+            data_dir: Directory holding the mute index file
+            flush_delay_seconds: Write-behind delay before mute changes are persisted
         """
         # Player mute storage: {player_id: {target_id: mute_info}}
         # Using UUID objects as keys for type safety and consistency
         self._player_mutes: dict[uuid.UUID, dict[uuid.UUID, dict[str, object]]] = {}
 
+        # Reverse player mute index: {target_id: {muter_id, ...}}
+        self._muted_by: dict[uuid.UUID, set[uuid.UUID]] = {}
+
         # Channel mute storage: {player_id: {channel: mute_info}}
         # Using UUID objects as keys for type safety and consistency
         self._channel_mutes: dict[uuid.UUID, dict[str, dict[str, object]]] = {}
@@ -62,16 +76,29 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
         # Chat logger for AI processing
         self.chat_logger = chat_logger
 
-        # Data directory for player-specific mute files
+        # Data directory for the mute index file
         self.data_dir = data_dir or Path("data/user_management")
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Mute data cache with TTL: {player_id: (load_time, data_loaded)}
-        # Using UUID objects as keys for type safety and consistency
-        self._mute_cache: dict[uuid.UUID, tuple[datetime, bool]] = {}
-        self._mute_cache_ttl = timedelta(seconds=mute_cache_ttl)
-
-        logger.info("UserManager initialized with JSON file persistence", cache_ttl_seconds=mute_cache_ttl)
+        # Write-behind persistence state
+        self._store_file = self.data_dir / MUTE_STORE_FILENAME
+        self._store_loaded = False
+        self._store_dirty = False
+        self._flush_delay_seconds = flush_delay_seconds
+        self._flush_task: asyncio.Task[None] | None = None
+        # Set by shutdown() so a flush window stops after its in-progress write
+        self._flush_closing = False
+        # Held while the index is written, so shutdown never races a write in a worker thread
+        self._store_write_lock = asyncio.Lock()
+
+        self._load_mute_store()
+
+        logger.info(
+            "UserManager initialized with in-memory mute index",
+            store_file=str(self._store_file),
+            players_with_mutes=len(self._player_mutes),
+            global_mutes=len(self._global_mutes),
+        )
 
     def _normalize_to_uuid(self, player_id: uuid.UUID | str) -> uuid.UUID:
         """
@@ -289,10 +316,6 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
                 logger.warning("Attempted to mute admin player")
                 return False
 
-            # Initialize player mutes if needed
-            if muter_id_uuid not in self._player_mutes:
-                self._player_mutes[muter_id_uuid] = {}
-
             # Calculate mute expiry
             expiry_time = None
             if duration_minutes:
@@ -310,7 +333,7 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
                 "is_permanent": duration_minutes is None,
             }
 
-            self._player_mutes[muter_id_uuid][target_id_uuid] = mute_info
+            self._add_player_mute(muter_id_uuid, target_id_uuid, mute_info)
 
             # Log the mute for AI processing (chat_logger may expect strings)
             self.chat_logger.log_player_muted(
@@ -333,9 +356,7 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
                 reason=reason,
             )
 
-            # Save mute data for both players
-            _ = self.save_player_mutes(muter_id_uuid)
-            _ = self.save_player_mutes(target_id_uuid)
+            self._schedule_store_flush()
 
             return True
 
@@ -369,18 +390,8 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
             unmuter_id_uuid = self._normalize_to_uuid(unmuter_id)
             target_id_uuid = self._normalize_to_uuid(target_id)
 
-            # Load unmuter's mute data to ensure it's available
-            _ = self.load_player_mutes(unmuter_id_uuid)
-
-            # Check if mute exists
-            if unmuter_id_uuid in self._player_mutes and target_id_uuid in self._player_mutes[unmuter_id_uuid]:
-                # Remove the mute
-                del self._player_mutes[unmuter_id_uuid][target_id_uuid]
-
-                # Clean up empty player mute entries
-                if not self._player_mutes[unmuter_id_uuid]:
-                    del self._player_mutes[unmuter_id_uuid]
-
+            # Remove the mute (also drops it from the reverse index)
+            if self._remove_player_mute(unmuter_id_uuid, target_id_uuid):
                 # Log the unmute for AI processing (chat_logger may expect strings)
                 self.chat_logger.log_player_unmuted(
                     unmuter_id=str(unmuter_id_uuid),
@@ -398,9 +409,7 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
                     target_name=target_name,
                 )
 
-                # Save mute data for both players
-                _ = self.save_player_mutes(unmuter_id_uuid)
-                _ = self.save_player_mutes(target_id_uuid)
+                self._schedule_store_flush()
 
                 return True
             logger.warning("Attempted to unmute non-muted player", unmuter_id=unmuter_id_uuid, target_id=target_id_uuid)
@@ -474,8 +483,7 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
                 reason=reason,
             )
 
-            # Save mute data for the player
-            _ = self.save_player_mutes(player_id_uuid)
+            self._schedule_store_flush()
 
             return True
 
@@ -530,8 +538,7 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
                     channel=channel,
                 )
 
-                # Save mute data for the player
-                _ = self.save_player_mutes(player_id_uuid)
+                self._schedule_store_flush()
 
                 return True
             logger.warning("Attempted to unmute non-muted channel", player_id=player_id_uuid, channel=channel)
@@ -617,9 +624,7 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
                 reason=reason,
             )
 
-            # Save mute data for both players
-            _ = self.save_player_mutes(muter_id_uuid)
-            _ = self.save_player_mutes(target_id_uuid)
+            self._schedule_store_flush()
 
             return True
 
@@ -647,9 +652,6 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
             unmuter_id_uuid = self._normalize_to_uuid(unmuter_id)
             target_id_uuid = self._normalize_to_uuid(target_id)
 
-            # Load unmuter's mute data to ensure it's available
-            _ = self.load_player_mutes(unmuter_id_uuid)
-
             # Check if global mute exists
             if target_id_uuid in self._global_mutes:
                 # Remove the global mute
@@ -672,9 +674,7 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
                     target_name=target_name,
                 )
 
-                # Save mute data for both players
-                _ = self.save_player_mutes(unmuter_id_uuid)
-                _ = self.save_player_mutes(target_id_uuid)
+                self._schedule_store_flush()
 
                 return True
             logger.warning(
@@ -691,6 +691,35 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
             )
             return False
 
+    def _add_player_mute(
+        self, muter_id_uuid: uuid.UUID, target_id_uuid: uuid.UUID, mute_info: dict[str, object]
+    ) -> None:
+        """Store a player mute in the forward and reverse indexes."""
+        self._player_mutes.setdefault(muter_id_uuid, {})[target_id_uuid] = mute_info
+        self._muted_by.setdefault(target_id_uuid, set()).add(muter_id_uuid)
+
+    def _remove_player_mute(self, muter_id_uuid: uuid.UUID, target_id_uuid: uuid.UUID) -> bool:
+        """Remove a player mute from the forward and reverse indexes. Returns True if it existed."""
+        bucket = self._player_mutes.get(muter_id_uuid)
+        if bucket is None or target_id_uuid not in bucket:
+            return False
+        del bucket[target_id_uuid]
+        if not bucket:
+            del self._player_mutes[muter_id_uuid]
+        muters = self._muted_by.get(target_id_uuid)
+        if muters is not None:
+            muters.discard(muter_id_uuid)
+            if not muters:
+                del self._muted_by[target_id_uuid]
+        return True
+
+    def _rebuild_reverse_index(self) -> None:
+        """Rebuild the target -> muters index from the forward index."""
+        self._muted_by = {}
+        for muter_id_uuid, targets in self._player_mutes.items():
+            for target_id_uuid in targets:
+                self._muted_by.setdefault(target_id_uuid, set()).add(muter_id_uuid)
+
     def _resolve_player_mute_vs_target(
         self, player_id_uuid: uuid.UUID, target_id_uuid: uuid.UUID
     ) -> Literal["active", "expired", "absent"]:
@@ -699,23 +728,21 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
 
         AI: Extracted from is_player_muted to keep cyclomatic complexity within tooling limits.
         """
-        if player_id_uuid not in self._player_mutes:
+        bucket = self._player_mutes.get(player_id_uuid)
+        if bucket is None:
             return "absent"
-        bucket = self._player_mutes[player_id_uuid]
-        if target_id_uuid not in bucket:
+        mute_info = bucket.get(target_id_uuid)
+        if mute_info is None:
             return "absent"
-        mute_info = bucket[target_id_uuid]
         ex_chk = mute_info.get("expires_at")
         if isinstance(ex_chk, datetime) and ex_chk < datetime.now(UTC):
-            logger.info(
-                "=== USER MANAGER: Mute is EXPIRED ===",
+            logger.debug(
+                "Player mute expired",
                 player_id=str(player_id_uuid),
                 target_id=str(target_id_uuid),
                 expires_at=ex_chk,
             )
-            del bucket[target_id_uuid]
-            if not bucket:
-                del self._player_mutes[player_id_uuid]
+            _ = self._remove_player_mute(player_id_uuid, target_id_uuid)
             return "expired"
         return "active"
 
@@ -723,6 +750,8 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
         """
         Check if a player has muted another player.
 
+        This is a pure in-memory lookup against the mute index.
+
         Args:
             player_id: Player ID
             target_id: Target player ID
@@ -734,60 +763,7 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
             # Normalize to UUID for dictionary operations
             player_id_uuid = self._normalize_to_uuid(player_id)
             target_id_uuid = self._normalize_to_uuid(target_id)
-
-            logger.info(
-                "=== USER MANAGER: is_player_muted called ===",
-                player_id=str(player_id_uuid),
-                target_id=str(target_id_uuid),
-                player_id_type=type(player_id).__name__,
-                target_id_type=type(target_id).__name__,
-            )
-
-            # Load player's mute data to ensure it's available
-            load_result = self.load_player_mutes(player_id_uuid)
-            has_bucket = player_id_uuid in self._player_mutes
-            logger.info(
-                "=== USER MANAGER: Mute data load result ===",
-                player_id=str(player_id_uuid),
-                load_result=load_result,
-                has_mute_data=has_bucket,
-            )
-
-            if has_bucket:
-                muted_players = list(self._player_mutes[player_id_uuid].keys())
-                logger.info(
-                    "=== USER MANAGER: Player's muted players list ===",
-                    player_id=str(player_id_uuid),
-                    muted_players=[str(p) for p in muted_players],
-                    target_id=str(target_id_uuid),
-                    target_in_list=target_id_uuid in self._player_mutes[player_id_uuid],
-                )
-
-            outcome = self._resolve_player_mute_vs_target(player_id_uuid, target_id_uuid)
-            if outcome == "active":
-                mute_info = self._player_mutes[player_id_uuid][target_id_uuid]
-                logger.info(
-                    "=== USER MANAGER: Mute EXISTS and is VALID ===",
-                    player_id=str(player_id_uuid),
-                    target_id=str(target_id_uuid),
-                    mute_info=mute_info,
-                )
-                return True
-
-            if has_bucket and outcome == "absent":
-                logger.info(
-                    "=== USER MANAGER: Target NOT in muted players list ===",
-                    player_id=str(player_id_uuid),
-                    target_id=str(target_id_uuid),
-                    muted_players=[str(p) for p in self._player_mutes[player_id_uuid].keys()],
-                )
-
-            logger.info(
-                "=== USER MANAGER: Returning False (not muted) ===",
-                player_id=str(player_id_uuid),
-                target_id=str(target_id_uuid),
-            )
-            return False
+            return self._resolve_player_mute_vs_target(player_id_uuid, target_id_uuid) == "active"
 
         except Exception as e:  # pylint: disable=broad-except  # Catch-all for unexpected errors
             logger.error(
@@ -801,7 +777,10 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
 
     async def is_player_muted_async(self, player_id: uuid.UUID | str, target_id: uuid.UUID | str) -> bool:
         """
-        Async version of is_player_muted using async mute loading.
+        Async version of is_player_muted.
+
+        Kept for callers running in async contexts; the check itself never
+        awaits because the mute index is held in memory.
 
         Args:
             player_id: Player ID
@@ -809,43 +788,8 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
 
         Returns:
             True if target is muted by player
-
-        AI: Uses async mute loading to prevent blocking the event loop.
         """
-        try:
-            # Normalize to UUID for dictionary operations
-            player_id_uuid = self._normalize_to_uuid(player_id)
-            target_id_uuid = self._normalize_to_uuid(target_id)
-
-            # Load player's mute data asynchronously to ensure it's available
-            _ = await self.load_player_mutes_async(player_id_uuid)
-
-            # Check if mute exists and is not expired
-            if player_id_uuid in self._player_mutes and target_id_uuid in self._player_mutes[player_id_uuid]:
-                mute_info = self._player_mutes[player_id_uuid][target_id_uuid]
-
-                # Check if mute is expired
-                ex_async = mute_info.get("expires_at")
-                if isinstance(ex_async, datetime) and ex_async < datetime.now(UTC):
-                    # Remove expired mute
-                    del self._player_mutes[player_id_uuid][target_id_uuid]
-                    if not self._player_mutes[player_id_uuid]:
-                        del self._player_mutes[player_id_uuid]
-                    return False
-
-                return True
-
-            return False
-
-        except Exception as e:  # pylint: disable=broad-except  # Catch-all for unexpected errors
-            logger.error(
-                "Error checking player mute (async)",
-                error=str(e),
-                # Structlog handles UUID objects automatically, no need to convert to string
-                player_id=player_id,
-                target_id=target_id,
-            )
-            return False
+        return self.is_player_muted(player_id, target_id)
 
     def is_channel_muted(self, player_id: uuid.UUID | str, channel: str) -> bool:
         """
@@ -1100,11 +1044,11 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
                 muter_name = str(mute_info.get("muted_by_name", "Unknown"))
                 muted_by.append((muter_name, "global"))
 
-            # Check personal mutes
-            for _muter_id_uuid, mutes in self._player_mutes.items():
-                if player_id_uuid in mutes:
-                    mute_info = mutes[player_id_uuid]
-                    muter_name = str(mute_info.get("muted_by_name", "Unknown"))
+            # Check personal mutes through the reverse index
+            for muter_id_uuid in self._muted_by.get(player_id_uuid, ()):
+                personal_mute = self._player_mutes.get(muter_id_uuid, {}).get(player_id_uuid)
+                if personal_mute is not None:
+                    muter_name = str(personal_mute.get("muted_by_name", "Unknown"))
                     muted_by.append((muter_name, "personal"))
 
             return muted_by
@@ -1124,10 +1068,14 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
 
             stats: dict[str, object] = {
                 "total_players_with_mutes": len(self._player_mutes),
+                "total_player_mutes": sum(len(mutes) for mutes in self._player_mutes.values()),
+                "total_muted_players": len(self._muted_by),
                 "total_channel_mutes": sum(len(mutes) for mutes in self._channel_mutes.values()),
                 "total_global_mutes": len(self._global_mutes),
                 "total_admin_players": len(self._admin_players),
                 "admin_players": [str(pid) for pid in self._admin_players],  # Convert UUIDs to strings for JSON
+                "mute_store_loaded": self._store_loaded,
+                "mute_store_dirty": self._store_dirty,
             }
 
             return stats
@@ -1138,35 +1086,42 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
 
     def _cleanup_player_mutes(self, current_time: datetime) -> None:
         """Clean up expired player mutes."""
-        for player_id in list(self._player_mutes.keys()):
-            for target_id in list(self._player_mutes[player_id].keys()):
-                mute_info = self._player_mutes[player_id][target_id]
-                ex_p = mute_info.get("expires_at")
-                if isinstance(ex_p, datetime) and ex_p < current_time:
-                    del self._player_mutes[player_id][target_id]
-
-            if not self._player_mutes[player_id]:
-                del self._player_mutes[player_id]
+        expired = [
+            (player_id, target_id)
+            for player_id, mutes in self._player_mutes.items()
+            for target_id, mute_info in mutes.items()
+            if isinstance(ex_p := mute_info.get("expires_at"), datetime) and ex_p < current_time
+        ]
+        for player_id, target_id in expired:
+            _ = self._remove_player_mute(player_id, target_id)
 
     def _cleanup_channel_mutes(self, current_time: datetime) -> None:
         """Clean up expired channel mutes."""
+        removed = False
         for player_id in list(self._channel_mutes.keys()):
             for channel in list(self._channel_mutes[player_id].keys()):
                 mute_info = self._channel_mutes[player_id][channel]
                 ex_c = mute_info.get("expires_at")
                 if isinstance(ex_c, datetime) and ex_c < current_time:
                     del self._channel_mutes[player_id][channel]
+                    removed = True
 
             if not self._channel_mutes[player_id]:
                 del self._channel_mutes[player_id]
+        if removed:
+            self._schedule_store_flush()
 
     def _cleanup_global_mutes(self, current_time: datetime) -> None:
         """Clean up expired global mutes."""
+        removed = False
         for player_id in list(self._global_mutes.keys()):
             mute_info = self._global_mutes[player_id]
             ex_g = mute_info.get("expires_at")
             if isinstance(ex_g, datetime) and ex_g < current_time:
                 del self._global_mutes[player_id]
+                removed = True
+        if removed:
+            self._schedule_store_flush()
 
     def _cleanup_expired_mutes(self) -> None:
         """Clean up expired mutes from all storage."""
@@ -1208,7 +1163,6 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
         if not isinstance(raw_pm, dict):
             return
 
-        self._player_mutes[player_id_uuid] = {}
         raw_pm_map = cast(dict[str, object], raw_pm)
         for target_id_str, mute_info_raw in raw_pm_map.items():
             if not isinstance(mute_info_raw, dict):
@@ -1219,7 +1173,7 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
 
             try:
                 target_id_uuid = uuid.UUID(target_id_str)
-                self._player_mutes[player_id_uuid][target_id_uuid] = mute_info
+                self._add_player_mute(player_id_uuid, target_id_uuid, mute_info)
             except (ValueError, TypeError):
                 logger.warning("Invalid UUID format in player_mutes", target_id=target_id_str)
 
@@ -1229,14 +1183,13 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
         if not isinstance(raw_cm, dict):
             return
 
-        self._channel_mutes[player_id_uuid] = {}
         raw_cm_map = cast(dict[str, object], raw_cm)
         for channel, mute_info_raw in raw_cm_map.items():
             if not isinstance(mute_info_raw, dict):
                 continue
             mute_info = cast(dict[str, object], mute_info_raw)
             self._convert_mute_info_timestamps(mute_info)
-            self._channel_mutes[player_id_uuid][channel] = mute_info
+            self._channel_mutes.setdefault(player_id_uuid, {})[channel] = mute_info
 
     def _load_global_mutes_from_data(self, data: dict[str, object]) -> None:
         """Load global mutes from JSON data into memory."""
@@ -1258,14 +1211,6 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
             except (ValueError, TypeError):
                 logger.warning("Invalid UUID format in global_mutes", target_id=target_id_str)
 
-    def _update_cache_on_error(self, player_id: uuid.UUID | str) -> None:
-        """Update cache to mark load as failed."""
-        try:
-            player_id_uuid = self._normalize_to_uuid(player_id)
-            self._mute_cache[player_id_uuid] = (datetime.now(UTC), False)
-        except (ValueError, TypeError):
-            pass
-
     def _serialize_mute_info_for_json(self, mute_info: dict[str, object]) -> dict[str, object]:
         """Convert mute_info datetime and UUID objects to JSON-serializable formats."""
         serialized_mute: dict[str, object] = dict(mute_info)
@@ -1283,289 +1228,296 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
             serialized_mute["muted_by"] = str(mb)
         return serialized_mute
 
-    def _save_player_mutes_to_data(self, data: dict[str, object], player_id_uuid: uuid.UUID) -> None:
-        """Save player mutes to data dictionary for JSON serialization."""
-        if player_id_uuid not in self._player_mutes:
-            return
-
+    def _load_store_data(self, data: dict[str, object]) -> None:
+        """Load the compact mute index payload into memory."""
         raw_pm = data.get("player_mutes")
-        if not isinstance(raw_pm, dict):
-            return
-        player_mutes_out = cast(dict[str, object], raw_pm)
-
-        for target_id_uuid, mute_info in self._player_mutes[player_id_uuid].items():
-            serialized_mute = self._serialize_mute_info_for_json(mute_info)
-            player_mutes_out[str(target_id_uuid)] = serialized_mute
-
-    def _save_channel_mutes_to_data(self, data: dict[str, object], player_id_uuid: uuid.UUID) -> None:
-        """Save channel mutes to data dictionary for JSON serialization."""
-        if player_id_uuid not in self._channel_mutes:
-            return
+        if isinstance(raw_pm, dict):
+            for muter_id_str, mutes in cast(dict[str, object], raw_pm).items():
+                try:
+                    self._load_player_mutes_from_data({"player_mutes": mutes}, uuid.UUID(muter_id_str))
+                except (ValueError, TypeError):
+                    logger.warning("Invalid UUID format in mute index player_mutes", player_id=muter_id_str)
 
         raw_cm = data.get("channel_mutes")
-        if not isinstance(raw_cm, dict):
-            return
-        channel_mutes_out = cast(dict[str, object], raw_cm)
-
-        for channel, mute_info in self._channel_mutes[player_id_uuid].items():
-            serialized_mute = self._serialize_mute_info_for_json(mute_info)
-            channel_mutes_out[channel] = serialized_mute
-
-    def _save_global_mutes_to_data(self, data: dict[str, object], player_id_uuid: uuid.UUID) -> None:
-        """Save global mutes applied by this player to data dictionary for JSON serialization."""
-        raw_gm = data.get("global_mutes")
-        if not isinstance(raw_gm, dict):
-            return
-        global_mutes_out = cast(dict[str, object], raw_gm)
-
-        for target_id_uuid, mute_info in self._global_mutes.items():
-            if mute_info.get("muted_by") == player_id_uuid:  # Compare UUID objects
-                serialized_mute = self._serialize_mute_info_for_json(mute_info)
-                global_mutes_out[str(target_id_uuid)] = serialized_mute
-
-    def load_player_mutes(self, player_id: uuid.UUID | str) -> bool:
+        if isinstance(raw_cm, dict):
+            for player_id_str, mutes in cast(dict[str, object], raw_cm).items():
+                try:
+                    self._load_channel_mutes_from_data({"channel_mutes": mutes}, uuid.UUID(player_id_str))
+                except (ValueError, TypeError):
+                    logger.warning("Invalid UUID format in mute index channel_mutes", player_id=player_id_str)
+
+        self._load_global_mutes_from_data(data)
+
+        raw_admins = data.get("admins")
+        if isinstance(raw_admins, list):
+            for admin_id in cast(list[object], raw_admins):
+                try:
+                    self._admin_players.add(uuid.UUID(str(admin_id)))
+                except ValueError:
+                    logger.warning("Invalid UUID format in mute index admins", player_id=admin_id)
+
+    def _import_legacy_mute_files(self) -> int:
         """
-        Load mute data for a specific player from JSON file.
+        Import per-player ``mutes_{player_id}.json`` files into the index.
 
-        Args:
-            player_id: Player ID to load mutes for
+        Used once, when no mute index file exists yet. The legacy files are
+        left in place; the next flush writes everything to the index file.
 
         Returns:
-            True if data was loaded successfully, False otherwise
+            Number of legacy files imported
         """
+        imported = 0
+        for mute_file in sorted(self.data_dir.glob("mutes_*.json")):
+            try:
+                player_id_uuid = uuid.UUID(mute_file.stem.removeprefix("mutes_"))
+                raw = mute_file.read_text(encoding="utf-8")
+                parsed: object = json.loads(raw) if raw.strip() else {}
+                if not isinstance(parsed, dict):
+                    raise TypeError("Mute file root must be a JSON object")
+                data = cast(dict[str, object], parsed)
+                self._load_player_mutes_from_data(data, player_id_uuid)
+                self._load_channel_mutes_from_data(data, player_id_uuid)
+                self._load_global_mutes_from_data(data)
+                if bool(data.get("is_admin")):
+                    self._admin_players.add(player_id_uuid)
+                imported += 1
+            except (OSError, ValueError, TypeError) as e:
+                logger.error("Error importing legacy mute file", file=mute_file.name, error=str(e))
+        return imported
+
+    def _load_mute_store(self) -> None:
+        """Load the whole mute index from disk (called once, from __init__)."""
         try:
-            # Normalize to UUID for dictionary operations
-            player_id_uuid = self._normalize_to_uuid(player_id)
-
-            mute_file = self._get_player_mute_file(player_id_uuid)
+            if self._store_file.exists():
+                raw = self._store_file.read_text(encoding="utf-8")
+                parsed: object = json.loads(raw) if raw.strip() else {}
+                if not isinstance(parsed, dict):
+                    raise TypeError("Mute index root must be a JSON object")
+                self._load_store_data(cast(dict[str, object], parsed))
+            elif self._import_legacy_mute_files():
+                # Persist the migrated data in the compact format right away
+                self._store_dirty = True
+                _ = self.flush_mute_store()
+            self._store_loaded = True
+        except (OSError, ValueError, TypeError) as e:
+            # Keep the unreadable file for inspection instead of overwriting it on the next flush
+            logger.error("Error loading mute index, starting empty", error=str(e), error_type=type(e).__name__)
+            try:
+                _ = self._store_file.replace(self._store_file.with_suffix(".corrupt"))
+            except OSError:
+                pass
+            self._player_mutes.clear()
+            self._channel_mutes.clear()
+            self._global_mutes.clear()
+            self._store_loaded = True
+        self._rebuild_reverse_index()
+
+    def _build_store_payload(self) -> dict[str, object]:
+        """Snapshot the mute index into a JSON-serializable dictionary."""
+        return {
+            "version": MUTE_STORE_VERSION,
+            "last_updated": datetime.now(UTC).isoformat(),
+            "player_mutes": {
+                str(muter_id): {
+                    str(target_id): self._serialize_mute_info_for_json(mute_info)
+                    for target_id, mute_info in mutes.items()
+                }
+                for muter_id, mutes in self._player_mutes.items()
+                if mutes
+            },
+            "channel_mutes": {
+                str(player_id): {
+                    channel: self._serialize_mute_info_for_json(mute_info) for channel, mute_info in mutes.items()
+                }
+                for player_id, mutes in self._channel_mutes.items()
+                if mutes
+            },
+            "global_mutes": {
+                str(target_id): self._serialize_mute_info_for_json(mute_info)
+                for target_id, mute_info in self._global_mutes.items()
+            },
+            "admins": sorted(str(pid) for pid in self._admin_players),
+        }
+
+    def _write_store_payload(self, payload: dict[str, object]) -> bool:
+        """Write a payload snapshot to the mute index file atomically."""
+        try:
+            serialized = json.dumps(payload, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.error("Mute index is not JSON serializable", error=str(e), error_type=type(e).__name__)
+            return False
 
-            if not mute_file.exists():
-                logger.debug("No mute file found for player")
-                return False
+        temp_file = self._store_file.with_suffix(".tmp")
+        try:
+            _ = temp_file.write_text(serialized, encoding="utf-8")
+            _ = temp_file.replace(self._store_file)
+        except OSError as e:
+            logger.error("File system error writing mute index", error=str(e), error_type=type(e).__name__)
+            if temp_file.exists():
+                temp_file.unlink()
+            return False
+        return True
 
-            with open(mute_file, encoding="utf-8") as f:
-                raw = f.read()
-            # Empty or whitespace-only file: treat as valid empty mute data (avoids JSONDecodeError)
-            parsed: object = json.loads(raw) if raw.strip() else {}
-            if not isinstance(parsed, dict):
-                raise TypeError("Mute file root must be a JSON object")
-            data: dict[str, object] = cast(dict[str, object], parsed)
-
-            # Load all mute types from JSON data
-            self._load_player_mutes_from_data(data, player_id_uuid)
-            self._load_channel_mutes_from_data(data, player_id_uuid)
-            self._load_global_mutes_from_data(data)
-
-            # Load admin status (using UUID object as key)
-            if bool(data.get("is_admin")):
-                self._admin_players.add(player_id_uuid)
+    def flush_mute_store(self) -> bool:
+        """
+        Persist the mute index now if it has unsaved changes.
 
-            # Update cache (using UUID object as key)
-            self._mute_cache[player_id_uuid] = (datetime.now(UTC), True)
-            logger.info("Player mute data loaded")
+        Returns:
+            True if the index is persisted (or had nothing to persist), False otherwise
+        """
+        if not self._store_dirty:
             return True
+        self._store_dirty = False
+        if self._write_store_payload(self._build_store_payload()):
+            logger.debug("Mute index saved")
+            return True
+        self._store_dirty = True
+        return False
 
-        except OSError as e:
-            logger.error("File system error loading player mute data", error=str(e), error_type=type(e).__name__)
-            self._update_cache_on_error(player_id)
-            return False
-        except (ValueError, TypeError, json.JSONDecodeError) as e:
-            logger.error("Data validation error loading player mute data", error=str(e), error_type=type(e).__name__)
-            self._update_cache_on_error(player_id)
-            return False
-        except Exception as e:  # pylint: disable=broad-except  # Catch-all for unexpected errors
-            logger.error("Unexpected error loading player mute data", error=str(e), error_type=type(e).__name__)
-            self._update_cache_on_error(player_id)
-            return False
-
-    def _is_cache_valid(self, player_id: uuid.UUID) -> bool:
+    async def flush_mute_store_async(self) -> bool:
         """
-        Check if cached mute data is still valid.
+        Async version of flush_mute_store that writes the file in a worker thread.
 
-        Args:
-            player_id: Player ID to check (UUID object)
+        The snapshot is taken on the event loop so the index is never read
+        while it is being mutated.
 
         Returns:
-            True if cache is valid, False otherwise
+            True if the index is persisted (or had nothing to persist), False otherwise
         """
-        if player_id not in self._mute_cache:
+        async with self._store_write_lock:
+            if not self._store_dirty:
+                return True
+            self._store_dirty = False
+            payload = self._build_store_payload()
+            if await asyncio.to_thread(self._write_store_payload, payload):
+                logger.debug("Mute index saved")
+                return True
+            self._store_dirty = True
             return False
 
-        load_time, _ = self._mute_cache[player_id]
-        age = datetime.now(UTC) - load_time
-        return age < self._mute_cache_ttl
+    async def _run_flush_window(self) -> None:
+        """
+        Write the mute index after each delay until no changes are left unsaved.
 
-    async def load_player_mutes_async(self, player_id: uuid.UUID | str) -> bool:
+        Changes made while a write is in progress mark the index dirty again and
+        are written by the next pass. A failed write is retried, backing off up
+        to MUTE_STORE_MAX_RETRY_SECONDS. Once shutdown() has begun, the window
+        ends after its current write and shutdown writes what is left.
+        """
+        delay = self._flush_delay_seconds
+        try:
+            while self._store_dirty and not self._flush_closing:
+                await asyncio.sleep(delay)
+                if await self.flush_mute_store_async():
+                    delay = self._flush_delay_seconds
+                else:
+                    delay = min(max(delay * 2, 1.0), MUTE_STORE_MAX_RETRY_SECONDS)
+        finally:
+            self._flush_task = None
+
+    def _schedule_store_flush(self) -> None:
+        """
+        Mark the mute index dirty and schedule a write-behind flush.
+
+        Changes made within the flush delay are coalesced into a single write.
+        Without a running event loop (scripts, synchronous callers) the index
+        is written immediately.
         """
-        Async version of load_player_mutes using asyncio.to_thread for file I/O.
+        self._store_dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _ = self.flush_mute_store()
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._run_flush_window())
+
+    async def shutdown(self) -> None:
+        """Stop the write-behind flush and persist outstanding changes."""
+        task = self._flush_task
+        if task is not None and not task.done():
+            if self._store_write_lock.locked():
+                # Mid-write: cancelling would abandon a write already running in a worker thread, so
+                # let the window finish it and stop
+                self._flush_closing = True
+                try:
+                    await task
+                finally:
+                    self._flush_closing = False
+            else:
+                _ = task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._flush_task = None
+        _ = await self.flush_mute_store_async()
+
+    def load_player_mutes(self, player_id: uuid.UUID | str) -> bool:
+        """
+        Ensure mute data for a player is available.
+
+        The whole mute index is loaded when the manager is created, so this
+        performs no I/O; it is kept for callers that prepare mute checks.
 
         Args:
             player_id: Player ID to load mutes for
 
         Returns:
-            True if data was loaded successfully, False otherwise
-
-        AI: Uses asyncio.to_thread to run synchronous file I/O in thread pool,
-            preventing blocking of the event loop.
+            True if the mute index is loaded and the player ID is valid, False otherwise
         """
         try:
-            # Normalize to UUID for dictionary operations
-            player_id_uuid = self._normalize_to_uuid(player_id)
-
-            # Check cache first
-            if self._is_cache_valid(player_id_uuid):
-                logger.debug("Using cached mute data", player_id=player_id_uuid)
-                return True
-
-            # Load from file using thread pool
-            result = await asyncio.to_thread(self.load_player_mutes, player_id_uuid)
-            return result
-        except Exception as e:  # pylint: disable=broad-except  # Catch-all for unexpected errors
-            logger.error("Error in async mute loading", player_id=player_id, error=str(e))
+            _ = self._normalize_to_uuid(player_id)
+        except ValueError:
+            logger.warning("Invalid player ID for mute data", player_id=player_id)
             return False
+        return self._store_loaded
 
-    async def load_player_mutes_batch(self, player_ids: list[uuid.UUID | str]) -> dict[str, bool]:
+    async def load_player_mutes_async(self, player_id: uuid.UUID | str) -> bool:
         """
-        Batch load mute data for multiple players concurrently.
+        Async version of load_player_mutes.
 
         Args:
-            player_ids: List of player IDs to load mutes for
+            player_id: Player ID to load mutes for
 
         Returns:
-            Dictionary mapping player_id to load success status
-
-        AI: Loads mute data for all players concurrently using asyncio.gather,
-            significantly improving performance when loading multiple players.
+            True if the mute index is loaded and the player ID is valid, False otherwise
         """
-        # Filter out players with valid cache (normalize to UUID first)
-        players_to_load: list[uuid.UUID | str] = []
-        for pid in player_ids:
-            try:
-                pid_uuid = self._normalize_to_uuid(pid)
-                if not self._is_cache_valid(pid_uuid):
-                    players_to_load.append(pid)
-            except (ValueError, TypeError):
-                # Invalid UUID, include in load list to handle error
-                players_to_load.append(pid)
-
-        if not players_to_load:
-            logger.debug("All players have valid cached mute data", total_players=len(player_ids))
-            # Convert all UUIDs to strings for dict.fromkeys
-            player_ids_str = [str(pid) for pid in player_ids]
-            return dict.fromkeys(player_ids_str, True)
-
-        logger.debug(
-            "Batch loading mute data",
-            total_players=len(player_ids),
-            cached=len(player_ids) - len(players_to_load),
-            to_load=len(players_to_load),
-        )
-
-        # Load all players concurrently
-        results = await asyncio.gather(
-            *[self.load_player_mutes_async(pid) for pid in players_to_load],
-            return_exceptions=True,
-        )
+        return self.load_player_mutes(player_id)
 
-        # Build result dictionary (convert UUIDs to strings for dictionary keys)
-        result_dict: dict[str, bool] = {}
-        for i, player_id in enumerate(players_to_load):
-            player_id_str = str(player_id)  # Convert to string for dictionary key
-            if isinstance(results[i], Exception):
-                logger.error(
-                    "Error loading mute data in batch",
-                    # Structlog handles UUID objects automatically, no need to convert to string
-                    player_id=player_id,
-                    error=str(results[i]),
-                )
-                result_dict[player_id_str] = False
-            else:
-                result_dict[player_id_str] = bool(results[i])
-
-        # Add cached players (convert UUIDs to strings for dictionary keys)
-        for player_id in player_ids:
-            player_id_str = str(player_id)  # Convert to string for dictionary key
-            if player_id_str not in result_dict:
-                result_dict[player_id_str] = True
-
-        return result_dict
-
-    def save_player_mutes(self, player_id: uuid.UUID | str) -> bool:
+    async def load_player_mutes_batch(self, player_ids: list[uuid.UUID | str]) -> dict[str, bool]:
         """
-        Save mute data for a specific player to JSON file.
+        Ensure mute data is available for multiple players.
 
         Args:
-            player_id: Player ID to save mutes for
+            player_ids: List of player IDs to load mutes for
 
         Returns:
-            True if data was saved successfully, False otherwise
+            Dictionary mapping player_id (as string) to load success status
         """
-        payload: dict[str, object] | None = None
-        try:
-            # Normalize to UUID for dictionary operations
-            player_id_uuid = self._normalize_to_uuid(player_id)
-            player_id_str = str(player_id_uuid)  # For JSON serialization
-
-            mute_file = self._get_player_mute_file(player_id_uuid)
-
-            # Prepare data for serialization
-            payload = {
-                "player_id": player_id_str,  # Use string for JSON serialization
-                "last_updated": datetime.now(UTC).isoformat(),
-                "player_mutes": cast(dict[str, object], {}),
-                "channel_mutes": cast(dict[str, object], {}),
-                "global_mutes": cast(dict[str, object], {}),
-                "is_admin": player_id_uuid in self._admin_players,  # Use UUID for dictionary lookup
-            }
-
-            # Save all mute types to data dictionary
-            self._save_player_mutes_to_data(payload, player_id_uuid)
-            self._save_channel_mutes_to_data(payload, player_id_uuid)
-            self._save_global_mutes_to_data(payload, player_id_uuid)
-
-            # Validate data is serializable before writing
-            try:
-                _ = json.dumps(payload, indent=2, ensure_ascii=False)
-            except (TypeError, ValueError) as e:
-                logger.error("Data is not JSON serializable", error=str(e), error_type=type(e).__name__)
-                return False
-
-            # Write to file atomically to prevent corruption
-
-            # Create a temporary file
-            temp_file = mute_file.with_suffix(".tmp")
-            try:
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    json.dump(payload, f, indent=2, ensure_ascii=False)
-
-                # Atomically replace the original file
-                _ = temp_file.replace(mute_file)
-            except Exception as e:
-                # Clean up temp file if it exists
-                if temp_file.exists():
-                    temp_file.unlink()
-                raise e
-
-            logger.debug("Player mute data saved")
-            return True
-
-        except Exception as e:  # pylint: disable=broad-except  # Catch-all for unexpected errors
-            logger.error(
-                "Error saving player mute data",
-                error=str(e),
-                player_id=player_id,
-                data_keys=list(payload.keys()) if payload is not None else None,
-            )
-            return False
+        return {str(player_id): self.load_player_mutes(player_id) for player_id in player_ids}
+
+    def _purge_player_from_index(self, player_id_uuid: uuid.UUID) -> None:
+        """Remove every mute a player applied or received."""
+        for target_id_uuid in list(self._player_mutes.get(player_id_uuid, {})):
+            _ = self._remove_player_mute(player_id_uuid, target_id_uuid)
+        for muter_id_uuid in list(self._muted_by.get(player_id_uuid, ())):
+            _ = self._remove_player_mute(muter_id_uuid, player_id_uuid)
+        _ = self._channel_mutes.pop(player_id_uuid, None)
+        _ = self._global_mutes.pop(player_id_uuid, None)
+        self._admin_players.discard(player_id_uuid)
 
     def cleanup_player_mutes(self, player_id: uuid.UUID | str, *, delete_file: bool = False) -> bool:
         """
-        Remove mute data for a player from memory and optionally delete their file.
-        Called when a player logs out or is deleted.
+        Release per-session mute state for a player, or purge them entirely.
+
+        Called when a player logs out (the index keeps their mutes, since it is
+        the authoritative store) or is deleted (``delete_file=True`` removes
+        every mute they applied or received and any legacy mute file).
 
         Args:
             player_id: Player ID to cleanup
-            delete_file: Whether to delete the persisted mute file. Defaults to False.
+            delete_file: Whether to purge the player's persisted mute data. Defaults to False.
 
         Returns:
             True if cleanup was successful, False otherwise
@@ -1574,26 +1526,14 @@ class UserManager:  # pylint: disable=too-many-instance-attributes  # Reason: Us
             # Normalize to UUID for dictionary operations
             player_id_uuid = self._normalize_to_uuid(player_id)
 
-            # Remove from memory (using UUID objects as keys)
-            if player_id_uuid in self._player_mutes:
-                del self._player_mutes[player_id_uuid]
-
-            if player_id_uuid in self._channel_mutes:
-                del self._channel_mutes[player_id_uuid]
-
-            if player_id_uuid in self._global_mutes:
-                del self._global_mutes[player_id_uuid]
-
-            if player_id_uuid in self._admin_players:
-                self._admin_players.remove(player_id_uuid)
-
             if delete_file:
-                # Delete file only when explicitly requested (e.g., account deletion)
-                mute_file = self._get_player_mute_file(player_id_uuid)
-                if mute_file.exists():
-                    mute_file.unlink()
+                self._purge_player_from_index(player_id_uuid)
+                self._schedule_store_flush()
+                legacy_file = self._get_player_mute_file(player_id_uuid)
+                if legacy_file.exists():
+                    legacy_file.unlink()
 
-            logger.info("Player mute data cleaned up")
+            logger.info("Player mute data cleaned up", purged=delete_file)
             return True
 
         except OSError as e:
@@ -1619,23 +1559,14 @@ def _get_proper_data_dir() -> Path:
     AI: Environment separation prevents test data pollution.
     """
     from ..config import get_config
+    from ..utils.project_paths import get_environment_data_dir
 
     config = get_config()
-    environment = config.logging.environment
-
-    # Find the project root (where pyproject.toml is located)
-    current_file = Path(__file__).resolve()
-    project_root = current_file.parent
-    while project_root.parent != project_root:
-        if (project_root / "pyproject.toml").exists():
-            break
-        project_root = project_root.parent
 
     # CRITICAL: Include environment in path for data isolation
     # data/{environment}/user_management NOT data/user_management
-    data_path = project_root / "data" / environment / "user_management"
-    return data_path
+    return get_environment_data_dir(config.logging.environment) / "user_management"
 
 
-# Global user manager instance with environment-aware path resolution
+# The one user manager (and mute index writer) per process; the container exposes this instance
 user_manager = UserManager(data_dir=_get_proper_data_dir())
@@ -5,7 +5,7 @@ Provides type hints for FastAPI Users authentication library.
 """
 
 from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 from uuid import UUID
 
 from fastapi import APIRouter
@@ -29,13 +29,16 @@ class UUIDIDMixin:
 class BaseUserManager(Generic[UP, ID]):
     """Base user manager for handling user operations."""
 
+    user_db: SQLAlchemyUserDatabase[UP, ID]
+
     def __init__(
         self,
         user_db: SQLAlchemyUserDatabase[UP, ID],
         password_helper: object | None = ...,
     ) -> None: ...
     async def get(self, id: ID) -> UP | None: ...
-    async def get_by_email(self, email: str) -> UP | None: ...
+    # Raises fastapi_users.exceptions.UserNotExists rather than returning None
+    async def get_by_email(self, email: str) -> UP: ...
     async def create(
         self,
         user_create: object,
@@ -50,6 +53,8 @@ class BaseUserManager(Generic[UP, ID]):
         request: Request | None = ...,
     ) -> UP: ...
     async def delete(self, user: UP) -> None: ...
+    async def validate_password(self, password: str, user: object) -> None: ...
+    async def _update(self, user: UP, update_dict: dict[str, Any]) -> UP: ...
     async def authenticate(self, credentials: OAuth2PasswordRequestForm) -> UP | None: ...
     async def on_after_register(self, user: UP, request: Request | None = ...) -> None: ...
     async def on_after_update(
@@ -0,0 +1,37 @@
+"""
+Type stubs for fastapi_users.schemas module.
+
+Only the create/update schema bases used by the app; the package leaves
+create_update_dict untyped.
+"""
+
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+class CreateUpdateDictModel(BaseModel):
+    def create_update_dict(self) -> dict[str, Any]: ...
+    def create_update_dict_superuser(self) -> dict[str, Any]: ...
+
+ID = TypeVar("ID")
+
+class BaseUser(CreateUpdateDictModel, Generic[ID]):
+    id: ID
+    email: str
+    is_active: bool
+    is_superuser: bool
+    is_verified: bool
+
+class BaseUserCreate(CreateUpdateDictModel):
+    email: str
+    password: str
+    is_active: bool | None
+    is_superuser: bool | None
+    is_verified: bool | None
+
+class BaseUserUpdate(CreateUpdateDictModel):
+    password: str | None
+    email: str | None
+    is_active: bool | None
+    is_superuser: bool | None
+    is_verified: bool | None
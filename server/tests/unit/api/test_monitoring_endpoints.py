@@ -18,7 +18,9 @@ from server.api.monitoring import (
     force_memory_cleanup,
     get_cache_metrics,
     get_connection_health_stats,
+    get_database_pool_metrics,
     get_dual_connection_stats,
+    get_eventbus_dispatch_metrics,
     get_eventbus_metrics,
     get_memory_alerts,
     get_memory_leak_metrics,
@@ -80,6 +82,7 @@ async def test_validate_room_integrity_builds_room_map() -> None:
     with patch("server.api.monitoring.get_movement_monitor", return_value=monitor):
         out = await validate_room_integrity(MagicMock(spec=Request), persistence)
     assert out.total_rooms == 1
+    assert set(out.player_room_validation) == {"validated", "fixed"}
     assert isinstance(out.timestamp, str)
 
 
@@ -320,6 +323,28 @@ async def test_get_eventbus_metrics_shapes() -> None:
     assert out.total_subscribers == 1
 
 
+@pytest.mark.asyncio
+async def test_get_eventbus_dispatch_metrics_from_real_bus() -> None:
+    from server.events.event_bus import EventBus
+
+    bus = EventBus()
+    try:
+        req = _request_with_container(event_bus=bus)
+        out = await get_eventbus_dispatch_metrics(req)
+    finally:
+        await bus.shutdown()
+    assert out.queue_depth == 0
+    assert out.max_queue_size > 0
+    assert out.subscriber_latency == {}
+
+
+@pytest.mark.asyncio
+async def test_get_eventbus_dispatch_metrics_without_bus_returns_500() -> None:
+    with pytest.raises(LoggedHTTPException) as exc_info:
+        await get_eventbus_dispatch_metrics(_request_with_container(event_bus=None))
+    assert exc_info.value.status_code == 500
+
+
 @pytest.mark.asyncio
 async def test_get_task_metrics_from_registry() -> None:
     reg: MagicMock = MagicMock()
@@ -343,6 +368,17 @@ async def test_get_task_metrics_from_registry() -> None:
     assert out.active_task_count == 0
 
 
+@pytest.mark.asyncio
+async def test_get_database_pool_metrics_shapes() -> None:
+    persistence = MagicMock()
+    persistence.get_player_loader_stats.return_value = {"loads": 3, "identity_hits": 1, "avg_batch_size": 1.5}
+    out = await get_database_pool_metrics(MagicMock(spec=Request), persistence)
+    assert out.checkout_wait["buckets"]["le_inf"] == out.checkout_wait["count"]
+    assert out.in_use >= 0
+    assert isinstance(out.units_of_work, dict)
+    assert out.player_loads == {"loads": 3, "identity_hits": 1, "avg_batch_size": 1.5}
+
+
 @pytest.mark.asyncio
 async def test_get_memory_leak_metrics_endpoint() -> None:
     coll: MagicMock = MagicMock()
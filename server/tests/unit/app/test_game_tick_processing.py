@@ -26,7 +26,6 @@ from server.app.game_tick_processing import (
     _process_heal_over_time_effect,
     _process_mp_regeneration,
     _process_single_effect,
-    _process_single_player_mp_regeneration,
     _update_player_status_effects,
     _validate_and_get_player,
     _validate_app_state_for_status_effects,
@@ -382,16 +381,15 @@ async def test_process_status_effects_with_online_player() -> None:
 
 
 @pytest.mark.asyncio
-async def test_process_single_player_mp_regeneration() -> None:
-    process_tick_regeneration: AsyncMock = AsyncMock(return_value={"mp_restored": 2})
+async def test_process_mp_regeneration_passes_online_players() -> None:
+    process_online_tick: AsyncMock = AsyncMock(return_value=1)
     mp_service: MagicMock = MagicMock()
-    mp_service.process_tick_regeneration = process_tick_regeneration
-    player_id = str(uuid.uuid4())
-    assert await _process_single_player_mp_regeneration(mp_service, player_id) is True
-
+    mp_service.process_online_tick = process_online_tick
+    player_id = uuid.uuid4()
     connection_manager: MagicMock = MagicMock()
-    connection_manager.online_players = {uuid.uuid4(): {}}
+    connection_manager.online_players = {player_id: {}}
     container: MagicMock = MagicMock()
     container.mp_regeneration_service = mp_service
     container.connection_manager = connection_manager
     await _process_mp_regeneration(container, MagicMock(), tick_count=1)
+    process_online_tick.assert_awaited_once_with([player_id], 1)
@@ -16,7 +16,9 @@ from server.app.lifespan_shutdown import (
     _shutdown_mythos_chronicle,
     _shutdown_mythos_tick_scheduler,
     _shutdown_nats_handler,
+    _shutdown_password_hashing,
     _shutdown_task_registry,
+    _shutdown_user_manager,
     shutdown_services,
 )
 
@@ -96,6 +98,7 @@ async def test_shutdown_connection_manager(mock_app: FastAPI) -> None:
     await _shutdown_connection_manager(mock_app)
     stop_idle_sampler.assert_awaited_once()
     stop_health_checks.assert_called_once()
+    cm.shutdown_room_event_handler.assert_called_once()
     force_cleanup.assert_awaited_once()
 
 
@@ -110,6 +113,7 @@ async def test_shutdown_connection_manager_handles_errors(mock_app: FastAPI) ->
     cm.memory_monitor = memory_monitor
     cm.force_cleanup = force_cleanup
     cm.stop_health_checks = stop_health_checks
+    cm.shutdown_room_event_handler = MagicMock(side_effect=RuntimeError("room events"))
     mock_app.state.container = MagicMock(connection_manager=cm)
     await _shutdown_connection_manager(mock_app)
 
@@ -172,6 +176,38 @@ async def test_shutdown_event_bus_missing(mock_container: MagicMock) -> None:
     await _shutdown_event_bus(mock_container)
 
 
+@pytest.mark.asyncio
+async def test_shutdown_user_manager_flushes_mute_index(mock_container: MagicMock) -> None:
+    user_manager: MagicMock = MagicMock()
+    user_manager.shutdown = AsyncMock()
+    mock_container.user_manager = user_manager
+    await _shutdown_user_manager(mock_container)
+    user_manager.shutdown.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_user_manager_missing(mock_container: MagicMock) -> None:
+    mock_container.user_manager = None
+    await _shutdown_user_manager(mock_container)
+
+
+def test_shutdown_password_hashing_stops_pool() -> None:
+    with patch("server.app.lifespan_shutdown.shutdown_password_hashing_pool") as shutdown_pool:
+        _shutdown_password_hashing()
+    shutdown_pool.assert_called_once_with()
+
+
+def test_shutdown_password_hashing_pool_releases_singleton() -> None:
+    from server.auth import argon2_pool
+
+    pool = argon2_pool.get_password_hashing_pool()
+    with patch.object(pool, "shutdown") as pool_shutdown:
+        argon2_pool.shutdown_password_hashing_pool()
+    pool_shutdown.assert_called_once_with()
+    assert argon2_pool.get_password_hashing_pool() is not pool
+    argon2_pool.shutdown_password_hashing_pool()
+
+
 @pytest.mark.asyncio
 async def test_shutdown_services_orchestrates_all(mock_app: FastAPI, mock_container: MagicMock) -> None:
     container_shutdown: AsyncMock = AsyncMock()
@@ -181,7 +217,9 @@ async def test_shutdown_services_orchestrates_all(mock_app: FastAPI, mock_contai
         patch("server.app.lifespan_shutdown._shutdown_nats_handler", new_callable=AsyncMock) as nats,
         patch("server.app.lifespan_shutdown._shutdown_connection_manager", new_callable=AsyncMock) as conn,
         patch("server.app.lifespan_shutdown._shutdown_mythos_tick_scheduler", new_callable=AsyncMock) as tick,
+        patch("server.app.lifespan_shutdown._shutdown_password_hashing") as hashing,
         patch("server.app.lifespan_shutdown._shutdown_task_registry", new_callable=AsyncMock) as tasks,
+        patch("server.app.lifespan_shutdown._shutdown_user_manager", new_callable=AsyncMock) as users,
         patch("server.app.lifespan_shutdown._shutdown_event_bus", new_callable=AsyncMock) as bus,
     ):
         await shutdown_services(mock_app, mock_container)
@@ -190,6 +228,8 @@ async def test_shutdown_services_orchestrates_all(mock_app: FastAPI, mock_contai
     nats.assert_awaited_once_with(mock_app)
     conn.assert_awaited_once_with(mock_app)
     tick.assert_awaited_once_with(mock_app)
+    hashing.assert_called_once_with()
     tasks.assert_awaited_once_with(mock_container)
+    users.assert_awaited_once_with(mock_container)
     bus.assert_awaited_once_with(mock_container)
     container_shutdown.assert_awaited_once()
@@ -0,0 +1,107 @@
+"""
+Unit tests for the off-loop Argon2 hashing pool.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from server.auth.argon2_pool import PasswordHashingBusyError, PasswordHashingPool, memory_bounded_workers
+from server.auth.argon2_utils import create_hasher_with_params
+
+# pylint: disable=redefined-outer-name  # Reason: pytest fixture parameter names match fixture names
+
+# Most the event loop may lag behind a 5 ms timer while verifications run; one
+# verification at the hash parameters below takes longer than this on its own
+MAX_LOOP_LAG_SECONDS = 0.05
+
+
+async def _max_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+@pytest.fixture
+def pool():
+    """Two-worker pool, shut down after the test."""
+    hashing_pool = PasswordHashingPool(max_workers=2, max_queued=32)
+    yield hashing_pool
+    hashing_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_verifications_keep_event_loop_responsive(pool):
+    """Twenty logins verifying at once never stall the event loop for as long as one hash takes."""
+    password = "correct horse battery staple"
+    hashed = create_hasher_with_params(time_cost=2, memory_cost=32768).hash(password)
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_max_loop_lag(stop))
+    await asyncio.sleep(0.01)
+    results = await asyncio.gather(*(pool.verify(password, hashed) for _ in range(20)))
+    stop.set()
+    max_lag = await monitor
+
+    assert results == [True] * 20
+    assert max_lag < MAX_LOOP_LAG_SECONDS
+    assert pool.admitted == 0
+
+
+@pytest.mark.asyncio
+async def test_full_pool_refuses_immediately():
+    """Requests beyond workers + queue fail fast instead of waiting."""
+    release = threading.Event()
+
+    def _blocked_verify(_password: str, _hashed: str) -> bool:
+        release.wait(5)
+        return True
+
+    hashing_pool = PasswordHashingPool(max_workers=1, max_queued=1)
+    try:
+        with patch("server.auth.argon2_pool.argon2_utils.verify_password", _blocked_verify):
+            admitted = [asyncio.create_task(hashing_pool.verify("pw", "hash")) for _ in range(2)]
+            await asyncio.sleep(0)
+            assert hashing_pool.admitted == 2
+
+            started = time.perf_counter()
+            with pytest.raises(PasswordHashingBusyError) as exc_info:
+                await hashing_pool.verify("pw", "hash")
+            assert time.perf_counter() - started < 0.1
+            assert exc_info.value.retry_after == 1
+
+            release.set()
+            assert await asyncio.gather(*admitted) == [True, True]
+        await asyncio.sleep(0)
+        assert hashing_pool.admitted == 0
+    finally:
+        release.set()
+        hashing_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_runs_argon2_utils_hash(pool):
+    """hash() produces a hash argon2_utils can verify."""
+    hashed = await pool.hash("test_password_123")
+
+    assert hashed.startswith("$argon2id$")
+    assert await pool.verify("test_password_123", hashed) is True
+    assert await pool.verify("wrong_password", hashed) is False
+
+
+def test_memory_bounded_workers():
+    """Worker count is bounded by the memory budget and by CPUs, and is at least one."""
+    gib = 1024**3
+    # 64 MiB per hash, a quarter of 4 GiB available: 16 by memory, capped by 8 CPUs
+    assert memory_bounded_workers(65536, available_bytes=4 * gib, cpus=8) == 8
+    # A quarter of 512 MiB fits two 64 MiB hashes
+    assert memory_bounded_workers(65536, available_bytes=gib // 2, cpus=8) == 2
+    assert memory_bounded_workers(65536, available_bytes=0, cpus=8) == 1
+    with patch("server.auth.argon2_pool._available_memory_bytes", return_value=None):
+        assert memory_bounded_workers(65536, cpus=3) == 3
@@ -420,6 +420,45 @@ async def test_login_user_authenticate_raises_exception(mock_request: MagicMock,
         assert exc_info.value.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_login_user_hashing_pool_busy_returns_503(mock_request: MagicMock, mock_session: MagicMock):
+    """Test login when the password hashing pool is full: 503 with Retry-After, not 401."""
+    from server.auth.argon2_pool import PasswordHashingBusyError
+
+    login_request = LoginRequest(username="testuser", password="testpass123")
+    user = User(
+        id=str(uuid.uuid4()),
+        username="testuser",
+        email="test@example.com",
+        hashed_password="hashed",
+        is_active=True,
+        is_superuser=False,
+        is_verified=True,
+    )
+
+    from sqlalchemy.engine import Result
+
+    result_mock = MagicMock(spec=Result)
+    result_mock.scalar_one_or_none = MagicMock(return_value=user)
+    mock_session.execute = AsyncMock(return_value=result_mock)
+
+    mock_user_manager = MagicMock()
+    mock_user_manager.authenticate = AsyncMock(side_effect=PasswordHashingBusyError())
+
+    with patch("server.commands.admin_shutdown_command.is_shutdown_pending", return_value=False):
+        with pytest.raises(LoggedHTTPException) as exc_info:
+            _ = await login_user(
+                request=login_request,
+                http_request=mock_request,
+                user_manager=mock_user_manager,
+                session=mock_session,
+                container=MagicMock(),
+            )
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "1"}
+
+
 @pytest.mark.asyncio
 async def test_login_user_http_exception_re_raised(mock_request: MagicMock, mock_session: MagicMock):
     """Test login when HTTPException is raised (should be re-raised)."""
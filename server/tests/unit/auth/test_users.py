@@ -148,6 +148,137 @@ async def test_user_manager_on_after_request_verify():
     await manager.on_after_request_verify(user, "verify_token")
 
 
+def _credentials(email: str, password: str) -> MagicMock:
+    credentials = MagicMock()
+    credentials.username = email
+    credentials.password = password
+    return credentials
+
+
+@pytest.mark.asyncio
+async def test_user_manager_authenticate_verifies_off_loop():
+    """authenticate() verifies with the hashing pool and returns the user on a match."""
+    from server.auth.argon2_pool import verify_password_async
+    from server.auth.argon2_utils import hash_password
+
+    user_db = MagicMock()
+    user_db.update = AsyncMock()
+    manager = UserManager(user_db)
+    user = User(id=str(uuid.uuid4()), username="testuser", email="test@example.com")
+    user.hashed_password = hash_password("correct_password")
+    manager.get_by_email = AsyncMock(return_value=user)
+
+    with patch("server.auth.users.verify_password_async", wraps=verify_password_async) as verify:
+        assert await manager.authenticate(_credentials("test@example.com", "correct_password")) is user
+        assert await manager.authenticate(_credentials("test@example.com", "wrong_password")) is None
+
+    assert verify.await_count == 2
+    user_db.update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_user_manager_authenticate_upgrades_outdated_hash():
+    """A hash made with outdated Argon2 parameters is replaced after a successful login."""
+    from server.auth.argon2_utils import create_hasher_with_params
+
+    user_db = MagicMock()
+    user_db.update = AsyncMock()
+    manager = UserManager(user_db)
+    user = User(id=str(uuid.uuid4()), username="testuser", email="test@example.com")
+    user.hashed_password = create_hasher_with_params(time_cost=1, memory_cost=8192).hash("correct_password")
+    manager.get_by_email = AsyncMock(return_value=user)
+
+    assert await manager.authenticate(_credentials("test@example.com", "correct_password")) is user
+
+    user_db.update.assert_awaited_once()
+    new_hash = user_db.update.await_args.args[1]["hashed_password"]
+    assert new_hash.startswith("$argon2id$") and new_hash != user.hashed_password
+
+
+@pytest.mark.asyncio
+async def test_user_manager_authenticate_unknown_user_still_hashes():
+    """Unknown emails run the hasher too, so they are not faster to reject."""
+    from fastapi_users import exceptions
+
+    manager = UserManager(MagicMock())
+    manager.get_by_email = AsyncMock(side_effect=exceptions.UserNotExists())
+
+    with patch("server.auth.users.hash_password_async", AsyncMock(return_value="hashed")) as hash_async:
+        assert await manager.authenticate(_credentials("nobody@example.com", "password")) is None
+
+    hash_async.assert_awaited_once_with("password")
+
+
+@pytest.mark.asyncio
+async def test_user_manager_create_hashes_off_loop():
+    """create() (fastapi-users register route) hashes with the hashing pool, not the sync password helper."""
+    from fastapi_users.schemas import BaseUserCreate
+
+    user_db = MagicMock()
+    user_db.get_by_email = AsyncMock(return_value=None)
+    created = User(id=str(uuid.uuid4()), username="testuser", email="test@example.com")
+    user_db.create = AsyncMock(return_value=created)
+    manager = UserManager(user_db)
+    manager.on_after_register = AsyncMock()
+
+    with patch("server.auth.users.hash_password_async", AsyncMock(return_value="pooled-hash")) as hash_async:
+        result = await manager.create(BaseUserCreate(email="test@example.com", password="correct_password"), safe=True)
+
+    assert result is created
+    hash_async.assert_awaited_once_with("correct_password")
+    user_dict = user_db.create.await_args.args[0]
+    assert user_dict["hashed_password"] == "pooled-hash"
+    assert "password" not in user_dict
+    manager.on_after_register.assert_awaited_once_with(created, None)
+
+
+@pytest.mark.asyncio
+async def test_user_manager_create_existing_email_does_not_hash():
+    """A duplicate email is refused before any hash is queued."""
+    from fastapi_users import exceptions
+    from fastapi_users.schemas import BaseUserCreate
+
+    user_db = MagicMock()
+    user_db.get_by_email = AsyncMock(return_value=MagicMock())
+    manager = UserManager(user_db)
+
+    with patch("server.auth.users.hash_password_async", AsyncMock()) as hash_async:
+        with pytest.raises(exceptions.UserAlreadyExists):
+            await manager.create(BaseUserCreate(email="test@example.com", password="correct_password"))
+
+    hash_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_user_manager_update_password_hashes_off_loop():
+    """A password change (PATCH /users/me) is hashed with the hashing pool; other fields pass through."""
+    user_db = MagicMock()
+    user = User(id=str(uuid.uuid4()), username="testuser", email="test@example.com")
+    user_db.update = AsyncMock(return_value=user)
+    manager = UserManager(user_db)
+
+    with patch("server.auth.users.hash_password_async", AsyncMock(return_value="pooled-hash")) as hash_async:
+        await manager._update(user, {"password": "new_password", "is_active": False})  # pylint: disable=protected-access  # Reason: Testing the override fastapi-users calls from update()
+
+    hash_async.assert_awaited_once_with("new_password")
+    assert user_db.update.await_args.args[1] == {"is_active": False, "hashed_password": "pooled-hash"}
+
+
+@pytest.mark.asyncio
+async def test_user_manager_update_without_password_does_not_hash():
+    """Updates that leave the password alone never touch the hashing pool."""
+    user_db = MagicMock()
+    user = User(id=str(uuid.uuid4()), username="testuser", email="test@example.com")
+    user_db.update = AsyncMock(return_value=user)
+    manager = UserManager(user_db)
+
+    with patch("server.auth.users.hash_password_async", AsyncMock()) as hash_async:
+        await manager._update(user, {"is_active": False})  # pylint: disable=protected-access  # Reason: Testing the override fastapi-users calls from update()
+
+    hash_async.assert_not_awaited()
+    assert user_db.update.await_args.args[1] == {"is_active": False}
+
+
 def test_user_manager_parse_id_uuid():
     """Test parsing UUID from UUID object."""
     user_db = MagicMock()
@@ -0,0 +1,254 @@
+"""
+Unit tests for the asyncio-native LRU cache.
+
+Tests AsyncLRUCache expiry buckets, single-flight loading, negative caching
+and the statistics consumed by the cache monitoring endpoint.
+"""
+
+import asyncio
+
+import pytest
+
+from server.caching.async_cache import AsyncLRUCache
+from server.caching.lru_cache import CacheManager
+
+# pylint: disable=redefined-outer-name  # Reason: pytest fixtures are used as function parameters, which triggers this warning
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> _FakeClock:
+    """Create a controllable clock."""
+    return _FakeClock()
+
+
+def test_get_put_and_lru_eviction(clock):
+    """Test that the least recently used entry is evicted at capacity."""
+    cache = AsyncLRUCache[str, int](max_size=2, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_lazy_expiry_on_read(clock):
+    """Test that an expired entry is dropped when read."""
+    cache = AsyncLRUCache[str, int](max_size=10, ttl_seconds=5, clock=clock)
+    cache.put("a", 1)
+    clock.advance(4.9)
+    assert cache.get("a") == 1
+    clock.advance(0.2)
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.get_stats()["expired_count"] == 1
+
+
+def test_expired_buckets_drained_on_write(clock):
+    """Test that writes reclaim expired entries without reading them."""
+    cache = AsyncLRUCache[str, int](max_size=100, ttl_seconds=2, bucket_seconds=1, clock=clock)
+    for i in range(50):
+        cache.put(f"old{i}", i)
+    clock.advance(5)
+    cache.put("fresh", 1)
+
+    stats = cache.get_stats()
+    assert stats["size"] == 1
+    assert stats["expired_count"] == 50
+    assert stats["evictions"] == 0
+
+
+def test_refreshed_entry_survives_old_bucket_drain(clock):
+    """Test that re-putting a key moves it out of its old expiry bucket."""
+    cache = AsyncLRUCache[str, int](max_size=10, ttl_seconds=2, bucket_seconds=1, clock=clock)
+    cache.put("a", 1)
+    clock.advance(1.5)
+    cache.put("a", 2)
+    clock.advance(1.5)
+    cache.put("b", 3)  # Drains the bucket "a" was originally in
+
+    assert cache.get("a") == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_misses(clock):
+    """Test that concurrent misses for one key share a single load."""
+    cache = AsyncLRUCache[str, str](max_size=10, clock=clock)
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    tasks = [asyncio.create_task(cache.get_or_load("k", loader)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == ["value"] * 10
+    assert calls == 1
+    stats = cache.get_stats()
+    assert stats["loads"] == 1
+    assert stats["coalesced_loads"] == 9
+    assert stats["inflight_loads"] == 0
+    assert await cache.get_or_load("k", loader) == "value"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_loader_failure_propagates_and_is_not_cached(clock):
+    """Test that a failing load reaches every waiter and the next call retries."""
+    cache = AsyncLRUCache[str, str](max_size=10, clock=clock)
+    release = asyncio.Event()
+
+    async def failing() -> str:
+        await release.wait()
+        raise RuntimeError("db down")
+
+    tasks = [asyncio.create_task(cache.get_or_load("k", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def working() -> str:
+        return "ok"
+
+    assert await cache.get_or_load("k", working) == "ok"
+    assert cache.get_stats()["load_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_lets_waiter_retry(clock):
+    """Test that cancelling the loading task does not cancel the waiters."""
+    cache = AsyncLRUCache[str, str](max_size=10, clock=clock)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow() -> str:
+        started.set()
+        await release.wait()
+        return "value"
+
+    leader = asyncio.create_task(cache.get_or_load("k", slow))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_load("k", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await waiter == "value"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_load_racing_delete_is_returned_but_not_stored(clock):
+    """Test that a delete during a load detaches it, so the stale result is not cached."""
+    cache = AsyncLRUCache[str, str](max_size=10, clock=clock)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow() -> str:
+        started.set()
+        await release.wait()
+        return "stale"
+
+    load = asyncio.create_task(cache.get_or_load("k", slow))
+    await started.wait()
+    cache.delete("k")
+    release.set()
+
+    assert await load == "stale"
+    assert "k" not in cache
+
+    async def fresh() -> str:
+        return "fresh"
+
+    assert await cache.get_or_load("k", fresh) == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_negative_caching(clock):
+    """Test that a None result is cached for the negative TTL only."""
+    cache = AsyncLRUCache[str, str](max_size=10, ttl_seconds=60, negative_ttl_seconds=1, clock=clock)
+    calls = 0
+
+    async def missing() -> str | None:
+        nonlocal calls
+        calls += 1
+        return None
+
+    assert await cache.get_or_load("ghost", missing) is None
+    assert await cache.get_or_load("ghost", missing) is None
+    assert calls == 1
+    assert cache.get_stats()["negative_hits"] == 1
+
+    clock.advance(1.1)
+    assert await cache.get_or_load("ghost", missing) is None
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_negative_caching_disabled_by_default(clock):
+    """Test that None results are not cached unless a negative TTL is set."""
+    cache = AsyncLRUCache[str, str](max_size=10, clock=clock)
+    calls = 0
+
+    async def missing() -> str | None:
+        nonlocal calls
+        calls += 1
+        return None
+
+    await cache.get_or_load("ghost", missing)
+    await cache.get_or_load("ghost", missing)
+    assert calls == 2
+    assert len(cache) == 0
+
+
+def test_stats_have_lru_cache_keys(clock):
+    """Test that stats expose the keys the monitoring endpoint reads."""
+    cache = AsyncLRUCache[str, int](max_size=4, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.get_stats()
+    for key in ("size", "max_size", "hit_rate", "expired_count", "expiration_rate", "capacity_utilization"):
+        assert key in stats
+    assert stats["hit_rate"] == 0.5
+    assert stats["capacity_utilization"] == 0.25
+
+
+def test_cache_manager_reports_async_caches():
+    """Test that async caches are created, listed and reported by CacheManager."""
+    manager = CacheManager()
+    cache = manager.create_async_cache("sessions", max_size=10, ttl_seconds=30)
+
+    assert manager.get_async_cache("sessions") is cache
+    assert manager.get_cache("sessions") is None
+    assert "sessions" in manager.get_cache_names()
+    assert "loads" in manager.get_all_stats()["sessions"]
+    with pytest.raises(ValueError):
+        manager.create_cache("sessions")
+    assert manager.delete_cache("sessions") is True
+    assert manager.get_async_cache("sessions") is None
@@ -0,0 +1,162 @@
+"""Unit tests for event-driven cache invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from server.caching.cache_invalidation import (
+    CACHE_INVALIDATION_SERVICE_ID,
+    CacheInvalidationListener,
+    publish_cache_invalidation,
+)
+from server.caching.cache_service import NPCCacheService, RoomCacheService
+from server.caching.lru_cache import reset_cache_manager
+from server.events.event_bus import EventBus
+from server.events.event_serialization import deserialize_event, serialize_event
+from server.events.event_types import (
+    NPCDefinitionsChanged,
+    NPCSpawnRulesChanged,
+    RoomDefinitionChanged,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache_manager() -> None:
+    reset_cache_manager()
+    yield
+    reset_cache_manager()
+
+
+def _listener(**caches: MagicMock) -> tuple[CacheInvalidationListener, dict[type, object]]:
+    bus = MagicMock()
+    handlers: dict[type, object] = {}
+    bus.subscribe.side_effect = lambda event_type, handler, service_id=None: handlers.__setitem__(event_type, handler)
+    listener = CacheInvalidationListener(bus, **caches)
+    listener.start()
+    return listener, handlers
+
+
+def test_start_subscribes_each_event_type_once() -> None:
+    listener, handlers = _listener()
+    listener.start()
+    assert set(handlers) == {RoomDefinitionChanged, NPCDefinitionsChanged, NPCSpawnRulesChanged}
+    assert listener._event_bus.subscribe.call_count == 3  # pylint: disable=protected-access
+
+
+def test_stop_unsubscribes_by_service_id() -> None:
+    listener, _handlers = _listener()
+    listener.stop()
+    listener._event_bus.unsubscribe_all_for_service.assert_called_once_with(CACHE_INVALIDATION_SERVICE_ID)  # pylint: disable=protected-access
+
+
+def test_room_event_invalidates_room_and_sync_caches() -> None:
+    room_cache = MagicMock()
+    room_data_cache = MagicMock()
+    listener, handlers = _listener(room_cache=room_cache, room_data_cache=room_data_cache)
+
+    handlers[RoomDefinitionChanged](RoomDefinitionChanged(room_id="r1"))
+    room_cache.invalidate_room.assert_called_once_with("r1")
+    room_data_cache.clear_cache.assert_called_once_with("r1")
+
+    handlers[RoomDefinitionChanged](RoomDefinitionChanged())
+    room_cache.invalidate_all_rooms.assert_called_once()
+    assert listener.get_stats() == {"RoomDefinitionChanged": 2}
+
+
+def test_npc_events_invalidate_npc_cache() -> None:
+    npc_cache = MagicMock()
+    _listener_obj, handlers = _listener(npc_cache=npc_cache)
+
+    handlers[NPCDefinitionsChanged](NPCDefinitionsChanged(definition_id=3))
+    handlers[NPCSpawnRulesChanged](NPCSpawnRulesChanged(rule_id=4))
+
+    npc_cache.invalidate_npc_definitions.assert_called_once()
+    npc_cache.invalidate_spawn_rules.assert_called_once()
+
+
+def test_npc_cache_attached_after_start() -> None:
+    listener, handlers = _listener()
+    handlers[NPCDefinitionsChanged](NPCDefinitionsChanged(definition_id=3))
+
+    npc_cache = MagicMock()
+    listener.set_npc_cache(npc_cache)
+    handlers[NPCDefinitionsChanged](NPCDefinitionsChanged(definition_id=3))
+
+    npc_cache.invalidate_npc_definitions.assert_called_once()
+
+
+def test_publish_cache_invalidation_without_bus() -> None:
+    assert publish_cache_invalidation(None, NPCSpawnRulesChanged()) is False
+    bus = MagicMock()
+    assert publish_cache_invalidation(bus, NPCSpawnRulesChanged()) is True
+    bus.publish.assert_called_once()
+
+
+def test_invalidation_events_round_trip_for_nats() -> None:
+    event = NPCDefinitionsChanged(definition_id=7)
+    restored = deserialize_event(serialize_event(event))
+    assert isinstance(restored, NPCDefinitionsChanged)
+    assert restored.definition_id == 7
+
+
+@pytest.mark.asyncio
+async def test_event_bus_delivers_invalidation_to_room_cache() -> None:
+    persistence = MagicMock()
+    room_cache = RoomCacheService(persistence)
+    room_cache.rooms_cache.put("r1", {"id": "r1"})
+    bus = EventBus()
+    try:
+        CacheInvalidationListener(bus, room_cache=room_cache).start()
+        bus.publish(RoomDefinitionChanged(room_id="r1"))
+        for _ in range(50):
+            if "r1" not in room_cache.rooms_cache:
+                break
+            await asyncio.sleep(0.01)
+        assert "r1" not in room_cache.rooms_cache
+    finally:
+        await bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_room_load_started_before_invalidation_is_not_cached() -> None:
+    release = asyncio.Event()
+
+    async def slow_get_room(_room_id: str) -> dict[str, str]:
+        await release.wait()
+        return {"id": "r1", "name": "Old Name"}
+
+    persistence = MagicMock()
+    persistence.async_get_room = slow_get_room
+    room_cache = RoomCacheService(persistence)
+
+    load = asyncio.create_task(room_cache.get_room("r1"))
+    await asyncio.sleep(0)
+    room_cache.invalidate_room("r1")
+    release.set()
+
+    assert (await load) == {"id": "r1", "name": "Old Name"}
+    assert "r1" not in room_cache.rooms_cache
+
+
+@pytest.mark.asyncio
+async def test_npc_definitions_load_racing_invalidation_is_not_cached() -> None:
+    release = asyncio.Event()
+    npc_service = MagicMock()
+
+    async def slow_definitions(_session: object) -> list[object]:
+        await release.wait()
+        return [MagicMock(id=1)]
+
+    npc_service.get_npc_definitions = slow_definitions
+    npc_cache = NPCCacheService(npc_service)
+
+    load = asyncio.create_task(npc_cache.get_npc_definitions(MagicMock()))
+    await asyncio.sleep(0)
+    npc_cache.invalidate_npc_definitions()
+    release.set()
+    await load
+
+    assert npc_cache.definitions_cache.size() == 0
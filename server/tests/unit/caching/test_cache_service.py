@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from server.caching.async_cache import AsyncLRUCache
 from server.caching.cache_service import (
     CacheService,
     NPCCacheService,
     ProfessionCacheService,
     RoomCacheService,
     cached,
+    make_cache_key,
 )
 from server.caching.lru_cache import get_cache_manager, reset_cache_manager
 
@@ -119,6 +122,61 @@ class TestCachedDecorator:
         assert fetch(object(), 3) == 6
         assert call_count == 1
 
+    def test_empty_cache_is_still_used(self) -> None:
+        call_count = 0
+
+        @cached("players")
+        def fetch(value: str) -> str:
+            nonlocal call_count
+            call_count += 1
+            return value
+
+        assert fetch("a") == "a"
+        assert fetch("a") == "a"
+        assert call_count == 1
+
+    def test_make_cache_key_structured_and_unhashable_fallback(self) -> None:
+        def fetch(*_args: Any, **_kwargs: Any) -> None:
+            return None
+
+        assert make_cache_key(fetch, (1, "a"), {"b": 2}) == make_cache_key(fetch, (1, "a"), {"b": 2})
+        assert make_cache_key(fetch, (1,), {}) != make_cache_key(fetch, ("1",), {})
+        assert isinstance(make_cache_key(fetch, ([1, 2],), {}), str)
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_misses_call_function_once(self) -> None:
+        call_count = 0
+        release = asyncio.Event()
+
+        @cached("players")
+        async def fetch(value: str) -> str:
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            return value
+
+        tasks = [asyncio.create_task(fetch("x")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        assert await asyncio.gather(*tasks) == ["x"] * 5
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_prefers_registered_async_cache(self) -> None:
+        async_cache = get_cache_manager().create_async_cache("lookups", max_size=10, negative_ttl_seconds=30)
+        call_count = 0
+
+        @cached("lookups")
+        async def fetch(value: str) -> str | None:
+            nonlocal call_count
+            call_count += 1
+            return None
+
+        assert await fetch("missing") is None
+        assert await fetch("missing") is None
+        assert call_count == 1
+        assert async_cache.get_stats()["negative_hits"] == 1
+
 
 class TestRoomCacheService:
     @pytest.fixture
@@ -130,24 +188,53 @@ class TestRoomCacheService:
 
     def test_init_uses_existing_rooms_cache(self, persistence: MagicMock) -> None:
         service = RoomCacheService(persistence)
-        assert service.rooms_cache is get_cache_manager().get_cache("rooms")
+        assert isinstance(service.rooms_cache, AsyncLRUCache)
+        assert service.rooms_cache is get_cache_manager().get_async_cache("rooms")
 
     def test_init_lazy_creates_rooms_cache(self, persistence: MagicMock) -> None:
         manager = get_cache_manager()
         manager.delete_cache("rooms")
         service = RoomCacheService(persistence)
-        assert service.rooms_cache is manager.get_cache("rooms")
+        assert service.rooms_cache is manager.get_async_cache("rooms")
 
     def test_init_concurrent_create_uses_existing(self, persistence: MagicMock) -> None:
         manager = get_cache_manager()
         manager.delete_cache("rooms")
-        existing = manager.create_cache("rooms", max_size=100)
+        existing = manager.create_async_cache("rooms", max_size=100)
 
-        with patch.object(manager, "create_cache", side_effect=ValueError("exists")):
-            service = RoomCacheService(persistence)
+        with patch.object(manager, "get_async_cache", side_effect=[None, existing]):
+            with patch.object(manager, "create_async_cache", side_effect=ValueError("exists")):
+                service = RoomCacheService(persistence)
 
         assert service.rooms_cache is existing
 
+    def test_init_rejects_regular_rooms_cache(self, persistence: MagicMock) -> None:
+        manager = get_cache_manager()
+        manager.delete_cache("rooms")
+        manager.create_cache("rooms", max_size=100)
+
+        with pytest.raises(RuntimeError, match="not an async cache"):
+            RoomCacheService(persistence)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_room_misses_share_one_load(self, persistence: MagicMock) -> None:
+        release = asyncio.Event()
+
+        async def _slow_get_room(room_id: str) -> _RoomObj:
+            await release.wait()
+            return _RoomObj(room_id, "Library")
+
+        persistence.async_get_room = AsyncMock(side_effect=_slow_get_room)
+        service = RoomCacheService(persistence)
+
+        lookups = [asyncio.create_task(service.get_room("room_1")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*lookups)
+
+        assert results == [{"id": "room_1", "name": "Library"}] * 5
+        persistence.async_get_room.assert_awaited_once_with("room_1")
+
     @pytest.mark.asyncio
     async def test_get_room_cache_hit(self, persistence: MagicMock) -> None:
         service = RoomCacheService(persistence)
@@ -260,6 +347,14 @@ class TestNPCCacheService:
         assert rules is cached_rules
         npc_service.get_spawn_rules.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_definition_misses_share_one_load(self, npc_service: MagicMock) -> None:
+        service = NPCCacheService(npc_service)
+        session = MagicMock()
+        results = await asyncio.gather(*(service.get_npc_definitions(session) for _ in range(3)))
+        assert results[0] is results[1] is results[2]
+        npc_service.get_npc_definitions.assert_awaited_once()
+
     def test_invalidate_caches(self, npc_service: MagicMock) -> None:
         service = NPCCacheService(npc_service)
         service.definitions_cache.put("all_definitions", [_NpcDef(1, "x")])
@@ -444,5 +444,5 @@ async def test_handle_get_command_room_quantity_string_coerces_without_type_erro
                         )
 
     assert result == {"result": "ok"}
-    room_manager.take_room_drop.assert_called_once_with("room_001", 0, 1)
+    room_manager.take_room_drop.assert_called_once_with("room_001", 0, 1, expected={"item_name": "coin", "quantity": 5})
     complete_pickup.assert_awaited_once()
@@ -48,7 +48,7 @@ async def test_handle_pickup_command():
     assert "result" in result
     rt = command_result_text(result)
     assert "picks up" in rt or "pick up" in rt
-    w.take_room_drop.assert_called_once_with("room_001", 0, 1)
+    w.take_room_drop.assert_called_once_with("room_001", 0, 1, expected=stack)
     w.set_inventory.assert_called_once()
     inv_after = cast(object, w.set_inventory.call_args[0][0])
     assert inventory_has_named_item(inv_after, "sword"), "Pickup should merge the floor stack into player inventory"
@@ -66,7 +66,7 @@ async def test_handle_pickup_command_persist_failure_restores_drop_and_inventory
     result = await _pickup_with_persist_patch(w, {"index": 1}, mock_persist)
 
     assert result == persist_error
-    w.take_room_drop.assert_called_once_with("room_001", 0, 1)
+    w.take_room_drop.assert_called_once_with("room_001", 0, 1, expected=stack)
     w.add_room_drop.assert_called_once()
     raw_drop = cast(tuple[object, object], tuple(w.add_room_drop.call_args[0]))
     drop_room_id: object = raw_drop[0]
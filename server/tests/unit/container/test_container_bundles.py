@@ -117,6 +117,16 @@ def test_game_bundle_initialize_caching_services_failure() -> None:
     assert bundle.room_cache_service is None
 
 
+def test_game_bundle_initialize_caching_services_starts_invalidation_listener() -> None:
+    bundle = GameBundle()
+    event_bus = MagicMock()
+    with patch("server.caching.cache_service.RoomCacheService", return_value=MagicMock()):
+        with patch("server.caching.cache_service.ProfessionCacheService", return_value=MagicMock()):
+            bundle._initialize_caching_services(MagicMock(), event_bus)
+    assert bundle.cache_invalidation_listener is not None
+    assert event_bus.subscribe.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_game_bundle_init_emote_service_loads_once() -> None:
     """#624: GameBundle constructs EmoteRepository/EmoteService and loads once at init time,
@@ -350,6 +360,10 @@ async def test_npc_bundle_initialize_success() -> None:
     assert bundle.npc_lifecycle_manager is lifecycle
     assert bundle.npc_spawning_service is spawn_instance
     assert bundle.npc_population_controller is pop_instance
+    pop_instance.load_npc_definitions.assert_called_once_with([])
+    pop_instance.load_spawn_rules.assert_called_once_with([])
+    # Admin edits published as invalidation events reload the controller's definitions
+    container.cache_invalidation_listener.set_npc_cache.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -443,9 +457,11 @@ async def test_realtime_bundle_shutdown() -> None:
     bundle = RealtimeBundle()
     bundle.nats_message_handler = AsyncMock()
     bundle.nats_service = AsyncMock()
+    bundle.real_time_event_handler = MagicMock()
     await bundle.shutdown(MagicMock())
     bundle.nats_message_handler.stop.assert_awaited_once()
     bundle.nats_service.disconnect.assert_awaited_once()
+    bundle.real_time_event_handler.shutdown.assert_called_once()
 
 
 def test_realtime_bundle_setup_nats_dependent_services_with_nats() -> None:
@@ -524,7 +540,7 @@ async def test_realtime_bundle_connect_nats_success() -> None:
     with patch("server.services.nats_service.NATSService", return_value=nats_service):
         result = await bundle._connect_nats(config, event_bus)
     assert result is nats_service
-    event_bus.set_nats_service.assert_called_once_with(nats_service)
+    event_bus.set_nats_service.assert_called_once_with(nats_service, zones=config.nats.domain_event_zones)
 
 
 async def test_combat_bundle_sanitarium_failover_callback() -> None:
@@ -630,7 +646,9 @@ async def test_game_bundle_initialize_wiring() -> None:
                                     with patch("server.time.tick_scheduler.MythosTickScheduler"):
                                         with patch("server.game.player_service.PlayerService"):
                                             with patch("server.game.room_service.RoomService"):
-                                                with patch("server.services.user_manager.UserManager"):
+                                                with patch(
+                                                    "server.services.user_manager.user_manager"
+                                                ) as shared_user_manager:
                                                     with patch("server.services.container_service.ContainerService"):
                                                         with patch("server.game.skill_service.SkillService"):
                                                             with patch("server.game.level_service.LevelService"):
@@ -652,3 +670,5 @@ async def test_game_bundle_initialize_wiring() -> None:
                                                                                 ):
                                                                                     await bundle.initialize(container)
     assert bundle.player_service is not None
+    # Chat, websocket and NATS code import the module-level manager; the container must hand out the same one
+    assert bundle.user_manager is shared_user_manager
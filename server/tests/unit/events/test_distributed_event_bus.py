@@ -48,18 +48,16 @@ async def test_publish_without_nats_delegates_to_parent(distributed_bus: Distrib
 
 @pytest.mark.asyncio
 async def test_publish_with_nats_bridge_publishes_to_nats() -> None:
-    """When bridge is active, publish also sends to NATS."""
+    """When bridge is active, publish also queues the event for the bridge's writer."""
     nats = MagicMock()
     bus = DistributedEventBus()
     mock_bridge = MagicMock()
-    mock_bridge.publish = AsyncMock()
     bus._nats_bridge = mock_bridge  # pylint: disable=protected-access
     bus._nats_service = nats  # pylint: disable=protected-access
 
     event = SampleEvent()
     bus.publish(event)
-    await asyncio.sleep(0.05)
-    mock_bridge.publish.assert_awaited_once_with(event)
+    mock_bridge.enqueue.assert_called_once_with(event)
 
 
 @pytest.mark.asyncio
@@ -19,7 +19,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from server.events.event_bus import EventBus
-from server.events.event_types import BaseEvent
+from server.events.event_bus_lanes import default_lane_key
+from server.events.event_types import BaseEvent, NPCDefinitionsChanged, PlayerEnteredRoom, RoomDefinitionChanged
 
 
 class MockEventClass(BaseEvent):
@@ -748,12 +749,13 @@ async def test_signal_shutdown_and_cancel_helpers(event_bus: EventBus) -> None:
 
 
 @pytest.mark.asyncio
-async def test_publish_queue_full_raises(event_bus: EventBus) -> None:
+async def test_publish_queue_full_drops_and_counts(event_bus: EventBus) -> None:
     event_bus._running = True
     event_bus._event_queue = asyncio.Queue(maxsize=1)
     event_bus._event_queue.put_nowait(MockEventClass())
-    with pytest.raises(RuntimeError, match="overloaded"):
-        event_bus.publish(MockEventClass())
+    event_bus.publish(MockEventClass())
+    assert event_bus._event_queue.qsize() == 1
+    assert event_bus.get_dispatch_stats()["overloaded_events"] == 1
 
 
 @pytest.mark.asyncio
@@ -762,8 +764,8 @@ async def test_inject_queue_full_and_invalid(event_bus: EventBus) -> None:
         event_bus.inject(cast(BaseEvent, object()))
     event_bus._event_queue = asyncio.Queue(maxsize=1)
     event_bus._event_queue.put_nowait(MockEventClass())
-    with pytest.raises(RuntimeError, match="overloaded"):
-        event_bus.inject(MockEventClass())
+    event_bus.inject(MockEventClass())
+    assert event_bus.get_dispatch_stats()["overloaded_events"] == 1
 
 
 @pytest.mark.asyncio
@@ -800,7 +802,7 @@ async def test_ensure_async_processing_no_loop_logs(event_bus: EventBus) -> None
 
 @pytest.mark.asyncio
 async def test_queue_depth_grows_when_consumer_blocked(event_bus: EventBus) -> None:
-    """A blocked subscriber stalls the sole consumer, so the unbounded queue grows."""
+    """A blocked subscriber stalls its dispatch lane, so that lane's backlog grows."""
     gate = asyncio.Event()
 
     async def blocker(_event: BaseEvent) -> None:
@@ -816,3 +818,169 @@ async def test_queue_depth_grows_when_consumer_blocked(event_bus: EventBus) -> N
     assert event_bus.get_queue_depth() >= 10
     _ = gate.set()
     await event_bus.shutdown()
+
+
+def test_default_lane_key_prefers_entity_ids() -> None:
+    """Events are laned by player, then NPC, then room, then event type."""
+    assert default_lane_key(PlayerEnteredRoom(player_id="p1", room_id="r1")) == ("player_id", "p1")
+    assert default_lane_key(RoomDefinitionChanged(room_id="r1")) == ("room_id", "r1")
+    assert default_lane_key(RoomDefinitionChanged()) is RoomDefinitionChanged
+    assert default_lane_key(NPCDefinitionsChanged(definition_id=1)) is NPCDefinitionsChanged
+
+
+@pytest.mark.asyncio
+async def test_slow_lane_does_not_block_other_lanes(event_bus: EventBus) -> None:
+    """A blocked subscriber only holds up events that share its lane."""
+    gate = asyncio.Event()
+    handled: list[str | None] = []
+
+    async def room_handler(event: RoomDefinitionChanged) -> None:
+        if event.room_id == "slow":
+            _ = await gate.wait()
+        handled.append(event.room_id)
+
+    event_bus.subscribe(RoomDefinitionChanged, room_handler)
+    event_bus._ensure_async_processing()
+    event_bus.publish(RoomDefinitionChanged(room_id="slow"))
+    event_bus.publish(RoomDefinitionChanged(room_id="fast"))
+    await asyncio.sleep(0.05)
+    assert handled == ["fast"]
+
+    _ = gate.set()
+    await asyncio.sleep(0.05)
+    assert handled == ["fast", "slow"]
+    await event_bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_events_in_one_lane_keep_publish_order(event_bus: EventBus) -> None:
+    """Events for the same key are handled strictly in order, even with async delays."""
+    handled: list[int] = []
+
+    async def handler(event: PlayerEnteredRoom) -> None:
+        await asyncio.sleep(0.001 * (5 - int(event.room_id)))
+        handled.append(int(event.room_id))
+
+    event_bus.subscribe(PlayerEnteredRoom, handler)
+    event_bus._ensure_async_processing()
+    for i in range(5):
+        event_bus.publish(PlayerEnteredRoom(player_id="p1", room_id=str(i)))
+    for _ in range(300):
+        if len(handled) == 5:
+            break
+        await asyncio.sleep(0.01)
+    assert handled == [0, 1, 2, 3, 4]
+    assert event_bus.get_dispatch_stats()["active_lanes"] == 0
+    await event_bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_subscribers_classified_on_subscribe_not_per_event(event_bus: EventBus) -> None:
+    """Dispatch uses the pre-built table instead of inspecting handlers per event."""
+    calls: list[str] = []
+
+    def sync_handler(_event: BaseEvent) -> None:
+        calls.append("sync")
+
+    async def async_handler(_event: BaseEvent) -> None:
+        calls.append("async")
+
+    event_bus.subscribe(MockEventClass, sync_handler)
+    event_bus.subscribe(MockEventClass, async_handler)
+    async_entries, sync_entries = event_bus._subscriber_tables[MockEventClass]
+    assert [handler for handler, _name in async_entries] == [async_handler]
+    assert [handler for handler, _name in sync_entries] == [sync_handler]
+
+    with patch("server.events.event_bus_processing.inspect.iscoroutinefunction") as classify:
+        for _ in range(3):
+            await event_bus._handle_event_async(MockEventClass())
+        classify.assert_not_called()
+    await asyncio.sleep(0)
+    assert calls.count("sync") == 3
+    assert calls.count("async") == 3
+
+    _ = event_bus.unsubscribe(MockEventClass, async_handler)
+    assert event_bus._subscriber_tables[MockEventClass][0] == ()
+    _ = event_bus.unsubscribe(MockEventClass, sync_handler)
+    assert MockEventClass not in event_bus._subscriber_tables
+
+
+@pytest.mark.asyncio
+async def test_per_subscriber_latency_is_recorded(event_bus: EventBus) -> None:
+    """Each subscriber gets call, error and latency totals."""
+
+    async def slow(_event: BaseEvent) -> None:
+        await asyncio.sleep(0.01)
+
+    def failing(_event: BaseEvent) -> None:
+        raise RuntimeError("boom")
+
+    event_bus.subscribe(MockEventClass, slow)
+    event_bus.subscribe(MockEventClass, failing)
+    await event_bus._handle_event_async(MockEventClass())
+    await asyncio.sleep(0)
+
+    latency = event_bus.get_dispatch_stats()["subscriber_latency"]
+    slow_name = next(name for name in latency if name.endswith("slow"))
+    failing_name = next(name for name in latency if name.endswith("failing"))
+    assert latency[slow_name]["calls"] == 1
+    assert latency[slow_name]["max_ms"] >= 5
+    assert latency[failing_name]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_reports_high_watermark_and_overload() -> None:
+    """A full intake queue drops further publishes and the metrics record the pressure."""
+    bus = EventBus(max_queue_size=4)
+    bus._running = True  # Queue events without starting the consumer
+    for _ in range(5):
+        bus.publish(MockEventClass())
+
+    stats = bus.get_dispatch_stats()
+    assert stats["queue_depth"] == 4
+    assert stats["queue_high_watermark"] == 4
+    assert stats["backpressure_warnings"] == 1
+    assert stats["overloaded_events"] == 1
+    bus._running = False
+
+
+@pytest.mark.asyncio
+async def test_full_lane_drops_its_events_without_blocking_other_lanes() -> None:
+    """A stalled lane caps its own backlog; events for other lanes keep being dispatched."""
+    bus = EventBus(max_queue_size=100, max_lane_backlog=2)
+    gate = asyncio.Event()
+    handled: list[str] = []
+
+    async def handler(event: PlayerEnteredRoom) -> None:
+        if event.player_id == "slow":
+            _ = await gate.wait()
+        handled.append(event.player_id)
+
+    bus.subscribe(PlayerEnteredRoom, handler)
+    bus._ensure_async_processing()
+    # One slow event in flight, two waiting in its lane, the rest dropped
+    bus.publish(PlayerEnteredRoom(player_id="slow", room_id="0"))
+    await asyncio.sleep(0.01)
+    for i in range(5):
+        bus.publish(PlayerEnteredRoom(player_id="slow", room_id=str(i + 1)))
+    await asyncio.sleep(0.01)
+    bus.publish(PlayerEnteredRoom(player_id="fast", room_id="r1"))
+    await asyncio.sleep(0.01)
+
+    assert handled == ["fast"]
+    stats = bus.get_dispatch_stats()
+    assert stats["lane_backlog"] == 2
+    assert stats["lane_overflow_events"] == 3
+    assert stats["intake_depth"] == 0
+
+    _ = gate.set()
+    await asyncio.sleep(0.05)
+    assert handled.count("slow") == 3
+    assert bus.get_queue_depth() == 0
+    await bus.shutdown()
+
+
+def test_max_queue_size_must_be_positive() -> None:
+    """A non-positive capacity is rejected."""
+    with pytest.raises(ValueError):
+        _ = EventBus(max_queue_size=0)
@@ -0,0 +1,80 @@
+"""Tests for per-event-type distribution policies of the distributed EventBus."""
+
+from server.events.event_distribution import (
+    DistributionPolicy,
+    EventDistributionRegistry,
+    default_event_distribution,
+    subscription_subjects,
+)
+from server.events.event_serialization import _EVENT_CLASS_REGISTRY, _register_event_types
+from server.events.event_types import (
+    BaseEvent,
+    MythosHourTickEvent,
+    NPCEnteredRoom,
+    NPCLeftRoom,
+    NPCSpoke,
+    PartyUpdated,
+    PlayerEnteredRoom,
+    PlayerLeftRoom,
+    QuestCompleted,
+    RoomOccupantsRefreshRequested,
+)
+
+
+def test_unregistered_types_stay_local() -> None:
+    """The registry is an allowlist: nothing leaves the instance unless registered."""
+    registry = EventDistributionRegistry()
+
+    assert registry.policy_for(QuestCompleted) is DistributionPolicy.LOCAL_ONLY
+    assert registry.subject_for(QuestCompleted(player_id="p1", quest_id="q1")) is None
+
+
+def test_zone_policy_reads_the_configured_room_field_and_falls_back_to_broadcast() -> None:
+    """A zone event shards on its room's zone; without a parseable room it is broadcast."""
+    registry = EventDistributionRegistry()
+    registry.register(NPCSpoke, DistributionPolicy.ZONE)
+
+    spoke = NPCSpoke(npc_id="n1", room_id="earth_innsmouth_docks_pier_001", message="Ia!")
+    assert registry.subject_for(spoke) == "events.domain.NPCSpoke.innsmouth"
+    assert registry.subject_for(NPCSpoke(npc_id="n1", room_id="limbo", message="...")) == "events.domain.NPCSpoke"
+
+
+def test_register_replaces_an_earlier_policy() -> None:
+    """Registering a class again changes its policy."""
+    registry = EventDistributionRegistry()
+    registry.register(PartyUpdated, DistributionPolicy.BROADCAST)
+    registry.register(PartyUpdated, DistributionPolicy.LOCAL_ONLY)
+
+    assert registry.subject_for(PartyUpdated(party_id="x", leader_id="p1")) is None
+
+
+def test_default_registry_keeps_tick_and_room_occupancy_local() -> None:
+    """The tick, occupant refreshes and room occupancy stay on the instance; every other EventBus event is distributed."""
+    registry = default_event_distribution()
+    _register_event_types()
+    local = {
+        cls for cls in set(_EVENT_CLASS_REGISTRY.values()) if registry.policy_for(cls) is DistributionPolicy.LOCAL_ONLY
+    }
+
+    # Combat events go straight to NATS through CombatEventPublisher, never through the EventBus bridge
+    local_bus_events = {
+        cls for cls in local if cls.__module__ != "server.events.combat_events" and cls is not BaseEvent
+    }
+    assert local_bus_events == {
+        MythosHourTickEvent,
+        RoomOccupantsRefreshRequested,
+        PlayerEnteredRoom,
+        PlayerLeftRoom,
+        NPCEnteredRoom,
+        NPCLeftRoom,
+    }
+
+
+def test_subscription_subjects() -> None:
+    """No zones means everything; hosted zones mean broadcasts plus those zones' shards."""
+    assert subscription_subjects(None) == ["events.domain.>"]
+    assert subscription_subjects(["innsmouth", "arkhamcity", "innsmouth"]) == [
+        "events.domain.*",
+        "events.domain.*.arkhamcity",
+        "events.domain.*.innsmouth",
+    ]
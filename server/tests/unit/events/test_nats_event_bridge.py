@@ -1,11 +1,27 @@
-"""Tests for NATS EventBus bridge - skip self-echo to prevent duplicate event processing."""
+"""Tests for NATS EventBus bridge - subject routing, batching and skipping self-echo to prevent duplicate event processing."""
 
-from unittest.mock import AsyncMock, MagicMock
+# pylint: disable=protected-access  # Reason: Tests count writer task runs
+
+import json
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
 
 import pytest
 
-from server.events.event_types import NPCEnteredRoom
-from server.events.nats_event_bridge import NATSEventBusBridge
+from server.events.event_types import (
+    BaseEvent,
+    MythosHourTickEvent,
+    NPCDied,
+    NPCSpawnRulesChanged,
+    ObjectAddedToRoom,
+    PlayerDPUpdated,
+    PlayerRespawnedEvent,
+    RoomDefinitionChanged,
+    RoomOccupantsRefreshRequested,
+)
+from server.events.nats_event_bridge import ORIGIN_HEADER, WRITER_BATCH_SIZE, NATSEventBusBridge
 
 
 @pytest.mark.asyncio
@@ -23,11 +39,11 @@ async def test_handle_nats_message_skips_own_origin():
     bridge = NATSEventBusBridge(event_bus=mock_bus, nats_service=mock_nats, instance_id=instance_id)
 
     message_data = {
-        "_event_type": "NPCEnteredRoom",
+        "_event_type": "NPCDied",
         "_origin_instance_id": instance_id,
         "npc_id": "npc_001",
         "room_id": "room_001",
-        "from_room_id": None,
+        "cause": "unknown",
     }
     await bridge.handle_nats_message(message_data)
 
@@ -48,32 +64,214 @@ async def test_handle_nats_message_injects_remote_origin():
     bridge = NATSEventBusBridge(event_bus=mock_bus, nats_service=mock_nats, instance_id="local-instance")
 
     message_data = {
-        "_event_type": "NPCEnteredRoom",
+        "_event_type": "NPCDied",
         "_origin_instance_id": "remote-instance-456",
         "npc_id": "npc_001",
         "room_id": "room_001",
-        "from_room_id": None,
+        "cause": "unknown",
     }
     await bridge.handle_nats_message(message_data)
 
     assert len(inject_called) == 1
-    assert isinstance(inject_called[0], NPCEnteredRoom)
+    assert isinstance(inject_called[0], NPCDied)
     assert inject_called[0].npc_id == "npc_001"
 
 
+class FakeNATSService:
+    """In-memory NATS: delivers every published message to every matching subscription, publisher included."""
+
+    def __init__(self) -> None:
+        self.published: list[tuple[str, bytes, dict[str, str] | None]] = []
+        self.batches: list[int] = []
+        self._subscriptions: list[tuple[str, Callable[[bytes, Mapping[str, str] | None], Awaitable[None]]]] = []
+
+    @staticmethod
+    def matches(pattern: str, subject: str) -> bool:
+        """NATS wildcard match: '*' is one token, a trailing '>' is one or more."""
+        pattern_tokens, subject_tokens = pattern.split("."), subject.split(".")
+        for i, token in enumerate(pattern_tokens):
+            if token == ">":
+                return len(subject_tokens) > i
+            if i >= len(subject_tokens) or token not in ("*", subject_tokens[i]):
+                return False
+        return len(pattern_tokens) == len(subject_tokens)
+
+    async def subscribe_encoded(
+        self, subject: str, callback: Callable[[bytes, Mapping[str, str] | None], Awaitable[None]]
+    ) -> None:
+        """Register callback for subject (wildcards allowed)."""
+        self._subscriptions.append((subject, callback))
+
+    async def publish_encoded_batch(
+        self, messages: list[tuple[str, bytes]], headers: Mapping[str, str] | None = None
+    ) -> None:
+        """Record the batch and deliver each message to matching subscriptions."""
+        self.batches.append(len(messages))
+        for subject, payload in messages:
+            self.published.append((subject, payload, dict(headers) if headers else None))
+            for pattern, callback in list(self._subscriptions):
+                if self.matches(pattern, subject):
+                    await callback(payload, headers)
+
+    def subjects(self) -> list[str]:
+        """Subjects published so far, in order."""
+        return [subject for subject, _, _ in self.published]
+
+
+class RecordingBus:  # pylint: disable=too-few-public-methods  # Reason: Stand-in only needs inject
+    """Local EventBus stand-in recording injected events."""
+
+    def __init__(self) -> None:
+        self.injected: list[BaseEvent] = []
+
+    def inject(self, event: BaseEvent) -> None:
+        """Record an injected event."""
+        self.injected.append(event)
+
+
+async def _started_bridge(
+    nats: FakeNATSService, instance_id: str, zones: list[str] | None = None
+) -> tuple[NATSEventBusBridge, RecordingBus]:
+    bus = RecordingBus()
+    bridge = NATSEventBusBridge(event_bus=bus, nats_service=nats, instance_id=instance_id, zones=zones)  # type: ignore[arg-type]  # Reason: In-memory fake
+    await bridge.start()
+    return bridge, bus
+
+
 @pytest.mark.asyncio
-async def test_publish_adds_origin_and_calls_nats():
-    """publish() serializes event and forwards to NATS with origin metadata."""
-    mock_nats = MagicMock()
-    mock_nats.publish = AsyncMock()
-    mock_bus = type("MockBus", (), {"inject": lambda _e: None})()
-    bridge = NATSEventBusBridge(event_bus=mock_bus, nats_service=mock_nats, instance_id="inst-1")
-    event = NPCEnteredRoom(npc_id="npc_001", room_id="room_001", from_room_id=None)
+async def test_publish_adds_origin_and_calls_nats() -> None:
+    """publish() encodes the event and sends it with the origin header and body field."""
+    nats = FakeNATSService()
+    bridge = NATSEventBusBridge(event_bus=RecordingBus(), nats_service=nats, instance_id="inst-1")  # type: ignore[arg-type]  # Reason: In-memory fake
+    event = NPCDied(npc_id="npc_001", room_id="earth_arkhamcity_northside_room_001")
+
     await bridge.publish(event)
-    mock_nats.publish.assert_awaited_once()
-    subject, data = mock_nats.publish.await_args.args
-    assert subject.startswith("events.domain.")
+
+    assert len(nats.published) == 1
+    subject, payload, headers = nats.published[0]
+    assert subject == "events.domain.NPCDied.arkhamcity"
+    assert headers == {ORIGIN_HEADER: "inst-1"}
+    data = json.loads(payload)
     assert data.get("_origin_instance_id") == "inst-1"
+    assert data["npc_id"] == "npc_001"
+
+
+@pytest.mark.asyncio
+async def test_subjects_follow_each_event_types_policy() -> None:
+    """Broadcast types go to events.domain.<type>, zone types add the zone, local-only types stay home."""
+    nats = FakeNATSService()
+    bridge = NATSEventBusBridge(event_bus=RecordingBus(), nats_service=nats, instance_id="inst-1")  # type: ignore[arg-type]  # Reason: In-memory fake
+    tick = MythosHourTickEvent(
+        mythos_datetime=datetime(1926, 10, 31, 0, tzinfo=UTC),
+        month_name="October",
+        day_of_month=31,
+        week_of_month=5,
+        day_of_week=6,
+        day_name="Saturday",
+        season="autumn",
+        is_daytime=False,
+        is_witching_hour=True,
+        daypart="night",
+    )
+
+    queued = [
+        bridge.enqueue(RoomDefinitionChanged(room_id="earth_innsmouth_docks_pier_001")),
+        bridge.enqueue(ObjectAddedToRoom(object_id="p1", room_id="earth_innsmouth_docks_pier_001")),
+        bridge.enqueue(PlayerRespawnedEvent(uuid4(), "Ada", "earth_arkhamcity_sanitarium_room_001", 0, 10)),
+        bridge.enqueue(PlayerDPUpdated(player_id=uuid4(), old_dp=10, new_dp=8, max_dp=10)),
+        bridge.enqueue(tick),
+        bridge.enqueue(RoomOccupantsRefreshRequested(room_id="earth_innsmouth_docks_pier_001")),
+    ]
+    await bridge.flush()
+
+    assert queued == [True, True, True, True, False, False]
+    assert nats.subjects() == [
+        "events.domain.RoomDefinitionChanged",
+        "events.domain.ObjectAddedToRoom.innsmouth",
+        "events.domain.PlayerRespawnedEvent.arkhamcity",
+        # No room to shard by: broadcast
+        "events.domain.PlayerDPUpdated",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_own_echo_is_dropped_before_decoding() -> None:
+    """The publishing instance never decodes or injects its own events; the other instance gets them once."""
+    nats = FakeNATSService()
+    sender, sender_bus = await _started_bridge(nats, "inst-1")
+    _, receiver_bus = await _started_bridge(nats, "inst-2")
+    event = NPCDied(npc_id="npc_001", room_id="earth_arkhamcity_northside_room_001")
+
+    with patch("server.events.nats_event_bridge.json.loads", wraps=json.loads) as loads:
+        await sender.publish(event)
+
+    assert sender_bus.injected == []
+    assert receiver_bus.injected == [event]
+    assert loads.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_zone_subscriptions_only_receive_hosted_zones_and_broadcasts() -> None:
+    """An instance hosting innsmouth gets innsmouth shards and broadcasts, not arkhamcity shards."""
+    nats = FakeNATSService()
+    sender, _ = await _started_bridge(nats, "inst-1")
+    _, innsmouth_bus = await _started_bridge(nats, "inst-2", zones=["innsmouth"])
+
+    for event in (
+        ObjectAddedToRoom(object_id="p1", room_id="earth_arkhamcity_northside_room_001"),
+        ObjectAddedToRoom(object_id="p2", room_id="earth_innsmouth_docks_pier_001"),
+        NPCSpawnRulesChanged(rule_id=3),
+    ):
+        _ = sender.enqueue(event)
+    await sender.flush()
+
+    assert [type(e).__name__ for e in innsmouth_bus.injected] == ["ObjectAddedToRoom", "NPCSpawnRulesChanged"]
+    assert innsmouth_bus.injected[0].object_id == "p2"  # type: ignore[attr-defined]  # Reason: Checked by name above
+
+
+@pytest.mark.asyncio
+async def test_one_writer_sends_a_burst_in_order_in_batches() -> None:
+    """Events queued in one loop turn share one writer task and go out in publish order."""
+    nats = FakeNATSService()
+    bridge = NATSEventBusBridge(event_bus=RecordingBus(), nats_service=nats, instance_id="inst-1")  # type: ignore[arg-type]  # Reason: In-memory fake
+    count = WRITER_BATCH_SIZE + 44
+
+    with patch.object(bridge, "_run_writer", wraps=bridge._run_writer) as run_writer:
+        for n in range(count):
+            _ = bridge.enqueue(ObjectAddedToRoom(object_id=f"p{n}", room_id="earth_arkhamcity_northside_room_001"))
+        await bridge.flush()
+
+    assert run_writer.call_count == 1
+    assert nats.batches == [WRITER_BATCH_SIZE, 44]
+    assert [json.loads(payload)["object_id"] for _, payload, _ in nats.published] == [f"p{n}" for n in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_does_not_stop_later_events() -> None:
+    """A NATS error is logged and the writer carries on with the next events."""
+    nats = FakeNATSService()
+    bridge = NATSEventBusBridge(event_bus=RecordingBus(), nats_service=nats, instance_id="inst-1")  # type: ignore[arg-type]  # Reason: In-memory fake
+    real_publish = nats.publish_encoded_batch
+    nats.publish_encoded_batch = AsyncMock(side_effect=[RuntimeError("nats gone"), None])  # type: ignore[method-assign]
+
+    await bridge.publish(NPCSpawnRulesChanged(rule_id=1))
+    nats.publish_encoded_batch = real_publish  # type: ignore[method-assign]
+    await bridge.publish(NPCSpawnRulesChanged(rule_id=2))
+
+    assert [json.loads(payload)["rule_id"] for _, payload, _ in nats.published] == [2]
+
+
+@pytest.mark.asyncio
+async def test_local_only_event_from_another_instance_is_not_injected() -> None:
+    """A tick sent by an instance that still broadcasts everything is ignored here."""
+    bus = RecordingBus()
+    bridge = NATSEventBusBridge(event_bus=bus, nats_service=FakeNATSService(), instance_id="inst-2")  # type: ignore[arg-type]  # Reason: In-memory fake
+
+    await bridge.handle_encoded_message(
+        json.dumps({"_event_type": "RoomOccupantsRefreshRequested", "room_id": "r1"}).encode(), None
+    )
+
+    assert not bus.injected
 
 
 @pytest.mark.asyncio
@@ -84,4 +282,4 @@ async def test_handle_nats_message_bad_payload_logs_warning():
     mock_nats = type("MockNats", (), {})()
     bridge = NATSEventBusBridge(event_bus=mock_bus, nats_service=mock_nats, instance_id="local")
     await bridge.handle_nats_message({"_event_type": "NotARealEvent"})
-    assert inject_called == []
+    assert not inject_called
@@ -0,0 +1,105 @@
+"""
+Unit tests for the online MP regeneration ledger.
+"""
+
+import uuid
+
+from server.game.magic.mp_regeneration_ledger import (
+    LYING_MP_REGEN_MULTIPLIER,
+    REST_MP_REGEN_MULTIPLIER,
+    MPChange,
+    OnlineMPLedger,
+    regen_multiplier_for_position,
+)
+
+
+def test_regen_multiplier_for_position():
+    """Test posture multipliers."""
+    assert regen_multiplier_for_position("sitting") == REST_MP_REGEN_MULTIPLIER
+    assert regen_multiplier_for_position("lying") == LYING_MP_REGEN_MULTIPLIER
+    assert regen_multiplier_for_position("standing") == 1.0
+    assert regen_multiplier_for_position(None) == 1.0
+
+
+def test_unknown_players_do_not_accrue_until_read():
+    """Test that players accrue only once their MP has been read back."""
+    ledger = OnlineMPLedger(regen_rate=0.5)
+    player_id = uuid.uuid4()
+    ledger.sync_online([player_id])
+    ledger.accrue()
+    ledger.accrue()
+    assert ledger.pending_gain(player_id) == 0
+
+    assert ledger.take_gains() == {player_id: 0}
+    assert not ledger.apply_readings({player_id: (5, 10, "standing")})
+    ledger.accrue()
+    ledger.accrue()
+    assert ledger.pending_gain(player_id) == 1
+
+
+def test_accrue_uses_posture_and_stops_at_maximum():
+    """Test posture multipliers and the maximum MP cap (pending gains count toward it)."""
+    ledger = OnlineMPLedger(regen_rate=0.5)
+    sitting, full = uuid.uuid4(), uuid.uuid4()
+    ledger.sync_online([sitting, full])
+    _ = ledger.apply_readings({sitting: (8, 10, "sitting"), full: (10, 10, "standing")})
+
+    for _ in range(4):
+        ledger.accrue()
+
+    assert ledger.pending_gain(sitting) == 2
+    assert ledger.pending_gain(full) == 0
+
+
+def test_apply_readings_reports_changed_mp():
+    """Test that readings report MP that changed since the last reading."""
+    ledger = OnlineMPLedger(regen_rate=1.0)
+    regenerating, casting, idle = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    ledger.sync_online([regenerating, casting, idle])
+    _ = ledger.apply_readings(
+        {regenerating: (5, 10, "standing"), casting: (10, 10, "standing"), idle: (10, 10, "standing")}
+    )
+    ledger.accrue()
+
+    gains = ledger.take_gains()
+    assert gains == {regenerating: 1, casting: 0, idle: 0}
+    assert ledger.pending_gain(regenerating) == 0
+    changes = ledger.apply_readings(
+        {regenerating: (6, 10, "standing"), casting: (4, 10, "standing"), idle: (10, 10, "standing")}
+    )
+
+    assert sorted(changes, key=lambda change: change.magic_points) == [
+        MPChange(casting, 4, 10),
+        MPChange(regenerating, 6, 10),
+    ]
+
+
+def test_restore_gains_after_failed_write():
+    """Test that gains whose write failed are retried on the next flush."""
+    ledger = OnlineMPLedger(regen_rate=1.0)
+    player_id = uuid.uuid4()
+    ledger.sync_online([player_id])
+    _ = ledger.apply_readings({player_id: (0, 10, "standing")})
+    ledger.accrue()
+
+    gains = ledger.take_gains()
+    ledger.restore_gains(gains)
+    ledger.accrue()
+
+    assert ledger.take_gains() == {player_id: 2}
+
+
+def test_sync_online_swap_removes_players_who_left():
+    """Test that leaving players are dropped and the remaining rows keep their state."""
+    ledger = OnlineMPLedger(regen_rate=1.0)
+    players = [uuid.uuid4() for _ in range(100)]
+    ledger.sync_online(players)
+    _ = ledger.apply_readings({player_id: (index % 10, 5, "standing") for index, player_id in enumerate(players)})
+
+    ledger.sync_online(players[50:])
+    ledger.accrue()
+
+    assert len(ledger) == 50
+    assert players[0] not in ledger
+    for index, player_id in enumerate(players[50:], start=50):
+        assert ledger.pending_gain(player_id) == (1 if index % 10 < 5 else 0)
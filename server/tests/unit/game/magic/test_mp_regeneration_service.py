@@ -6,10 +6,11 @@ Tests the MPRegenerationService class for magic point regeneration.
 
 import uuid
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from server.exceptions import DatabaseError
 from server.game.magic.mp_regeneration_service import MPRegenerationService
 
 # pylint: disable=protected-access  # Reason: Test file - accessing protected members is standard practice for unit testing
@@ -323,3 +324,43 @@ async def test_process_tick_regeneration_lying_position(mp_regeneration_service,
     result = await mp_regeneration_service.process_tick_regeneration(sample_player_id)
     # Should restore MP
     assert result["mp_restored"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_process_online_tick_flushes_once_per_interval(mock_player_service):
+    """Test that online regeneration writes all players in one call per flush interval."""
+    player_id = uuid.uuid4()
+    readings = {player_id: (5, 10, "standing")}
+    mock_player_service.persistence.regenerate_players_mp = AsyncMock(side_effect=lambda gains: readings)
+    service = MPRegenerationService(mock_player_service, regen_rate=0.5, flush_interval_ticks=2)
+
+    assert await service.process_online_tick([player_id], 1) == 0
+    mock_player_service.persistence.regenerate_players_mp.assert_not_awaited()
+    assert await service.process_online_tick([player_id], 2) == 0
+    mock_player_service.persistence.regenerate_players_mp.assert_awaited_once_with({player_id: 0})
+
+    readings = {player_id: (6, 10, "standing")}
+    with patch("server.realtime.connection_manager_api.send_game_event", new_callable=AsyncMock) as send_event:
+        assert await service.process_online_tick([player_id], 3) == 0
+        assert await service.process_online_tick([player_id], 4) == 1
+
+    mock_player_service.persistence.regenerate_players_mp.assert_awaited_with({player_id: 1})
+    send_event.assert_awaited_once_with(
+        player_id, "player_update", {"stats": {"magic_points": 6, "max_magic_points": 10}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_online_tick_keeps_gains_when_write_fails(mock_player_service):
+    """Test that gains are retried on the next flush after a database error."""
+    player_id = uuid.uuid4()
+    mock_player_service.persistence.regenerate_players_mp = AsyncMock(return_value={player_id: (0, 10, "standing")})
+    service = MPRegenerationService(mock_player_service, regen_rate=1.0, flush_interval_ticks=1)
+    _ = await service.process_online_tick([player_id], 1)
+
+    mock_player_service.persistence.regenerate_players_mp.side_effect = DatabaseError("down")
+    assert await service.process_online_tick([player_id], 2) == 0
+
+    mock_player_service.persistence.regenerate_players_mp.side_effect = None
+    _ = await service.process_online_tick([player_id], 3)
+    mock_player_service.persistence.regenerate_players_mp.assert_awaited_with({player_id: 2})
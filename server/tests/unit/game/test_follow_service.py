@@ -6,14 +6,20 @@ unfollow, get_followers/get_following, movement propagation, auto-unfollow on mo
 disconnect cleanup.
 """
 
+import asyncio
 import uuid
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from server.events.event_types import NPCEnteredRoom, PlayerEnteredRoom
-from server.game.follow_service import FOLLOW_REQUEST_TTL_SECONDS, FollowService
+from server.game.follow_service import (
+    FOLLOW_MOVE_CONCURRENCY,
+    FOLLOW_REQUEST_TTL_SECONDS,
+    FollowService,
+    _FollowTable,
+)
 from server.tests.unit.realtime.envelope_assertions import assert_event_envelope
 
 # pylint: disable=protected-access  # Reason: Test file - accessing protected members is standard practice for unit testing
@@ -286,6 +292,81 @@ async def test_on_player_entered_room_no_from_room_id_skips_propagation(follow_s
     movement_service.move_player.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_follower_lookup_does_not_scan_follow_table(follow_service, movement_service):
+    """With 5,000 follow relationships, finding a mover's followers never iterates the table."""
+    for i in range(5000):
+        follow_service._follow_target[f"follower_{i}"] = (f"leader_{i % 2500}", "player")
+
+    with patch.object(_FollowTable, "__iter__", side_effect=AssertionError("follow table scanned")):
+        assert set(follow_service.get_followers("leader_7")) == {"follower_7", "follower_2507"}
+        assert follow_service.get_followers("nobody") == []
+        await follow_service._on_player_entered_room(
+            PlayerEnteredRoom(player_id="nobody", room_id="room_b", from_room_id="room_a")
+        )
+        follow_service.on_player_disconnect("leader_7")
+
+    movement_service.move_player.assert_not_called()
+    assert follow_service.get_following("follower_7") is None
+    assert follow_service.get_followers("leader_7") == []
+    assert len(follow_service._follow_target) == 4998
+
+
+def test_reverse_index_follows_retarget_and_unfollow(follow_service):
+    """Changing or removing a follow target updates the reverse index."""
+    follow_service._follow_target["f1"] = ("leader_1", "player")
+    follow_service._follow_target["f1"] = ("npc_1", "npc", "Guard")
+    assert follow_service.get_followers("leader_1") == []
+    assert follow_service.get_followers("npc_1") == ["f1"]
+    follow_service.unfollow("f1")
+    assert follow_service.get_followers("npc_1") == []
+
+
+@pytest.mark.asyncio
+async def test_followers_move_concurrently_with_bounded_fan_out(follow_service, movement_service):
+    """A group's follow moves run side by side, never more than FOLLOW_MOVE_CONCURRENCY at once."""
+    running = 0
+    peak = 0
+
+    async def move_player(_follower_id, _from_room_id, _to_room_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return True
+
+    movement_service.move_player = AsyncMock(side_effect=move_player)
+    for i in range(FOLLOW_MOVE_CONCURRENCY * 3):
+        follow_service._follow_target[f"f{i}"] = ("leader_1", "player")
+
+    await follow_service._on_player_entered_room(
+        PlayerEnteredRoom(player_id="leader_1", room_id="room_b", from_room_id="room_a")
+    )
+
+    assert movement_service.move_player.await_count == FOLLOW_MOVE_CONCURRENCY * 3
+    assert peak == FOLLOW_MOVE_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_follow_move_loads_follower_once(follow_service, movement_service):
+    """The standing and already-in-room checks share one follower load."""
+    follower_id = str(uuid.uuid4())
+    follower = MagicMock(current_room_id="room_a")
+    follower.get_stats.return_value = {"position": "standing"}
+    follow_service._async_persistence = MagicMock()
+    follow_service._async_persistence.get_player_by_id = AsyncMock(return_value=follower)
+    follow_service._player_position_service = MagicMock()
+    follow_service._follow_target[follower_id] = ("leader_1", "player")
+
+    await follow_service._on_player_entered_room(
+        PlayerEnteredRoom(player_id="leader_1", room_id="room_b", from_room_id="room_a")
+    )
+
+    follow_service._async_persistence.get_player_by_id.assert_awaited_once()
+    movement_service.move_player.assert_awaited_once_with(follower_id, "room_a", "room_b")
+
+
 # ---- get_following_display ----
 @pytest.mark.asyncio
 async def test_get_following_display_not_following(follow_service):
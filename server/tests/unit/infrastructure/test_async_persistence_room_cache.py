@@ -495,3 +495,34 @@ async def test_load_room_cache_async_success_with_rooms_logs_sample_ids(async_pe
     call_kwargs = mock_logger.debug.call_args[1]
     assert "sample_room_ids" in call_kwargs
     assert len(call_kwargs["sample_room_ids"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_load_room_cache_async_maps_stable_ids_to_room_uuids(async_persistence_layer):
+    """Loading rooms records each room's UUID so exploration can skip the rooms table lookup."""
+    mock_session = AsyncMock()
+
+    async def mock_get_async_session():
+        yield mock_session
+
+    room_uuid = uuid.uuid4()
+    loader = async_persistence_layer._room_loader
+    loader._query_rooms_with_exits_async = AsyncMock(
+        return_value=[
+            {
+                "room_uuid": room_uuid,
+                "stable_id": "earth_arkhamcity_northside_room_001",
+                "zone_stable_id": "earth/arkhamcity",
+            },
+            {"room_uuid": "not-a-uuid", "stable_id": "earth_arkhamcity_northside_room_002"},
+        ]
+    )
+    loader._process_combined_rows = MagicMock(return_value=([], {}))
+    loader._build_room_objects = MagicMock()
+
+    with patch("server.async_persistence_room_loader.get_async_session", side_effect=mock_get_async_session):
+        await async_persistence_layer._load_room_cache_async()
+
+    assert async_persistence_layer.get_room_uuid("earth_arkhamcity_northside_room_001") == room_uuid
+    assert async_persistence_layer.get_room_uuid("earth_arkhamcity_northside_room_002") is None
+    assert async_persistence_layer.get_room_uuid("unknown_room") is None
@@ -25,6 +25,14 @@ def reset_db_state():
     reset_database()
 
 
+# autouse: create_async_engine is mocked in this module, so the engine's pool is a MagicMock
+@pytest.fixture(autouse=True)
+def skip_pool_instrumentation():
+    """Skip attaching pool metrics listeners to mocked engines."""
+    with patch("server.database.instrument_pool"):
+        yield
+
+
 def test_database_manager_init_raises_when_instance_exists():
     """Test DatabaseManager.__init__ raises when instance already exists."""
     DatabaseManager.reset_instance()
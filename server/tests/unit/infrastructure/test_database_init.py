@@ -10,6 +10,7 @@ import pytest
 
 from server.database import DatabaseManager, ValidationError, reset_database
 from server.exceptions import DatabaseError
+from server.monitoring.database_pool_metrics import InstrumentedAsyncQueuePool
 
 # pylint: disable=protected-access  # Reason: Test file - accessing protected members is standard practice for unit testing
 # pylint: disable=redefined-outer-name  # Reason: Test file - pytest fixture parameter names must match fixture names, causing intentional redefinitions
@@ -24,6 +25,14 @@ def reset_db():
     reset_database()
 
 
+# autouse: create_async_engine is mocked in this module, so the engine's pool is a MagicMock
+@pytest.fixture(autouse=True)
+def skip_pool_instrumentation():
+    """Skip attaching pool metrics listeners to mocked engines."""
+    with patch("server.database.instrument_pool"):
+        yield
+
+
 def test_initialize_database_skip_if_already_initialized():
     """Test _initialize_database skips if already initialized."""
     DatabaseManager.reset_instance()
@@ -223,7 +232,8 @@ def test_initialize_database_uses_pool_config_for_production():
             assert call_kwargs["pool_size"] == 10
             assert call_kwargs["max_overflow"] == 20
             assert call_kwargs["pool_timeout"] == 30
-            assert "poolclass" not in call_kwargs  # Uses default AsyncAdaptedQueuePool
+            assert call_kwargs["poolclass"] is InstrumentedAsyncQueuePool
+            assert call_kwargs["pool_pre_ping"] is False
 
 
 def test_initialize_database_value_error():
@@ -0,0 +1,215 @@
+"""
+Tests for the unit of work (one shared session per command or tick phase).
+"""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+
+from server.database_unit_of_work import (
+    UnitOfWorkSession,
+    UnitOfWorkSessionMaker,
+    current_unit_of_work,
+    defer_until_commit,
+    get_unit_of_work_stats,
+    reset_unit_of_work_stats,
+    unit_of_work,
+)
+from server.exceptions import DatabaseError
+
+
+@pytest.fixture(autouse=True)
+def clean_stats() -> Iterator[None]:
+    """Reset unit statistics around each test."""
+    reset_unit_of_work_stats()
+    yield
+    reset_unit_of_work_stats()
+
+
+@pytest.fixture(name="maker")
+def fixture_maker() -> UnitOfWorkSessionMaker:
+    """Session maker without an engine (no test here reaches the database)."""
+    return UnitOfWorkSessionMaker(class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_outside_unit_each_call_gets_new_session(maker: UnitOfWorkSessionMaker) -> None:
+    """Without a unit the session maker behaves as before."""
+    first, second = maker(), maker()
+    assert first is not second
+    assert not isinstance(first, UnitOfWorkSession)
+    assert current_unit_of_work() is None
+
+
+@pytest.mark.asyncio
+async def test_unit_shares_one_session_and_defers_commit_and_close(maker: UnitOfWorkSessionMaker) -> None:
+    """Repository calls in a unit share its session; commit flushes and close waits for the unit."""
+    async with unit_of_work("command") as unit:
+        first = maker()
+        async with maker() as second:
+            await second.commit()
+        assert first is second
+        assert isinstance(first, UnitOfWorkSession)
+        assert current_unit_of_work() is unit
+
+    stats = get_unit_of_work_stats()["command"]
+    assert stats["units"] == 1
+    assert stats["connections"] == 1
+    assert stats["sessions_requested"] == 2
+    assert stats["avg_sessions_requested"] == 2.0
+    assert stats["deferred_commits"] == 1
+    assert stats["failed"] == 0
+    assert current_unit_of_work() is None
+
+
+@pytest.mark.asyncio
+async def test_session_with_overrides_does_not_join(maker: UnitOfWorkSessionMaker) -> None:
+    """Callers asking for custom session options get their own session."""
+    async with unit_of_work("command"):
+        assert not isinstance(maker(expire_on_commit=True), UnitOfWorkSession)
+
+
+@pytest.mark.asyncio
+async def test_nested_unit_joins_outer(maker: UnitOfWorkSessionMaker) -> None:
+    """A unit opened inside another unit of the same task is the outer unit."""
+    async with unit_of_work("command") as outer:
+        session = maker()
+        async with unit_of_work("tick.status_effects") as inner:
+            assert inner is outer
+            assert maker() is session
+
+    assert set(get_unit_of_work_stats()) == {"command"}
+
+
+@pytest.mark.asyncio
+async def test_other_tasks_get_their_own_sessions(maker: UnitOfWorkSessionMaker) -> None:
+    """Tasks spawned inside a unit must not share its (non-concurrency-safe) session."""
+    async with unit_of_work("command"):
+        shared = maker()
+
+        async def in_child_task() -> AsyncSession:
+            assert current_unit_of_work() is None
+            return maker()
+
+        child_session = await asyncio.create_task(in_child_task())
+        assert child_session is not shared
+        assert not isinstance(child_session, UnitOfWorkSession)
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_run_on_success() -> None:
+    """Deferred callbacks run once the unit commits."""
+    calls: list[str] = []
+    async with unit_of_work("command"):
+        assert defer_until_commit(lambda: calls.append("published"))
+        assert not calls
+    assert calls == ["published"]
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_dropped_on_failure(maker: UnitOfWorkSessionMaker) -> None:
+    """A failing unit rolls back and drops its deferred callbacks."""
+    calls: list[str] = []
+    with pytest.raises(ValueError):
+        async with unit_of_work("command"):
+            _ = maker()
+            _ = defer_until_commit(lambda: calls.append("published"))
+            raise ValueError("command failed")
+
+    assert not calls
+    assert get_unit_of_work_stats()["command"]["failed"] == 1
+
+
+def test_defer_until_commit_without_unit() -> None:
+    """Outside a unit the caller runs the callback itself."""
+    assert defer_until_commit(lambda: None) is False
+
+
+@pytest.mark.asyncio
+async def test_commit_error_raises_database_error(maker: UnitOfWorkSessionMaker) -> None:
+    """A failure committing the unit surfaces as DatabaseError and is counted."""
+    calls: list[str] = []
+    with patch.object(
+        AsyncSession, "commit", AsyncMock(side_effect=OperationalError("COMMIT", {}, Exception("connection lost")))
+    ):
+        with pytest.raises(DatabaseError):
+            async with unit_of_work("command"):
+                _ = maker()
+                _ = defer_until_commit(lambda: calls.append("published"))
+
+    assert not calls
+    assert get_unit_of_work_stats()["command"]["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_call_rolls_back_only_its_savepoint(maker: UnitOfWorkSessionMaker) -> None:
+    """One repository call failing inside a unit keeps the earlier calls' writes and the unit still commits."""
+    with (
+        patch.object(AsyncSessionTransaction, "commit", autospec=True) as release,
+        patch.object(AsyncSessionTransaction, "rollback", autospec=True) as rollback_to,
+        patch.object(AsyncSession, "commit", AsyncMock()) as unit_commit,
+    ):
+        async with unit_of_work("command"):
+            async with maker() as session:
+                await session.commit()
+            with pytest.raises(OperationalError):
+                async with maker() as session:
+                    raise OperationalError("UPDATE players", {}, Exception("deadlock detected"))
+            async with maker() as session:
+                assert session.in_nested_transaction()
+
+    assert release.await_count == 2
+    assert rollback_to.await_count == 1
+    unit_commit.assert_awaited_once()
+    stats = get_unit_of_work_stats()["command"]
+    assert stats["rollbacks"] == 1
+    assert stats["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rollback_in_block_is_scoped_to_its_savepoint(maker: UnitOfWorkSessionMaker) -> None:
+    """A repository's own rollback() undoes its block only and the block continues in a fresh savepoint."""
+    with (
+        patch.object(AsyncSessionTransaction, "rollback", autospec=True) as rollback_to,
+        patch.object(AsyncSession, "commit", AsyncMock()) as unit_commit,
+    ):
+        async with unit_of_work("command"):
+            async with maker() as session:
+                first_savepoint = session.get_nested_transaction()
+                await session.rollback()
+                assert session.in_nested_transaction()
+                assert session.get_nested_transaction() is not first_savepoint
+
+    rollback_to.assert_awaited_once()
+    unit_commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_rollback_outside_block_fails_the_unit(maker: UnitOfWorkSessionMaker) -> None:
+    """Without a savepoint to return to, rollback() fails the unit instead of committing a partial result."""
+    with patch.object(AsyncSession, "commit", AsyncMock()) as unit_commit:
+        with pytest.raises(DatabaseError):
+            async with unit_of_work("command"):
+                await maker().rollback()
+
+    unit_commit.assert_not_awaited()
+    assert get_unit_of_work_stats()["command"]["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_event_bus_publish_waits_for_commit() -> None:
+    """Events published inside a unit reach the bus only after the unit commits."""
+    from server.events.event_bus import EventBus
+    from server.events.event_types import BaseEvent
+
+    bus = EventBus()
+    event = BaseEvent()
+    with patch.object(bus, "_publish_in_test_mode") as delivered:
+        async with unit_of_work("command"):
+            bus.publish(event)
+            delivered.assert_not_called()
+        delivered.assert_called_once_with(event)
@@ -4,6 +4,8 @@ Unit tests for Player SQLAlchemy model.
 Tests the Player model methods including stats, inventory, status effects, and health state.
 """
 
+import json
+from copy import deepcopy
 from uuid import uuid4
 
 from server.models.game import PositionState
@@ -645,3 +647,94 @@ def test_player_repr() -> None:
     repr_str = repr(player)
     assert "Player" in repr_str
     assert "TestPlayer" in repr_str
+
+
+def test_dirty_fields_none_until_marked_persisted():
+    """A player that was never loaded or saved has no dirty-field baseline."""
+    player = Player(player_id=str(uuid4()), user_id=str(uuid4()), name="Fresh", stats={"current_dp": 20})
+    assert player.get_dirty_fields() is None
+
+
+def test_dirty_fields_track_stats_keys_and_columns():
+    """In-place stats edits, removed keys and column changes are all reported."""
+    player = Player(
+        player_id=str(uuid4()),
+        user_id=str(uuid4()),
+        name="Tracked",
+        stats={"current_dp": 20, "luck": 50, "position": "standing"},
+        current_room_id="room_a",
+        inventory="[]",
+    )
+    player.mark_persisted()
+    assert player.get_dirty_fields().is_clean
+
+    stats = player.get_stats()
+    stats["current_dp"] = 3
+    del stats["luck"]
+    player.current_room_id = "room_b"
+    dirty = player.get_dirty_fields()
+    assert dirty.columns == {"stats", "current_room_id"}
+    assert dirty.stats_set == {"current_dp": 3}
+    assert dirty.stats_removed == ("luck",)
+
+    player.set_equipped_items({"head": {"item_id": "hat"}})
+    assert "equipped" in player.get_dirty_fields().columns
+    player.mark_persisted()
+    assert player.get_dirty_fields().is_clean
+
+
+def test_json_columns_parsed_once_and_serialized_at_save():
+    """Repeated reads share one parsed list; writes are serialized once, when the column is read."""
+    player = Player(
+        player_id=str(uuid4()),
+        user_id=str(uuid4()),
+        name="Cached",
+        status_effects='[{"type": "poisoned", "duration": 3}]',
+        inventory="[]",
+    )
+    player.mark_persisted()
+
+    effects = player.get_status_effects()
+    assert player.get_status_effects() is effects
+    effects.append({"type": "stunned", "duration": 1})
+    player.set_status_effects([*effects, {"type": "blessed", "duration": 2}])
+    assert player.get_json_column_stats() == {"parses": 1, "serializations": 0}
+
+    assert player.get_dirty_fields().columns == {"status_effects"}
+    assert [effect["type"] for effect in json.loads(player.status_effects)] == ["poisoned", "stunned", "blessed"]
+    assert player.get_json_column_stats()["serializations"] == 1
+
+
+def test_json_column_raw_assignment_replaces_parsed_list():
+    player = Player(player_id=str(uuid4()), user_id=str(uuid4()), name="Raw", inventory='[{"item_id": "a"}]')
+    assert player.get_inventory() == [{"item_id": "a"}]
+
+    player.inventory = '[{"item_id": "b"}]'
+
+    assert player.get_inventory() == [{"item_id": "b"}]
+    assert type(deepcopy(player.get_inventory())) is list
+
+
+def test_json_column_edits_inside_rows_are_saved():
+    """Rows are shared, so a row edited in place is written back; an untouched list is not."""
+    player = Player(
+        player_id=str(uuid4()),
+        user_id=str(uuid4()),
+        name="Nested",
+        inventory='[{"item_id": "a",  "quantity": 1}]',
+    )
+    player.mark_persisted()
+
+    inventory = player.get_inventory()
+    assert player.get_dirty_fields().is_clean
+    assert player.inventory == '[{"item_id": "a",  "quantity": 1}]'
+
+    inventory[0]["quantity"] = 2
+
+    assert player.get_dirty_fields().columns == {"inventory"}
+    assert json.loads(player.inventory) == [{"item_id": "a", "quantity": 2}]
+    assert player.get_inventory() is inventory
+    player.mark_persisted()
+
+    inventory[0]["quantity"] = 3
+    assert player.get_dirty_fields().columns == {"inventory"}
@@ -0,0 +1,116 @@
+"""Unit tests for database connection pool metrics."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, NullPool
+
+from server.database_config_helpers import configure_pool_settings, configure_statement_cache_args
+from server.monitoring.database_pool_metrics import (
+    DatabasePoolMetrics,
+    InstrumentedAsyncQueuePool,
+    LatencyHistogram,
+    get_database_pool_metrics,
+)
+
+
+class _Record:
+    """Minimal ConnectionPoolEntry stand-in (only ``info`` is used)."""
+
+    def __init__(self) -> None:
+        self.info: dict[str, object] = {}
+
+
+def _record() -> ConnectionPoolEntry:
+    return _Record()  # type: ignore[return-value]  # Reason: Listeners only touch record.info
+
+
+def test_latency_histogram_buckets_and_percentiles() -> None:
+    histogram = LatencyHistogram((1.0, 10.0, 100.0))
+    for duration_ms in (0.5, 0.7, 5.0, 50.0, 700.0):
+        histogram.observe(duration_ms)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"le_1": 2, "le_10": 3, "le_100": 4, "le_inf": 5}
+    assert snapshot["count"] == 5
+    assert snapshot["max_ms"] == 700.0
+    assert histogram.percentile(0.4) == 1.0
+    assert histogram.percentile(0.8) == 100.0
+    assert histogram.percentile(1.0) == 700.0
+    assert LatencyHistogram().percentile(0.5) == 0.0
+
+
+def test_checkout_and_checkin_track_hold_time_and_concurrency() -> None:
+    metrics = DatabasePoolMetrics()
+    records = [_record() for _ in range(3)]
+    for record in records:
+        metrics.on_checkout(None, record, None)  # type: ignore[arg-type]  # Reason: Listener ignores the DBAPI connection and proxy
+    for record in records:
+        metrics.on_checkin(None, record)
+    # A second checkin of the same record (e.g. after invalidation) is ignored
+    metrics.on_checkin(None, records[0])
+
+    stats = metrics.get_stats()
+    assert stats["in_use"] == 0
+    assert stats["peak_in_use"] == 3
+    assert stats["checkout_hold"]["count"] == 3
+
+
+def test_recommended_pool_settings_follow_measured_concurrency() -> None:
+    metrics = DatabasePoolMetrics()
+    assert not metrics.recommended_pool_settings()
+    # 95 single checkouts, then one burst of 5 concurrent connections
+    for _ in range(95):
+        record = _record()
+        metrics.on_checkout(None, record, None)  # type: ignore[arg-type]  # Reason: Listener ignores the DBAPI connection and proxy
+        metrics.on_checkin(None, record)
+    burst = [_record() for _ in range(5)]
+    for record in burst:
+        metrics.on_checkout(None, record, None)  # type: ignore[arg-type]  # Reason: Listener ignores the DBAPI connection and proxy
+
+    assert metrics.recommended_pool_settings() == {"pool_size": 1, "max_overflow": 4}
+
+
+def test_reset_keeps_connections_in_use() -> None:
+    metrics = DatabasePoolMetrics()
+    metrics.on_checkout(None, _record(), None)  # type: ignore[arg-type]  # Reason: Listener ignores the DBAPI connection and proxy
+    metrics.record_wait(3.0)
+    metrics.record_checkout_timeout()
+    metrics.on_invalidate(None, _record(), None)  # type: ignore[arg-type]  # Reason: Listener ignores the DBAPI connection
+
+    metrics.reset()
+
+    stats = metrics.get_stats()
+    assert stats["in_use"] == 1
+    assert stats["peak_in_use"] == 1
+    assert stats["checkout_wait"]["count"] == 0
+    assert stats["checkout_timeouts"] == 0
+    assert stats["invalidations"] == 0
+
+
+def test_instrumented_pool_records_waits_and_timeouts() -> None:
+    metrics = get_database_pool_metrics()
+    pool = InstrumentedAsyncQueuePool(creator=MagicMock(), pool_size=1)
+    waits_before = metrics.get_stats()["checkout_wait"]["count"]
+    timeouts_before = metrics.get_stats()["checkout_timeouts"]
+
+    with patch.object(AsyncAdaptedQueuePool, "connect", return_value=MagicMock()):
+        _ = pool.connect()
+    with patch.object(AsyncAdaptedQueuePool, "connect", side_effect=PoolTimeoutError("pool exhausted")):
+        with pytest.raises(PoolTimeoutError):
+            _ = pool.connect()
+
+    stats = metrics.get_stats()
+    assert stats["checkout_wait"]["count"] == waits_before + 1
+    assert stats["checkout_timeouts"] == timeouts_before + 1
+
+
+def test_configure_pool_settings_uses_instrumented_pool_without_pre_ping() -> None:
+    pool_kwargs = configure_pool_settings("postgresql+asyncpg://localhost/mythos_dev")
+    assert pool_kwargs["poolclass"] is InstrumentedAsyncQueuePool
+    assert pool_kwargs["pool_pre_ping"] is False
+    assert configure_pool_settings("postgresql+asyncpg://localhost/mythos_test")["poolclass"] is NullPool
+    assert configure_statement_cache_args()["prepared_statement_cache_size"] > 100
@@ -0,0 +1,84 @@
+"""Unit tests for the room- and zone-indexed active NPC registry."""
+
+from types import SimpleNamespace
+from typing import Any
+
+from server.npc.active_npc_registry import ActiveNPCRegistry, npc_ids_in_room, npc_zone_counts, relocate_npc
+
+DOWNTOWN = "earth_arkhamcity_downtown_001"
+DOWNTOWN_2 = "earth_arkhamcity_downtown_002"
+DOCKS = "earth_innsmouth_waterfront_dock_001"
+
+
+def _npc(room_id: str | None) -> Any:
+    return SimpleNamespace(current_room=room_id, is_alive=True)
+
+
+def test_spawn_indexes_npc_by_room_and_zone() -> None:
+    registry = ActiveNPCRegistry()
+    registry["rat-1"] = _npc(DOWNTOWN)
+    registry["rat-2"] = _npc(DOWNTOWN)
+    registry["fisher"] = _npc(DOCKS)
+
+    assert registry.npc_ids_in_room(DOWNTOWN) == ["rat-1", "rat-2"]
+    assert registry.npc_ids_in_room("empty") == []
+    assert registry.zone_counts() == {"arkhamcity/downtown": 2, "innsmouth/waterfront": 1}
+    assert registry.npc_ids_in_zone("innsmouth/waterfront") == {"fisher"}
+
+
+def test_despawn_and_death_remove_from_indexes() -> None:
+    registry = ActiveNPCRegistry({"rat-1": _npc(DOWNTOWN), "rat-2": _npc(DOWNTOWN), "fisher": _npc(DOCKS)})
+
+    del registry["rat-1"]
+    assert registry.pop("fisher").current_room == DOCKS
+    assert registry.pop("missing", None) is None
+
+    assert registry.npc_ids_in_room(DOWNTOWN) == ["rat-2"]
+    assert registry.npc_ids_in_room(DOCKS) == []
+    assert registry.zone_counts() == {"arkhamcity/downtown": 1}
+
+
+def test_relocate_follows_movement() -> None:
+    registry = ActiveNPCRegistry()
+    npc = _npc(None)
+    registry["rat-1"] = npc
+    assert registry.room_of("rat-1") is None
+
+    npc.current_room = DOWNTOWN
+    registry.relocate("rat-1")
+    relocate_npc(registry, "rat-1", DOWNTOWN_2)
+
+    assert registry.npc_ids_in_room(DOWNTOWN) == []
+    assert registry.npc_ids_in_room(DOWNTOWN_2) == ["rat-1"]
+    assert registry.zone_counts() == {"arkhamcity/downtown": 1}
+
+
+def test_room_of_falls_back_to_current_room_id() -> None:
+    registry = ActiveNPCRegistry({"clerk": SimpleNamespace(current_room=None, current_room_id=DOWNTOWN)})
+
+    assert registry.room_of("clerk") == DOWNTOWN
+
+
+def test_replaced_npc_moves_to_end_of_spawn_order() -> None:
+    registry = ActiveNPCRegistry({"a": _npc(DOWNTOWN), "b": _npc(DOWNTOWN)})
+    registry["a"] = _npc(DOCKS)
+
+    assert list(registry) == ["b", "a"]
+    assert registry.npc_ids_in_room(DOWNTOWN) == ["b"]
+    assert registry.npc_ids_in_room(DOCKS) == ["a"]
+
+
+def test_clear_empties_indexes() -> None:
+    registry = ActiveNPCRegistry({"a": _npc(DOWNTOWN)})
+    registry.clear()
+
+    assert registry.npc_ids_in_room(DOWNTOWN) == []
+    assert registry.zone_counts() == {}
+
+
+def test_helpers_scan_plain_mappings() -> None:
+    active_npcs = {"a": _npc(DOWNTOWN), "b": _npc(DOCKS), "c": SimpleNamespace(current_room=None)}
+
+    assert npc_ids_in_room(active_npcs, DOWNTOWN) == ["a"]
+    assert npc_zone_counts(active_npcs) == {"arkhamcity/downtown": 1, "innsmouth/waterfront": 1}
+    relocate_npc(active_npcs, "a", DOCKS)  # no index to maintain
@@ -0,0 +1,82 @@
+"""
+Unit tests for NPCDefinitionLoader (startup load and reload after admin edits).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from server.npc.npc_definition_loader import NPCDefinitionLoader
+
+
+def _npc_sessions():
+    """Stand-in for get_npc_session: each call yields one session."""
+
+    async def _gen():
+        yield MagicMock()
+
+    return _gen()
+
+
+@pytest.fixture(name="npc_service")
+def fixture_npc_service() -> MagicMock:
+    """NPC service returning one definition and one spawn rule."""
+    service = MagicMock()
+    service.get_npc_definitions = AsyncMock(return_value=[MagicMock(id=1)])
+    service.get_spawn_rules = AsyncMock(return_value=[MagicMock(id=2)])
+    return service
+
+
+@pytest.mark.asyncio
+async def test_load_fills_population_controller(npc_service: MagicMock) -> None:
+    """Startup loads both definitions and spawn rules."""
+    controller = MagicMock()
+    loader = NPCDefinitionLoader(controller, npc_service)
+
+    with patch("server.npc_database.get_npc_session", side_effect=_npc_sessions):
+        await loader.load()
+
+    controller.load_npc_definitions.assert_called_once_with(npc_service.get_npc_definitions.return_value)
+    controller.load_spawn_rules.assert_called_once_with(npc_service.get_spawn_rules.return_value)
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reloads_only_what_changed(npc_service: MagicMock) -> None:
+    """A definition edit reloads definitions in the background and leaves spawn rules alone."""
+    controller = MagicMock()
+    loader = NPCDefinitionLoader(controller, npc_service)
+
+    with patch("server.npc_database.get_npc_session", side_effect=_npc_sessions):
+        loader.invalidate_npc_definitions()
+        controller.load_npc_definitions.assert_not_called()
+        await loader._reload_task  # pylint: disable=protected-access  # Reason: Test waits for the background reload
+
+    controller.load_npc_definitions.assert_called_once()
+    controller.load_spawn_rules.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_edits_during_a_reload_are_coalesced(npc_service: MagicMock) -> None:
+    """Edits arriving while a reload runs are applied by one more reload, not one each."""
+    release = asyncio.Event()
+
+    async def slow_definitions(_session: object) -> list[object]:
+        await release.wait()
+        return []
+
+    npc_service.get_npc_definitions = AsyncMock(side_effect=slow_definitions)
+    controller = MagicMock()
+    loader = NPCDefinitionLoader(controller, npc_service)
+
+    with patch("server.npc_database.get_npc_session", side_effect=_npc_sessions):
+        loader.invalidate_npc_definitions()
+        await asyncio.sleep(0)
+        for _ in range(3):
+            loader.invalidate_npc_definitions()
+        loader.invalidate_spawn_rules()
+        release.set()
+        await loader._reload_task  # pylint: disable=protected-access  # Reason: Test waits for the background reload
+
+    assert controller.load_npc_definitions.call_count == 2
+    controller.load_spawn_rules.assert_called_once()
@@ -306,6 +306,30 @@ def test_cleanup_inactive_npcs_removes_old_npcs(population_controller, mock_life
         mock_despawn.assert_called_once_with("old-npc")
 
 
+def test_cleanup_inactive_npcs_stops_at_first_young_npc_in_registry(population_controller, mock_lifecycle_manager):
+    """The registry iterates in spawn order, so NPCs after the first young one are not examined."""
+    import time
+
+    from server.npc.active_npc_registry import ActiveNPCRegistry
+
+    old_npc = MagicMock(spawned_at=time.time() - 7200, is_required=False)
+    young_npc = MagicMock(spawned_at=time.time() - 300, is_required=False)
+    never_checked = MagicMock(is_required=False)
+    mock_lifecycle_manager.active_npcs = ActiveNPCRegistry({"old": old_npc, "young": young_npc, "last": never_checked})
+    with (
+        patch.object(population_controller, "despawn_npc", return_value=True) as mock_despawn,
+        patch.object(
+            population_controller,
+            "_should_remove_inactive_npc",
+            wraps=population_controller._should_remove_inactive_npc,
+        ) as should_remove,
+    ):
+        result = population_controller.cleanup_inactive_npcs(max_age_seconds=3600)
+    assert result == 1
+    mock_despawn.assert_called_once_with("old")
+    assert [call.args[0] for call in should_remove.call_args_list] == [old_npc]
+
+
 def test_cleanup_inactive_npcs_keeps_required(population_controller, mock_lifecycle_manager):
     """Test cleanup_inactive_npcs() keeps required NPCs."""
     import time
@@ -10,7 +10,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from server.exceptions import DatabaseError
 from server.models.player import Player
-from server.persistence.repositories.health_repository import HealthRepository, _stats_int
+from server.persistence.repositories.health_repository import HealthRepository, PlayerMPRow, _stats_int
 
 
 def test_stats_int_defaults_and_coercion() -> None:
@@ -145,3 +145,94 @@ async def test_update_player_health_raises_database_error() -> None:
     ):
         with pytest.raises(DatabaseError):
             await repo.update_player_health(uuid.uuid4(), 1, reason="heal")
+
+
+@pytest.mark.asyncio
+async def test_set_players_dp_returns_stored_rows() -> None:
+    repo = HealthRepository()
+    found, missing = uuid.uuid4(), uuid.uuid4()
+    result = MagicMock()
+    result.fetchall.return_value = [MagicMock(player_id=found, current_dp=-2)]
+    result.fetchall.return_value[0].name = "Wounded"
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(return_value=result)
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+
+    with patch(
+        "server.persistence.repositories.health_repository.get_session_maker",
+        return_value=MagicMock(return_value=mock_session),
+    ):
+        stored = await repo.set_players_dp({found: -2, missing: 7})
+
+    assert stored == {found: ("Wounded", -2)}
+    params = mock_session.execute.await_args.args[1]
+    assert params == {"player_ids": [found, missing], "dps": [-2, 7]}
+    assert mock_session.execute.await_count == 1
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_set_players_dp_empty_skips_database() -> None:
+    repo = HealthRepository()
+    with patch("server.persistence.repositories.health_repository.get_session_maker") as session_maker:
+        assert await repo.set_players_dp({}) == {}
+    session_maker.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_set_players_dp_raises_database_error() -> None:
+    repo = HealthRepository()
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("boom"))
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+
+    with patch(
+        "server.persistence.repositories.health_repository.get_session_maker",
+        return_value=MagicMock(return_value=mock_session),
+    ):
+        with pytest.raises(DatabaseError):
+            await repo.set_players_dp({uuid.uuid4(): 3})
+
+
+@pytest.mark.asyncio
+async def test_regenerate_players_mp_returns_stored_rows() -> None:
+    repo = HealthRepository()
+    found, missing = uuid.uuid4(), uuid.uuid4()
+    result = MagicMock()
+    result.fetchall.return_value = [
+        MagicMock(player_id=found, magic_points=8, max_magic_points=10, position="sitting"),
+    ]
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(return_value=result)
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+
+    with patch(
+        "server.persistence.repositories.health_repository.get_session_maker",
+        return_value=MagicMock(return_value=mock_session),
+    ):
+        stored = await repo.regenerate_players_mp({found: 2, missing: 0})
+
+    assert stored == {found: PlayerMPRow(8, 10, "sitting")}
+    params = mock_session.execute.await_args.args[1]
+    assert params == {"player_ids": [found, missing], "gains": [2, 0]}
+    assert mock_session.execute.await_count == 1
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_regenerate_players_mp_raises_database_error() -> None:
+    repo = HealthRepository()
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(side_effect=SQLAlchemyError("boom"))
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+
+    with patch(
+        "server.persistence.repositories.health_repository.get_session_maker",
+        return_value=MagicMock(return_value=mock_session),
+    ):
+        with pytest.raises(DatabaseError):
+            await repo.regenerate_players_mp({uuid.uuid4(): 1})
@@ -0,0 +1,164 @@
+"""
+Tests for PlayerLoader (batched get_player_by_id with a per-unit identity map).
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from server.database_unit_of_work import current_unit_of_work, unit_of_work
+from server.exceptions import DatabaseError
+from server.persistence.player_loader import PlayerLoader
+
+
+def _player(player_id: uuid.UUID) -> SimpleNamespace:
+    return SimpleNamespace(player_id=str(player_id))
+
+
+def _repository(*player_ids: uuid.UUID) -> MagicMock:
+    """Repository stand-in returning a fresh object per row, like the real queries."""
+    known = set(player_ids)
+    repository = MagicMock()
+    repository.get_player_by_id = AsyncMock(side_effect=lambda i: _player(i) if i in known else None)
+    repository.get_players_batch = AsyncMock(side_effect=lambda ids: [_player(i) for i in ids if i in known])
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_batch_query() -> None:
+    """Loads issued in the same loop iteration are resolved by one get_players_batch call."""
+    a, b, missing = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    repository = _repository(a, b)
+    loader = PlayerLoader(lambda: repository)
+
+    first, second, duplicate, not_found = await asyncio.gather(
+        loader.load(a), loader.load(b), loader.load(a), loader.load(missing)
+    )
+
+    assert first is duplicate
+    assert second.player_id == str(b)
+    assert not_found is None
+    repository.get_players_batch.assert_awaited_once()
+    assert set(repository.get_players_batch.await_args.args[0]) == {a, b, missing}
+    repository.get_player_by_id.assert_not_awaited()
+    stats = loader.get_stats()
+    assert stats["batches"] == 1
+    assert stats["coalesced"] == 1
+    assert stats["avg_batch_size"] == 3.0
+
+
+@pytest.mark.asyncio
+async def test_single_load_uses_get_player_by_id() -> None:
+    """A lone load keeps using the single-player query."""
+    player_id = uuid.uuid4()
+    repository = _repository(player_id)
+    loader = PlayerLoader(lambda: repository)
+
+    player = await loader.load(str(player_id))
+
+    assert player.player_id == str(player_id)
+    repository.get_player_by_id.assert_awaited_once_with(player_id)
+    repository.get_players_batch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_identity_map_returns_same_object_within_unit() -> None:
+    """Inside a unit of work a player is loaded once and the same object is returned afterwards."""
+    player_id = uuid.uuid4()
+    repository = _repository(player_id)
+    loader = PlayerLoader(lambda: repository)
+
+    async with unit_of_work("command"):
+        first = await loader.load(player_id)
+        second = await loader.load(player_id)
+        assert first is second
+    third = await loader.load(player_id)
+
+    assert third is not first
+    assert repository.get_player_by_id.await_count == 2
+    assert loader.get_stats()["identity_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_load_in_unit_reads_the_units_own_writes() -> None:
+    """A player written earlier in the unit is read back through the unit's session, not reloaded stale."""
+    player_id = uuid.uuid4()
+    committed = {player_id: "Arkham"}
+    uncommitted: dict[uuid.UUID, str] = {}
+
+    async def save_room(pid: uuid.UUID, room: str) -> None:
+        # Writes inside a unit stay on the unit's session until it commits
+        (uncommitted if current_unit_of_work() is not None else committed)[pid] = room
+
+    async def get_player_by_id(pid: uuid.UUID) -> SimpleNamespace:
+        # Only a query on the unit's session (the unit-owning task) sees its uncommitted writes
+        room = uncommitted.get(pid, committed[pid]) if current_unit_of_work() is not None else committed[pid]
+        return SimpleNamespace(player_id=str(pid), current_room_id=room)
+
+    repository = MagicMock()
+    repository.get_player_by_id = AsyncMock(side_effect=get_player_by_id)
+    loader = PlayerLoader(lambda: repository)
+
+    async with unit_of_work("command"):
+        await save_room(player_id, "Innsmouth")
+        player = await loader.load(player_id)
+        assert player.current_room_id == "Innsmouth"
+
+
+@pytest.mark.asyncio
+async def test_remember_and_forget_update_identity_map() -> None:
+    """Saved players replace the mapped object; deleted players are dropped."""
+    player_id = uuid.uuid4()
+    repository = _repository(player_id)
+    loader = PlayerLoader(lambda: repository)
+    saved = _player(player_id)
+
+    async with unit_of_work("command"):
+        _ = await loader.load(player_id)
+        loader.remember(saved)  # type: ignore[arg-type]  # Reason: Stand-in player object
+        assert await loader.load(player_id) is saved
+        loader.forget(player_id)
+        assert await loader.load(player_id) is not saved
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller() -> None:
+    """A failed batch query raises in every waiting caller."""
+    repository = _repository()
+    repository.get_players_batch = AsyncMock(side_effect=DatabaseError("connection lost"))
+    loader = PlayerLoader(lambda: repository)
+
+    results = await asyncio.gather(loader.load(uuid.uuid4()), loader.load(uuid.uuid4()), return_exceptions=True)
+
+    assert all(isinstance(result, DatabaseError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_load() -> None:
+    """Cancelling one waiter leaves the load running for the others."""
+    player_id = uuid.uuid4()
+    release = asyncio.Event()
+    repository = _repository(player_id)
+
+    async def slow_batch(ids: list[uuid.UUID]) -> list[SimpleNamespace]:
+        await release.wait()
+        return [_player(i) for i in ids if i == player_id]
+
+    repository.get_players_batch = AsyncMock(side_effect=slow_batch)
+    loader = PlayerLoader(lambda: repository)
+
+    cancelled = asyncio.create_task(loader.load(player_id))
+    waiting = asyncio.create_task(loader.load(player_id))
+    other = asyncio.create_task(loader.load(uuid.uuid4()))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    assert (await waiting).player_id == str(player_id)
+    assert await other is None
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
@@ -5,6 +5,7 @@ Tests the PlayerRepository class which handles player persistence operations.
 Uses procedure-based persistence; mocks return rows compatible with row_to_player.
 """
 
+import json
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -89,6 +90,7 @@ def mock_player():
     player.get_inventory.return_value = []
     player.get_equipped_items.return_value = {}
     player.get_stats.return_value = {"current_dp": 20, "constitution": 50, "size": 50}
+    player.get_dirty_fields.return_value = None  # Never persisted: full upsert
     return player
 
 
@@ -325,6 +327,50 @@ async def test_get_player_by_id_success(player_repository):
         assert str(result.player_id) == str(player_id)
 
 
+@pytest.mark.asyncio
+async def test_get_player_by_id_skips_room_validation(player_repository):
+    """Hot reads return the stored room as-is; validation happens when the player is loaded into memory."""
+    mock_row = _make_mock_row()
+    mock_row.current_room_id = "deleted_room"
+
+    mock_session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = [mock_row]
+    mock_session.execute.return_value = mock_result
+
+    with patch("server.persistence.repositories.player_repository.get_session_maker") as mock_get_session:
+        mock_get_session.return_value = MagicMock()
+        mock_get_session.return_value.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_get_session.return_value.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        result = await player_repository.get_player_by_id(mock_row.player_id)
+
+    assert result is not None
+    assert result.current_room_id == "deleted_room"
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_validate_player_room_persists_fix(player_repository, mock_player):
+    """validate_player_room moves a player out of an unknown room and saves the new room."""
+    mock_player.current_room_id = "deleted_room"
+    mock_player.tutorial_instance_id = None
+    mock_session = AsyncMock()
+
+    with patch("server.persistence.repositories.player_repository.get_session_maker") as mock_get_session:
+        mock_get_session.return_value = MagicMock()
+        mock_get_session.return_value.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_get_session.return_value.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        fixed = await player_repository.validate_player_room(mock_player)
+
+    assert fixed is True
+    assert mock_player.current_room_id == "earth_arkhamcity_sanitarium_room_foyer_001"
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_get_player_by_id_not_found(player_repository):
     """Test get_player_by_id returns None when player not found."""
@@ -457,6 +503,7 @@ async def test_save_players_success(player_repository, mock_player):
     mock_player2.get_inventory.return_value = []
     mock_player2.get_equipped_items.return_value = {}
     mock_player2.get_stats.return_value = {}
+    mock_player2.get_dirty_fields.return_value = None
     players: list[Any] = [mock_player, mock_player2]
 
     mock_session = AsyncMock()
@@ -621,3 +668,177 @@ async def test_get_players_batch_success(player_repository):
         result = await player_repository.get_players_batch(player_ids)
 
         assert len(result) == 2
+
+
+def _patched_session(mock_session: AsyncMock) -> Any:
+    patcher = patch("server.persistence.repositories.player_repository.get_session_maker")
+    mock_get_session = patcher.start()
+    mock_get_session.return_value = MagicMock()
+    mock_get_session.return_value.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_get_session.return_value.return_value.__aexit__ = AsyncMock(return_value=None)
+    return patcher
+
+
+def _sql_of(call: Any) -> str:
+    return str(call.args[0])
+
+
+@pytest.mark.asyncio
+async def test_save_player_dp_change_uses_partial_update(player_repository):
+    """A DP change patches the stats key without the upsert or inventory validation."""
+    from server.persistence.repositories.player_repository_mappers import row_to_player
+
+    player = row_to_player(_make_mock_row())
+    player.apply_dp_change(12)
+    mock_session = AsyncMock()
+    patcher = _patched_session(mock_session)
+    try:
+        with patch("server.persistence.repositories.player_repository_save.validate_inventory_payload") as validate:
+            await player_repository.save_player(player)
+        validate.assert_not_called()
+    finally:
+        patcher.stop()
+
+    mock_session.execute.assert_awaited_once()
+    call = mock_session.execute.await_args
+    assert _sql_of(call).startswith("SELECT patch_player(")
+    assert call.args[1]["columns"] == ["stats"]
+    assert call.args[1]["stats_patch"] == '{"current_dp": 12}'
+    assert call.args[1]["stats_removed"] is None
+    mock_session.commit.assert_awaited_once()
+    assert player.get_dirty_fields().is_clean
+
+
+@pytest.mark.asyncio
+async def test_save_player_room_change_updates_only_room(player_repository):
+    from server.persistence.repositories.player_repository_mappers import row_to_player
+
+    player = row_to_player(_make_mock_row())
+    player.current_room_id = "arkham_square"
+    mock_session = AsyncMock()
+    patcher = _patched_session(mock_session)
+    try:
+        await player_repository.save_player(player)
+    finally:
+        patcher.stop()
+
+    call = mock_session.execute.await_args
+    assert _sql_of(call).startswith("SELECT patch_player(")
+    assert call.args[1]["columns"] == ["current_room_id"]
+    assert call.args[1]["current_room_id"] == "arkham_square"
+    assert call.args[1]["stats_patch"] is None
+
+
+@pytest.mark.asyncio
+async def test_save_player_inventory_change_uses_full_upsert(player_repository):
+    from server.persistence.repositories.player_repository_mappers import row_to_player
+
+    player = row_to_player(_make_mock_row())
+    player.set_inventory([{"item_id": "lantern", "item_name": "Lantern", "slot_type": "backpack", "quantity": 1}])
+    mock_session = AsyncMock()
+    patcher = _patched_session(mock_session)
+    try:
+        with patch("server.persistence.repositories.player_repository_save.validate_inventory_payload") as validate:
+            await player_repository.save_player(player)
+        validate.assert_called_once()
+    finally:
+        patcher.stop()
+
+    assert "upsert_player" in _sql_of(mock_session.execute.await_args)
+
+
+@pytest.mark.asyncio
+async def test_save_player_unchanged_skips_database(player_repository):
+    from server.persistence.repositories.player_repository_mappers import row_to_player
+
+    player = row_to_player(_make_mock_row())
+    mock_session = AsyncMock()
+    patcher = _patched_session(mock_session)
+    try:
+        await player_repository.save_player(player)
+    finally:
+        patcher.stop()
+
+    mock_session.execute.assert_not_awaited()
+    mock_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_save_player_partial_update_missing_row_falls_back_to_upsert(player_repository):
+    from server.persistence.repositories.player_repository_mappers import row_to_player
+
+    player = row_to_player(_make_mock_row())
+    player.apply_dp_change(5)
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = MagicMock(scalar=MagicMock(return_value=False))
+    patcher = _patched_session(mock_session)
+    try:
+        await player_repository.save_player(player)
+    finally:
+        patcher.stop()
+
+    sqls = [_sql_of(call) for call in mock_session.execute.await_args_list]
+    assert sqls[0].startswith("SELECT patch_player(")
+    assert "upsert_player" in sqls[1]
+
+
+@pytest.mark.asyncio
+async def test_save_players_batches_partial_updates(player_repository):
+    """All partial updates share one patch_players call."""
+    from server.persistence.repositories.player_repository_mappers import row_to_player
+
+    hit = [row_to_player(_make_mock_row(name=f"P{i}")) for i in range(3)]
+    for i, player in enumerate(hit):
+        player.apply_dp_change(10 + i)
+    mover = row_to_player(_make_mock_row(name="Mover"))
+    mover.current_room_id = "room1"
+    idle = row_to_player(_make_mock_row(name="Idle"))
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = MagicMock(scalars=MagicMock(return_value=MagicMock(all=list)))
+    patcher = _patched_session(mock_session)
+    try:
+        await player_repository.save_players([*hit, mover, idle])
+    finally:
+        patcher.stop()
+
+    mock_session.execute.assert_awaited_once()
+    batch = mock_session.execute.await_args
+    assert _sql_of(batch).startswith("SELECT patch_players(")
+    patches = json.loads(batch.args[1]["patches"])
+    assert [patch.get("stats_patch") for patch in patches] == [
+        '{"current_dp": 10}',
+        '{"current_dp": 11}',
+        '{"current_dp": 12}',
+        None,
+    ]
+    assert patches[3] == {"player_id": str(mover.player_id), "columns": ["current_room_id"], "current_room_id": "room1"}
+    mock_session.commit.assert_awaited_once()
+    assert all(player.get_dirty_fields().is_clean for player in [*hit, mover])
+
+
+@pytest.mark.asyncio
+async def test_save_players_upserts_rows_missing_for_partial_update(player_repository):
+    """A player whose row is missing from the batched patch is inserted with upsert_player."""
+    from server.persistence.repositories.player_repository_mappers import row_to_player
+
+    present = row_to_player(_make_mock_row(name="Present"))
+    present.apply_dp_change(5)
+    absent = row_to_player(_make_mock_row(name="Absent"))
+    absent.apply_dp_change(7)
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = MagicMock(
+        scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[uuid.UUID(str(absent.player_id))])))
+    )
+    patcher = _patched_session(mock_session)
+    try:
+        with patch("server.persistence.repositories.player_repository_save.validate_inventory_payload"):
+            await player_repository.save_players([present, absent])
+    finally:
+        patcher.stop()
+
+    calls = mock_session.execute.await_args_list
+    assert len(calls) == 2
+    assert _sql_of(calls[0]).startswith("SELECT patch_players(")
+    assert "upsert_player" in _sql_of(calls[1])
+    assert calls[1].args[1]["player_id"] == str(absent.player_id)
+    mock_session.commit.assert_awaited_once()
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from server.persistence.repositories.player_repository_room import (
+    get_room_validation_stats,
     should_skip_room_validation,
     validate_and_fix_player_room,
     validate_and_fix_player_room_with_persistence,
@@ -54,6 +55,17 @@ def test_validate_and_fix_player_room_moves_to_foyer() -> None:
     logger.info.assert_called_once()
 
 
+def test_room_validation_stats_count_checks_and_fixes() -> None:
+    room_cache = {"arkham_square": MagicMock(), "earth_arkhamcity_sanitarium_room_foyer_001": MagicMock()}
+    before = get_room_validation_stats()
+    _ = validate_and_fix_player_room(room_cache, _player("arkham_square"), MagicMock())
+    _ = validate_and_fix_player_room(room_cache, _player("invalid_room"), MagicMock())
+    _ = validate_and_fix_player_room(room_cache, _player("instance_dungeon_001"), MagicMock())
+    after = get_room_validation_stats()
+    assert after["validated"] - before["validated"] == 2
+    assert after["fixed"] - before["fixed"] == 1
+
+
 def test_validate_and_fix_player_room_fallback_missing_in_cache() -> None:
     player = _player("invalid_room")
     room_cache = {"other_room": MagicMock()}
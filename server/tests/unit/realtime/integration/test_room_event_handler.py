@@ -1,5 +1,6 @@
 """Unit tests for RoomEventHandler integration."""
 
+import asyncio
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -109,3 +110,33 @@ async def test_subscribe_handles_exception() -> None:
     )
     with patch("server.realtime.integration.room_event_handler.logger"):
         await handler.subscribe_to_events()
+
+
+@pytest.mark.asyncio
+async def test_follow_burst_broadcasts_occupants_twice(room_handler: RoomEventHandler) -> None:
+    """A leader and followers entering together share the trailing occupant broadcast."""
+    for _ in range(6):
+        await room_handler.handle_player_entered_room({"room_id": "room-001", "player_id": str(uuid.uuid4())})
+    assert room_handler.broadcast_to_room.await_count == 1
+
+    coalescer = room_handler.occupancy_coalescer
+    for _ in range(50):
+        if coalescer.get_stats()["open_windows"] == 0:
+            break
+        await asyncio.sleep(0.02)
+    assert room_handler.broadcast_to_room.await_count == 2
+    assert coalescer.get_stats()["merged"] == 4
+
+
+@pytest.mark.asyncio
+async def test_shutdown_drops_pending_occupant_broadcast(room_handler: RoomEventHandler) -> None:
+    """Shutdown closes the coalescer: an open window's trailing broadcast never runs."""
+    for _ in range(2):
+        await room_handler.handle_player_entered_room({"room_id": "room-001", "player_id": str(uuid.uuid4())})
+    assert room_handler.occupancy_coalescer.get_stats()["open_windows"] == 1
+
+    room_handler.shutdown()
+    await asyncio.sleep(0.3)
+
+    assert room_handler.occupancy_coalescer.get_stats()["open_windows"] == 0
+    assert room_handler.broadcast_to_room.await_count == 1
@@ -404,6 +404,28 @@ async def test_setup_player_and_room_success():
     assert mock_manager.room_manager.subscribe_calls == [(str(player_id), room_id)]
 
 
+@pytest.mark.asyncio
+async def test_setup_player_and_room_validates_room_on_connect():
+    """The room is validated (and fixed) once when the player is loaded into memory."""
+    player_id = uuid.uuid4()
+    mock_manager = _make_manager()
+    mock_player: MagicMock = MagicMock()
+    mock_player.current_room_id = "deleted_room"
+
+    class _Persistence:
+        async def validate_player_room(self, player: MagicMock) -> bool:
+            player.current_room_id = "earth_arkhamcity_sanitarium_room_foyer_001"
+            return True
+
+    mock_manager.async_persistence = _Persistence()
+    mock_manager.get_player = AsyncMock(return_value=mock_player)
+
+    success, _ = await _setup_player_and_room(player_id, _as_mgr(mock_manager))
+
+    assert success is True
+    assert mock_manager.room_manager.subscribe_calls == [(str(player_id), "earth_arkhamcity_sanitarium_room_foyer_001")]
+
+
 @pytest.mark.asyncio
 async def test_setup_player_and_room_no_player():
     """Test _setup_player_and_room() returns False when player not found."""
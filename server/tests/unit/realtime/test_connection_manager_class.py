@@ -7,8 +7,12 @@ import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.websockets import WebSocketState
 
+from server.database_unit_of_work import UnitOfWorkSessionMaker, unit_of_work
+from server.exceptions import DatabaseError
 from server.realtime.connection_manager import ConnectionManager
 
 
@@ -125,3 +129,41 @@ def test_connection_manager_getattr_lazy_api_exports() -> None:
     assert callable(mod.__getattr__("broadcast_game_event"))
     with pytest.raises(AttributeError):
         _ = mod.__getattr__("not_exported")
+
+
+@pytest.mark.asyncio
+async def test_sends_inside_unit_of_work_wait_for_commit(manager: ConnectionManager) -> None:
+    """Messages a command sends reach players only after its unit of work commits."""
+    player_id = uuid.uuid4()
+    event = {"event_type": "command_response"}
+    with (
+        patch("server.realtime.connection_manager._cmm.send_personal_message_impl", AsyncMock()) as send,
+        patch("server.realtime.connection_manager._cmm.broadcast_to_room_impl", AsyncMock()) as broadcast,
+    ):
+        async with unit_of_work("command"):
+            status = await manager.send_personal_message(player_id, event)
+            _ = await manager.broadcast_to_room("room_1", event, exclude_player=player_id)
+            assert status["deferred_until_commit"] is True
+            send.assert_not_awaited()
+            broadcast.assert_not_awaited()
+
+        send.assert_awaited_once_with(manager, player_id, event)
+        broadcast.assert_awaited_once_with(manager, "room_1", event, player_id)
+
+
+@pytest.mark.asyncio
+async def test_sends_dropped_when_unit_of_work_commit_fails(manager: ConnectionManager) -> None:
+    """A command whose commit fails never tells the player it succeeded."""
+    maker = UnitOfWorkSessionMaker(class_=AsyncSession, expire_on_commit=False)
+    with (
+        patch("server.realtime.connection_manager._cmm.send_personal_message_impl", AsyncMock()) as send,
+        patch.object(
+            AsyncSession, "commit", AsyncMock(side_effect=OperationalError("COMMIT", {}, Exception("connection lost")))
+        ),
+    ):
+        with pytest.raises(DatabaseError):
+            async with unit_of_work("command"):
+                _ = maker()
+                _ = await manager.send_personal_message(uuid.uuid4(), {"event_type": "command_response"})
+
+    send.assert_not_awaited()
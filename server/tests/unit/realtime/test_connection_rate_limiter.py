@@ -4,10 +4,37 @@ Unit tests for rate limiter.
 Tests the rate_limiter module classes and functions.
 """
 
+# pylint: disable=redefined-outer-name  # Reason: Test file - pytest fixture parameter names must match fixture names, causing intentional redefinitions
+
 import time
+from collections.abc import Iterator
 from unittest.mock import patch
 
-from server.realtime.rate_limiter import RateLimiter
+import pytest
+
+from server.realtime.rate_limiter import IDLE_EVICTIONS_PER_CHECK, RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock the limiter reads, advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> Iterator[FakeClock]:
+    """Drive the limiter's monotonic clock from the test."""
+    fake = FakeClock()
+    with patch("server.realtime.rate_limiter.monotonic", fake):
+        yield fake
 
 
 def test_rate_limiter_init_defaults():
@@ -73,14 +100,15 @@ def test_rate_limiter_check_rate_limit_exceeded():
         mock_logger.warning.assert_called_once()
 
 
-def test_rate_limiter_check_rate_limit_old_attempts_removed():
+def test_rate_limiter_check_rate_limit_old_attempts_removed(clock):
     """Test RateLimiter.check_rate_limit() removes old attempts outside window."""
     limiter = RateLimiter(max_connection_attempts=5, connection_window=60)
     player_id = "player_123"
 
     # Add old attempt (outside window)
-    old_time = time.time() - 120  # 2 minutes ago
-    limiter.connection_attempts[player_id] = [old_time]
+    old_time = clock.now
+    limiter.check_rate_limit(player_id)
+    clock.advance(120)
 
     # New attempt should be allowed (old one removed)
     result = limiter.check_rate_limit(player_id)
@@ -91,126 +119,130 @@ def test_rate_limiter_check_rate_limit_old_attempts_removed():
     assert all(t > old_time for t in limiter.connection_attempts[player_id])
 
 
-def test_rate_limiter_get_rate_limit_info():
-    """Test RateLimiter.get_rate_limit_info() returns correct info."""
-    limiter = RateLimiter(max_connection_attempts=5, connection_window=60)
-    player_id = "player_123"
+def test_rate_limiter_window_slides_rather_than_resets(clock):
+    """Attempts leave the window one by one as they age, not all at once."""
+    limiter = RateLimiter(max_connection_attempts=3, connection_window=60)
+    for _ in range(3):
+        assert limiter.check_rate_limit("player_123") is True
+        clock.advance(20)
 
-    # Make 2 attempts
-    limiter.check_rate_limit(player_id)
-    limiter.check_rate_limit(player_id)
+    # t=60: the first attempt (t=0) has just aged out, the others have not
+    assert limiter.check_rate_limit("player_123") is True
+    assert limiter.check_rate_limit("player_123") is False
+    clock.advance(20)
+    assert limiter.check_rate_limit("player_123") is True
 
-    info = limiter.get_rate_limit_info(player_id)
 
-    assert info["attempts"] == 2
-    assert info["max_attempts"] == 5
-    assert info["window_seconds"] == 60
-    assert info["attempts_remaining"] == 3
-    assert info["reset_time"] > time.time()
+def test_rate_limiter_history_is_bounded_by_the_limit(clock):
+    """A flooding connection keeps at most max_messages_per_minute timestamps."""
+    limiter = RateLimiter(max_messages_per_minute=10, message_window=60)
 
+    for _ in range(1000):
+        limiter.check_message_rate_limit("conn_123")
+        clock.advance(0.001)
 
-def test_rate_limiter_get_rate_limit_info_no_attempts():
-    """Test RateLimiter.get_rate_limit_info() for player with no attempts."""
-    limiter = RateLimiter(max_connection_attempts=5, connection_window=60)
-    player_id = "player_123"
+    assert len(limiter.message_attempts["conn_123"]) == 10
 
-    info = limiter.get_rate_limit_info(player_id)
 
-    assert info["attempts"] == 0
-    assert info["max_attempts"] == 5
-    assert info["attempts_remaining"] == 5
-    assert info["reset_time"] == 0
+def test_rate_limiter_ignores_wall_clock_jumping_back(clock):
+    """A wall clock set back an hour neither extends a lockout nor hides past attempts."""
+    limiter = RateLimiter(max_connection_attempts=2, connection_window=60)
+    assert limiter.check_rate_limit("player_123") is True
+    assert limiter.check_rate_limit("player_123") is True
 
+    with patch("time.time", return_value=time.time() - 3600):
+        assert limiter.check_rate_limit("player_123") is False
+        clock.advance(61)
+        assert limiter.check_rate_limit("player_123") is True
 
-def test_rate_limiter_cleanup_old_attempts():
-    """Test RateLimiter.cleanup_old_attempts() removes old attempts."""
-    limiter = RateLimiter()
-    player_id = "player_123"
 
-    # Add old and recent attempts
-    old_time = time.time() - 7200  # 2 hours ago
-    recent_time = time.time() - 30  # 30 seconds ago
-    limiter.connection_attempts[player_id] = [old_time, recent_time]
+def test_rate_limiter_ignores_wall_clock_jumping_forward(clock):
+    """A wall clock set forward an hour does not hand a flooding connection a fresh budget."""
+    limiter = RateLimiter(max_messages_per_minute=5, message_window=60)
+    for _ in range(5):
+        assert limiter.check_message_rate_limit("conn_123") is True
 
-    limiter.cleanup_old_attempts(max_age_seconds=3600)
+    with patch("time.time", return_value=time.time() + 3600):
+        assert limiter.check_message_rate_limit("conn_123") is False
+        assert limiter.get_message_rate_limit_info("conn_123")["attempts"] == 5
+    clock.advance(1)
+    assert limiter.check_message_rate_limit("conn_123") is False
 
-    # Only recent attempt should remain
-    assert len(limiter.connection_attempts[player_id]) == 1
-    assert limiter.connection_attempts[player_id][0] == recent_time
 
+def test_rate_limiter_evicts_idle_keys_while_checking(clock):
+    """Keys whose window expired are forgotten a few per check, without a sweep."""
+    limiter = RateLimiter(max_messages_per_minute=100, message_window=60)
+    for n in range(100):
+        limiter.check_message_rate_limit(f"idle_{n}")
+    clock.advance(30)
+    limiter.check_message_rate_limit("active")
+    clock.advance(31)
 
-def test_rate_limiter_cleanup_old_attempts_removes_empty():
-    """Test RateLimiter.cleanup_old_attempts() removes empty entries."""
-    limiter = RateLimiter()
-    player_id = "player_123"
+    limiter.check_message_rate_limit("busy")
+    assert len(limiter.message_attempts) == 100 - IDLE_EVICTIONS_PER_CHECK + 2
 
-    # Add only old attempts
-    old_time = time.time() - 7200
-    limiter.connection_attempts[player_id] = [old_time]
+    for _ in range(100 // IDLE_EVICTIONS_PER_CHECK):
+        limiter.check_message_rate_limit("busy")
+    assert list(limiter.message_attempts) == ["active", "busy"]
 
-    with patch("server.realtime.rate_limiter.logger") as mock_logger:
-        limiter.cleanup_old_attempts(max_age_seconds=3600)
 
-        # Player entry should be removed
-        assert player_id not in limiter.connection_attempts
-        mock_logger.debug.assert_called_once()
+def test_rate_limiter_eviction_stops_at_a_key_still_in_its_window(clock):
+    """A key checked least recently but still inside its window is kept."""
+    limiter = RateLimiter(max_connection_attempts=5, connection_window=60)
+    limiter.check_rate_limit("player_old")
+    clock.advance(59)
 
+    for _ in range(10):
+        limiter.check_rate_limit("player_new")
 
-def test_rate_limiter_cleanup_old_attempts_error():
-    """Test RateLimiter.cleanup_old_attempts() handles errors."""
-    limiter = RateLimiter()
-    player_id = "player_123"
+    assert "player_old" in limiter.connection_attempts
+    assert limiter.get_rate_limit_info("player_old")["attempts"] == 1
 
-    # Create a custom dict-like object that raises an error
-    class ErrorDict(dict):
-        def items(self):
-            raise OSError("Test error")
 
-    error_dict = ErrorDict()
-    error_dict[player_id] = [time.time()]
-    limiter.connection_attempts = error_dict
+def test_rate_limiter_raised_limit_applies_to_existing_keys(clock):
+    """Raising the limit at runtime lets existing keys use the larger budget."""
+    limiter = RateLimiter(max_messages_per_minute=2, message_window=60)
+    limiter.check_message_rate_limit("conn_123")
+    limiter.check_message_rate_limit("conn_123")
+    assert limiter.check_message_rate_limit("conn_123") is False
 
-    with patch("server.realtime.rate_limiter.logger") as mock_logger:
-        limiter.cleanup_old_attempts()
+    limiter.max_messages_per_minute = 4
+    clock.advance(1)
 
-        mock_logger.error.assert_called_once()
+    assert limiter.check_message_rate_limit("conn_123") is True
+    assert limiter.check_message_rate_limit("conn_123") is True
+    assert limiter.check_message_rate_limit("conn_123") is False
 
 
-def test_rate_limiter_cleanup_large_structures():
-    """Test RateLimiter.cleanup_large_structures() trims large lists."""
-    limiter = RateLimiter()
+def test_rate_limiter_get_rate_limit_info():
+    """Test RateLimiter.get_rate_limit_info() returns correct info."""
+    limiter = RateLimiter(max_connection_attempts=5, connection_window=60)
     player_id = "player_123"
 
-    # Create a large list of attempts
-    large_list = [time.time() - i for i in range(2000)]
-    limiter.connection_attempts[player_id] = large_list
+    # Make 2 attempts
+    limiter.check_rate_limit(player_id)
+    limiter.check_rate_limit(player_id)
 
-    with patch("server.realtime.rate_limiter.logger") as mock_logger:
-        limiter.cleanup_large_structures(max_entries=1000)
+    info = limiter.get_rate_limit_info(player_id)
 
-        # Should be trimmed to 1000 most recent
-        assert len(limiter.connection_attempts[player_id]) == 1000
-        mock_logger.debug.assert_called_once()
+    assert info["attempts"] == 2
+    assert info["max_attempts"] == 5
+    assert info["window_seconds"] == 60
+    assert info["attempts_remaining"] == 3
+    assert info["reset_time"] > time.time()
 
 
-def test_rate_limiter_cleanup_large_structures_error():
-    """Test RateLimiter.cleanup_large_structures() handles errors."""
-    limiter = RateLimiter()
+def test_rate_limiter_get_rate_limit_info_no_attempts():
+    """Test RateLimiter.get_rate_limit_info() for player with no attempts."""
+    limiter = RateLimiter(max_connection_attempts=5, connection_window=60)
     player_id = "player_123"
 
-    # Create a custom dict-like object that raises an error
-    class ErrorDict(dict):
-        def items(self):
-            raise ValueError("Test error")
-
-    error_dict = ErrorDict()
-    error_dict[player_id] = [time.time()]
-    limiter.connection_attempts = error_dict
-
-    with patch("server.realtime.rate_limiter.logger") as mock_logger:
-        limiter.cleanup_large_structures()
+    info = limiter.get_rate_limit_info(player_id)
 
-        mock_logger.error.assert_called_once()
+    assert info["attempts"] == 0
+    assert info["max_attempts"] == 5
+    assert info["attempts_remaining"] == 5
+    assert info["reset_time"] == 0
 
 
 def test_rate_limiter_remove_player_data():
@@ -404,57 +436,3 @@ def test_rate_limiter_remove_connection_message_data_not_present():
     limiter.remove_connection_message_data(connection_id)
 
     assert connection_id not in limiter.message_attempts
-
-
-def test_rate_limiter_cleanup_old_message_attempts():
-    """Test RateLimiter.cleanup_old_message_attempts() removes old attempts."""
-    limiter = RateLimiter()
-    connection_id = "conn_123"
-
-    # Add old and recent attempts
-    old_time = time.time() - 7200  # 2 hours ago
-    recent_time = time.time() - 30  # 30 seconds ago
-    limiter.message_attempts[connection_id] = [old_time, recent_time]
-
-    limiter.cleanup_old_message_attempts(max_age_seconds=3600)
-
-    # Only recent attempt should remain
-    assert len(limiter.message_attempts[connection_id]) == 1
-    assert limiter.message_attempts[connection_id][0] == recent_time
-
-
-def test_rate_limiter_cleanup_old_message_attempts_removes_empty():
-    """Test RateLimiter.cleanup_old_message_attempts() removes empty entries."""
-    limiter = RateLimiter()
-    connection_id = "conn_123"
-
-    # Add only old attempts
-    old_time = time.time() - 7200
-    limiter.message_attempts[connection_id] = [old_time]
-
-    with patch("server.realtime.rate_limiter.logger") as mock_logger:
-        limiter.cleanup_old_message_attempts(max_age_seconds=3600)
-
-        # Connection entry should be removed
-        assert connection_id not in limiter.message_attempts
-        mock_logger.debug.assert_called_once()
-
-
-def test_rate_limiter_cleanup_old_message_attempts_error():
-    """Test RateLimiter.cleanup_old_message_attempts() handles errors."""
-    limiter = RateLimiter()
-    connection_id = "conn_123"
-
-    # Create a custom dict-like object that raises an error
-    class ErrorDict(dict):
-        def items(self):
-            raise OSError("Test error")
-
-    error_dict = ErrorDict()
-    error_dict[connection_id] = [time.time()]
-    limiter.message_attempts = error_dict
-
-    with patch("server.realtime.rate_limiter.logger") as mock_logger:
-        limiter.cleanup_old_message_attempts()
-
-        mock_logger.error.assert_called_once()
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from server.services.lucidity_tier_registry import lucidity_tier_registry
 from server.services.nats_exceptions import NATSError
 
 # pylint: disable=protected-access  # Reason: Test file - accessing protected members is standard practice
@@ -110,6 +111,70 @@ async def test_get_player_lucidity_tier_default(nats_message_handler):
         assert result == "lucid"
 
 
+@pytest.mark.asyncio
+async def test_get_player_lucidity_tier_uses_registry(nats_message_handler):
+    """Registered (connected) players are answered from memory."""
+    player_id = uuid.uuid4()
+    lucidity_tier_registry.set(player_id, "fractured")
+    try:
+        with patch("server.database.get_async_session") as mock_session:
+            assert await nats_message_handler._get_player_lucidity_tier(str(player_id)) == "fractured"
+        mock_session.assert_not_called()
+    finally:
+        lucidity_tier_registry.discard(player_id)
+
+
+@pytest.mark.asyncio
+async def test_send_messages_to_50_players_opens_no_sessions(nats_message_handler):
+    """Dampening a room say to 50 connected players needs no database session."""
+    sender_id = str(uuid.uuid4())
+    targets = [str(uuid.uuid4()) for _ in range(50)]
+    tiers = ["lucid", "uneasy", "fractured", "deranged"]
+    lucidity_tier_registry.set(sender_id, "uneasy")
+    for index, target in enumerate(targets):
+        lucidity_tier_registry.set(target, tiers[index % len(tiers)])
+    chat_event = {"type": "chat_message", "data": {"original_content": "Hello there", "player_name": "Player1"}}
+    nats_message_handler.connection_manager.send_personal_message = AsyncMock()
+    try:
+        with patch("server.database.get_async_session") as sessions_opened:
+            await nats_message_handler._send_messages_to_players(targets, chat_event, "room_001", sender_id, "say")
+        assert sessions_opened.call_count == 0
+        assert nats_message_handler.connection_manager.send_personal_message.await_count == 50
+    finally:
+        for player_id in [sender_id, *targets]:
+            lucidity_tier_registry.discard(player_id)
+
+
+@pytest.mark.asyncio
+async def test_send_messages_to_players_builds_one_event_per_tier(nats_message_handler):
+    """Receivers in the same tier share one dampened event; deranged scrambling is seeded per receiver."""
+    sender_id = str(uuid.uuid4())
+    lucid = [str(uuid.uuid4()) for _ in range(3)]
+    deranged = [str(uuid.uuid4()) for _ in range(40)]
+    tiers = {sender_id: "lucid", **dict.fromkeys(lucid, "lucid"), **dict.fromkeys(deranged, "deranged")}
+    nats_message_handler._get_player_lucidity_tier = AsyncMock(side_effect=lambda player_id: tiers[player_id])
+    nats_message_handler.connection_manager.send_personal_message = AsyncMock()
+    chat_event = {
+        "type": "chat_message",
+        "data": {"original_content": "one two three four five six", "player_name": "Player1", "message_id": "m1"},
+    }
+
+    async def deliveries() -> dict[str, dict]:
+        nats_message_handler.connection_manager.send_personal_message.reset_mock()
+        await nats_message_handler._send_messages_to_players(lucid + deranged, chat_event, "room_001", sender_id, "say")
+        return {
+            str(call.args[0]): call.args[1]
+            for call in nats_message_handler.connection_manager.send_personal_message.await_args_list
+        }
+
+    first = await deliveries()
+    assert len(first) == 43
+    assert first[lucid[0]] is first[lucid[1]] is first[lucid[2]]
+    assert first[lucid[0]] is not first[deranged[0]]
+    assert {event["data"]["message"] for event in first.values()} >= {"Player1 says: one two three four five six"}
+    assert await deliveries() == first
+
+
 def test_validate_chat_message_fields_type_errors(nats_message_handler):
     """Test _validate_chat_message_fields raises TypeError for invalid types."""
     chat_fields = {
@@ -262,7 +327,7 @@ async def test_send_messages_to_players_no_original_content(nats_message_handler
     nats_message_handler._get_player_lucidity_tier = AsyncMock(return_value="lucid")
     nats_message_handler.connection_manager.send_personal_message = AsyncMock()
     with patch(
-        "server.services.lucidity_communication_dampening.apply_communication_dampening",
+        "server.services.lucidity_communication_dampening.apply_receiver_dampening",
         return_value={"blocked": False, "message": "Hello"},
     ):
         await nats_message_handler._send_messages_to_players(filtered_targets, chat_event, "room_001", sender_id, "say")
@@ -282,8 +347,8 @@ async def test_send_messages_to_players_blocked(nats_message_handler):
     nats_message_handler._get_player_lucidity_tier = AsyncMock(return_value="lucid")
     nats_message_handler.connection_manager.send_personal_message = AsyncMock()
     with patch(
-        "server.services.lucidity_communication_dampening.apply_communication_dampening",
-        return_value={"blocked": True, "message": "Hello"},
+        "server.services.lucidity_communication_dampening.apply_sender_dampening",
+        return_value={"blocked": True, "message": "", "tags": ["hallucination"]},
     ):
         await nats_message_handler._send_messages_to_players(filtered_targets, chat_event, "room_001", sender_id, "say")
         nats_message_handler.connection_manager.send_personal_message.assert_not_awaited()
@@ -302,7 +367,7 @@ async def test_send_messages_to_players_with_tags(nats_message_handler):
     nats_message_handler._get_player_lucidity_tier = AsyncMock(return_value="lucid")
     nats_message_handler.connection_manager.send_personal_message = AsyncMock()
     with patch(
-        "server.services.lucidity_communication_dampening.apply_communication_dampening",
+        "server.services.lucidity_communication_dampening.apply_receiver_dampening",
         return_value={"blocked": False, "message": "Hello", "tags": ["strained"]},
     ):
         await nats_message_handler._send_messages_to_players(filtered_targets, chat_event, "room_001", sender_id, "say")
@@ -321,7 +386,7 @@ async def test_send_messages_to_players_invalid_player_id(nats_message_handler):
     filtered_targets = ["invalid-uuid"]
     nats_message_handler._get_player_lucidity_tier = AsyncMock(return_value="lucid")
     with patch(
-        "server.services.lucidity_communication_dampening.apply_communication_dampening",
+        "server.services.lucidity_communication_dampening.apply_receiver_dampening",
         return_value={"blocked": False, "message": "Hello"},
     ):
         await nats_message_handler._send_messages_to_players(filtered_targets, chat_event, "room_001", sender_id, "say")
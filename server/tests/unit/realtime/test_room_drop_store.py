@@ -0,0 +1,234 @@
+"""
+Unit tests for the copy-on-write room drop store.
+"""
+
+# pylint: disable=protected-access  # Reason: Tests await the store's snapshot window task directly
+
+import asyncio
+import json
+import threading
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from server.commands.inventory_item_matching import match_room_drop_by_name
+from server.realtime.room_drop_store import RoomDropList, RoomDropStore
+from server.realtime.room_subscription_manager import RoomSubscriptionManager
+from server.utils.room_renderer import clone_room_drops
+
+ROOM = "earth_arkhamcity_room_001"
+
+FLOOR = [
+    {"item_name": "Brass Lantern", "item_id": "lantern_001", "prototype_id": "lantern", "quantity": 1},
+    {"item_name": "Lantern Oil", "item_id": "oil_001", "prototype_id": "oil", "quantity": 3},
+    {"item_name": "Elder Sign", "item_id": "sign_001", "prototype_id": "elder_sign", "quantity": 1},
+    {"item_name": "Signet Ring", "item_id": "ring_001", "prototype_id": "ring", "quantity": 1},
+    {"item_name": "lantern", "item_id": "lantern_002", "prototype_id": "lantern", "quantity": 2},
+    {"item_id": "unnamed_relic", "prototype_id": "relic", "quantity": 1},
+]
+
+
+def _store_with(stacks: list[dict[str, object]]) -> RoomDropStore:
+    store = RoomDropStore()
+    for stack in stacks:
+        _ = store.add(ROOM, stack)
+    return store
+
+
+def test_reads_share_one_read_only_list() -> None:
+    """Every reader gets the same list until the room changes; nothing is copied per read."""
+    store = _store_with(FLOOR)
+
+    first = store.stacks(ROOM)
+    assert store.stacks(ROOM) is first
+    assert clone_room_drops(first)[0] is first[0]
+    with pytest.raises(TypeError):
+        first[0]["quantity"] = 9
+    with pytest.raises(TypeError):
+        first.append({"item_name": "Stray Cat", "quantity": 1})
+
+    mutable = deepcopy(first[0])
+    mutable["quantity"] = 9
+    assert first[0]["quantity"] == 1
+
+
+def test_writes_replace_the_list_instead_of_changing_it() -> None:
+    """A list held by a reader keeps describing the floor as it was when read."""
+    store = _store_with(FLOOR)
+    before = store.stacks(ROOM)
+
+    _ = store.take(ROOM, 1, 2)
+
+    assert before[1]["quantity"] == 3
+    assert store.stacks(ROOM)[1]["quantity"] == 1
+    assert store.stacks(ROOM)[0] is before[0]
+
+
+def test_stored_stack_shares_nothing_with_the_dropped_payload() -> None:
+    """Changing the caller's dict (or its nested metadata) after the drop does not reach the floor."""
+    store = RoomDropStore()
+    payload: dict[str, object] = {"item_name": "Journal", "quantity": 1, "metadata": {"pages": [1, 2]}}
+    _ = store.add(ROOM, payload)
+
+    payload["quantity"] = 5
+    metadata = payload["metadata"]
+    assert isinstance(metadata, dict)
+    metadata["pages"].append(3)
+
+    stored = store.stacks(ROOM)[0]
+    assert stored == {"item_name": "Journal", "quantity": 1, "metadata": {"pages": [1, 2]}}
+    assert json.loads(json.dumps(stored)) == stored
+
+
+@pytest.mark.parametrize(
+    "term",
+    ["lantern", "LANTERN ", "lantern_002", "lan", "oil", "sig", "ring", "elder_sign", "relic", "ntern", "zzz", " "],
+)
+def test_name_index_matches_the_scan(term: str) -> None:
+    """The index resolves every search term to the same stack as scanning a plain list."""
+    listed = _store_with(FLOOR).stacks(ROOM)
+
+    assert isinstance(listed, RoomDropList)
+    assert match_room_drop_by_name(listed, term) == match_room_drop_by_name(list(FLOOR), term)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_full_takes_of_one_stack_only_one_wins() -> None:
+    """Two players resolving the same stack and yielding before the take cannot both get it."""
+    manager = RoomSubscriptionManager()
+    manager.add_room_drop(ROOM, {"item_name": "Elder Sign", "item_id": "sign_001", "quantity": 1})
+    manager.add_room_drop(ROOM, {"item_name": "Candle", "item_id": "candle_001", "quantity": 1})
+
+    async def get_elder_sign() -> dict[str, object] | None:
+        listed = manager.list_room_drops(ROOM)
+        index = match_room_drop_by_name(listed, "elder sign")
+        assert index is not None
+        await asyncio.sleep(0)
+        return manager.take_room_drop(ROOM, index, 1, expected=listed[index])
+
+    results = await asyncio.gather(*(get_elder_sign() for _ in range(5)))
+
+    taken = [result for result in results if result is not None]
+    assert len(taken) == 1
+    assert taken[0]["item_id"] == "sign_001"
+    assert [stack["item_id"] for stack in manager.list_room_drops(ROOM)] == ["candle_001"]
+
+
+def test_take_from_a_stale_listing_follows_the_stack_or_fails() -> None:
+    """After another take shifts indexes, the take finds the listed stack instead of its new neighbour."""
+    store = _store_with(FLOOR[:3])
+    listed = store.stacks(ROOM)
+    _ = store.take(ROOM, 0, 1)  # Someone else picks up the lantern first
+
+    oil = store.take(ROOM, 1, 1, expected=listed[1])
+    assert oil is not None
+    assert oil["item_id"] == "oil_001"
+    assert store.take(ROOM, 0, 1, expected=listed[0]) is None
+    assert [stack["item_id"] for stack in store.stacks(ROOM)] == ["oil_001", "sign_001"]
+
+
+def test_partial_takes_follow_a_stack_whose_quantity_changed() -> None:
+    """A stack listed with 3 items is still found after someone took one of them."""
+    store = _store_with([FLOOR[1]])
+    listed = store.stacks(ROOM)
+    _ = store.take(ROOM, 0, 1)
+
+    taken = store.take(ROOM, 0, 5, expected=listed[0])
+
+    assert taken is not None
+    assert taken["quantity"] == 2
+    assert ROOM not in store
+
+
+def test_threaded_takes_never_hand_out_more_than_the_floor_holds() -> None:
+    """Eight threads taking one coin at a time from 200 coins get exactly 200 between them."""
+    store = _store_with([{"item_name": "Silver Coin", "item_id": "coin", "quantity": 200}])
+    taken: list[int] = []
+    taken_lock = threading.Lock()
+
+    def grab() -> None:
+        for _ in range(50):
+            listed = store.stacks(ROOM)
+            if not listed:
+                return
+            removed = store.take(ROOM, 0, 1, expected=listed[0])
+            if removed is not None:
+                with taken_lock:
+                    taken.append(removed["quantity"])
+
+    threads = [threading.Thread(target=grab) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(taken) == 200
+    assert ROOM not in store
+
+
+def test_look_in_a_room_with_500_stacks_copies_nothing() -> None:
+    """The look path (list, clone, match) over 500 stacks reuses the stored stacks and finds by index."""
+    manager = RoomSubscriptionManager()
+    for i in range(500):
+        manager.add_room_drop(ROOM, {"item_name": f"Curio {i:03d}", "item_id": f"curio_{i:03d}", "quantity": 1})
+    stored = manager.room_drops[ROOM]
+
+    drops = clone_room_drops(manager.list_room_drops(ROOM))
+
+    assert len(drops) == 500
+    assert all(shown is kept for shown, kept in zip(drops, stored, strict=True))
+    assert match_room_drop_by_name(manager.list_room_drops(ROOM), "curio 499") == 499
+
+
+@pytest.mark.asyncio
+async def test_snapshot_restores_drops_after_a_restart(tmp_path: Path) -> None:
+    """Drops written at shutdown are back on the floor when the next server enables snapshots."""
+    snapshot = tmp_path / "drops" / "room_drops.json"
+    before = RoomDropStore(snapshot_window_seconds=3600)
+    assert before.enable_snapshots(snapshot) == 0
+    for stack in FLOOR[:2]:
+        _ = before.add(ROOM, stack)
+    _ = before.take(ROOM, 1, 1)
+
+    await before.shutdown()
+
+    after = RoomDropStore()
+    assert after.enable_snapshots(snapshot) == 2
+    assert list(after.stacks(ROOM)) == [FLOOR[0], {**FLOOR[1], "quantity": 2}]
+    assert not list(tmp_path.glob("drops/room_drops_*.json"))
+
+
+@pytest.mark.asyncio
+async def test_snapshot_window_writes_changes_on_its_own(tmp_path: Path) -> None:
+    """The first change opens a window that writes the snapshot when it closes."""
+    snapshot = tmp_path / "room_drops.json"
+    store = RoomDropStore(snapshot_window_seconds=0)
+    _ = store.enable_snapshots(snapshot)
+
+    _ = store.add(ROOM, FLOOR[2])
+    task = store._snapshot_task
+    assert task is not None
+    await task
+
+    assert json.loads(snapshot.read_text(encoding="utf-8"))["rooms"] == {ROOM: [FLOOR[2]]}
+    assert store._snapshot_task is None
+
+
+def test_unreadable_snapshot_starts_with_empty_floors(tmp_path: Path) -> None:
+    """A corrupt snapshot is reported and ignored rather than blocking startup."""
+    snapshot = tmp_path / "room_drops.json"
+    _ = snapshot.write_text("{not json", encoding="utf-8")
+    store = RoomDropStore()
+
+    assert store.enable_snapshots(snapshot) == 0
+    assert len(store) == 0
+    assert store.snapshot_path == snapshot
+
+
+def test_without_snapshots_nothing_is_scheduled() -> None:
+    """The default in-memory store never opens a snapshot window."""
+    store = _store_with(FLOOR)
+
+    assert store.snapshot_path is None
+    assert store._snapshot_task is None
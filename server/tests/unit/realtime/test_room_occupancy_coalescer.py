@@ -0,0 +1,116 @@
+"""Unit tests for per-room coalescing of occupant broadcasts."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from server.realtime.room_occupancy_coalescer import RoomOccupancyCoalescer
+
+WINDOW = 0.02
+
+
+async def _wait_for_windows_to_close(coalescer: RoomOccupancyCoalescer) -> None:
+    for _ in range(50):
+        if coalescer.get_stats()["open_windows"] == 0:
+            return
+        await asyncio.sleep(WINDOW)
+
+
+@pytest.mark.asyncio
+async def test_first_change_broadcasts_immediately() -> None:
+    flush = AsyncMock()
+    coalescer = RoomOccupancyCoalescer(flush, window_seconds=WINDOW)
+
+    await coalescer.request_update("room-1", exclude_player="p1")
+
+    flush.assert_awaited_once_with("room-1", "p1")
+    await _wait_for_windows_to_close(coalescer)
+    assert flush.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_burst_collapses_into_one_trailing_broadcast() -> None:
+    """A group of followers arriving together yields a leading and a single trailing broadcast."""
+    flush = AsyncMock()
+    coalescer = RoomOccupancyCoalescer(flush, window_seconds=WINDOW)
+
+    for i in range(10):
+        await coalescer.request_update("room-1", exclude_player=f"follower-{i}")
+    assert flush.await_count == 1
+
+    await _wait_for_windows_to_close(coalescer)
+    assert flush.await_count == 2
+    # Merged requests excluded different players, so the trailing snapshot goes to everyone
+    assert flush.await_args.args == ("room-1", None)
+    assert coalescer.get_stats() == {"requests": 10, "broadcasts": 2, "merged": 8, "open_windows": 0}
+
+
+@pytest.mark.asyncio
+async def test_trailing_broadcast_keeps_shared_exclusion() -> None:
+    flush = AsyncMock()
+    coalescer = RoomOccupancyCoalescer(flush, window_seconds=WINDOW)
+
+    await coalescer.request_update("room-1")
+    await coalescer.request_update("room-1", exclude_player="p1")
+    await coalescer.request_update("room-1", exclude_player="p1")
+    await _wait_for_windows_to_close(coalescer)
+
+    assert flush.await_args.args == ("room-1", "p1")
+
+
+@pytest.mark.asyncio
+async def test_rooms_are_coalesced_independently() -> None:
+    flush = AsyncMock()
+    coalescer = RoomOccupancyCoalescer(flush, window_seconds=WINDOW)
+
+    await coalescer.request_update("room-1")
+    await coalescer.request_update("room-2")
+
+    assert [call.args[0] for call in flush.await_args_list] == ["room-1", "room-2"]
+    await _wait_for_windows_to_close(coalescer)
+    assert flush.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_zero_window_disables_coalescing() -> None:
+    flush = AsyncMock()
+    coalescer = RoomOccupancyCoalescer(flush, window_seconds=0)
+
+    for _ in range(3):
+        await coalescer.request_update("room-1")
+
+    assert flush.await_count == 3
+    assert coalescer.get_stats()["open_windows"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_broadcast_does_not_stick_the_window() -> None:
+    flush = AsyncMock(side_effect=RuntimeError("socket gone"))
+    coalescer = RoomOccupancyCoalescer(flush, window_seconds=WINDOW)
+
+    await coalescer.request_update("room-1")
+    await coalescer.request_update("room-1")
+    await _wait_for_windows_to_close(coalescer)
+
+    assert flush.await_count == 2
+    assert coalescer.get_stats()["open_windows"] == 0
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_windows() -> None:
+    flush = AsyncMock()
+    coalescer = RoomOccupancyCoalescer(flush, window_seconds=10)
+
+    await coalescer.request_update("room-1")
+    await coalescer.request_update("room-1")
+    coalescer.close()
+    await asyncio.sleep(0)
+
+    assert flush.await_count == 1
+    assert coalescer.get_stats()["open_windows"] == 0
+
+
+def test_negative_window_rejected() -> None:
+    with pytest.raises(ValueError):
+        _ = RoomOccupancyCoalescer(AsyncMock(), window_seconds=-1)
@@ -21,14 +21,16 @@ def subscription_manager():
 
 
 def test_list_room_drops(subscription_manager):
-    """Test list_room_drops() returns defensive copy."""
-    subscription_manager.room_drops["room_001"] = [{"item_id": "item_001", "quantity": 1}]
+    """Test list_room_drops() returns a read-only list that later changes do not alter."""
+    subscription_manager.add_room_drop("room_001", {"item_id": "item_001", "quantity": 1})
     result = subscription_manager.list_room_drops("room_001")
     assert len(result) == 1
     assert result[0]["item_id"] == "item_001"
-    # Modify original to verify defensive copy
-    subscription_manager.room_drops["room_001"][0]["quantity"] = 2
+    with pytest.raises(TypeError):
+        result[0]["quantity"] = 2
+    subscription_manager.adjust_room_drop("room_001", 0, 2)
     assert result[0]["quantity"] == 1
+    assert subscription_manager.list_room_drops("room_001")[0]["quantity"] == 2
 
 
 def test_list_room_drops_empty(subscription_manager):
@@ -58,7 +60,7 @@ def test_add_room_drop_invalid_quantity(subscription_manager):
 
 def test_take_room_drop(subscription_manager):
     """Test take_room_drop() removes drop from room."""
-    subscription_manager.room_drops["room_001"] = [{"item_id": "item_001", "quantity": 5}]
+    subscription_manager.add_room_drop("room_001", {"item_id": "item_001", "quantity": 5})
     result = subscription_manager.take_room_drop("room_001", 0, 3)
     assert result is not None
     assert result["quantity"] == 3
@@ -67,7 +69,7 @@ def test_take_room_drop(subscription_manager):
 
 def test_take_room_drop_all(subscription_manager):
     """Test take_room_drop() removes entire stack when quantity >= available."""
-    subscription_manager.room_drops["room_001"] = [{"item_id": "item_001", "quantity": 5}]
+    subscription_manager.add_room_drop("room_001", {"item_id": "item_001", "quantity": 5})
     result = subscription_manager.take_room_drop("room_001", 0, 5)
     assert result is not None
     assert result["quantity"] == 5
@@ -76,14 +78,14 @@ def test_take_room_drop_all(subscription_manager):
 
 def test_take_room_drop_invalid_index(subscription_manager):
     """Test take_room_drop() returns None for invalid index."""
-    subscription_manager.room_drops["room_001"] = [{"item_id": "item_001", "quantity": 5}]
+    subscription_manager.add_room_drop("room_001", {"item_id": "item_001", "quantity": 5})
     result = subscription_manager.take_room_drop("room_001", 10, 1)
     assert result is None
 
 
 def test_adjust_room_drop(subscription_manager):
     """Test adjust_room_drop() adjusts quantity."""
-    subscription_manager.room_drops["room_001"] = [{"item_id": "item_001", "quantity": 5}]
+    subscription_manager.add_room_drop("room_001", {"item_id": "item_001", "quantity": 5})
     result = subscription_manager.adjust_room_drop("room_001", 0, 3)
     assert result is True
     assert subscription_manager.room_drops["room_001"][0]["quantity"] == 3
@@ -91,7 +93,7 @@ def test_adjust_room_drop(subscription_manager):
 
 def test_adjust_room_drop_remove(subscription_manager):
     """Test adjust_room_drop() removes stack when quantity is 0."""
-    subscription_manager.room_drops["room_001"] = [{"item_id": "item_001", "quantity": 5}]
+    subscription_manager.add_room_drop("room_001", {"item_id": "item_001", "quantity": 5})
     result = subscription_manager.adjust_room_drop("room_001", 0, 0)
     assert result is True
     assert "room_001" not in subscription_manager.room_drops
@@ -99,7 +101,7 @@ def test_adjust_room_drop_remove(subscription_manager):
 
 def test_adjust_room_drop_invalid_index(subscription_manager):
     """Test adjust_room_drop() returns False for invalid index."""
-    subscription_manager.room_drops["room_001"] = [{"item_id": "item_001", "quantity": 5}]
+    subscription_manager.add_room_drop("room_001", {"item_id": "item_001", "quantity": 5})
     result = subscription_manager.adjust_room_drop("room_001", 10, 3)
     assert result is False
 
@@ -259,7 +261,7 @@ def test_take_room_drop_error_handling(subscription_manager):
     """Test take_room_drop() handles errors gracefully."""
     stack = {"item_name": "sword", "quantity": 1}
     subscription_manager.add_room_drop("room_001", stack)
-    with patch("server.realtime.room_subscription_manager.deepcopy", side_effect=Exception("Deepcopy error")):
+    with patch("server.realtime.room_drop_store.thaw_stack", side_effect=Exception("Copy error")):
         result = subscription_manager.take_room_drop("room_001", 0, 1)
         assert result is None
 
@@ -268,14 +270,14 @@ def test_adjust_room_drop_error_handling(subscription_manager):
     """Test adjust_room_drop() handles errors gracefully."""
     stack = {"item_name": "sword", "quantity": 1}
     subscription_manager.add_room_drop("room_001", stack)
-    subscription_manager.room_drops["room_001"][0] = None
-    result = subscription_manager.adjust_room_drop("room_001", 0, 5)
+    with patch.object(subscription_manager.room_drops, "adjust", side_effect=Exception("Store error")):
+        result = subscription_manager.adjust_room_drop("room_001", 0, 5)
     assert result is False
 
 
 def test_list_room_drops_error(subscription_manager):
     """Test list_room_drops() handles errors gracefully."""
     subscription_manager.add_room_drop("room_001", {"item": "sword", "quantity": 1})
-    with patch("server.realtime.room_subscription_manager.deepcopy", side_effect=Exception("Deepcopy error")):
+    with patch.object(subscription_manager.room_drops, "stacks", side_effect=Exception("Store error")):
         result = subscription_manager.list_room_drops("room_001")
         assert result == []
@@ -4,8 +4,10 @@ Unit tests for room subscription manager helper functions.
 Tests the helper functions in room_subscription_manager.py.
 """
 
+# pylint: disable=protected-access  # Reason: Tests break and inspect the manager's reverse indexes
+
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -86,9 +88,10 @@ def test_remove_player_from_all_rooms_with_subscriptions(subscription_manager):
 def test_remove_player_from_all_rooms_error(subscription_manager):
     """Test remove_player_from_all_rooms() handles errors gracefully."""
     subscription_manager.subscribe_to_room("player_001", "room_001")
-    with patch("builtins.list", side_effect=Exception("List error")):
-        result = subscription_manager.remove_player_from_all_rooms("player_001")
-        assert result is False
+    subscription_manager._player_subscriptions = MagicMock()
+    subscription_manager._player_subscriptions.pop.side_effect = Exception("Index error")
+    result = subscription_manager.remove_player_from_all_rooms("player_001")
+    assert result is False
 
 
 def test_reconcile_room_presence_no_online_players(subscription_manager):
@@ -176,3 +179,79 @@ def test_get_stats_error(subscription_manager):
         assert isinstance(result, dict)
     finally:
         subscription_manager.room_subscriptions = original_subscriptions
+
+
+class _NoScanDict(dict[str, set[str]]):
+    """Room map that fails the test if anything iterates over all rooms."""
+
+    def __iter__(self):
+        raise AssertionError("iterated over every room")
+
+    def keys(self):
+        raise AssertionError("iterated over every room")
+
+    def values(self):
+        raise AssertionError("iterated over every room")
+
+    def items(self):
+        raise AssertionError("iterated over every room")
+
+
+def _add_players(manager: RoomSubscriptionManager, room_count: int, player_count: int) -> None:
+    """Subscribe each player to one room and make it the player's location."""
+    for i in range(player_count):
+        manager.subscribe_to_room(f"player_{i}", f"room_{i * 7 % room_count}")
+        manager.add_room_occupant(f"player_{i}", f"room_{i * 7 % room_count}")
+
+
+def _populated_manager(room_count: int) -> RoomSubscriptionManager:
+    """Manager in which every room has a resident subscriber and occupant."""
+    manager = RoomSubscriptionManager()
+    for i in range(room_count):
+        manager.subscribe_to_room(f"resident_{i}", f"room_{i}")
+        manager.add_room_occupant(f"resident_{i}", f"room_{i}")
+    return manager
+
+
+def test_remove_player_from_all_rooms_touches_only_the_players_rooms():
+    """Disconnecting uses the player's room index; it never walks every room (cost is O(player's rooms))."""
+    rooms, players = 500, 100
+    manager = _populated_manager(rooms)
+    _add_players(manager, rooms, players)
+    manager.room_subscriptions = _NoScanDict(manager.room_subscriptions)
+    manager.room_occupants = _NoScanDict(manager.room_occupants)
+
+    for i in range(players):
+        assert manager.remove_player_from_all_rooms(f"player_{i}") is True
+
+    assert manager.room_subscriptions["room_0"] == {"resident_0"}
+    assert manager.room_occupants["room_0"] == {"resident_0"}
+    assert manager.get_stats()["total_subscriptions"] == rooms
+    assert not manager._player_subscriptions.keys() & {f"player_{i}" for i in range(players)}
+
+
+def test_get_stats_uses_running_totals():
+    """Totals follow subscribe/unsubscribe, occupancy changes, reconciliation and disconnects without scanning."""
+    manager = RoomSubscriptionManager()
+    manager.subscribe_to_room("player_001", "room_001")
+    manager.subscribe_to_room("player_001", "room_001")  # Duplicate does not count twice
+    manager.subscribe_to_room("player_002", "room_001")
+    manager.subscribe_to_room("player_002", "room_002")
+    manager.add_room_occupant("player_001", "room_001")
+    manager.add_room_occupant("player_002", "room_001")
+    manager.add_room_occupant("player_003", "room_001")
+    manager.unsubscribe_from_room("player_002", "room_002")
+    manager.unsubscribe_from_room("player_009", "room_001")  # Not subscribed: no change
+    assert manager.reconcile_room_presence("room_001", {"player_001": {}, "player_002": {}}) is True
+    manager.room_subscriptions = _NoScanDict(manager.room_subscriptions)
+    manager.room_occupants = _NoScanDict(manager.room_occupants)
+
+    stats = manager.get_stats()
+    assert stats["total_subscriptions"] == 2
+    assert stats["total_occupants"] == 2
+    assert stats["average_subscriptions_per_room"] == 2
+
+    assert manager.remove_player_from_all_rooms("player_002") is True
+    stats = manager.get_stats()
+    assert stats["total_subscriptions"] == 1
+    assert stats["total_occupants"] == 1
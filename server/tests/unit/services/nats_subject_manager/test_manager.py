@@ -132,6 +132,12 @@ def test_validate_subject_event_domain(subject_manager):
     assert subject_manager.validate_subject("events.domain.PlayerEnteredRoom") is True
 
 
+def test_validate_subject_event_domain_zone(subject_manager):
+    """Test validate_subject() accepts zone-sharded events.domain.{event_type}.{zone}."""
+    assert subject_manager.validate_subject("events.domain.PlayerEnteredRoom.arkhamcity") is True
+    assert subject_manager.validate_subject("events.domain.player_xp_awarded.innsmouth") is True
+
+
 def test_validate_subject_empty(subject_manager):
     """Test validate_subject() returns False for empty subject."""
     result = subject_manager.validate_subject("")
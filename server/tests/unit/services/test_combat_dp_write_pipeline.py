@@ -0,0 +1,172 @@
+"""Unit tests for the coalescing combat DP write pipeline."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+
+from server.exceptions import DatabaseError
+from server.services.combat_dp_write_pipeline import CombatDPWritePipeline
+
+WINDOW = 0.01
+
+
+def _persistence(stored_name: str = "Investigator") -> MagicMock:
+    """Persistence double whose set_players_dp echoes the written values like RETURNING would."""
+    persistence = MagicMock()
+
+    async def set_players_dp(dp_by_player: dict[uuid.UUID, int]) -> dict[uuid.UUID, tuple[str, int]]:
+        return {player_id: (stored_name, dp) for player_id, dp in dp_by_player.items()}
+
+    persistence.set_players_dp = AsyncMock(side_effect=set_players_dp)
+    return persistence
+
+
+def _pipeline(persistence: MagicMock | None, correction: AsyncMock | None = None) -> CombatDPWritePipeline:
+    return CombatDPWritePipeline(lambda: persistence, correction or AsyncMock(), window_seconds=WINDOW)
+
+
+async def _wait_for_flush(pipeline: CombatDPWritePipeline) -> None:
+    for _ in range(50):
+        if pipeline._flush_task is None:  # pylint: disable=protected-access  # Reason: Test waits for the window task to finish
+            return
+        await asyncio.sleep(WINDOW)
+
+
+@pytest.mark.asyncio
+async def test_hits_in_one_window_become_one_statement() -> None:
+    persistence = _persistence()
+    pipeline = _pipeline(persistence)
+    player_id = uuid.uuid4()
+
+    for dp in (18, 15, 11, 6):
+        pipeline.submit(player_id, dp, dp + 3, 20, "room-1", "combat-1")
+    await _wait_for_flush(pipeline)
+
+    persistence.set_players_dp.assert_awaited_once_with({player_id: 6})
+    assert pipeline.get_combat_write_stats("combat-1") == {
+        "dp_changes": 4,
+        "coalesced": 3,
+        "statements": 1,
+        "rows_written": 1,
+        "failures": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_raid_writes_all_players_in_one_statement() -> None:
+    persistence = _persistence()
+    pipeline = _pipeline(persistence)
+    raid = [uuid.uuid4() for _ in range(25)]
+
+    for round_number in range(3):
+        for player_id in raid:
+            pipeline.submit(player_id, 20 - round_number, 21 - round_number, 20, "lair", "raid")
+    await _wait_for_flush(pipeline)
+
+    assert persistence.set_players_dp.await_count == 1
+    stats = pipeline.get_combat_write_stats("raid")
+    assert stats["dp_changes"] == 75
+    assert stats["statements"] == 1
+    assert stats["rows_written"] == 25
+
+
+@pytest.mark.asyncio
+async def test_changes_after_a_flush_open_a_new_window() -> None:
+    persistence = _persistence()
+    pipeline = _pipeline(persistence)
+    player_id = uuid.uuid4()
+
+    pipeline.submit(player_id, 15, 20, 20, combat_id="combat-1")
+    await _wait_for_flush(pipeline)
+    pipeline.submit(player_id, 9, 15, 20, combat_id="combat-1")
+    await _wait_for_flush(pipeline)
+
+    assert [call.args[0] for call in persistence.set_players_dp.await_args_list] == [{player_id: 15}, {player_id: 9}]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_restores_dp_from_before_the_window() -> None:
+    persistence = MagicMock()
+    persistence.set_players_dp = AsyncMock(side_effect=DatabaseError("db down"))
+    correction = AsyncMock()
+    pipeline = _pipeline(persistence, correction)
+    player_id = uuid.uuid4()
+
+    pipeline.submit(player_id, 15, 20, 20, "room-1", "combat-1")
+    pipeline.submit(player_id, 10, 15, 20, "room-1", "combat-1")
+    await _wait_for_flush(pipeline)
+
+    correction.assert_awaited_once_with(player_id, 20, 20, "room-1", "combat-1", "db down")
+    stats = pipeline.get_combat_write_stats("combat-1")
+    assert stats["failures"] == 1
+    assert stats["statements"] == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_player_is_not_counted_as_written() -> None:
+    persistence = MagicMock()
+    persistence.set_players_dp = AsyncMock(return_value={})
+    pipeline = _pipeline(persistence)
+
+    pipeline.submit(uuid.uuid4(), 5, 10, 20, combat_id="combat-1")
+    await _wait_for_flush(pipeline)
+
+    assert pipeline.get_combat_write_stats("combat-1")["rows_written"] == 0
+
+
+@pytest.mark.asyncio
+async def test_finish_combat_flushes_and_releases_counters() -> None:
+    persistence = _persistence()
+    pipeline = CombatDPWritePipeline(lambda: persistence, AsyncMock(), window_seconds=10)
+    player_id = uuid.uuid4()
+
+    pipeline.submit(player_id, -10, -5, 20, combat_id="combat-1")
+    stats = await pipeline.finish_combat("combat-1")
+
+    persistence.set_players_dp.assert_awaited_once_with({player_id: -10})
+    assert stats["rows_written"] == 1
+    assert pipeline.get_combat_write_stats("combat-1")["dp_changes"] == 0
+    assert pipeline.get_stats()["rows_written"] == 1
+    await pipeline.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_writes_pending_changes_immediately() -> None:
+    persistence = _persistence()
+    pipeline = CombatDPWritePipeline(lambda: persistence, AsyncMock(), window_seconds=10)
+    player_id = uuid.uuid4()
+
+    pipeline.submit(player_id, 12, 20, 20)
+    await pipeline.shutdown()
+
+    persistence.set_players_dp.assert_awaited_once_with({player_id: 12})
+    assert pipeline._flush_task is None  # pylint: disable=protected-access  # Reason: Test verifies the window task is gone
+
+
+@pytest.mark.asyncio
+async def test_no_persistence_drops_batch_without_error() -> None:
+    pipeline = _pipeline(None)
+
+    pipeline.submit(uuid.uuid4(), 5, 10, 20, combat_id="combat-1")
+    await _wait_for_flush(pipeline)
+
+    assert pipeline.get_combat_write_stats("combat-1")["statements"] == 0
+
+
+def test_submit_without_event_loop_keeps_change_pending() -> None:
+    persistence = _persistence()
+    pipeline = _pipeline(persistence)
+    player_id = uuid.uuid4()
+
+    pipeline.submit(player_id, 5, 10, 20)
+
+    assert anyio.run(pipeline.flush) == 1
+    persistence.set_players_dp.assert_awaited_once_with({player_id: 5})
+
+
+def test_negative_window_rejected() -> None:
+    with pytest.raises(ValueError):
+        _ = CombatDPWritePipeline(MagicMock(), AsyncMock(), window_seconds=-1)
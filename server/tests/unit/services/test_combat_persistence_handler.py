@@ -1,7 +1,7 @@
 """
 Unit tests for combat persistence handler - core functionality.
 
-Tests initialization, persistence layer access, and DP/posture updates.
+Tests initialization, persistence layer access, and DP persistence entry point.
 """
 
 import uuid
@@ -81,22 +81,9 @@ def test_get_persistence_layer_no_async_persistence(persistence_handler):
         assert result is None
 
 
-def test_log_death_state_changes_death_threshold(persistence_handler):
-    """Test _log_death_state_changes logs death threshold."""
-    player_id = uuid.uuid4()
-    # Should not raise, just log
-    persistence_handler._log_death_state_changes(player_id, "TestPlayer", -10, 5)
-
-
-def test_log_death_state_changes_mortally_wounded(persistence_handler):
-    """Test _log_death_state_changes logs mortally wounded."""
-    player_id = uuid.uuid4()
-    persistence_handler._log_death_state_changes(player_id, "TestPlayer", 0, 5)
-
-
 def test_persist_player_dp_background_public_api(persistence_handler):
     """Test persist_player_dp_background public API method."""
     player_id = uuid.uuid4()
-    with patch.object(persistence_handler, "_persist_player_dp_background") as mock_persist:
+    with patch.object(persistence_handler.dp_write_pipeline, "submit") as mock_submit:
         persistence_handler.persist_player_dp_background(player_id, 30, 50, 100)
-        mock_persist.assert_called_once_with(player_id, 30, 50, 100, None, None)
+        mock_submit.assert_called_once_with(player_id, 30, 50, 100, None, None)
@@ -5,9 +5,7 @@
 
 from __future__ import annotations
 
-import asyncio
 import uuid
-from collections.abc import Coroutine
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -20,6 +18,7 @@ from server.services import (
     combat_service_events,
     combat_service_start,
 )
+from server.services.combat_dp_write_pipeline import CombatDPWritePipeline
 from server.services.combat_hp_sync import CombatDPSync
 from server.services.combat_types import CombatParticipantData
 from server.services.nats_exceptions import NATSError
@@ -55,10 +54,6 @@ def _combat_instance() -> CombatInstance:
     return combat
 
 
-def _create_task(coro: Coroutine[None, None, None]) -> asyncio.Task[None]:
-    return asyncio.ensure_future(coro)
-
-
 @pytest.mark.asyncio
 async def test_validate_combat_can_start_raises_when_in_combat() -> None:
     """Cannot start combat when either participant is already fighting."""
@@ -200,6 +195,7 @@ async def test_end_combat_full_flow() -> None:
     service.notify_player_combat_ended = notify_player_combat_ended
     service.check_connection_state = check_connection_state
     service.publish_combat_ended_event = publish_combat_ended_event
+    service.finish_combat_dp_writes = AsyncMock()
 
     with patch("server.services.combat_service_end.clear_aggro_for_combat") as mock_clear:
         await combat_service_end.end_combat(service, combat.combat_id, reason="Victory")
@@ -208,6 +204,7 @@ async def test_end_combat_full_flow() -> None:
     assert combat.status == CombatStatus.ENDED
     cleanup_combat_tracking.assert_called_once_with(combat)
     notify_player_combat_ended.assert_awaited_once_with(combat.combat_id)
+    service.finish_combat_dp_writes.assert_awaited_once_with(combat.combat_id)
     publish_combat_ended_event.assert_awaited_once()
 
 
@@ -293,46 +290,6 @@ def test_combat_dp_sync_get_persistence_missing() -> None:
         assert sync._get_persistence(uuid.uuid4()) is None
 
 
-@pytest.mark.asyncio
-async def test_combat_dp_sync_update_and_save_player_not_found() -> None:
-    sync = _dp_sync()
-    get_player_by_id: AsyncMock = AsyncMock(return_value=None)
-    persistence: AsyncMock = AsyncMock()
-    persistence.get_player_by_id = get_player_by_id
-    result = await sync._update_and_save_player_dp(persistence, uuid.uuid4(), 5)
-    assert result is None
-
-
-@pytest.mark.asyncio
-async def test_combat_dp_sync_update_and_save_success() -> None:
-    sync = _dp_sync()
-    apply_dp_change: MagicMock = MagicMock(return_value=(10, False, False))
-    player: MagicMock = MagicMock(name="Investigator")
-    player.apply_dp_change = apply_dp_change
-    save_player: AsyncMock = AsyncMock()
-    get_player_by_id: AsyncMock = AsyncMock(return_value=player)
-    persistence: AsyncMock = AsyncMock()
-    persistence.get_player_by_id = get_player_by_id
-    persistence.save_player = save_player
-    result = await sync._update_and_save_player_dp(persistence, uuid.uuid4(), 8)
-    assert result is not None
-    save_player.assert_awaited_once()
-
-
-def test_combat_dp_sync_log_death_threshold() -> None:
-    sync = _dp_sync()
-    player_id = uuid.uuid4()
-    sync._log_death_threshold_events(-10, 5, player_id, "Investigator")
-    sync._log_death_threshold_events(-1, 5, player_id, "Investigator")
-
-
-@pytest.mark.asyncio
-async def test_combat_dp_sync_persist_player_dp_sync_no_persistence() -> None:
-    sync = _dp_sync()
-    with patch.object(sync, "_get_persistence", return_value=None):
-        await sync._persist_player_dp_sync(uuid.uuid4(), 5)
-
-
 @pytest.mark.asyncio
 async def test_combat_dp_sync_publish_correction_event() -> None:
     sync = _dp_sync()
@@ -346,75 +303,36 @@ async def test_combat_dp_sync_publish_correction_event() -> None:
 
 
 @pytest.mark.asyncio
-async def test_combat_dp_sync_verify_player_save_mismatch() -> None:
-    sync = _dp_sync()
-    get_stats: MagicMock = MagicMock(return_value={"current_dp": 99})
-    player: MagicMock = MagicMock()
-    player.get_stats = get_stats
-    get_player_by_id: AsyncMock = AsyncMock(return_value=player)
-    persistence: AsyncMock = AsyncMock()
-    persistence.get_player_by_id = get_player_by_id
-    await sync._verify_player_save(persistence, uuid.uuid4(), "Investigator", 10, 8)
+async def test_combat_dp_sync_persist_background_shares_combat_pipeline() -> None:
+    pipeline = CombatDPWritePipeline(MagicMock(return_value=None), AsyncMock(), window_seconds=10)
+    handler: MagicMock = MagicMock()
+    handler.dp_write_pipeline = pipeline
+    sync = _dp_sync(_persistence_handler=handler)
 
+    sync._persist_player_dp_background(uuid.uuid4(), 8, 10, 20, room_id="room-a", combat_id="combat-1")
 
-@pytest.mark.asyncio
-async def test_combat_dp_sync_persist_player_dp_sync_success() -> None:
-    sync = _dp_sync()
-    apply_dp_change: MagicMock = MagicMock(return_value=(10, True, False))
-    player: MagicMock = MagicMock(name="Investigator")
-    player.apply_dp_change = apply_dp_change
-    save_player: AsyncMock = AsyncMock()
-    get_player_by_id: AsyncMock = AsyncMock(return_value=player)
-    persistence: AsyncMock = AsyncMock()
-    persistence.get_player_by_id = get_player_by_id
-    persistence.save_player = save_player
-    with patch.object(sync, "_get_persistence", return_value=persistence):
-        await sync._persist_player_dp_sync(uuid.uuid4(), 5)
-    save_player.assert_awaited_once()
+    assert pipeline.get_combat_write_stats("combat-1")["dp_changes"] == 1
+    await pipeline.shutdown()
 
 
 @pytest.mark.asyncio
-async def test_combat_dp_sync_persist_player_dp_sync_database_error() -> None:
+async def test_combat_dp_sync_persist_background_failure_sends_correction() -> None:
     sync = _dp_sync()
-    get_player_by_id: AsyncMock = AsyncMock(side_effect=DatabaseError("db down"))
+    player_id = uuid.uuid4()
     persistence: AsyncMock = AsyncMock()
-    persistence.get_player_by_id = get_player_by_id
-    with patch.object(sync, "_get_persistence", return_value=persistence):
-        await sync._persist_player_dp_sync(uuid.uuid4(), 5)
+    persistence.set_players_dp = AsyncMock(side_effect=DatabaseError("write failed"))
+    correction: AsyncMock = AsyncMock()
+    sync._dp_writes = CombatDPWritePipeline(lambda: persistence, correction, window_seconds=0)
 
+    sync._persist_player_dp_background(player_id, 8, 10, 20, room_id="room-a")
+    await sync._dp_writes.shutdown()
 
-@pytest.mark.asyncio
-async def test_combat_dp_sync_persist_background_runs_task() -> None:
-    sync = _dp_sync()
-    player_id = uuid.uuid4()
-    persist: AsyncMock = AsyncMock()
-    with patch.object(sync, "_persist_player_dp_sync", persist):
-        with patch("asyncio.create_task", new=_create_task):
-            sync._persist_player_dp_background(player_id, 8, 10, 20, room_id="room-a")
-            await asyncio.sleep(0)
-    persist.assert_awaited_once_with(player_id, 8)
+    correction.assert_awaited_once_with(player_id, 10, 20, "room-a", None, "write failed")
 
 
 def test_combat_dp_sync_persist_background_no_event_loop() -> None:
     sync = _dp_sync()
-    with patch("asyncio.create_task", side_effect=RuntimeError("no loop")):
-        sync._persist_player_dp_background(uuid.uuid4(), 8, 10, 20)
-
-
-@pytest.mark.asyncio
-async def test_combat_dp_sync_persist_background_persistence_failure_sends_correction() -> None:
-    sync = _dp_sync()
-
-    async def fail_persist(_player_id: uuid.UUID, _dp: int) -> None:
-        raise DatabaseError("write failed")
-
-    correction: AsyncMock = AsyncMock()
-    with patch.object(sync, "_persist_player_dp_sync", fail_persist):
-        with patch.object(sync, "_publish_player_dp_correction_event", correction):
-            with patch("asyncio.create_task", new=_create_task):
-                sync._persist_player_dp_background(uuid.uuid4(), 8, 10, 20, room_id="room-a")
-                await asyncio.sleep(0)
-            correction.assert_awaited_once()
+    sync._persist_player_dp_background(uuid.uuid4(), 8, 10, 20)
 
 
 def _attack_participant(
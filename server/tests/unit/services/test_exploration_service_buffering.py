@@ -0,0 +1,143 @@
+"""
+Unit tests for ExplorationService room-cache lookups, buffered discoveries and connect/disconnect hooks.
+
+Split from test_exploration_service.py to satisfy the file-length limit.
+"""
+
+# pylint: disable=redefined-outer-name  # Reason: pytest fixture parameter names must match fixture names
+# pylint: disable=protected-access  # Reason: Tests inspect the service's write buffer and background tasks
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from server.services.exploration_service import ExplorationService
+
+
+def _row_fetchall(rows: object) -> MagicMock:
+    """SQLAlchemy-style result mock with fetchall() -> rows."""
+    mock_result = MagicMock()
+    mock_result.fetchall = MagicMock(return_value=rows)
+    return mock_result
+
+
+def _async_session_maker_mock(mock_session: AsyncMock) -> MagicMock:
+    """Async context manager returned by get_session_maker() -> maker() in tests."""
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=mock_session)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=ctx)
+
+
+@pytest.fixture
+def mock_database_manager() -> MagicMock:
+    """Create a mock database manager."""
+    manager = MagicMock()
+    manager.get_session_maker = MagicMock(return_value=MagicMock())
+    return manager
+
+
+ROOM_ID = "earth_arkhamcity_northside_room_001"
+
+
+@pytest.fixture
+def cached_room_uuid() -> uuid.UUID:
+    """UUID the room cache resolves ROOM_ID to."""
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def buffered_service(mock_database_manager: MagicMock, cached_room_uuid: uuid.UUID) -> ExplorationService:
+    """ExplorationService resolving ROOM_ID from the room cache, with a long flush window."""
+    room_uuids = {ROOM_ID: cached_room_uuid}
+    return ExplorationService(mock_database_manager, room_uuid_lookup=room_uuids.get, flush_window_seconds=3600)
+
+
+@pytest.mark.asyncio
+async def test_mark_room_as_explored_cached_room_skips_database(
+    buffered_service: ExplorationService, mock_database_manager: MagicMock, cached_room_uuid: uuid.UUID
+) -> None:
+    """Rooms the room cache resolves are buffered without a rooms lookup or a session."""
+    player_id = uuid.uuid4()
+    mock_database_manager.get_session_maker.reset_mock()
+    with patch.object(buffered_service, "_get_room_uuid_by_stable_id", AsyncMock()) as room_lookup:
+        for _ in range(3):
+            assert await buffered_service.mark_room_as_explored(player_id, ROOM_ID) is True
+
+    room_lookup.assert_not_awaited()
+    mock_database_manager.get_session_maker.assert_not_called()
+    assert buffered_service._writes.pending_rooms(player_id) == [cached_room_uuid]
+    await buffered_service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_mark_room_as_explored_sync_cached_room_creates_no_task(
+    buffered_service: ExplorationService, cached_room_uuid: uuid.UUID
+) -> None:
+    """Movement's fire-and-forget call buffers known rooms without spawning a task per move."""
+    player_id = uuid.uuid4()
+    with patch("asyncio.AbstractEventLoop.create_task") as create_task:
+        buffered_service.mark_room_as_explored_sync(player_id, ROOM_ID)
+    create_task.assert_not_called()
+    assert buffered_service._writes.is_explored(player_id, cached_room_uuid)
+    await buffered_service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_flushes_buffered_discoveries(
+    buffered_service: ExplorationService, mock_database_manager: MagicMock, cached_room_uuid: uuid.UUID
+) -> None:
+    """Logging out writes the player's discoveries at once instead of waiting for the window."""
+    player_id = uuid.uuid4()
+    mock_session = AsyncMock()
+    mock_database_manager.get_session_maker.return_value = _async_session_maker_mock(mock_session)
+    buffered_service.mark_room_as_explored_sync(player_id, ROOM_ID)
+
+    buffered_service.on_player_disconnect(player_id)
+    assert buffered_service._background_tasks
+    _ = await asyncio.gather(*buffered_service._background_tasks)
+
+    mock_session.execute.assert_awaited_once()
+    params = mock_session.execute.await_args.args[1]
+    assert params["player_ids"] == [player_id]
+    assert params["room_ids"] == [cached_room_uuid]
+    mock_session.commit.assert_awaited_once()
+    assert buffered_service._writes.pending_count() == 0
+    await buffered_service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_connect_loads_explored_rooms(
+    buffered_service: ExplorationService, mock_database_manager: MagicMock, cached_room_uuid: uuid.UUID
+) -> None:
+    """After the login load, re-entering a stored room writes nothing."""
+    player_id = uuid.uuid4()
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(return_value=_row_fetchall([(str(cached_room_uuid),)]))
+    mock_database_manager.get_session_maker.return_value = _async_session_maker_mock(mock_session)
+
+    buffered_service.on_player_connect(player_id)
+    _ = await asyncio.gather(*buffered_service._background_tasks)
+    buffered_service.mark_room_as_explored_sync(player_id, ROOM_ID)
+
+    assert buffered_service._writes.pending_count() == 0
+    assert await buffered_service.is_room_explored(player_id, ROOM_ID, AsyncMock()) is True
+
+
+@pytest.mark.asyncio
+async def test_get_explored_rooms_includes_buffered_discoveries(
+    buffered_service: ExplorationService, cached_room_uuid: uuid.UUID
+) -> None:
+    """The map shows rooms discovered since the last flush."""
+    player_id = uuid.uuid4()
+    stored = uuid.uuid4()
+    buffered_service.mark_room_as_explored_sync(player_id, ROOM_ID)
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(return_value=_row_fetchall([(stored,)]))
+
+    result = await buffered_service.get_explored_rooms(player_id, mock_session)
+
+    assert result == [str(stored), str(cached_room_uuid)]
+    await buffered_service.shutdown()
@@ -0,0 +1,237 @@
+"""
+Unit tests for the write-once exploration buffer.
+"""
+
+# pylint: disable=protected-access  # Reason: Tests await the buffer's flush window task directly
+# pylint: disable=redefined-outer-name  # Reason: pytest fixture parameter names must match fixture names
+
+import uuid
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from server.services.exploration_write_buffer import ExplorationWriteBuffer
+
+
+def _session_maker(session: AsyncMock) -> MagicMock:
+    """get_session_maker() return value whose sessions are always ``session``."""
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=session)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=ctx)
+
+
+BufferFactory = Callable[..., ExplorationWriteBuffer]
+
+
+@pytest.fixture
+async def make_buffer() -> AsyncIterator[BufferFactory]:
+    """Build buffers over a mocked session; open flush windows are closed at teardown."""
+    buffers: list[ExplorationWriteBuffer] = []
+
+    def _make(session: AsyncMock, window_seconds: float = 60.0) -> ExplorationWriteBuffer:
+        maker = _session_maker(session)
+        buffer = ExplorationWriteBuffer(lambda: maker, window_seconds)
+        buffers.append(buffer)
+        return buffer
+
+    yield _make
+    for buffer in buffers:
+        task = buffer._flush_task
+        if task is not None:
+            _ = task.cancel()
+
+
+def _stored_rows(session: AsyncMock) -> list[tuple[str, str]]:
+    """(player_id, room_id) pairs passed to every record_player_explorations call on the session."""
+    rows: list[tuple[str, str]] = []
+    for call in session.execute.await_args_list:
+        params = call.args[1]
+        rows.extend((str(p), str(r)) for p, r in zip(params["player_ids"], params["room_ids"], strict=True))
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_new_rooms_are_written_with_one_statement(make_buffer: BufferFactory) -> None:
+    """Fifty discoveries become one record_player_explorations call and one commit."""
+    session = AsyncMock()
+    buffer = make_buffer(session)
+    player_id = uuid.uuid4()
+    rooms = [uuid.uuid4() for _ in range(50)]
+
+    for room in rooms:
+        assert buffer.record(player_id, room) is True
+    assert await buffer.flush() == 50
+
+    session.execute.assert_awaited_once()
+    statement = str(session.execute.await_args.args[0])
+    assert "record_player_explorations" in statement
+    assert _stored_rows(session) == [(str(player_id), str(room)) for room in rooms]
+    session.commit.assert_awaited_once()
+    assert buffer.pending_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_known_rooms_are_never_written_again(make_buffer: BufferFactory) -> None:
+    """Re-entering a room loaded at login or already recorded queues nothing."""
+    session = AsyncMock()
+    player_id = uuid.uuid4()
+    stored_room, new_room = uuid.uuid4(), uuid.uuid4()
+    load_result = MagicMock()
+    load_result.fetchall.return_value = [(str(stored_room),)]
+    session.execute = AsyncMock(return_value=load_result)
+    buffer = make_buffer(session)
+
+    assert await buffer.load_player(player_id) == 1
+    session.execute.reset_mock()
+
+    assert buffer.record(player_id, stored_room) is False
+    assert buffer.record(player_id, new_room) is True
+    assert buffer.record(player_id, new_room) is False
+    assert buffer.pending_rooms(player_id) == [new_room]
+
+    _ = await buffer.flush()
+    assert _stored_rows(session) == [(str(player_id), str(new_room))]
+
+
+@pytest.mark.asyncio
+async def test_flush_window_writes_discoveries_on_its_own(make_buffer: BufferFactory) -> None:
+    """The first discovery opens a window that writes everything recorded within it."""
+    session = AsyncMock()
+    buffer = make_buffer(session, window_seconds=0)
+    player_id = uuid.uuid4()
+
+    _ = buffer.record(player_id, uuid.uuid4())
+    _ = buffer.record(player_id, uuid.uuid4())
+    task = buffer._flush_task
+    assert task is not None
+    await task
+
+    session.execute.assert_awaited_once()
+    assert len(_stored_rows(session)) == 2
+    assert buffer._flush_task is None
+
+
+@pytest.mark.asyncio
+async def test_large_flush_is_chunked_in_one_transaction(make_buffer: BufferFactory) -> None:
+    """Batches above the chunk size use several statements but a single commit."""
+    session = AsyncMock()
+    buffer = make_buffer(session)
+    player_id = uuid.uuid4()
+    for _ in range(5):
+        _ = buffer.record(player_id, uuid.uuid4())
+
+    with patch("server.services.exploration_write_buffer.EXPLORATION_INSERT_CHUNK_ROWS", 2):
+        assert await buffer.flush() == 5
+
+    assert session.execute.await_count == 3
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_flush_one_player_leaves_others_pending(make_buffer: BufferFactory) -> None:
+    """A disconnect flush only writes that player's discoveries."""
+    session = AsyncMock()
+    buffer = make_buffer(session)
+    leaving, staying = uuid.uuid4(), uuid.uuid4()
+    _ = buffer.record(leaving, uuid.uuid4())
+    _ = buffer.record(staying, uuid.uuid4())
+
+    assert await buffer.flush(leaving) == 1
+    assert buffer.pending_count(leaving) == 0
+    assert buffer.pending_count(staying) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_discoveries_for_retry(make_buffer: BufferFactory) -> None:
+    """A write failure loses nothing: the rooms stay explored and pending, and the next flush writes them."""
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=[SQLAlchemyError("connection reset"), MagicMock()])
+    buffer = make_buffer(session)
+    player_id, room = uuid.uuid4(), uuid.uuid4()
+    _ = buffer.record(player_id, room)
+
+    assert await buffer.flush() == 0
+    assert buffer.pending_rooms(player_id) == [room]
+    assert buffer.is_explored(player_id, room)
+
+    assert await buffer.flush() == 1
+    assert buffer.pending_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_discoveries_lost_in_a_crash_are_recorded_again(make_buffer: BufferFactory) -> None:
+    """
+    After a crash before the flush, the database simply lacks the room.
+
+    The restarted server loads what was stored, so the room counts as new
+    on the next entry and is written then; nothing half-written remains.
+    """
+    player_id, stored_room, lost_room = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    crashed = make_buffer(AsyncMock())
+    _ = crashed.record(player_id, lost_room)
+    # The process dies here: the window never closes and nothing is written
+
+    session = AsyncMock()
+    load_result = MagicMock()
+    load_result.fetchall.return_value = [(str(stored_room),)]
+    session.execute = AsyncMock(return_value=load_result)
+    restarted = make_buffer(session)
+    _ = await restarted.load_player(player_id)
+    session.execute.reset_mock()
+
+    assert restarted.is_explored(player_id, lost_room) is False
+    assert restarted.record(player_id, lost_room) is True
+    _ = await restarted.flush()
+    assert _stored_rows(session) == [(str(player_id), str(lost_room))]
+
+
+@pytest.mark.asyncio
+async def test_load_merges_with_rooms_recorded_before_it_finished(make_buffer: BufferFactory) -> None:
+    """A discovery made while the login load is in flight is kept."""
+    session = AsyncMock()
+    player_id, stored_room, early_room = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    load_result = MagicMock()
+    load_result.fetchall.return_value = [(str(stored_room),)]
+    session.execute = AsyncMock(return_value=load_result)
+    buffer = make_buffer(session)
+
+    _ = buffer.record(player_id, early_room)
+    assert await buffer.load_player(player_id) == 2
+    assert buffer.is_explored(player_id, stored_room)
+    assert buffer.is_explored(player_id, early_room)
+
+
+@pytest.mark.asyncio
+async def test_failed_load_leaves_the_player_writable(make_buffer: BufferFactory) -> None:
+    """Without the stored set, discoveries are still recorded (ON CONFLICT absorbs duplicates)."""
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=SQLAlchemyError("timeout"))
+    buffer = make_buffer(session)
+    player_id = uuid.uuid4()
+
+    assert await buffer.load_player(player_id) == 0
+    assert buffer.record(player_id, uuid.uuid4()) is True
+
+
+@pytest.mark.asyncio
+async def test_shutdown_writes_pending_discoveries_without_waiting_for_the_window(make_buffer: BufferFactory) -> None:
+    """Shutdown cancels the open window and writes what it held."""
+    session = AsyncMock()
+    buffer = make_buffer(session, window_seconds=3600)
+    _ = buffer.record(uuid.uuid4(), uuid.uuid4())
+
+    await buffer.shutdown()
+
+    session.execute.assert_awaited_once()
+    assert buffer.pending_count() == 0
+    assert buffer._flush_task is None
+
+
+def test_negative_window_is_rejected() -> None:
+    """A negative flush window is a configuration error."""
+    with pytest.raises(ValueError, match="window_seconds"):
+        _ = ExplorationWriteBuffer(MagicMock(), window_seconds=-1)
@@ -4,6 +4,9 @@ from unittest.mock import patch
 
 from server.services.lucidity_communication_dampening import (
     apply_communication_dampening,
+    apply_receiver_dampening,
+    apply_sender_dampening,
+    receiver_random,
     should_block_shout,
 )
 
@@ -62,3 +65,30 @@ def test_deranged_incoming_scrambles_words(_mock_randint, _mock_random):
     )
     assert "scrambled" in result["tags"]
     assert result["message"] != "one two three four"
+
+
+@patch("server.services.lucidity_communication_dampening.random.random", return_value=0.0)
+def test_receiver_dampening_leaves_sender_result_unchanged(_mock_random):
+    sender_result = apply_sender_dampening("Wait, what?", sender_tier="uneasy", message_type="whisper")
+    result = apply_receiver_dampening(sender_result, receiver_tier="fractured", message_type="whisper")
+    assert result["message"] == "Wait what"
+    assert result["tags"] == ["strained", "muffled"]
+    assert sender_result == {"message": "Wait, what?", "tags": ["strained"], "blocked": False}
+
+
+def test_seeded_scramble_is_reproducible_per_receiver():
+    sender_result = apply_sender_dampening("one two three four five six seven eight", "lucid", "say")
+    outcomes = {
+        receiver: [
+            apply_receiver_dampening(sender_result, "deranged", "say", rng=receiver_random(f"msg-{n}", receiver))
+            for n in range(200)
+        ]
+        for receiver in ("receiver-a", "receiver-b")
+    }
+    again = [
+        apply_receiver_dampening(sender_result, "deranged", "say", rng=receiver_random(f"msg-{n}", "receiver-a"))
+        for n in range(200)
+    ]
+    assert again == outcomes["receiver-a"]
+    assert outcomes["receiver-a"] != outcomes["receiver-b"]
+    assert any("scrambled" in result["tags"] for result in outcomes["receiver-a"])
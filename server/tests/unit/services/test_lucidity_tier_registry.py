@@ -0,0 +1,54 @@
+"""
+Unit tests for the in-memory lucidity tier registry.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from server.services.lucidity_event_dispatcher import send_lucidity_change_event
+from server.services.lucidity_tier_registry import LucidityTierRegistry, lucidity_tier_registry
+
+
+def test_set_get_and_discard_accept_uuid_or_string() -> None:
+    """String and UUID player IDs address the same entry."""
+    registry = LucidityTierRegistry()
+    player_id = uuid.uuid4()
+
+    registry.set(str(player_id), "fractured")
+    assert registry.get(player_id) == "fractured"
+
+    registry.discard(str(player_id))
+    assert registry.get(player_id) is None
+    assert len(registry) == 0
+
+
+def test_invalid_player_id_is_ignored() -> None:
+    """IDs that are not UUIDs are never registered."""
+    registry = LucidityTierRegistry()
+    registry.set("not-a-uuid", "deranged")
+    assert registry.get("not-a-uuid") is None
+    assert len(registry) == 0
+
+
+@pytest.mark.asyncio
+async def test_load_registers_tier_read_from_database() -> None:
+    """Connecting reads the tier once and registers it."""
+    registry = LucidityTierRegistry()
+    player_id = uuid.uuid4()
+    with patch("server.services.lucidity_tier_registry.read_lucidity_tier", AsyncMock(return_value="uneasy")):
+        assert await registry.load(player_id) == "uneasy"
+    assert registry.get(player_id) == "uneasy"
+
+
+@pytest.mark.asyncio
+async def test_lucidity_change_event_updates_registry() -> None:
+    """Every lucidity change event keeps the registry current."""
+    player_id = uuid.uuid4()
+    try:
+        with patch("server.realtime.connection_manager_api.send_game_event", AsyncMock()):
+            await send_lucidity_change_event(player_id, current_lcd=20, delta=-30, tier="fractured")
+        assert lucidity_tier_registry.get(player_id) == "fractured"
+    finally:
+        lucidity_tier_registry.discard(player_id)
@@ -373,6 +373,56 @@ async def test_publish_with_pool_success(svc: NATSService) -> None:
     publish.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_publish_encoded_sends_bytes_unchanged(svc: NATSService) -> None:
+    conn: AsyncMock = AsyncMock()
+    publish: AsyncMock = AsyncMock()
+    conn.publish = publish
+    svc._pool_initialized = True
+    svc.connection_pool = [conn]
+    svc.config.enable_subject_validation = False
+    await svc.available_connections.put(conn)
+    payload = b'{"_event_type":"PlayerEnteredRoom","player_id":"p1"}'
+    await svc.publish_encoded("events.domain.PlayerEnteredRoom", payload)
+    publish.assert_awaited_once_with("events.domain.PlayerEnteredRoom", payload, headers=None)
+    assert svc.available_connections.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_publish_encoded_batch_uses_one_connection_in_order(svc: NATSService) -> None:
+    conn: AsyncMock = AsyncMock()
+    svc._pool_initialized = True
+    svc.connection_pool = [conn]
+    svc.config.enable_subject_validation = False
+    await svc.available_connections.put(conn)
+    messages = [(f"events.domain.E{n}", f'{{"n": {n}}}'.encode()) for n in range(3)]
+    await svc.publish_encoded_batch(messages, {"Mythos-Origin-Instance": "inst-1"})
+    assert [c.args for c in conn.publish.await_args_list] == messages
+    assert conn.publish.await_args_list[0].kwargs == {"headers": {"Mythos-Origin-Instance": "inst-1"}}
+    assert svc.available_connections.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_subscribe_encoded_hands_over_raw_payload_and_headers(svc: NATSService) -> None:
+    handlers: list[_NatsMsgHandler] = []
+
+    async def capture_subscribe(_subject: str, cb: _NatsMsgHandler) -> MagicMock:
+        handlers.append(cb)
+        return MagicMock()
+
+    svc.nc = MagicMock()
+    svc.nc.subscribe = capture_subscribe
+    svc._running = True
+    user_cb = AsyncMock()
+    await svc.subscribe_encoded("events.domain.>", user_cb)
+    msg = MagicMock()
+    msg.data = b"not json"
+    msg.headers = {"Mythos-Origin-Instance": "inst-1"}
+    await handlers[0](msg)
+    user_cb.assert_awaited_once_with(b"not json", {"Mythos-Origin-Instance": "inst-1"})
+    assert "events.domain.>" in svc.subscriptions
+
+
 @pytest.mark.asyncio
 async def test_subscribe_message_handler_delivers_payload(svc: NATSService) -> None:
     handlers: list[_NatsMsgHandler] = []
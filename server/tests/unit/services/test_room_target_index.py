@@ -0,0 +1,112 @@
+"""Unit tests for the in-memory room target index."""
+
+from server.events.event_bus import EventBus
+from server.events.event_types import NPCEnteredRoom, NPCLeftRoom, PlayerEnteredRoom, PlayerLeftRoom
+from server.schemas.shared import TargetType
+from server.services.room_target_index import RoomTargetIndex, normalize_target_name
+
+
+def _names(targets) -> list[str]:
+    return [target.name for target in targets]
+
+
+def test_normalize_target_name_strips_punctuation() -> None:
+    assert normalize_target_name("Dr. West!") == "dr west"
+
+
+def test_find_matches_any_word_prefix() -> None:
+    index = RoomTargetIndex()
+    index.place("room", "npc-1", "Giant Sewer Rat", TargetType.NPC)
+    index.place("room", "npc-2", "Ratcatcher", TargetType.NPC)
+    index.place("room", "npc-3", "Deep One", TargetType.NPC)
+
+    assert _names(index.find("room", "rat")) == ["Giant Sewer Rat", "Ratcatcher"]
+    assert _names(index.find("room", "sew")) == ["Giant Sewer Rat"]
+    assert index.find("room", "ghoul") == []
+    assert index.find("other-room", "rat") == []
+
+
+def test_find_falls_back_to_substring() -> None:
+    index = RoomTargetIndex()
+    index.place("room", "p1", "Armitage", TargetType.PLAYER)
+
+    assert _names(index.find("room", "mita")) == ["Armitage"]
+
+
+def test_duplicate_names_get_arrival_ordered_suffixes() -> None:
+    index = RoomTargetIndex()
+    for npc_id in ("rat-a", "rat-b", "rat-c"):
+        index.place("room", npc_id, "Rat", TargetType.NPC)
+
+    assert [t.disambiguation_suffix for t in index.find("room", "rat")] == ["-1", "-2", "-3"]
+
+    _ = index.remove("rat-a")
+    assert [(t.target_id, t.disambiguation_suffix) for t in index.find("room", "rat")] == [
+        ("rat-b", "-1"),
+        ("rat-c", "-2"),
+    ]
+
+    _ = index.remove("rat-b")
+    assert index.find("room", "rat")[0].disambiguation_suffix is None
+
+
+def test_place_moves_target_between_rooms() -> None:
+    index = RoomTargetIndex()
+    index.place("room-1", "p1", "Armitage", TargetType.PLAYER)
+    index.place("room-2", "p1", "Armitage", TargetType.PLAYER)
+
+    assert index.find("room-1", "arm") == []
+    assert index.room_of("p1") == "room-2"
+    assert index.get_stats()["targets"] == 1
+
+
+def test_remove_only_from_given_room() -> None:
+    index = RoomTargetIndex()
+    index.place("room-2", "p1", "Armitage", TargetType.PLAYER)
+
+    assert index.remove("p1", "room-1") is None
+    assert index.room_of("p1") == "room-2"
+
+
+def test_sync_room_reconciles_members_and_version() -> None:
+    index = RoomTargetIndex()
+    index.place("room", "gone", "Ghost", TargetType.PLAYER)
+
+    assert index.needs_sync("room", 3)
+    index.sync_room("room", 3, {"p1": TargetType.PLAYER, "npc-1": TargetType.NPC}, {"p1": "Armitage"})
+
+    assert not index.needs_sync("room", 3)
+    assert index.needs_sync("room", 4)
+    assert index.needs_sync("room", None)
+    assert index.room_of("gone") is None
+    # Members without a known name are left out
+    assert index.room_of("npc-1") is None
+    assert _names(index.find("room", "arm")) == ["Armitage"]
+
+
+def test_events_keep_known_targets_in_step() -> None:
+    event_bus = EventBus()
+    index = RoomTargetIndex()
+    index.subscribe(event_bus)
+    index.sync_room("room-1", 1, {"p1": TargetType.PLAYER, "npc-1": TargetType.NPC}, {"p1": "Armitage", "npc-1": "Rat"})
+    index.sync_room("room-2", 1, {}, {})
+
+    event_bus.publish(PlayerLeftRoom(player_id="p1", room_id="room-1", to_room_id="room-2"))
+    event_bus.publish(PlayerEnteredRoom(player_id="p1", room_id="room-2", from_room_id="room-1"))
+    event_bus.publish(NPCLeftRoom(npc_id="npc-1", room_id="room-1"))
+
+    assert index.room_of("p1") == "room-2"
+    assert index.room_of("npc-1") is None
+    assert not index.needs_sync("room-2", 1)
+
+
+def test_unknown_arrival_marks_room_for_sync() -> None:
+    event_bus = EventBus()
+    index = RoomTargetIndex()
+    index.subscribe(event_bus)
+    index.sync_room("room", 1, {}, {})
+
+    event_bus.publish(NPCEnteredRoom(npc_id="npc-new", room_id="room"))
+
+    assert index.room_of("npc-new") is None
+    assert index.needs_sync("room", 1)
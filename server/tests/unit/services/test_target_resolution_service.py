@@ -5,11 +5,13 @@ Tests the TargetResolutionService class.
 """
 
 import uuid
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from server.schemas.shared import TargetResolutionResult
+from server.services.room_target_index import RoomTargetIndex
 from server.services.target_resolution_service import TargetResolutionService
 
 # pylint: disable=redefined-outer-name  # Reason: Test file - pytest fixture parameter names must match fixture names, causing intentional redefinitions
@@ -30,8 +32,8 @@ def mock_player_service():
 
 @pytest.fixture
 def target_service(mock_persistence, mock_player_service):
-    """Create a TargetResolutionService instance."""
-    return TargetResolutionService(mock_persistence, mock_player_service)
+    """Create a TargetResolutionService instance with its own target index."""
+    return TargetResolutionService(mock_persistence, mock_player_service, RoomTargetIndex())
 
 
 @pytest.mark.asyncio
@@ -87,52 +89,6 @@ async def test_resolve_target_player_no_room_id(mock_persistence, mock_player_se
     assert "not in a room" in result.error_message.lower()
 
 
-@pytest.mark.asyncio
-async def test_search_players_in_room_empty_list(mock_persistence, mock_player_service):
-    """Test _search_players_in_room() with empty player list."""
-    from server.services.target_resolution_service import TargetResolutionService
-
-    service = TargetResolutionService(mock_persistence, mock_player_service)
-    result = await service._search_players_in_room("room_001", "target", [])  # type: ignore[arg-type]  # Test intentionally passes empty list to test edge case behavior
-    assert len(result) == 0
-
-
-@pytest.mark.asyncio
-async def test_search_players_in_room_no_match(mock_persistence, mock_player_service):
-    """Test _search_players_in_room() with no matching players."""
-    from server.services.target_resolution_service import TargetResolutionService
-
-    mock_player1 = MagicMock()
-    mock_player1.name = "Alice"
-    mock_player1.player_id = uuid.uuid4()
-    service = TargetResolutionService(mock_persistence, mock_player_service)
-    result = await service._search_players_in_room("room_001", "Bob", [mock_player1])  # type: ignore[arg-type]
-    assert len(result) == 0
-
-
-@pytest.mark.asyncio
-async def test_search_npcs_in_room_empty_list(mock_persistence, mock_player_service):
-    """Test _search_npcs_in_room() with empty NPC list."""
-    from server.services.target_resolution_service import TargetResolutionService
-
-    service = TargetResolutionService(mock_persistence, mock_player_service)
-    result = await service._search_npcs_in_room("room_001", "target", [])  # type: ignore[arg-type]
-    assert len(result) == 0
-
-
-@pytest.mark.asyncio
-async def test_search_npcs_in_room_no_match(mock_persistence, mock_player_service):
-    """Test _search_npcs_in_room() with no matching NPCs."""
-    from server.services.target_resolution_service import TargetResolutionService
-
-    mock_npc = MagicMock()
-    mock_npc.name = "Goblin"
-    mock_npc.npc_id = "npc_001"
-    service = TargetResolutionService(mock_persistence, mock_player_service)
-    result = await service._search_npcs_in_room("room_001", "Orc", [mock_npc])  # type: ignore[arg-type]
-    assert len(result) == 0
-
-
 @pytest.mark.asyncio
 async def test_get_npc_instance_not_found(mock_persistence, mock_player_service):
     """Test _get_npc_instance() when NPC not found."""
@@ -213,8 +169,6 @@ async def test_resolve_target_uses_get_player_fallback(target_service, mock_pers
     if hasattr(mock_persistence, "get_player_by_id"):
         delattr(mock_persistence, "get_player_by_id")
     mock_persistence.get_player = AsyncMock(return_value=mock_player)
-    mock_persistence.get_room = MagicMock(return_value=MagicMock())
-    mock_persistence.get_players_in_room = MagicMock(return_value=[])
     result = await target_service.resolve_target(uuid.uuid4(), "target")
     # Should proceed to search (may find no matches, but shouldn't error on player lookup)
     assert result.search_term == "target"
@@ -227,24 +181,32 @@ async def test_resolve_target_sync_get_player_by_id(target_service, mock_persist
     mock_player.current_room_id = "room_001"
     # Use sync method (not AsyncMock)
     mock_persistence.get_player_by_id = MagicMock(return_value=mock_player)
-    mock_persistence.get_room = MagicMock(return_value=MagicMock())
-    mock_persistence.get_players_in_room = MagicMock(return_value=[])
     result = await target_service.resolve_target(uuid.uuid4(), "target")
     assert result.search_term == "target"
 
 
+def _room_with(persistence, *player_names: tuple[uuid.UUID, str]):
+    """Real Room (tracks occupancy_version) served by a sync get_room_by_id, with named players."""
+    from server.models.room import Room
+
+    room = Room({"id": "room_001", "name": "Library"})
+    names = dict(player_names)
+    for player_id in names:
+        room.add_player_silently(player_id)
+    persistence.get_room_by_id = MagicMock(return_value=room)
+
+    async def get_player_by_id(player_id):
+        return SimpleNamespace(current_room_id="room_001", name=names.get(player_id, "Actor"))
+
+    persistence.get_player_by_id = AsyncMock(side_effect=get_player_by_id)
+    persistence.get_players_in_room = AsyncMock()
+    return room
+
+
 @pytest.mark.asyncio
 async def test_resolve_target_no_matches(target_service, mock_persistence):
     """Test resolve_target() when no matches found."""
-    mock_player = MagicMock()
-    mock_player.current_room_id = "room_001"
-    mock_persistence.get_player_by_id = AsyncMock(return_value=mock_player)
-    mock_room = MagicMock()
-    mock_room.room_id = "room_001"
-    mock_persistence.get_room = MagicMock(return_value=mock_room)
-    mock_persistence.get_players_in_room = MagicMock(return_value=[])
-    # Mock the _search_npcs_in_room method to return empty list
-    target_service._search_npcs_in_room = AsyncMock(return_value=[])
+    _room_with(mock_persistence)
     result = await target_service.resolve_target(uuid.uuid4(), "nonexistent")
     assert result.success is False
     assert "No targets found" in result.error_message
@@ -252,42 +214,60 @@ async def test_resolve_target_no_matches(target_service, mock_persistence):
 
 @pytest.mark.asyncio
 async def test_resolve_target_single_match(target_service, mock_persistence):
-    """Test resolve_target() with single match."""
-
-    mock_player = MagicMock()
-    mock_player.current_room_id = "room_001"
-    mock_persistence.get_player_by_id = AsyncMock(return_value=mock_player)
-    mock_room = MagicMock()
-    mock_room.room_id = "room_001"
-    mock_persistence.get_room = MagicMock(return_value=mock_room)
-    mock_target_player = MagicMock()
-    mock_target_player.name = "TargetPlayer"
-    mock_target_player.player_id = uuid.uuid4()
-    mock_persistence.get_players_in_room = MagicMock(return_value=[mock_target_player])
+    """A room occupant is found by name prefix without querying players in the room."""
+    target_id = uuid.uuid4()
+    _room_with(mock_persistence, (target_id, "TargetPlayer"))
     result = await target_service.resolve_target(uuid.uuid4(), "target")
-    # Should find the player match
-    assert result.success is True or len(result.matches) > 0
+    assert result.success is True
+    assert result.matches[0].target_id == str(target_id)
+    assert result.matches[0].metadata.additional_info == {"player_id": str(target_id)}
+    mock_persistence.get_players_in_room.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_resolve_target_multiple_matches(target_service, mock_persistence):
     """Test resolve_target() with multiple matches requires disambiguation."""
-    mock_player = MagicMock()
-    mock_player.current_room_id = "room_001"
-    mock_persistence.get_player_by_id = AsyncMock(return_value=mock_player)
-    mock_room = MagicMock()
-    mock_room.room_id = "room_001"
-    mock_persistence.get_room = MagicMock(return_value=mock_room)
-    mock_target_player1 = MagicMock()
-    mock_target_player1.name = "TargetPlayer1"
-    mock_target_player1.player_id = uuid.uuid4()
-    mock_target_player2 = MagicMock()
-    mock_target_player2.name = "TargetPlayer2"
-    mock_target_player2.player_id = uuid.uuid4()
-    mock_persistence.get_players_in_room = MagicMock(return_value=[mock_target_player1, mock_target_player2])
+    _room_with(mock_persistence, (uuid.uuid4(), "TargetPlayer1"), (uuid.uuid4(), "TargetPlayer2"))
     result = await target_service.resolve_target(uuid.uuid4(), "target")
-    # Should require disambiguation
-    assert result.disambiguation_required is True or "Multiple targets" in result.error_message
+    assert result.disambiguation_required is True
+    assert "Multiple targets" in result.error_message
+
+
+@pytest.mark.asyncio
+async def test_resolve_target_suffix_selects_npc(target_service, mock_persistence):
+    """``rat-2`` picks the later arrival of two identically named NPCs."""
+    from unittest.mock import patch
+
+    actor_id = uuid.uuid4()
+    room = _room_with(mock_persistence)
+    with patch.object(target_service, "_get_npc_instance", return_value=SimpleNamespace(name="Sewer Rat")):
+        room.npc_entered("rat_a")
+        first = await target_service.resolve_target(actor_id, "rat")
+        room.npc_entered("rat_b")
+        result = await target_service.resolve_target(actor_id, "rat-2")
+    assert first.matches[0].target_id == "rat_a"
+    assert result.success is True
+    assert result.matches[0].target_id == "rat_b"
+    assert result.matches[0].metadata.additional_info == {"npc_id": "rat_b"}
+
+
+@pytest.mark.asyncio
+async def test_resolve_target_reuses_index_until_occupancy_changes(target_service, mock_persistence):
+    """Names are looked up once; the acting player's room comes from the index once indexed."""
+    actor_id = uuid.uuid4()
+    target_id = uuid.uuid4()
+    room = _room_with(mock_persistence, (actor_id, "Armitage"), (target_id, "Wilmarth"))
+
+    _ = await target_service.resolve_target(actor_id, "wil")
+    lookups = mock_persistence.get_player_by_id.await_count
+    result = await target_service.resolve_target(actor_id, "wil")
+    assert result.success is True
+    assert mock_persistence.get_player_by_id.await_count == lookups
+
+    room.remove_player_silently(target_id)
+    result = await target_service.resolve_target(actor_id, "wil")
+    assert result.success is False
+    assert mock_persistence.get_player_by_id.await_count == lookups
 
 
 @pytest.mark.asyncio
@@ -296,10 +276,6 @@ async def test_resolve_target_with_disambiguation_suffix(target_service, mock_pe
     mock_player = MagicMock()
     mock_player.current_room_id = "room_001"
     mock_persistence.get_player_by_id = AsyncMock(return_value=mock_player)
-    mock_room = MagicMock()
-    mock_room.room_id = "room_001"
-    mock_persistence.get_room = MagicMock(return_value=mock_room)
-    mock_persistence.get_players_in_room = MagicMock(return_value=[])
     result = await target_service.resolve_target(uuid.uuid4(), "target-1")
     # Should extract suffix and search
     assert result.search_term == "target-1"
@@ -336,52 +312,6 @@ def test_validate_player_and_room_blank_room_id(target_service):
     assert "not in a room" in (err.error_message or "").lower()
 
 
-def test_normalize_name_for_matching(target_service):
-    """Punctuation is stripped for fuzzy name matching."""
-    assert target_service._normalize_name_for_matching("Dr. West!") == "dr west"
-
-
-def test_validate_room_exists_sync_get_room_by_id(target_service, mock_persistence):
-    """Sync get_room_by_id validates room presence."""
-    mock_persistence.get_room_by_id = MagicMock(return_value=MagicMock())
-    assert target_service._validate_room_exists("room_001") is True
-    mock_persistence.get_room_by_id = MagicMock(return_value=None)
-    assert target_service._validate_room_exists("missing") is False
-
-
-@pytest.mark.asyncio
-async def test_validate_room_exists_async(target_service, mock_persistence):
-    """Async get_room_by_id validates room presence."""
-    mock_persistence.get_room_by_id = AsyncMock(return_value=MagicMock())
-    assert await target_service._validate_room_exists_async("room_001") is True
-
-
-def test_add_disambiguation_suffixes(target_service):
-    """Duplicate names receive numeric suffixes."""
-    from server.schemas.shared.target_metadata import TargetMetadata
-    from server.schemas.shared.target_resolution import TargetMatch, TargetType
-
-    matches = [
-        TargetMatch(
-            target_id="p1",
-            target_name="Bob",
-            target_type=TargetType.PLAYER,
-            room_id="room_001",
-            metadata=TargetMetadata(),
-        ),
-        TargetMatch(
-            target_id="p2",
-            target_name="Bob",
-            target_type=TargetType.PLAYER,
-            room_id="room_001",
-            metadata=TargetMetadata(),
-        ),
-    ]
-    result = target_service._add_disambiguation_suffixes(matches)
-    assert result[0].disambiguation_suffix == "-1"
-    assert result[1].disambiguation_suffix == "-2"
-
-
 def test_build_target_result_single_match(target_service):
     """Single match returns success."""
     from server.schemas.shared.target_metadata import TargetMetadata
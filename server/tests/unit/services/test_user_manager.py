@@ -4,7 +4,9 @@ Unit tests for user manager service.
 Tests the UserManager class.
 """
 
+import asyncio
 import json
+import threading
 import uuid
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -350,32 +352,6 @@ def test_get_player_mute_file(user_manager):
     assert isinstance(result, Path)
 
 
-def test_is_cache_valid_true(user_manager):
-    """Test _is_cache_valid() returns True for valid cache."""
-    player_id = uuid.uuid4()
-    user_manager._mute_cache[player_id] = (datetime.now(UTC), True)
-    result = user_manager._is_cache_valid(player_id)
-    assert result is True
-
-
-def test_is_cache_valid_false_expired(user_manager):
-    """Test _is_cache_valid() returns False for expired cache."""
-    player_id = uuid.uuid4()
-
-    # Set cache to expired time
-    expired_time = datetime.now(UTC) - timedelta(seconds=400)  # More than TTL (300)
-    user_manager._mute_cache[player_id] = (expired_time, True)
-    result = user_manager._is_cache_valid(player_id)
-    assert result is False
-
-
-def test_is_cache_valid_false_not_cached(user_manager):
-    """Test _is_cache_valid() returns False when not cached."""
-    player_id = uuid.uuid4()
-    result = user_manager._is_cache_valid(player_id)
-    assert result is False
-
-
 @pytest.mark.asyncio
 async def test_add_admin_no_container(user_manager):
     """Test add_admin() handles missing container."""
@@ -463,69 +439,6 @@ async def test_is_admin_no_persistence(user_manager):
         assert result is False
 
 
-def test_load_player_mutes_file_not_exists(user_manager):
-    """Test load_player_mutes() returns False when file doesn't exist."""
-    result = user_manager.load_player_mutes(uuid.uuid4())
-    assert result is False
-
-
-def test_load_player_mutes_empty_file(user_manager, tmp_path):
-    """Test load_player_mutes() treats empty or whitespace-only file as valid empty mute data."""
-    user_manager.data_dir = tmp_path
-    player_id = uuid.uuid4()
-    mute_file = user_manager._get_player_mute_file(player_id)
-    mute_file.write_text("")
-    result = user_manager.load_player_mutes(player_id)
-    assert result is True
-    assert player_id not in user_manager._player_mutes
-    assert player_id not in user_manager._channel_mutes
-    assert player_id in user_manager._mute_cache
-    _, valid = user_manager._mute_cache[player_id]
-    assert valid is True
-
-
-def test_load_player_mutes_invalid_json(user_manager, tmp_path):
-    """Test load_player_mutes() handles invalid JSON."""
-    user_manager.data_dir = tmp_path
-    player_id = uuid.uuid4()
-    mute_file = user_manager._get_player_mute_file(player_id)
-    mute_file.write_text("invalid json")
-    result = user_manager.load_player_mutes(player_id)
-    assert result is False
-
-
-def test_load_player_mutes_invalid_uuid_in_data(user_manager, tmp_path):
-    """Test load_player_mutes() handles invalid UUID in data."""
-
-    user_manager.data_dir = tmp_path
-    player_id = uuid.uuid4()
-    mute_file = user_manager._get_player_mute_file(player_id)
-    data = {"player_mutes": {"invalid-uuid": {"target_name": "Test"}}}
-    mute_file.write_text(json.dumps(data))
-    result = user_manager.load_player_mutes(player_id)
-    # Should handle gracefully
-    assert result is True or result is False
-
-
-def test_save_player_mutes_serialization_error(user_manager, tmp_path):
-    """Test save_player_mutes() handles serialization error."""
-    user_manager.data_dir = tmp_path
-    player_id = uuid.uuid4()
-    # Create non-serializable data by adding a function
-    user_manager._player_mutes[player_id] = {uuid.uuid4(): {"target_name": "Test", "func": lambda x: x}}
-    result = user_manager.save_player_mutes(player_id)
-    assert result is False
-
-
-@pytest.mark.asyncio
-async def test_load_player_mutes_async_cache_valid(user_manager):
-    """Test load_player_mutes_async() uses cache when valid."""
-    player_id = uuid.uuid4()
-    user_manager._mute_cache[player_id] = (datetime.now(UTC), True)
-    result = await user_manager.load_player_mutes_async(player_id)
-    assert result is True
-
-
 @pytest.mark.asyncio
 async def test_load_player_mutes_batch_empty_list(user_manager):
     """Test load_player_mutes_batch() with empty list."""
@@ -533,28 +446,6 @@ async def test_load_player_mutes_batch_empty_list(user_manager):
     assert result == {}
 
 
-@pytest.mark.asyncio
-async def test_load_player_mutes_batch_all_cached(user_manager):
-    """Test load_player_mutes_batch() when all players are cached."""
-    player_id1 = uuid.uuid4()
-    player_id2 = uuid.uuid4()
-    user_manager._mute_cache[player_id1] = (datetime.now(UTC), True)
-    user_manager._mute_cache[player_id2] = (datetime.now(UTC), True)
-    result = await user_manager.load_player_mutes_batch([player_id1, player_id2])
-    assert len(result) == 2
-    assert result[str(player_id1)] is True
-    assert result[str(player_id2)] is True
-
-
-def test_cleanup_player_mutes_no_delete_file(user_manager):
-    """Test cleanup_player_mutes() without deleting file."""
-    player_id = uuid.uuid4()
-    user_manager._player_mutes[player_id] = {uuid.uuid4(): {"target_name": "Test"}}
-    result = user_manager.cleanup_player_mutes(player_id, delete_file=False)
-    assert result is True
-    assert player_id not in user_manager._player_mutes
-
-
 def test_cleanup_player_mutes_with_delete_file(user_manager, tmp_path):
     """Test cleanup_player_mutes() with delete_file=True."""
     user_manager.data_dir = tmp_path
@@ -664,3 +555,266 @@ async def test_is_admin_not_cached(user_manager):
         result = await user_manager.is_admin(player_id)
         assert result is True
         assert player_id in user_manager._admin_players
+
+
+def test_mute_index_persists_across_instances(mock_data_dir):
+    """Test that the single mute index file restores every mute type on startup."""
+    muter_id = uuid.uuid4()
+    target_id = uuid.uuid4()
+    manager = UserManager(data_dir=mock_data_dir)
+    manager.mute_player(muter_id, "Muter", target_id, "Target", duration_minutes=30)
+    manager.mute_channel(muter_id, "Muter", "ooc")
+    manager.mute_global(muter_id, "Muter", target_id, "Target")
+
+    assert (mock_data_dir / "mute_index.json").exists()
+    assert not list(mock_data_dir.glob("mutes_*.json"))
+
+    restored = UserManager(data_dir=mock_data_dir)
+    assert restored.is_player_muted(muter_id, target_id) is True
+    assert restored.is_channel_muted(muter_id, "ooc") is True
+    assert restored.is_globally_muted(target_id) is True
+    assert isinstance(restored._player_mutes[muter_id][target_id]["expires_at"], datetime)
+    assert restored.get_who_muted_player(target_id) == [("Muter", "global"), ("Muter", "personal")]
+
+
+def test_legacy_per_player_files_are_migrated(mock_data_dir):
+    """Test that per-player mute files are imported when no index file exists."""
+    mock_data_dir.mkdir(parents=True)
+    muter_id = uuid.uuid4()
+    target_id = uuid.uuid4()
+    legacy = {
+        "player_id": str(muter_id),
+        "player_mutes": {
+            str(target_id): {
+                "target_id": str(target_id),
+                "muted_by": str(muter_id),
+                "muted_by_name": "Muter",
+                "muted_at": datetime.now(UTC).isoformat(),
+                "expires_at": None,
+            }
+        },
+        "channel_mutes": {},
+        "global_mutes": {},
+        "is_admin": False,
+    }
+    (mock_data_dir / f"mutes_{muter_id}.json").write_text(json.dumps(legacy))
+    (mock_data_dir / f"mutes_{uuid.uuid4()}.json").write_text("")
+
+    manager = UserManager(data_dir=mock_data_dir)
+
+    assert manager.is_player_muted(muter_id, target_id) is True
+    assert manager._muted_by[target_id] == {muter_id}
+    stored = json.loads((mock_data_dir / "mute_index.json").read_text())
+    assert str(target_id) in stored["player_mutes"][str(muter_id)]
+
+
+def test_corrupt_index_file_is_set_aside(mock_data_dir):
+    """Test that an unreadable index starts empty without being overwritten."""
+    mock_data_dir.mkdir(parents=True)
+    (mock_data_dir / "mute_index.json").write_text("invalid json")
+
+    manager = UserManager(data_dir=mock_data_dir)
+
+    assert manager._player_mutes == {}
+    assert (mock_data_dir / "mute_index.corrupt").read_text() == "invalid json"
+
+
+def test_reverse_index_tracks_mute_and_unmute(user_manager):
+    """Test that get_who_muted_player reads the reverse index."""
+    target_id = uuid.uuid4()
+    muters = [uuid.uuid4() for _ in range(3)]
+    for i, muter_id in enumerate(muters):
+        user_manager.mute_player(muter_id, f"Muter{i}", target_id, "Target")
+    user_manager.unmute_player(muters[1], "Muter1", target_id, "Target")
+
+    assert user_manager._muted_by[target_id] == {muters[0], muters[2]}
+    assert sorted(user_manager.get_who_muted_player(target_id)) == [("Muter0", "personal"), ("Muter2", "personal")]
+
+
+def test_expired_mute_is_removed_from_both_indexes(user_manager):
+    """Test that an expired player mute is dropped from forward and reverse indexes."""
+    muter_id = uuid.uuid4()
+    target_id = uuid.uuid4()
+    user_manager.mute_player(muter_id, "Muter", target_id, "Target", duration_minutes=5)
+    user_manager._player_mutes[muter_id][target_id]["expires_at"] = datetime.now(UTC) - timedelta(seconds=1)
+
+    assert user_manager.is_player_muted(muter_id, target_id) is False
+    assert muter_id not in user_manager._player_mutes
+    assert target_id not in user_manager._muted_by
+
+
+def test_mute_checks_do_no_file_io(user_manager):
+    """Test that mute lookups used during fan-out never open files."""
+    muter_id = uuid.uuid4()
+    target_id = uuid.uuid4()
+    user_manager.mute_player(muter_id, "Muter", target_id, "Target")
+    with (
+        patch("builtins.open", side_effect=AssertionError("file I/O")),
+        patch.object(Path, "exists", side_effect=AssertionError("file I/O")),
+    ):
+        assert user_manager.load_player_mutes(muter_id) is True
+        assert user_manager.is_player_muted(muter_id, target_id) is True
+        assert user_manager.get_who_muted_player(target_id) == [("Muter", "personal")]
+
+
+@pytest.mark.asyncio
+async def test_load_player_mutes_batch_is_in_memory(user_manager):
+    """Test that batch loading reports every valid player without touching disk."""
+    player_ids = [uuid.uuid4(), str(uuid.uuid4())]
+    result = await user_manager.load_player_mutes_batch([*player_ids, "not-a-uuid"])
+    assert result == {str(player_ids[0]): True, player_ids[1]: True, "not-a-uuid": False}
+
+
+@pytest.mark.asyncio
+async def test_write_behind_coalesces_changes(mock_data_dir):
+    """Test that changes inside the flush delay are written once, after the delay."""
+    manager = UserManager(data_dir=mock_data_dir, flush_delay_seconds=0.01)
+    with patch.object(manager, "_write_store_payload", wraps=manager._write_store_payload) as write:
+        for _ in range(5):
+            manager.mute_player(uuid.uuid4(), "Muter", uuid.uuid4(), "Target")
+        assert write.call_count == 0
+        await manager._flush_task
+
+    assert write.call_count == 1
+    stored = json.loads((mock_data_dir / "mute_index.json").read_text())
+    assert len(stored["player_mutes"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_change_during_write_is_written_by_the_same_window(mock_data_dir):
+    """Test that a mute made while the index is being written is persisted without another change."""
+    manager = UserManager(data_dir=mock_data_dir, flush_delay_seconds=0.01)
+    late_target = uuid.uuid4()
+    write_store_payload = manager._write_store_payload
+    calls = 0
+
+    def _write_then_mutate(payload):
+        nonlocal calls
+        calls += 1
+        written = write_store_payload(payload)
+        if calls == 1:
+            # Lands after the snapshot was taken, while the first write is still in flight
+            manager._player_mutes.setdefault(uuid.uuid4(), {})[late_target] = {"target_name": "Late"}
+            manager._store_dirty = True
+        return written
+
+    with patch.object(manager, "_write_store_payload", side_effect=_write_then_mutate):
+        manager.mute_player(uuid.uuid4(), "Muter", uuid.uuid4(), "Target")
+        await manager._flush_task
+
+    assert calls == 2
+    assert manager._store_dirty is False
+    assert str(late_target) in (mock_data_dir / "mute_index.json").read_text()
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_retried(mock_data_dir):
+    """Test that a failed write-behind flush is retried without waiting for another change."""
+    manager = UserManager(data_dir=mock_data_dir, flush_delay_seconds=0.01)
+    outcomes = iter([False, True])
+
+    with (
+        patch.object(manager, "_write_store_payload", side_effect=lambda _payload: next(outcomes)) as write,
+        patch("server.services.user_manager.asyncio.sleep", AsyncMock()) as sleep,
+    ):
+        manager.mute_player(uuid.uuid4(), "Muter", uuid.uuid4(), "Target")
+        await manager._flush_task
+
+    assert write.call_count == 2
+    assert manager._store_dirty is False
+    # The retry backs off instead of hammering a failing disk
+    assert sleep.await_args_list[1].args[0] > sleep.await_args_list[0].args[0]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_pending_changes(mock_data_dir):
+    """Test that shutdown persists changes still waiting for the write-behind delay."""
+    manager = UserManager(data_dir=mock_data_dir, flush_delay_seconds=60)
+    muter_id = uuid.uuid4()
+    target_id = uuid.uuid4()
+    manager.mute_player(muter_id, "Muter", target_id, "Target")
+    await manager.shutdown()
+
+    assert UserManager(data_dir=mock_data_dir).is_player_muted(muter_id, target_id) is True
+
+
+def test_expired_channel_and_global_mutes_are_removed_from_the_index(mock_data_dir):
+    """Test that expiring channel and global mutes is persisted, not only applied in memory."""
+    manager = UserManager(data_dir=mock_data_dir)
+    player_id = uuid.uuid4()
+    manager.mute_channel(player_id, "Player", "say", duration_minutes=5)
+    manager.mute_global(uuid.uuid4(), "Admin", player_id, "Player", duration_minutes=5)
+    expired = datetime.now(UTC) - timedelta(minutes=1)
+    manager._channel_mutes[player_id]["say"]["expires_at"] = expired
+    manager._global_mutes[player_id]["expires_at"] = expired
+
+    manager._cleanup_expired_mutes()
+
+    stored = json.loads((mock_data_dir / "mute_index.json").read_text())
+    assert stored["channel_mutes"] == {}
+    assert stored["global_mutes"] == {}
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_a_write_in_progress(mock_data_dir):
+    """Test that shutdown lets an in-flight write-behind flush finish instead of orphaning it."""
+    manager = UserManager(data_dir=mock_data_dir, flush_delay_seconds=0.01)
+    write_store_payload = manager._write_store_payload
+    release = threading.Event()
+
+    def _slow_write(payload):
+        _ = release.wait(5)
+        return write_store_payload(payload)
+
+    with patch.object(manager, "_write_store_payload", side_effect=_slow_write) as write:
+        manager.mute_player(uuid.uuid4(), "Muter", uuid.uuid4(), "Target")
+        task = manager._flush_task
+        while not manager._store_write_lock.locked():
+            await asyncio.sleep(0.005)
+        # A change made during the write is left for shutdown's final flush
+        late_target = uuid.uuid4()
+        manager.mute_player(uuid.uuid4(), "Late", late_target, "Target")
+
+        shutdown = asyncio.create_task(manager.shutdown())
+        await asyncio.sleep(0.05)
+        assert not shutdown.done()
+        release.set()
+        await shutdown
+
+    assert task is not None and task.done() and not task.cancelled()
+    assert write.call_count == 2
+    assert manager._store_dirty is False
+    assert str(late_target) in (mock_data_dir / "mute_index.json").read_text()
+
+
+def test_flush_reports_unserializable_data(user_manager):
+    """Test that flush_mute_store() fails cleanly and stays dirty on bad data."""
+    user_manager._player_mutes[uuid.uuid4()] = {uuid.uuid4(): {"target_name": "Test", "func": lambda x: x}}
+    user_manager._store_dirty = True
+    assert user_manager.flush_mute_store() is False
+    assert user_manager._store_dirty is True
+
+
+def test_cleanup_player_mutes_on_logout_keeps_index(user_manager):
+    """Test that logout cleanup keeps the player's mutes in the index."""
+    player_id = uuid.uuid4()
+    target_id = uuid.uuid4()
+    user_manager.mute_player(player_id, "Player", target_id, "Target")
+    result = user_manager.cleanup_player_mutes(player_id)
+    assert result is True
+    assert user_manager.is_player_muted(player_id, target_id) is True
+
+
+def test_cleanup_player_mutes_purges_applied_and_received(user_manager):
+    """Test that account deletion removes mutes the player applied and received."""
+    player_id = uuid.uuid4()
+    other_id = uuid.uuid4()
+    user_manager.mute_player(player_id, "Player", uuid.uuid4(), "Target")
+    user_manager.mute_player(other_id, "Other", player_id, "Player")
+    user_manager.mute_global(other_id, "Other", player_id, "Player")
+
+    assert user_manager.cleanup_player_mutes(player_id, delete_file=True) is True
+    assert player_id not in user_manager._player_mutes
+    assert player_id not in user_manager._muted_by
+    assert other_id not in user_manager._player_mutes
+    assert user_manager.is_globally_muted(player_id) is False
@@ -0,0 +1,106 @@
+"""
+Read-only item stack views.
+
+Room drops are read on every look and room update but change rarely, so the
+drop store hands out shared read-only views instead of copying each stack per
+reader. The views are dict and list subclasses, so they serialize, compare and
+render exactly like the plain payloads they replace; only mutation is refused.
+Use ``thaw_stack`` (or ``copy.deepcopy``) to get a mutable copy.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, NoReturn
+
+
+def _read_only(self: object, *_args: object, **_kwargs: object) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} is read-only; change room drops through the drop store")
+
+
+class FrozenStack(dict[str, Any]):
+    """Read-only mapping view of an item stack; nested dicts and lists are frozen too."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self) -> FrozenStack:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return thaw_stack(self)
+
+    def __reduce__(self) -> tuple[type[FrozenStack], tuple[dict[str, Any]]]:
+        return (FrozenStack, (dict(self),))
+
+
+class FrozenList(list[Any]):
+    """Read-only list nested inside a FrozenStack."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __copy__(self) -> FrozenList:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        thawed: list[Any] = _thaw(self)
+        return thawed
+
+    def __reduce__(self) -> tuple[type[FrozenList], tuple[list[Any]]]:
+        return (FrozenList, (list(self),))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, FrozenStack | FrozenList):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenStack({str(key): _freeze(item) for key, item in value.items()})
+    if isinstance(value, list | tuple):
+        return FrozenList(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, FrozenList):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def freeze_stack(stack: Mapping[str, Any]) -> FrozenStack:
+    """Return a read-only view of stack that shares nothing mutable with it."""
+    frozen: FrozenStack = _freeze(stack)
+    return frozen
+
+
+def thaw_stack(stack: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a mutable deep copy of a (possibly frozen) stack."""
+    thawed: dict[str, Any] = _thaw(stack)
+    return thawed
+
+
+__all__ = ["FrozenList", "FrozenStack", "freeze_stack", "thaw_stack"]
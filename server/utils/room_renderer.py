@@ -11,6 +11,8 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping, Sequence
 from copy import deepcopy
 
+from .frozen_stack import FrozenStack
+
 DROP_INTRO_LINE = "Scattered upon the floor, you notice:"
 DROP_EMPTY_LINE = "The floor bears no abandoned curios."
 
@@ -57,7 +59,7 @@ def build_room_drop_summary(drops: Sequence[Mapping[str, object]] | None) -> str
 
 
 def clone_room_drops(drops: Iterable[Mapping[str, object]] | None) -> list[dict[str, object]]:
-    """Deep copy room drop payloads to shield callers from mutation."""
+    """Deep copy room drop payloads to shield callers from mutation; read-only stacks are shared as they are."""
     if not drops:
         return []
-    return [deepcopy(dict(stack)) for stack in drops]
+    return [stack if isinstance(stack, FrozenStack) else deepcopy(dict(stack)) for stack in drops]